@@ -2,17 +2,23 @@
 
 """Main API CLI file."""
 
+from datetime import timedelta
 from pprint import pformat
 
 import typer
 import uvicorn
 
 from audio_api.api.settings import get_settings
+from audio_api.aws.dynamodb.repositories import radio_programs_repository
+from audio_api.aws.settings import get_settings as get_aws_settings
+from audio_api.domain.analysis_worker import AnalysisWorker
+from audio_api.domain.file_reconciliation import FileReconciliation
 from audio_api.logger.logger import get_logger
 
 logger = get_logger("manage_cli")
 app = typer.Typer()
 settings = get_settings()
+aws_settings = get_aws_settings()
 
 
 @app.command()
@@ -32,5 +38,59 @@ def start():
     uvicorn.run(**uvicorn_settings)
 
 
+@app.command()
+def backfill_indexes():
+    """Add missing secondary index attributes to existing RadioPrograms."""
+    updated_items = radio_programs_repository.backfill_index_attributes()
+    logger.info(f"Backfilled index attributes of {updated_items} RadioPrograms.")
+
+
+@app.command()
+def reconcile_orphans(
+    grace_hours: float = typer.Option(
+        24,
+        help=(
+            "Minimum age of the orphaned S3 objects to delete. Keep it longer "
+            "than the presigned upload expiration."
+        ),
+    ),
+    partitions: int = typer.Option(
+        16, min=1, help="Number of on-disk partitions used to diff the keys."
+    ),
+    dry_run: bool = typer.Option(False, help="Report orphans without deleting them."),
+):
+    """Delete S3 files not referenced by any RadioProgram and report missing files."""
+    report = FileReconciliation.run(
+        grace_period=timedelta(hours=grace_hours),
+        partitions=partitions,
+        dry_run=dry_run,
+    )
+    logger.info(f"Reconciled RadioProgram files: \n{pformat(report.dict())}")
+
+
+@app.command()
+def worker(
+    processes: int = typer.Option(
+        aws_settings.ANALYSIS_WORKER_PROCESSES,
+        min=1,
+        help="Number of analysis jobs run at the same time.",
+    ),
+    poll_interval: float = typer.Option(
+        aws_settings.ANALYSIS_WORKER_POLL_INTERVAL,
+        min=0,
+        help="Seconds between polls of the pending jobs when idle.",
+    ),
+    until_idle: bool = typer.Option(
+        False, help="Exit once no job is pending instead of polling forever."
+    ),
+):
+    """Run the queued analysis jobs of RadioProgram files on a process pool."""
+    logger.info(f"Starting analysis worker with {processes} processes.")
+    report = AnalysisWorker.run(
+        processes=processes, poll_interval=poll_interval, until_idle=until_idle
+    )
+    logger.info(f"Ran analysis jobs: \n{pformat(report.dict())}")
+
+
 if __name__ == "__main__":
     app()
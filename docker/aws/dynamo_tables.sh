@@ -1,7 +1,57 @@
 #!/bin/bash
 awslocal dynamodb create-table \
    --table-name radio_programs \
-   --attribute-definitions AttributeName=id,AttributeType=S \
+   --attribute-definitions \
+       AttributeName=id,AttributeType=S \
+       AttributeName=air_date_partition,AttributeType=S \
+       AttributeName=air_date,AttributeType=S \
    --key-schema AttributeName=id,KeyType=HASH \
    --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 \
+   --global-secondary-indexes \
+       "[{\"IndexName\": \"air_date_index\",
+          \"KeySchema\": [{\"AttributeName\": \"air_date_partition\", \"KeyType\": \"HASH\"},
+                          {\"AttributeName\": \"air_date\", \"KeyType\": \"RANGE\"}],
+          \"Projection\": {\"ProjectionType\": \"ALL\"},
+          \"ProvisionedThroughput\": {\"ReadCapacityUnits\": 5, \"WriteCapacityUnits\": 5}}]" \
+   --region ${AWS_DEFAULT_REGION}
+
+awslocal dynamodb create-table \
+   --table-name radio_program_files \
+   --attribute-definitions AttributeName=file_name,AttributeType=S \
+   --key-schema AttributeName=file_name,KeyType=HASH \
+   --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 \
+   --region ${AWS_DEFAULT_REGION}
+
+awslocal dynamodb create-table \
+   --table-name radio_program_uploads \
+   --attribute-definitions AttributeName=file_name,AttributeType=S \
+   --key-schema AttributeName=file_name,KeyType=HASH \
+   --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 \
+   --region ${AWS_DEFAULT_REGION}
+
+awslocal dynamodb update-time-to-live \
+   --table-name radio_program_uploads \
+   --time-to-live-specification Enabled=true,AttributeName=expires_at \
+   --region ${AWS_DEFAULT_REGION}
+
+awslocal dynamodb create-table \
+   --table-name radio_program_jobs \
+   --attribute-definitions \
+       AttributeName=id,AttributeType=S \
+       AttributeName=program_id,AttributeType=S \
+       AttributeName=status,AttributeType=S \
+       AttributeName=created_at,AttributeType=S \
+   --key-schema AttributeName=id,KeyType=HASH \
+   --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 \
+   --global-secondary-indexes \
+       "[{\"IndexName\": \"program_id_index\",
+          \"KeySchema\": [{\"AttributeName\": \"program_id\", \"KeyType\": \"HASH\"},
+                          {\"AttributeName\": \"created_at\", \"KeyType\": \"RANGE\"}],
+          \"Projection\": {\"ProjectionType\": \"ALL\"},
+          \"ProvisionedThroughput\": {\"ReadCapacityUnits\": 5, \"WriteCapacityUnits\": 5}},
+         {\"IndexName\": \"status_index\",
+          \"KeySchema\": [{\"AttributeName\": \"status\", \"KeyType\": \"HASH\"},
+                          {\"AttributeName\": \"created_at\", \"KeyType\": \"RANGE\"}],
+          \"Projection\": {\"ProjectionType\": \"ALL\"},
+          \"ProvisionedThroughput\": {\"ReadCapacityUnits\": 5, \"WriteCapacityUnits\": 5}}]" \
    --region ${AWS_DEFAULT_REGION}
@@ -0,0 +1,27 @@
+"""Endpoints related to API metrics."""
+
+from typing import Any
+
+from fastapi import APIRouter, status
+
+from audio_api.api.schemas import MetricsSchema
+from audio_api.domain.radio_programs import RadioPrograms
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=MetricsSchema,
+    summary="Retrieve API metrics",
+    description="Retrieve in-process cache counters and queue sizes",
+    status_code=status.HTTP_200_OK,
+)
+def get_metrics() -> Any:
+    """Retrieve the API metrics."""
+    return MetricsSchema(
+        radio_programs_cache=RadioPrograms.get_cache_stats(),
+        radio_program_urls_cache=RadioPrograms.get_url_cache_stats(),
+        radio_program_files_block_cache=RadioPrograms.get_block_cache_stats(),
+        pending_file_deletions=RadioPrograms.get_pending_file_deletions(),
+    )
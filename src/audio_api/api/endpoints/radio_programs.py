@@ -1,29 +1,258 @@
 """Endpoints related to Radio Programs."""
 
 import uuid
+from datetime import date, timezone
+from email.utils import format_datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from audio_api.api.schemas import (
     APIMessage,
+    RadioProgramBatchInSchema,
+    RadioProgramBatchOperation,
+    RadioProgramBatchOutSchema,
+    RadioProgramBatchResultSchema,
     RadioProgramCreateInSchema,
     RadioProgramCreateOutSchema,
     RadioProgramGetSchema,
+    RadioProgramJobSchema,
     RadioProgramListSchema,
     RadioProgramUpdateInSchema,
     RadioProgramUpdateOutSchema,
+    RadioProgramUploadCompleteInSchema,
+    RadioProgramUploadInSchema,
+    RadioProgramUploadOutSchema,
 )
 from audio_api.api.schemas.utils import as_form
+from audio_api.api.settings import get_settings
+from audio_api.audio.waveform import WaveformResolution
 from audio_api.aws.dynamodb.exceptions import (
     DynamoDbClientError,
+    DynamoDbInvalidCursorError,
     DynamoDbItemNotFoundError,
     DynamoDbStatusError,
+    DynamoDbVersionConflictError,
+)
+from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemResult,
+    DynamoDbBatchItemStatus,
+)
+from audio_api.aws.s3.exceptions import (
+    S3ClientError,
+    S3FileNotFoundError,
+    S3PersistenceError,
 )
-from audio_api.aws.s3.exceptions import S3ClientError, S3PersistenceError
-from audio_api.domain.radio_programs import RadioPrograms
+from audio_api.aws.s3.models import S3ObjectMetadata
+from audio_api.domain.async_radio_programs import AsyncRadioPrograms
+from audio_api.domain.models import RadioProgramAudioMetadata, RadioProgramModel
 
 router = APIRouter()
+settings = get_settings()
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+AUDIO_MEDIA_TYPE = "audio/mpeg"
+WAVEFORM_MEDIA_TYPE = "application/octet-stream"
+
+BATCH_STATUS_CODES = {
+    RadioProgramBatchOperation.create: status.HTTP_201_CREATED,
+    RadioProgramBatchOperation.update: status.HTTP_200_OK,
+    RadioProgramBatchOperation.delete: status.HTTP_204_NO_CONTENT,
+}
+
+
+def _parse_version(if_match: str | None) -> int | None:
+    """Get the RadioProgram version from an If-Match header.
+
+    "*" matches any version: updates always require the RadioProgram to exist.
+
+    Args:
+        if_match: If-Match header value, an ETag returned by a previous response.
+
+    Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If the header is not a RadioProgram ETag.
+
+    Returns:
+        int | None: Expected RadioProgram version, None if any version matches.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must be the ETag of a RadioProgram.",
+        )
+
+
+def _set_etag(response: Response, program: RadioProgramModel) -> None:
+    """Send the RadioProgram version as ETag, to be used in If-Match.
+
+    Args:
+        response: Response to add the header to.
+        program: Returned RadioProgram.
+    """
+    if program.version is not None:
+        response.headers["ETag"] = f'"{program.version}"'
+
+
+def _parse_range(range_header: str, content_length: int) -> tuple[int, int] | None:
+    """Get the byte range requested by a Range header.
+
+    Only single byte ranges are supported, other Range headers are ignored and
+    the whole file is sent.
+
+    Args:
+        range_header: Range header value, like bytes=0-1023, bytes=1024- or
+            bytes=-1024.
+        content_length: Size of the file, in bytes.
+
+    Raises:
+        HTTPException: HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            If the range does not overlap the file.
+
+    Returns:
+        tuple[int, int] | None: First and last byte, inclusive. None to send the
+            whole file.
+    """
+    unit, _, byte_range = range_header.partition("=")
+    first, separator, last = byte_range.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in byte_range or not separator:
+        return None
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else content_length - 1
+            if last and end < start:
+                return None
+        else:
+            suffix_length = int(last)
+            start = max(content_length - suffix_length, 0)
+            end = content_length - 1 if suffix_length else -1
+    except ValueError:
+        return None
+
+    if start >= content_length or end < start:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Range does not overlap the RadioProgram file.",
+            headers={"Content-Range": f"bytes */{content_length}"},
+        )
+    return start, min(end, content_length - 1)
+
+
+async def _get_start_range(
+    metadata: RadioProgramAudioMetadata, start: float
+) -> tuple[int, int]:
+    """Get the byte range of a file from the frame playing at a given time.
+
+    Args:
+        metadata: Metadata of the file.
+        start: Playback time, in seconds.
+
+    Raises:
+        HTTPException: HTTP_404_NOT_FOUND
+            If the file has no seek index.
+        HTTPException: HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            If start is after the end of the file.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve the seek index from S3.
+
+    Returns:
+        tuple[int, int]: First and last byte, inclusive.
+    """
+    try:
+        offset = await AsyncRadioPrograms.get_audio_offset(
+            metadata=metadata, start=start
+        )
+    except S3FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram seek index not found.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram seek index from S3.",
+        )
+
+    if offset is None or offset >= metadata.content_length:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="start is after the end of the RadioProgram file.",
+            headers={"Content-Range": f"bytes */{metadata.content_length}"},
+        )
+    return offset, metadata.content_length - 1
+
+
+def _if_range_matches(if_range: str, metadata: S3ObjectMetadata) -> bool:
+    """Check whether an If-Range header matches the current file.
+
+    Args:
+        if_range: If-Range header value, a strong ETag or a Last-Modified date.
+        metadata: Metadata of the current file.
+
+    Returns:
+        bool: True if the range can be sent, False to send the whole file.
+    """
+    if if_range.startswith('"'):
+        return if_range == metadata.etag
+    return if_range == _last_modified(metadata)
+
+
+def _last_modified(metadata: S3ObjectMetadata) -> str:
+    """Format the modification time of a file as a Last-Modified header.
+
+    Args:
+        metadata: Metadata of the file.
+
+    Returns:
+        str: HTTP date.
+    """
+    return format_datetime(metadata.last_modified.astimezone(timezone.utc), True)
+
+
+def _batch_result(
+    operation: RadioProgramBatchOperation, result: DynamoDbBatchItemResult
+) -> RadioProgramBatchResultSchema:
+    """Convert a DB batch result into the API result of a single RadioProgram.
+
+    Args:
+        operation: Operation applied to the RadioProgram.
+        result: Result returned by the DB.
+
+    Returns:
+        RadioProgramBatchResultSchema: Result with the matching HTTP status code.
+    """
+    status_code = {
+        DynamoDbBatchItemStatus.succeeded: BATCH_STATUS_CODES[operation],
+        DynamoDbBatchItemStatus.not_found: status.HTTP_404_NOT_FOUND,
+        DynamoDbBatchItemStatus.conflict: status.HTTP_409_CONFLICT,
+        DynamoDbBatchItemStatus.failed: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    }[result.status]
+    return RadioProgramBatchResultSchema(
+        id=result.id,
+        operation=operation,
+        status=result.status,
+        status_code=status_code,
+        detail=result.error,
+        program=result.item if operation != RadioProgramBatchOperation.delete else None,
+    )
 
 
 @router.get(
@@ -39,11 +268,13 @@ router = APIRouter()
 )
 async def get(
     *,
+    response: Response,
     program_id: uuid.UUID,
 ) -> Any:
     """Retrieve an existing Program.
 
     Args:
+        response: Response used to send the RadioProgram ETag.
         program_id: The UUID of the RadioProgram to retrieve.
 
     Raises:
@@ -53,7 +284,7 @@ async def get(
             If failed to retrieve RadioProgram from the DB.
     """
     try:
-        return RadioPrograms.get(program_id=program_id)
+        program = await AsyncRadioPrograms.get(program_id=program_id)
     except DynamoDbItemNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -65,32 +296,422 @@ async def get(
             detail="Failed to retrieve RadioProgram from the DB.",
         )
 
+    _set_etag(response, program)
+    return program
+
+
+@router.api_route(
+    "/{program_id}/audio",
+    methods=["GET", "HEAD"],
+    response_class=StreamingResponse,
+    summary="Stream the audio of a RadioProgram",
+    description=(
+        "Stream the MP3 file of a RadioProgram, supporting byte ranges. If start is "
+        "provided, the file is streamed from the frame playing at start seconds."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {AUDIO_MEDIA_TYPE: {}}},
+        status.HTTP_206_PARTIAL_CONTENT: {"content": {AUDIO_MEDIA_TYPE: {}}},
+        status.HTTP_404_NOT_FOUND: {"model": APIMessage},
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def get_audio(
+    *,
+    request: Request,
+    program_id: uuid.UUID,
+    start: float | None = Query(None, ge=0),
+    range_header: str | None = Header(None, alias="Range"),
+    if_range: str | None = Header(None),
+) -> Response:
+    """Stream the MP3 file of a RadioProgram.
+
+    A Range header requests a single byte range, which is read from S3 with a
+    ranged GET and sent as 206 Partial Content, so players can seek without
+    downloading the whole file. If-Range makes the Range conditional on the file
+    ETag or Last-Modified date. start seeks by time instead: it is resolved to
+    the offset of a frame with the seek index of the file, and takes precedence
+    over Range. The file is sent in AUDIO_CHUNK_SIZE chunks, read through the
+    block cache if it is enabled.
+
+    Args:
+        request: Request, used to answer HEAD requests without a body.
+        program_id: The UUID of the RadioProgram to stream.
+        start: Playback time to stream from, in seconds.
+        range_header: Range header value, if any.
+        if_range: If-Range header value, if any.
+
+    Raises:
+        HTTPException: HTTP_404_NOT_FOUND
+            If RadioProgram, its file or its seek index does not exist.
+        HTTPException: HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            If start is after the end of the file.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram from the DB.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram file from S3.
+
+    Returns:
+        Response: File content, or only its headers for HEAD requests.
+    """
+    try:
+        metadata = await AsyncRadioPrograms.get_audio_metadata(program_id=program_id)
+    except (DynamoDbItemNotFoundError, S3FileNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram not found.",
+        )
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram from the DB.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram file from S3.",
+        )
+
+    byte_range = None
+    if start is not None:
+        byte_range = await _get_start_range(metadata, start)
+    elif range_header and (if_range is None or _if_range_matches(if_range, metadata)):
+        byte_range = _parse_range(range_header, metadata.content_length)
+
+    status_code = status.HTTP_200_OK
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(metadata.content_length),
+        "ETag": metadata.etag,
+        "Last-Modified": _last_modified(metadata),
+    }
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Length"] = str(end - start + 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{metadata.content_length}"
+    media_type = metadata.content_type or AUDIO_MEDIA_TYPE
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+    try:
+        chunks = await AsyncRadioPrograms.iter_audio(
+            file_name=metadata.file_name,
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=byte_range,
+            metadata=metadata,
+        )
+    except S3FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram not found.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram file from S3.",
+        )
+
+    return StreamingResponse(
+        chunks, status_code=status_code, headers=headers, media_type=media_type
+    )
+
+
+@router.get(
+    "/{program_id}/clip",
+    response_class=StreamingResponse,
+    summary="Stream a clip of the audio of a RadioProgram",
+    description=(
+        "Stream the frames of the MP3 file of a RadioProgram playing between start "
+        "and end seconds, without re-encoding. end is clamped to the end of the file."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {AUDIO_MEDIA_TYPE: {}}},
+        status.HTTP_400_BAD_REQUEST: {"model": APIMessage},
+        status.HTTP_404_NOT_FOUND: {"model": APIMessage},
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def get_clip(
+    *,
+    program_id: uuid.UUID,
+    start: float = Query(..., ge=0),
+    end: float = Query(..., gt=0),
+) -> Response:
+    """Stream a clip of the MP3 file of a RadioProgram.
+
+    The clip bounds are resolved to frame-aligned byte offsets with the seek
+    index of the file, and only that byte range is read from S3. The clip is a
+    sequence of complete MPEG frames, a valid MP3 stream that is sent as is.
+
+    Args:
+        program_id: The UUID of the RadioProgram.
+        start: Start of the clip, in seconds.
+        end: End of the clip, in seconds.
+
+    Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If end is not after start.
+        HTTPException: HTTP_404_NOT_FOUND
+            If RadioProgram, its file or its seek index does not exist.
+        HTTPException: HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            If start is after the end of the file.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram from the DB.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram file from S3.
+
+    Returns:
+        Response: Clip content.
+    """
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start.",
+        )
+
+    try:
+        metadata = await AsyncRadioPrograms.get_audio_metadata(program_id=program_id)
+    except (DynamoDbItemNotFoundError, S3FileNotFoundError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram not found.",
+        )
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram from the DB.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram file from S3.",
+        )
+
+    try:
+        byte_range = await AsyncRadioPrograms.get_clip_range(
+            metadata=metadata, start=start, end=end
+        )
+        if byte_range is None:
+            raise HTTPException(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                detail="start is after the end of the RadioProgram file.",
+            )
+        chunks = await AsyncRadioPrograms.iter_audio(
+            file_name=metadata.file_name,
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=byte_range,
+            metadata=metadata,
+        )
+    except S3FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram seek index not found.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram file from S3.",
+        )
+
+    first, last = byte_range
+    return StreamingResponse(
+        chunks,
+        headers={"Content-Length": str(last - first + 1)},
+        media_type=AUDIO_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/{program_id}/jobs",
+    response_model=list[RadioProgramJobSchema],
+    summary="List the analysis jobs of a RadioProgram",
+    description=(
+        "List the analysis jobs queued for the files of a RadioProgram, oldest "
+        "first, with their status and result."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def get_jobs(*, program_id: uuid.UUID) -> Any:
+    """Retrieve the analysis jobs of a RadioProgram.
+
+    Args:
+        program_id: The UUID of the RadioProgram.
+
+    Raises:
+        HTTPException: HTTP_404_NOT_FOUND
+            If RadioProgram does not exist.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve the jobs from the DB.
+    """
+    try:
+        return await AsyncRadioPrograms.get_jobs(program_id=program_id)
+    except DynamoDbItemNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram not found.",
+        )
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram jobs from the DB.",
+        )
+
+
+@router.get(
+    "/{program_id}/waveform",
+    response_class=Response,
+    summary="Retrieve the waveform of a RadioProgram",
+    description=(
+        "Retrieve the min and max peaks of a RadioProgram, computed after its file "
+        "is uploaded, in the audiowaveform binary format with 8 bits peaks. The "
+        "resolution is the number of peaks per second."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"content": {WAVEFORM_MEDIA_TYPE: {}}},
+        status.HTTP_404_NOT_FOUND: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def get_waveform(
+    *,
+    program_id: uuid.UUID,
+    resolution: WaveformResolution = Query(WaveformResolution.medium),
+) -> Response:
+    """Retrieve the precomputed waveform of a RadioProgram.
+
+    Args:
+        program_id: The UUID of the RadioProgram.
+        resolution: Peaks per second of the waveform.
+
+    Raises:
+        HTTPException: HTTP_404_NOT_FOUND
+            If RadioProgram or its waveform does not exist.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram from the DB.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to retrieve RadioProgram waveform from S3.
+
+    Returns:
+        Response: Waveform content.
+    """
+    try:
+        waveform = await AsyncRadioPrograms.get_waveform(
+            program_id=program_id, resolution=resolution
+        )
+    except DynamoDbItemNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram not found.",
+        )
+    except S3FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="RadioProgram waveform not found.",
+        )
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram from the DB.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve RadioProgram waveform from S3.",
+        )
+
+    return Response(content=waveform, media_type=WAVEFORM_MEDIA_TYPE)
+
 
 @router.get(
     "",
     response_model=list[RadioProgramListSchema],
     summary="List RadioPrograms",
-    description="Get a list of RadioPrograms",
+    description=(
+        "Get a list of RadioPrograms. If ids are provided, only those RadioPrograms "
+        "are returned. If from or to are provided, only RadioPrograms aired in that "
+        "date range are returned, sorted by air date. If limit or cursor are "
+        "provided, a single page is returned and the next page cursor is sent in "
+        f"{NEXT_CURSOR_HEADER}."
+    ),
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_400_BAD_REQUEST: {"model": APIMessage},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
     },
 )
-def get_all() -> Any:
+async def get_all(
+    *,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    ids: list[uuid.UUID] | None = Query(None, max_items=settings.MAX_PAGE_SIZE),
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+) -> Any:
     """Retrieve all RadioProgram.
 
+    Args:
+        response: Response used to send the next page cursor.
+        limit: Maximum number of RadioPrograms to return in a single page.
+        cursor: Cursor received from a previous page.
+        ids: UUIDs of the RadioPrograms to retrieve.
+        date_from: First air date to include.
+        date_to: Last air date to include.
+
     Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If the cursor is invalid.
+        HTTPException: HTTP_400_BAD_REQUEST
+            If from is after to.
         HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
             If failed to retrieve RadioPrograms.
     """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from must not be after to.",
+        )
+
     try:
-        return RadioPrograms.get_all()
+        if ids:
+            return await AsyncRadioPrograms.get_many(program_ids=ids)
+        if limit is None and cursor is None:
+            return await AsyncRadioPrograms.get_all(
+                date_from=date_from, date_to=date_to
+            )
+
+        page = await AsyncRadioPrograms.get_page(
+            limit=limit or settings.DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except DynamoDbInvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        )
     except (DynamoDbClientError, DynamoDbStatusError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve RadioPrograms from the DB.",
         )
 
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
 
 @router.post(
     "",
@@ -112,6 +733,8 @@ async def create(
 ) -> Any:
     """Create a new RadioProgram.
 
+    The analysis jobs of the file are queued, see GET /programs/{id}/jobs.
+
     Args:
         program_in: New RadioProgram.
         program_file: RadioProgram MP3 file.
@@ -125,7 +748,7 @@ async def create(
             If failed to upload RadioProgram file to S3.
     """
     try:
-        return RadioPrograms.create(
+        return await AsyncRadioPrograms.create(
             radio_program=program_in, program_file=program_file.file
         )
     except (DynamoDbClientError, DynamoDbStatusError):
@@ -145,6 +768,179 @@ async def create(
         )
 
 
+@router.post(
+    "/uploads",
+    response_model=RadioProgramUploadOutSchema,
+    summary="Start a direct upload of a RadioProgram file",
+    description="Get presigned URLs to upload a RadioProgram MP3 file to S3",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def create_upload(*, upload_in: RadioProgramUploadInSchema) -> Any:
+    """Get presigned URLs to upload a RadioProgram file directly to S3.
+
+    Small files are uploaded with a single PUT to uploadUrl. Big files are
+    uploaded in parts of partSize bytes, each one with a PUT to its part URL.
+    The RadioProgram is then created with POST /programs/uploads/complete, so
+    file content never goes through the API.
+
+    Args:
+        upload_in: Title and size of the RadioProgram file.
+
+    Raises:
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to connect to S3.
+    """
+    try:
+        return await AsyncRadioPrograms.create_upload(
+            title=upload_in.title, file_size=upload_in.file_size
+        )
+    except S3ClientError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to connect to S3.",
+        )
+
+
+@router.post(
+    "/uploads/complete",
+    response_model=RadioProgramCreateOutSchema,
+    summary="Create a RadioProgram from a direct upload",
+    description="Create a RadioProgram from a file uploaded with presigned URLs",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": APIMessage},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def complete_upload(*, program_in: RadioProgramUploadCompleteInSchema) -> Any:
+    """Create a new RadioProgram from a file uploaded with POST /programs/uploads.
+
+    The analysis jobs of the file are queued, see GET /programs/{id}/jobs.
+
+    Args:
+        program_in: New RadioProgram, with the fileName and uploadId of the upload.
+
+    Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If the uploaded file does not exist.
+        HTTPException: HTTP_400_BAD_REQUEST
+            If the upload was not created, expired or was already completed.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to store RadioProgram on DB.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to connect to S3.
+    """
+    radio_program = RadioProgramCreateInSchema(
+        **program_in.dict(exclude={"file_name", "upload_id"})
+    )
+    try:
+        return await AsyncRadioPrograms.complete_upload(
+            radio_program=radio_program,
+            file_name=program_in.file_name,
+            upload_id=program_in.upload_id,
+        )
+    except S3FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded RadioProgram file not found.",
+        )
+    except DynamoDbItemNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload not found, expired or already completed.",
+        )
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store RadioProgram in the DB.",
+        )
+    except (S3ClientError, S3PersistenceError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to connect to S3.",
+        )
+
+
+@router.post(
+    "/batch",
+    response_model=RadioProgramBatchOutSchema,
+    summary="Create, update and delete RadioPrograms in bulk",
+    description=(
+        "Create, update and delete the metadata of up to "
+        f"{settings.MAX_BATCH_SIZE} RadioPrograms in a single request. Created "
+        "RadioPrograms must reference files already stored in S3. Every "
+        "RadioProgram gets its own result and status code, in request order. "
+        "A RadioProgram can only be updated or deleted once per request, and "
+        "updates of RadioPrograms modified concurrently get a 409 result."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": APIMessage},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": APIMessage},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
+    },
+)
+async def batch(*, batch_in: RadioProgramBatchInSchema) -> Any:
+    """Create, update and delete several RadioPrograms.
+
+    Args:
+        batch_in: RadioPrograms to create, update and delete.
+
+    Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If the batch has too many RadioPrograms.
+        HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
+            If failed to read RadioPrograms from the DB.
+    """
+    batch_size = len(batch_in.create) + len(batch_in.update) + len(batch_in.delete)
+    if batch_size > settings.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch must not have more than {settings.MAX_BATCH_SIZE} items.",
+        )
+
+    results = []
+    try:
+        if batch_in.create:
+            results += [
+                _batch_result(RadioProgramBatchOperation.create, result)
+                for result in await AsyncRadioPrograms.create_many(
+                    radio_programs=batch_in.create
+                )
+            ]
+        if batch_in.update:
+            results += [
+                _batch_result(RadioProgramBatchOperation.update, result)
+                for result in await AsyncRadioPrograms.update_many(
+                    new_programs={
+                        program.id: RadioProgramUpdateInSchema(
+                            **program.dict(exclude={"id"})
+                        )
+                        for program in batch_in.update
+                    }
+                )
+            ]
+        if batch_in.delete:
+            results += [
+                _batch_result(RadioProgramBatchOperation.delete, result)
+                for result in await AsyncRadioPrograms.delete_many(
+                    program_ids=batch_in.delete
+                )
+            ]
+    except (DynamoDbClientError, DynamoDbStatusError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to read RadioPrograms from the DB.",
+        )
+
+    return RadioProgramBatchOutSchema(results=results)
+
+
 @router.put(
     "/{program_id}",
     response_model=RadioProgramUpdateOutSchema,
@@ -152,29 +948,43 @@ async def create(
     description="Edit a RadioProgram",
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_400_BAD_REQUEST: {"model": APIMessage},
         status.HTTP_404_NOT_FOUND: {"model": APIMessage},
+        status.HTTP_409_CONFLICT: {"model": APIMessage},
         status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": APIMessage},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": APIMessage},
     },
 )
 async def update(
     *,
+    response: Response,
     program_id: uuid.UUID,
     program_in: RadioProgramUpdateInSchema = Depends(
         as_form(RadioProgramUpdateInSchema)
     ),
     program_file: UploadFile = File(None),
+    if_match: str | None = Header(None),
 ) -> Any:
     """Update an existing RadioProgram.
 
+    If If-Match is sent with the ETag of a previous response, the RadioProgram is
+    only updated if it was not modified since. The analysis jobs of a new file
+    are queued, see GET /programs/{id}/jobs.
+
     Args:
+        response: Response used to send the RadioProgram ETag.
         program_id: The UUID of the RadioProgram to modify.
         program_in: The updated RadioProgram.
         program_file: RadioProgram MP3 file.
+        if_match: ETag of the RadioProgram version being updated.
 
     Raises:
+        HTTPException: HTTP_400_BAD_REQUEST
+            If If-Match is not a RadioProgram ETag.
         HTTPException: HTTP_404_NOT_FOUND
             If RadioProgram does not exist.
+        HTTPException: HTTP_409_CONFLICT
+            If RadioProgram was modified since the If-Match version.
         HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
             If failed to store RadioProgram on DB.
         HTTPException: HTTP_500_INTERNAL_SERVER_ERROR
@@ -183,16 +993,25 @@ async def update(
             If failed to upload RadioProgram file to S3.
     """
     program_file = program_file.file if program_file else None
+    expected_version = _parse_version(if_match)
 
     try:
-        return RadioPrograms.update(
-            program_id=program_id, new_program=program_in, program_file=program_file
+        program = await AsyncRadioPrograms.update(
+            program_id=program_id,
+            new_program=program_in,
+            program_file=program_file,
+            expected_version=expected_version,
         )
     except DynamoDbItemNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="RadioProgram not found.",
         )
+    except DynamoDbVersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="RadioProgram was modified since the If-Match version.",
+        )
     except (DynamoDbClientError, DynamoDbStatusError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,6 +1028,9 @@ async def update(
             detail="Failed to upload RadioProgram file to S3.",
         )
 
+    _set_etag(response, program)
+    return program
+
 
 @router.delete(
     "/{program_id}",
@@ -236,7 +1058,7 @@ async def delete(
             If failed to delete RadioProgram from DB.
     """
     try:
-        RadioPrograms.delete(program_id=program_id)
+        await AsyncRadioPrograms.delete(program_id=program_id)
     except DynamoDbItemNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
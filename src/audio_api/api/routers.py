@@ -2,7 +2,8 @@
 
 from fastapi import APIRouter
 
-from audio_api.api.endpoints import radio_programs
+from audio_api.api.endpoints import metrics, radio_programs
 
 router = APIRouter()
 router.include_router(radio_programs.router, prefix="/programs", tags=["programs"])
+router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
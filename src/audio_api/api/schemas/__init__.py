@@ -1,11 +1,23 @@
 from audio_api.api.schemas.api_version import ApiVersionModel
 from audio_api.api.schemas.base import APIMessage, APISchema
+from audio_api.api.schemas.metrics import CacheStatsSchema, MetricsSchema
 from audio_api.api.schemas.radio_program import (
     BaseRadioProgramApiSchema,
+    RadioProgramBatchCreateInSchema,
+    RadioProgramBatchInSchema,
+    RadioProgramBatchOperation,
+    RadioProgramBatchOutSchema,
+    RadioProgramBatchResultSchema,
+    RadioProgramBatchUpdateInSchema,
     RadioProgramCreateInSchema,
     RadioProgramCreateOutSchema,
     RadioProgramGetSchema,
+    RadioProgramJobSchema,
     RadioProgramListSchema,
     RadioProgramUpdateInSchema,
     RadioProgramUpdateOutSchema,
+    RadioProgramUploadCompleteInSchema,
+    RadioProgramUploadInSchema,
+    RadioProgramUploadOutSchema,
+    RadioProgramUploadPartSchema,
 )
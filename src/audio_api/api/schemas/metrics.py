@@ -0,0 +1,17 @@
+"""Metrics Schemas."""
+
+from audio_api.api.schemas.base import APISchema
+from audio_api.aws.cache import CacheStats
+
+
+class CacheStatsSchema(APISchema, CacheStats):
+    """Counters of an in-process cache."""
+
+
+class MetricsSchema(APISchema):
+    """Runtime metrics of the API process."""
+
+    radio_programs_cache: CacheStatsSchema | None
+    radio_program_urls_cache: CacheStatsSchema | None
+    radio_program_files_block_cache: CacheStatsSchema | None
+    pending_file_deletions: int
@@ -1,8 +1,18 @@
 """RadioPrograms Schemas."""
-from pydantic import Field
+import uuid
+from collections import Counter
+from enum import Enum
+
+from pydantic import Field, PositiveInt, validator
 
 from audio_api.api.schemas import APISchema
-from audio_api.domain.models import RadioProgramModel
+from audio_api.aws.dynamodb.models import DynamoDbBatchItemStatus
+from audio_api.aws.s3.models import S3PresignedUpload, S3PresignedUploadPart
+from audio_api.domain.models import (
+    RadioProgramFileModel,
+    RadioProgramJobModel,
+    RadioProgramModel,
+)
 from audio_api.domain.models.radio_program import BaseRadioProgramSchema
 
 
@@ -38,3 +48,89 @@ class RadioProgramUpdateInSchema(BaseRadioProgramApiSchema):
 
 class RadioProgramUpdateOutSchema(RadioProgramApiSchema):
     """Parameters returned in a PUT request."""
+
+
+class RadioProgramBatchCreateInSchema(BaseRadioProgramApiSchema):
+    """Parameters of a RadioProgram created in a batch request.
+
+    Batch requests only store metadata, so the program file must already be in S3.
+    """
+
+    radio_program: RadioProgramFileModel
+
+
+class RadioProgramBatchUpdateInSchema(RadioProgramUpdateInSchema):
+    """Parameters of a RadioProgram updated in a batch request."""
+
+    id: uuid.UUID
+
+
+class RadioProgramBatchInSchema(APISchema):
+    """Parameters received in a batch POST request."""
+
+    create: list[RadioProgramBatchCreateInSchema] = Field(default_factory=list)
+    update: list[RadioProgramBatchUpdateInSchema] = Field(default_factory=list)
+    delete: list[uuid.UUID] = Field(default_factory=list)
+
+    @validator("update", "delete")
+    def validate_unique_ids(cls, value):
+        """Validate that an operation is applied once to each RadioProgram."""
+        ids = Counter(getattr(item, "id", item) for item in value)
+        if duplicate_ids := [
+            str(item_id) for item_id, count in ids.items() if count > 1
+        ]:
+            raise ValueError(f"Duplicate RadioProgram ids: {', '.join(duplicate_ids)}.")
+        return value
+
+
+class RadioProgramBatchOperation(str, Enum):
+    """Operation applied to a RadioProgram in a batch request."""
+
+    create = "create"
+    update = "update"
+    delete = "delete"
+
+
+class RadioProgramBatchResultSchema(APISchema):
+    """Result of a single RadioProgram in a batch request."""
+
+    id: uuid.UUID
+    operation: RadioProgramBatchOperation
+    status: DynamoDbBatchItemStatus
+    status_code: int
+    detail: str | None
+    program: RadioProgramApiSchema | None
+
+
+class RadioProgramBatchOutSchema(APISchema):
+    """Parameters returned in a batch POST request."""
+
+    results: list[RadioProgramBatchResultSchema]
+
+
+class RadioProgramUploadInSchema(APISchema):
+    """Parameters received to start a direct upload of a RadioProgram file."""
+
+    title: str = Field(example="Shopping 2.0 #001")
+    file_size: PositiveInt = Field(example=52428800)
+
+
+class RadioProgramUploadPartSchema(APISchema, S3PresignedUploadPart):
+    """Presigned URL of a single part of a multipart upload."""
+
+
+class RadioProgramUploadOutSchema(APISchema, S3PresignedUpload):
+    """Presigned URLs returned to upload a RadioProgram file directly to S3."""
+
+    parts: list[RadioProgramUploadPartSchema] = []
+
+
+class RadioProgramUploadCompleteInSchema(RadioProgramCreateInSchema):
+    """Parameters received to create a RadioProgram from a direct upload."""
+
+    file_name: str
+    upload_id: str | None
+
+
+class RadioProgramJobSchema(APISchema, RadioProgramJobModel):
+    """Parameters returned for each analysis job of a RadioProgram."""
@@ -30,6 +30,19 @@ class ApiSettings(EnvironmentSettings, LoggingSettings):
     # More info here: https://fastapi.tiangolo.com/advanced/behind-a-proxy/
     ROOT_PATH: str = ""
 
+    # Worker threads used to run blocking AWS calls outside the event loop
+    THREAD_POOL_SIZE: PositiveInt = 40
+
+    # Pagination settings for list endpoints
+    DEFAULT_PAGE_SIZE: PositiveInt = 50
+    MAX_PAGE_SIZE: PositiveInt = 500
+
+    # Maximum number of RadioPrograms written in a single batch request
+    MAX_BATCH_SIZE: PositiveInt = 1000
+
+    # Size of the chunks streamed by the audio endpoint, in bytes
+    AUDIO_CHUNK_SIZE: PositiveInt = 64 * 1024
+
     def get_uvicorn_settings(self) -> dict[str, Any]:
         """Get a dictionary with settings ready to be used by Uvicorn."""
         return {
@@ -1,20 +1,36 @@
 """API initialization and setup file."""
+from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI
 
 from audio_api.api.routers import router
 from audio_api.api.schemas import ApiVersionModel
 from audio_api.api.settings import ApiSettings, get_settings
+from audio_api.domain.radio_programs import RadioPrograms
 from audio_api.settings import EnvironmentEnum
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Configure the API process on startup and clean up on shutdown."""
+    # Blocking AWS calls run on this pool, size it for the expected concurrency.
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+    # Orphaned program files are deleted from S3 in the background.
+    RadioPrograms.deletion_queue.start()
+    yield
+    RadioPrograms.deletion_queue.stop()
+
+
 app = FastAPI(
     title="Audio API",
     description="Audio API built with FastAPI, PostgreSQL and S3 integration",
     version=settings.API_VERSION,
     debug=settings.ENVIRONMENT == EnvironmentEnum.development,
     root_path=settings.ROOT_PATH,
+    lifespan=lifespan,
 )
 app.include_router(router)
 
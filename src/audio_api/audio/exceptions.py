@@ -0,0 +1,5 @@
+"""Audio Exceptions."""
+
+
+class AudioDecodeError(Exception):
+    """AudioDecodeError class."""
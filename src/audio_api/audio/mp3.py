@@ -0,0 +1,267 @@
+"""Streaming MP3 frame header parser used to get the duration of MP3 files."""
+import os
+from collections.abc import Iterator
+from typing import BinaryIO, NamedTuple
+
+ID3V2_HEADER_SIZE = 10
+# Bytes searched for the first frame after the ID3v2 tag
+MAX_SYNC_SEARCH = 64 * 1024
+WALK_CHUNK_SIZE = 64 * 1024
+
+MPEG_1, MPEG_2, MPEG_25 = 1, 2, 25
+_VERSIONS = {0b00: MPEG_25, 0b10: MPEG_2, 0b11: MPEG_1}
+_LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+_SAMPLE_RATES = {
+    MPEG_1: (44100, 48000, 32000),
+    MPEG_2: (22050, 24000, 16000),
+    MPEG_25: (11025, 12000, 8000),
+}
+# Bitrates in kbps by (MPEG 1, layer) and (MPEG 2 or 2.5, layer), index 1 to 14
+_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+CHANNEL_MODE_MONO = 0b11
+XING_FRAMES_FLAG = 0x1
+# Offset of the VBRI header from the frame start, and of its frame count
+VBRI_OFFSET = 36
+VBRI_FRAMES_OFFSET = 14
+
+
+class FrameHeader(NamedTuple):
+    """FrameHeader class with the fields of a MPEG audio frame header."""
+
+    version: int
+    layer: int
+    sample_rate: int
+    frame_length: int
+    samples: int
+    mono: bool
+
+
+def _read_uint32(data: bytes, offset: int) -> int:
+    """Read a big endian 32 bits unsigned integer.
+
+    Args:
+        data: Bytes holding the integer.
+        offset: Position of the integer in data.
+
+    Returns:
+        int: Integer value.
+    """
+    end = offset + 4
+    return int.from_bytes(data[offset:end], "big")
+
+
+def parse_frame_header(data: bytes, offset: int = 0) -> FrameHeader | None:
+    """Parse the 4 bytes frame header found at an offset.
+
+    Args:
+        data: Bytes holding the header.
+        offset: Position of the header in data.
+
+    Returns:
+        FrameHeader | None: Parsed header, None if there is no valid header.
+    """
+    if len(data) < offset + 4 or data[offset] != 0xFF or data[offset + 1] < 0xE0:
+        return None
+    header = _read_uint32(data, offset)
+    version = _VERSIONS.get((header >> 19) & 0b11)
+    layer = _LAYERS.get((header >> 17) & 0b11)
+    bitrate_index = (header >> 12) & 0b1111
+    sample_rate_index = (header >> 10) & 0b11
+    # Free format bitrates and reserved values are not supported
+    if (
+        version is None
+        or layer is None
+        or bitrate_index in (0, 0b1111)
+        or sample_rate_index == 0b11
+    ):
+        return None
+
+    padding = (header >> 9) & 0b1
+    bitrate = _BITRATES[(version == MPEG_1, layer)][bitrate_index - 1] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and version != MPEG_1:
+        samples = 576
+        frame_length = 72 * bitrate // sample_rate + padding
+    else:
+        samples = 1152
+        frame_length = 144 * bitrate // sample_rate + padding
+
+    return FrameHeader(
+        version=version,
+        layer=layer,
+        sample_rate=sample_rate,
+        frame_length=frame_length,
+        samples=samples,
+        mono=(header >> 6) & 0b11 == CHANNEL_MODE_MONO,
+    )
+
+
+def _skip_id3v2(file: BinaryIO) -> int:
+    """Find the end of the ID3v2 tag at the start of a file, if any.
+
+    Args:
+        file: MP3 file, positioned at its start.
+
+    Returns:
+        int: Position of the first byte after the tag.
+    """
+    header = file.read(ID3V2_HEADER_SIZE)
+    if len(header) < ID3V2_HEADER_SIZE or header[:3] != b"ID3":
+        return 0
+    # Sizes are syncsafe integers, 7 bits per byte
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = ID3V2_HEADER_SIZE if header[5] & 0x10 else 0
+    return ID3V2_HEADER_SIZE + size + footer
+
+
+def _find_first_frame(file: BinaryIO, start: int) -> tuple[int, bytes] | None:
+    """Find the first frame whose header is followed by another valid header.
+
+    Args:
+        file: MP3 file.
+        start: Position where the search starts.
+
+    Returns:
+        tuple[int, bytes] | None: Position of the frame and the bytes from it,
+            None if no frame is found.
+    """
+    file.seek(start)
+    data = file.read(MAX_SYNC_SEARCH)
+    offset = data.find(b"\xff")
+    while offset != -1:
+        header = parse_frame_header(data, offset)
+        if header is not None:
+            file.seek(start + offset + header.frame_length)
+            if parse_frame_header(file.read(4)) is not None:
+                file.seek(start + offset)
+                return start + offset, file.read(WALK_CHUNK_SIZE)
+        offset = data.find(b"\xff", offset + 1)
+    return None
+
+
+def _header_frames(frame: bytes, header: FrameHeader) -> int | None:
+    """Get the frame count stored in a Xing, Info or VBRI header.
+
+    Args:
+        frame: Bytes from the start of the first frame.
+        header: Header of the first frame.
+
+    Returns:
+        int | None: Number of audio frames, None if there is no such header.
+    """
+    if header.version == MPEG_1:
+        side_info = 17 if header.mono else 32
+    else:
+        side_info = 9 if header.mono else 17
+    xing_offset = 4 + side_info
+    if frame.startswith((b"Xing", b"Info"), xing_offset):
+        if _read_uint32(frame, xing_offset + 4) & XING_FRAMES_FLAG:
+            return _read_uint32(frame, xing_offset + 8)
+
+    if frame.startswith(b"VBRI", VBRI_OFFSET):
+        return _read_uint32(frame, VBRI_OFFSET + VBRI_FRAMES_OFFSET)
+    return None
+
+
+def _walk_frames(file: BinaryIO, position: int) -> Iterator[tuple[int, FrameHeader]]:
+    """Iterate the frame headers of a file, reading it in chunks.
+
+    Only frame headers are parsed, frame data is skipped without decoding. The
+    walk stops at the first invalid header, such as a trailing ID3v1 tag.
+
+    Args:
+        file: MP3 file.
+        position: Position of the first frame.
+
+    Yields:
+        tuple[int, FrameHeader]: Position and header of the next frame.
+    """
+    file.seek(position)
+    buffer = b""
+    buffer_position = position
+    offset = 0
+    while True:
+        if offset + 4 > len(buffer):
+            if offset > len(buffer):
+                file.seek(offset - len(buffer), os.SEEK_CUR)
+            chunk = file.read(WALK_CHUNK_SIZE)
+            if not chunk:
+                return
+            buffer_position += offset
+            buffer = buffer[offset:] + chunk
+            offset = 0
+            continue
+        header = parse_frame_header(buffer, offset)
+        if header is None:
+            return
+        yield buffer_position + offset, header
+        offset += header.frame_length
+
+
+def iter_audio_frames(file: BinaryIO) -> Iterator[tuple[int, FrameHeader]]:
+    """Iterate the audio frames of a MP3 file, without decoding.
+
+    The ID3v2 tag and the Xing, Info or VBRI header frame, which holds no
+    audio, are skipped. The file is rewound afterwards.
+
+    Args:
+        file: Seekable MP3 file.
+
+    Yields:
+        tuple[int, FrameHeader]: Position and header of the next audio frame.
+    """
+    try:
+        file.seek(0)
+        first_frame = _find_first_frame(file, _skip_id3v2(file))
+        if first_frame is None:
+            return
+        position, frame = first_frame
+        header = parse_frame_header(frame)
+        if _header_frames(frame, header) is not None:
+            position += header.frame_length
+        yield from _walk_frames(file, position)
+    finally:
+        file.seek(0)
+
+
+def get_mp3_duration(file: BinaryIO) -> float | None:
+    """Get the duration of a MP3 file from its frame headers, without decoding.
+
+    The frame count of a Xing, Info or VBRI header is used when present, so
+    only the start of the file is read. Otherwise every frame header is walked.
+    The file is rewound afterwards.
+
+    Args:
+        file: Seekable MP3 file.
+
+    Returns:
+        float | None: Duration in seconds, None if no MP3 frame is found.
+    """
+    try:
+        file.seek(0)
+        first_frame = _find_first_frame(file, _skip_id3v2(file))
+        if first_frame is None:
+            return None
+        position, frame = first_frame
+        header = parse_frame_header(frame)
+        frames = _header_frames(frame, header)
+        if frames is not None:
+            return frames * header.samples / header.sample_rate
+        return sum(
+            header.samples / header.sample_rate
+            for _, header in _walk_frames(file, position)
+        )
+    finally:
+        file.seek(0)
@@ -0,0 +1,189 @@
+"""Seek index of MP3 files, mapping playback time to the byte offset of frames."""
+import math
+import struct
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+from audio_api.audio.mp3 import iter_audio_frames, parse_frame_header
+
+# Seconds between indexed frames
+SEEK_INDEX_INTERVAL = 1.0
+# Header: version, bytes per offset delta, interval in milliseconds, offset of
+# the first indexed frame and number of indexed frames
+SEEK_INDEX_HEADER = struct.Struct("<BBHQI")
+SEEK_INDEX_VERSION = 1
+# Largest MPEG audio frame, MPEG 2.5 layer II at 160 kbps and 8 kHz with padding
+MAX_FRAME_LENGTH = 2881
+
+
+class SeekIndex(NamedTuple):
+    """SeekIndex class with the byte offset of a frame every interval seconds.
+
+    The offset at index i is the frame playing at i * interval seconds.
+    """
+
+    interval: float
+    offsets: np.ndarray
+
+    def get_offset(self, start: float) -> int | None:
+        """Get the byte offset of the frame playing at a given time.
+
+        Args:
+            start: Playback time, in seconds.
+
+        Returns:
+            int | None: Offset of the frame, None if start is after the end.
+        """
+        index = int(start // self.interval)
+        if index >= len(self.offsets):
+            return None
+        return int(self.offsets[index])
+
+    def get_interval(self, start: float) -> tuple[float, int, int | None] | None:
+        """Get the indexed frames around a given time.
+
+        Args:
+            start: Playback time, in seconds.
+
+        Returns:
+            tuple[float, int, int | None] | None: Indexed time before start, the
+                offset of its frame and the offset of the next indexed frame,
+                None if it is the last one. None if start is after the end.
+        """
+        index = int(start // self.interval)
+        if index >= len(self.offsets):
+            return None
+        next_offset = (
+            int(self.offsets[index + 1]) if index + 1 < len(self.offsets) else None
+        )
+        return index * self.interval, int(self.offsets[index]), next_offset
+
+    def to_bytes(self) -> bytes:
+        """Encode the offsets as deltas of the smallest unsigned integer size.
+
+        Returns:
+            bytes: Header followed by the little endian offset deltas.
+        """
+        deltas = np.diff(self.offsets)
+        width = 2 if deltas.max(initial=0) <= np.iinfo(np.uint16).max else 4
+        header = SEEK_INDEX_HEADER.pack(
+            SEEK_INDEX_VERSION,
+            width,
+            round(self.interval * 1000),
+            int(self.offsets[0]) if len(self.offsets) else 0,
+            len(self.offsets),
+        )
+        return header + deltas.astype(f"<u{width}").tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeekIndex":
+        """Decode a seek index encoded with to_bytes.
+
+        Args:
+            data: Encoded seek index.
+
+        Raises:
+            ValueError: If data is not a supported seek index.
+
+        Returns:
+            SeekIndex: Decoded seek index.
+        """
+        version, width, interval, first_offset, count = SEEK_INDEX_HEADER.unpack_from(
+            data
+        )
+        if version != SEEK_INDEX_VERSION or width not in (2, 4):
+            raise ValueError(
+                f"Unsupported seek index version {version}, width {width}."
+            )
+
+        deltas = np.frombuffer(
+            data,
+            dtype=f"<u{width}",
+            count=max(count - 1, 0),
+            offset=SEEK_INDEX_HEADER.size,
+        )
+        offsets = np.empty(count, dtype=np.int64)
+        if count:
+            offsets[0] = first_offset
+            np.cumsum(deltas, out=offsets[1:])
+            offsets[1:] += first_offset
+        return cls(interval=interval / 1000, offsets=offsets)
+
+
+def index_audio_frames(
+    file: BinaryIO, interval: float = SEEK_INDEX_INTERVAL
+) -> tuple[float, SeekIndex] | None:
+    """Get the duration and the seek index of a MP3 file in a single frame walk.
+
+    Exact for VBR files, since the duration of every frame is added up instead
+    of assuming a constant bitrate. The file is rewound afterwards.
+
+    Args:
+        file: Seekable MP3 file.
+        interval: Seconds between indexed frames.
+
+    Returns:
+        tuple[float, SeekIndex] | None: Duration in seconds and seek index, None
+            if no MP3 frame is found.
+    """
+    offsets = []
+    time = 0.0
+    for position, header in iter_audio_frames(file):
+        end = time + header.samples / header.sample_rate
+        # Index the frame for every interval boundary it plays
+        while len(offsets) * interval < end:
+            offsets.append(position)
+        time = end
+
+    if not offsets:
+        return None
+    return time, SeekIndex(interval=interval, offsets=np.array(offsets, dtype=np.int64))
+
+
+def build_seek_index(
+    file: BinaryIO, interval: float = SEEK_INDEX_INTERVAL
+) -> SeekIndex | None:
+    """Build the seek index of a MP3 file from its frame headers.
+
+    Args:
+        file: Seekable MP3 file.
+        interval: Seconds between indexed frames.
+
+    Returns:
+        SeekIndex | None: Seek index, None if no MP3 frame is found.
+    """
+    frame_index = index_audio_frames(file, interval)
+    return frame_index[1] if frame_index is not None else None
+
+
+def find_frame(
+    data: bytes, indexed_time: float, start: float, after: bool = False
+) -> int | None:
+    """Find the frame playing at a given time by walking frames from an index entry.
+
+    Every frame of a MP3 stream has the same duration, so the frames to skip
+    are counted from the frame duration and only their headers are parsed.
+
+    Args:
+        data: Bytes from the indexed frame.
+        indexed_time: Playback time of the index entry, in seconds.
+        start: Playback time to find, in seconds.
+        after: Find the first frame starting at or after start instead of the
+            frame playing at start.
+
+    Returns:
+        int | None: Offset of the frame in data, None if data ends before.
+    """
+    header = parse_frame_header(data)
+    if header is None:
+        return None
+    duration = header.samples / header.sample_rate
+    frame = math.ceil(start / duration) if after else math.floor(start / duration)
+    position = 0
+    for _ in range(frame - math.floor(indexed_time / duration)):
+        position += header.frame_length
+        header = parse_frame_header(data, position)
+        if header is None:
+            return None
+    return position
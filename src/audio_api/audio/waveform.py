@@ -0,0 +1,196 @@
+"""Waveform peaks of MP3 files, encoded in the audiowaveform binary format."""
+import struct
+from collections.abc import Iterator
+from enum import IntEnum
+from typing import BinaryIO, Literal, NamedTuple
+
+import miniaudio
+import numpy as np
+
+from audio_api.audio.exceptions import AudioDecodeError
+
+# Audio is decoded to mono at this rate, plenty for a few peaks per second
+WAVEFORM_SAMPLE_RATE = 16000
+# Frames decoded at a time, one second of audio
+DECODE_FRAMES = WAVEFORM_SAMPLE_RATE
+# audiowaveform .dat version 1 header: version, flags, sample rate, samples per
+# peak and number of peaks
+DAT_HEADER = struct.Struct("<iIiiI")
+DAT_VERSION = 1
+DAT_FLAG_8_BITS = 0x1
+
+
+class WaveformResolution(IntEnum):
+    """WaveformResolution enum with the peaks per second of each zoom level."""
+
+    low = 1
+    medium = 4
+    high = 16
+    full = 64
+
+
+WAVEFORM_RESOLUTIONS = tuple(WaveformResolution)
+
+
+class _FileSource(miniaudio.StreamableSource):
+    """_FileSource class to decode a file object without reading it whole."""
+
+    def __init__(self, file: BinaryIO):
+        """Wrap a file object, which does not need to be seekable.
+
+        Args:
+            file: File object to decode.
+        """
+        self.file = file
+
+    def read(self, num_bytes: int) -> bytes:
+        """Read the next bytes of the file.
+
+        Args:
+            num_bytes: Maximum number of bytes to read.
+
+        Returns:
+            bytes: Bytes read, empty at the end of the file.
+        """
+        return self.file.read(num_bytes)
+
+
+class Waveform(NamedTuple):
+    """Waveform class with the min and max peaks of a zoom level."""
+
+    sample_rate: int
+    samples_per_peak: int
+    mins: np.ndarray
+    maxs: np.ndarray
+
+    def to_bytes(self, bits: Literal[8, 16] = 8) -> bytes:
+        """Encode the peaks in the audiowaveform binary .dat format.
+
+        Args:
+            bits: Size of each peak. 8 bits peaks keep the most significant byte
+                of the decoded 16 bits samples.
+
+        Returns:
+            bytes: Header followed by interleaved min and max peaks.
+        """
+        peaks = np.empty(2 * len(self.mins), dtype="<i2")
+        peaks[0::2] = self.mins
+        peaks[1::2] = self.maxs
+        flags = 0
+        if bits == 8:
+            peaks = (peaks >> 8).astype(np.int8)
+            flags = DAT_FLAG_8_BITS
+
+        header = DAT_HEADER.pack(
+            DAT_VERSION,
+            flags,
+            self.sample_rate,
+            self.samples_per_peak,
+            len(self.mins),
+        )
+        return header + peaks.tobytes()
+
+    def downsample(self, factor: int) -> "Waveform":
+        """Merge every factor consecutive peaks into a single peak.
+
+        Args:
+            factor: Number of peaks merged, the last peak may merge fewer.
+
+        Returns:
+            Waveform: Coarser zoom level.
+        """
+        starts = np.arange(0, len(self.mins), factor)
+        if not len(starts):
+            return self._replace(samples_per_peak=self.samples_per_peak * factor)
+        return Waveform(
+            sample_rate=self.sample_rate,
+            samples_per_peak=self.samples_per_peak * factor,
+            mins=np.minimum.reduceat(self.mins, starts),
+            maxs=np.maximum.reduceat(self.maxs, starts),
+        )
+
+
+def _iter_samples(file: BinaryIO) -> Iterator[np.ndarray]:
+    """Decode a MP3 file into mono 16 bits samples at WAVEFORM_SAMPLE_RATE.
+
+    Args:
+        file: MP3 file, read sequentially.
+
+    Raises:
+        AudioDecodeError: If the file is not a valid MP3 file.
+
+    Yields:
+        np.ndarray: Next DECODE_FRAMES samples, or fewer at the end.
+    """
+    try:
+        stream = miniaudio.stream_any(
+            _FileSource(file),
+            source_format=miniaudio.FileFormat.MP3,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1,
+            sample_rate=WAVEFORM_SAMPLE_RATE,
+            frames_to_read=DECODE_FRAMES,
+        )
+        for samples in stream:
+            yield np.frombuffer(samples, dtype=np.int16)
+    except miniaudio.DecodeError as e:
+        raise AudioDecodeError(f"Failed to decode audio: {e}")
+
+
+def _compute_peaks(
+    samples: Iterator[np.ndarray], samples_per_peak: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce chunks of samples into the min and max of every samples_per_peak.
+
+    Samples left over at the end of a chunk are carried to the next one, so
+    peaks do not depend on the chunk size.
+
+    Args:
+        samples: Chunks of samples.
+        samples_per_peak: Number of samples of each peak.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Min and max peaks.
+    """
+    mins = [np.empty(0, dtype=np.int16)]
+    maxs = [np.empty(0, dtype=np.int16)]
+    carry = mins[0]
+    for chunk in samples:
+        chunk = np.concatenate((carry, chunk))
+        end = len(chunk) - len(chunk) % samples_per_peak
+        blocks = chunk[:end].reshape(-1, samples_per_peak)
+        mins.append(blocks.min(axis=1))
+        maxs.append(blocks.max(axis=1))
+        carry = chunk[end:]
+
+    if len(carry):
+        mins.append(carry.min(keepdims=True))
+        maxs.append(carry.max(keepdims=True))
+    return np.concatenate(mins), np.concatenate(maxs)
+
+
+def compute_waveforms(file: BinaryIO) -> dict[WaveformResolution, Waveform]:
+    """Compute the waveform of a MP3 file at every WAVEFORM_RESOLUTIONS.
+
+    The file is decoded once, in chunks, into the finest zoom level. Coarser
+    levels are reduced from its peaks.
+
+    Args:
+        file: MP3 file, read sequentially.
+
+    Returns:
+        dict[WaveformResolution, Waveform]: Waveforms by resolution.
+    """
+    finest_resolution = max(WAVEFORM_RESOLUTIONS)
+    samples_per_peak = WAVEFORM_SAMPLE_RATE // finest_resolution
+    mins, maxs = _compute_peaks(_iter_samples(file), samples_per_peak)
+    waveform = Waveform(
+        sample_rate=WAVEFORM_SAMPLE_RATE,
+        samples_per_peak=samples_per_peak,
+        mins=mins,
+        maxs=maxs,
+    )
+    return {
+        resolution: waveform.downsample(finest_resolution // resolution)
+        for resolution in WAVEFORM_RESOLUTIONS
+    }
@@ -1,15 +1,21 @@
 """AwsService interface to obtain a boto3 Client or boto3 Resource."""
+import threading
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 import boto3
 from boto3.resources.base import ServiceResource
 from botocore.client import BaseClient
+from botocore.config import Config
 
 from audio_api.aws.settings import get_settings
 
 settings = get_settings()
 
+# Creating clients from a shared session is not thread safe.
+_session_lock = threading.Lock()
+
 
 class AwsServices(str, Enum):
     """AwsServices Enum."""
@@ -18,28 +24,81 @@ class AwsServices(str, Enum):
     s3 = "s3"
 
 
+@lru_cache(maxsize=1)
+def get_session() -> boto3.session.Session:
+    """Get the boto3 Session shared by every client and resource."""
+    return boto3.session.Session(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_DEFAULT_REGION,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the botocore Config of every client, from AwsSettings."""
+    return Config(
+        max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.AWS_CONNECT_TIMEOUT,
+        read_timeout=settings.AWS_READ_TIMEOUT,
+        retries={
+            "mode": settings.AWS_RETRY_MODE.value,
+            "max_attempts": settings.AWS_MAX_ATTEMPTS,
+        },
+        tcp_keepalive=settings.AWS_TCP_KEEPALIVE,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_client(service_name: AwsServices) -> BaseClient:
+    """Create the shared client of a service.
+
+    Args:
+        service_name: AWS service of the client.
+
+    Returns:
+        BaseClient: Client of the service.
+    """
+    with _session_lock:
+        return get_session().client(
+            service_name=service_name.value,
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            config=get_config(),
+        )
+
+
+@lru_cache(maxsize=None)
+def _get_resource(service_name: AwsServices) -> ServiceResource:
+    """Create the shared resource of a service.
+
+    Args:
+        service_name: AWS service of the resource.
+
+    Returns:
+        ServiceResource: Resource of the service.
+    """
+    with _session_lock:
+        return get_session().resource(
+            service_name=service_name.value,
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            config=get_config(),
+        )
+
+
 @dataclass
 class AwsService:
-    """AwsService class used to get a client or resource."""
+    """AwsService class used to get a client or resource.
+
+    Clients and resources are created once per service from a shared session
+    and reused, so every caller shares their connection pool.
+    """
 
     service_name: AwsServices
 
     def get_client(self) -> BaseClient:
-        """Return a boto3 Client for a specified service_name."""
-        return boto3.client(
-            service_name=self.service_name,
-            endpoint_url=settings.AWS_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_DEFAULT_REGION,
-        )
+        """Return the shared boto3 Client of service_name."""
+        return _get_client(AwsServices(self.service_name))
 
     def get_resource(self) -> ServiceResource:
-        """Return a boto3 Resource for a specified service_name."""
-        return boto3.resource(
-            service_name=self.service_name,
-            endpoint_url=settings.AWS_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_DEFAULT_REGION,
-        )
+        """Return the shared boto3 Resource of service_name."""
+        return _get_resource(AwsServices(self.service_name))
@@ -0,0 +1,105 @@
+"""LRUCache class used as a read-through cache in front of DynamoDB and S3."""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """CacheStats class with cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_size: int
+
+
+class LRUCache:
+    """Thread safe, size bounded LRU cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Create a new cache.
+
+        Args:
+            max_size: Maximum number of entries, least recently used are evicted.
+            ttl_seconds: Seconds an entry can be served after being stored.
+            timer: Monotonic clock used to expire entries.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._timer = timer
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_size=max_size)
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Any | None: The cached value, None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value in the cache, evicting the least recently used if full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        with self._lock:
+            self._entries[key] = (self._timer() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Remove a value from the cache.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return self._stats.copy(update={"size": len(self._entries)})
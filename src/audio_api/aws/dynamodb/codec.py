@@ -0,0 +1,201 @@
+"""Precompiled codecs between pydantic models and the DynamoDB wire format."""
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.utils import lenient_issubclass
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+Decoder = Callable[[dict], Any]
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _encode_number(value: int | float | Decimal) -> dict:
+    return {"N": str(value)}
+
+
+def _encode_date(value: date) -> dict:
+    return {"S": value.isoformat()}
+
+
+_VALUE_ENCODERS: dict[type, Callable[[Any], dict]] = {
+    str: lambda value: {"S": value},
+    bool: lambda value: {"BOOL": value},
+    int: _encode_number,
+    float: _encode_number,
+    Decimal: _encode_number,
+    date: _encode_date,
+    datetime: _encode_date,
+    UUID: lambda value: {"S": str(value)},
+}
+
+_TYPE_DECODERS: dict[type, Decoder] = {
+    str: lambda value: value["S"],
+    bool: lambda value: value["BOOL"],
+    int: lambda value: int(value["N"]),
+    float: lambda value: float(value["N"]),
+    Decimal: lambda value: Decimal(value["N"]),
+    date: lambda value: date.fromisoformat(value["S"]),
+    datetime: lambda value: datetime.fromisoformat(value["S"]),
+    UUID: lambda value: UUID(value["S"]),
+}
+
+
+def encode_value(value: Any) -> dict:
+    """Encode a python value into a DynamoDB attribute value.
+
+    Args:
+        value: Value to encode.
+
+    Returns:
+        dict: Attribute value in wire format.
+    """
+    if encoder := _VALUE_ENCODERS.get(type(value)):
+        return encoder(value)
+    if isinstance(value, BaseModel):
+        value = value.dict(exclude_none=True)
+    if isinstance(value, dict):
+        return {"M": {k: encode_value(v) for k, v in value.items() if v is not None}}
+    if isinstance(value, list | tuple):
+        return {"L": [encode_value(v) for v in value]}
+    return _serializer.serialize(value)
+
+
+def _compile_decoder(field: ModelField) -> Decoder | None:
+    """Build the decoder of a single model field from its annotation.
+
+    Args:
+        field: Pydantic field to decode.
+
+    Returns:
+        Decoder | None: Decoder function, None if the field type is not supported.
+    """
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        item_decoder = _compile_decoder(field.sub_fields[0])
+        if item_decoder is None:
+            return None
+
+        def decoder(value: dict) -> list:
+            return [item_decoder(v) for v in value["L"]]
+
+    elif field.shape != SHAPE_SINGLETON or field.sub_fields:
+        return None
+    elif field.type_ in _TYPE_DECODERS:
+        decoder = _TYPE_DECODERS[field.type_]
+    elif lenient_issubclass(field.type_, BaseModel):
+        nested_codec = get_codec(field.type_)
+        if not nested_codec.compiled:
+            return None
+
+        def decoder(value: dict) -> BaseModel:
+            return nested_codec.decode(value["M"])
+
+    else:
+        return None
+
+    if not field.allow_none:
+        return decoder
+
+    def nullable_decoder(value: dict) -> Any:
+        return None if "NULL" in value else decoder(value)
+
+    return nullable_decoder
+
+
+class ItemCodec(Generic[ModelType]):
+    """ItemCodec class to convert DynamoDB wire items into models.
+
+    Decoders are compiled once per model from its field annotations, so decoding
+    builds models with construct and skips pydantic validation. Models with
+    validators or unsupported field types, and items that do not match the model
+    annotations, are decoded through the generic deserializer and validated.
+    """
+
+    def __init__(self, model: type[ModelType]):
+        """Compile the field decoders of a model.
+
+        Args:
+            model: Pydantic model decoded by this codec.
+        """
+        self.model = model
+        self.decoders: dict[str, tuple[str, Decoder]] = {}
+        self.required_attributes = frozenset(
+            field.alias for field in model.__fields__.values() if field.required
+        )
+        self.compiled = not (
+            model.__validators__
+            or model.__pre_root_validators__
+            or model.__post_root_validators__
+        )
+        for name, field in model.__fields__.items():
+            if (decoder := _compile_decoder(field)) is None:
+                self.compiled = False
+                break
+            self.decoders[field.alias] = (name, decoder)
+
+    def decode(self, wire_item: dict) -> ModelType:
+        """Decode an item in wire format into a model.
+
+        Args:
+            wire_item: Item as returned by the low-level DynamoDB client.
+
+        Returns:
+            ModelType: Decoded model.
+        """
+        if self.compiled and self.required_attributes <= wire_item.keys():
+            try:
+                return self.model.construct(
+                    **{
+                        name: decoder(wire_item[alias])
+                        for alias, (name, decoder) in self.decoders.items()
+                        if alias in wire_item
+                    }
+                )
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                pass
+        return self.model(**self.to_python(wire_item))
+
+    @staticmethod
+    def to_python(wire_item: dict) -> dict:
+        """Decode an item in wire format into a dict of python values.
+
+        Args:
+            wire_item: Item as returned by the low-level DynamoDB client.
+
+        Returns:
+            dict: Item values.
+        """
+        return {k: _deserializer.deserialize(v) for k, v in wire_item.items()}
+
+    @staticmethod
+    def encode(item: dict) -> dict:
+        """Encode item values into wire format, skipping null values.
+
+        Args:
+            item: Item values.
+
+        Returns:
+            dict: Item in wire format.
+        """
+        return {k: encode_value(v) for k, v in item.items() if v is not None}
+
+
+@lru_cache(maxsize=None)
+def get_codec(model: type[ModelType]) -> ItemCodec[ModelType]:
+    """Get the ItemCodec of a model, compiled on first use.
+
+    Args:
+        model: Pydantic model to decode.
+
+    Returns:
+        ItemCodec[ModelType]: Codec of the model.
+    """
+    return ItemCodec(model)
@@ -11,3 +11,11 @@ class DynamoDbItemNotFoundError(Exception):
 
 class DynamoDbStatusError(Exception):
     """DynamoDbStatusError class to handle DynamoDB errors."""
+
+
+class DynamoDbInvalidCursorError(Exception):
+    """DynamoDbInvalidCursorError class to handle malformed pagination cursors."""
+
+
+class DynamoDbVersionConflictError(Exception):
+    """DynamoDbVersionConflictError class to handle stale optimistic updates."""
@@ -0,0 +1,92 @@
+"""Compiled DynamoDB update expressions."""
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+AttributePath = tuple[str, ...]
+
+
+class UpdateExpressionTemplate(NamedTuple):
+    """UpdateExpressionTemplate class.
+
+    An UpdateExpression with its attribute name placeholders, compiled once per
+    model and set of updated attributes. Updates only bind their values.
+    """
+
+    update_expression: str
+    attribute_names: dict[str, str]
+    value_placeholders: tuple[tuple[AttributePath, str], ...]
+    constant_values: dict[str, Any]
+
+    def bind(self, values: dict) -> dict:
+        """Build the ExpressionAttributeValues of an update.
+
+        Args:
+            values: Updated values, nested like the attribute paths.
+
+        Returns:
+            dict: Values by placeholder.
+        """
+        attribute_values = dict(self.constant_values)
+        for path, placeholder in self.value_placeholders:
+            value = values
+            for name in path:
+                value = value[name]
+            attribute_values[placeholder] = value
+        return attribute_values
+
+
+@lru_cache(maxsize=1024)
+def compile_update_expression(
+    model: type,
+    set_paths: tuple[AttributePath, ...],
+    remove_paths: tuple[AttributePath, ...] = (),
+    version_attribute: str | None = None,
+) -> UpdateExpressionTemplate:
+    """Compile the UpdateExpression setting and removing attribute paths.
+
+    Args:
+        model: Update model class, only used to scope the cache.
+        set_paths: Attribute paths to set, nested paths are document paths.
+        remove_paths: Attribute paths to remove.
+        version_attribute: Attribute to increment on every update, if any.
+
+    Returns:
+        UpdateExpressionTemplate: Compiled expression.
+    """
+    attribute_names = {}
+    name_placeholders = {}
+
+    def _placeholder_path(path: AttributePath) -> str:
+        for name in path:
+            if name not in name_placeholders:
+                name_placeholders[name] = f"#n{len(name_placeholders)}"
+                attribute_names[name_placeholders[name]] = name
+        return ".".join(name_placeholders[name] for name in path)
+
+    value_placeholders = tuple(
+        (path, f":v{index}") for index, path in enumerate(set_paths)
+    )
+    set_actions = [
+        f"{_placeholder_path(path)} = {placeholder}"
+        for path, placeholder in value_placeholders
+    ]
+    constant_values = {}
+    if version_attribute:
+        # Fixed placeholder, so condition expressions can reference the version.
+        attribute_names["#version"] = version_attribute
+        set_actions.append(
+            "#version = if_not_exists(#version, :version_zero) + :version_one"
+        )
+        constant_values = {":version_zero": 0, ":version_one": 1}
+
+    update_expression = "SET " + ", ".join(set_actions) if set_actions else ""
+    if remove_paths:
+        remove_actions = ", ".join(_placeholder_path(path) for path in remove_paths)
+        update_expression = f"{update_expression} REMOVE {remove_actions}".strip()
+
+    return UpdateExpressionTemplate(
+        update_expression=update_expression,
+        attribute_names=attribute_names,
+        value_placeholders=value_placeholders,
+        constant_values=constant_values,
+    )
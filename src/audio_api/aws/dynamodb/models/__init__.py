@@ -1,5 +1,8 @@
 from audio_api.aws.dynamodb.models.base_model import (
+    DynamoDbBatchItemResult,
+    DynamoDbBatchItemStatus,
     DynamoDbItemModel,
+    DynamoDbPage,
     DynamoDbPutItemModel,
     DynamoDbUpdateItemModel,
 )
@@ -8,3 +11,18 @@ from audio_api.aws.dynamodb.models.radio_program import (
     RadioProgramPutItemModel,
     RadioProgramUpdateItemModel,
 )
+from audio_api.aws.dynamodb.models.radio_program_file_reference import (
+    RadioProgramFileReferenceItemModel,
+    RadioProgramFileReferencePutItemModel,
+    RadioProgramFileReferenceUpdateItemModel,
+)
+from audio_api.aws.dynamodb.models.radio_program_job import (
+    RadioProgramJobItemModel,
+    RadioProgramJobPutItemModel,
+    RadioProgramJobUpdateItemModel,
+)
+from audio_api.aws.dynamodb.models.radio_program_upload import (
+    RadioProgramUploadItemModel,
+    RadioProgramUploadPutItemModel,
+    RadioProgramUploadUpdateItemModel,
+)
@@ -1,5 +1,11 @@
 """DynamoDbItemBaseModel classes."""
+from enum import Enum
+from typing import Generic, TypeVar
+
 from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+ItemType = TypeVar("ItemType")
 
 
 class DynamoDbItemModel(BaseModel):
@@ -12,3 +18,34 @@ class DynamoDbPutItemModel(BaseModel):
 
 class DynamoDbUpdateItemModel(BaseModel):
     """DynamoDbUpdateItemModel class."""
+
+
+class DynamoDbPage(GenericModel, Generic[ItemType]):
+    """DynamoDbPage class.
+
+    A single page of items and the opaque cursor to request the next one.
+    """
+
+    items: list[ItemType]
+    next_cursor: str | None
+
+
+class DynamoDbBatchItemStatus(str, Enum):
+    """Outcome of a single item in a batch write."""
+
+    succeeded = "succeeded"
+    not_found = "not_found"
+    conflict = "conflict"
+    failed = "failed"
+
+
+class DynamoDbBatchItemResult(GenericModel, Generic[ItemType]):
+    """DynamoDbBatchItemResult class.
+
+    Result of a single item in a batch write, in the same order as the request.
+    """
+
+    id: str
+    status: DynamoDbBatchItemStatus
+    item: ItemType | None
+    error: str | None
@@ -0,0 +1,34 @@
+"""RadioProgramFileReference DynamoDB Models."""
+from pydantic import BaseModel
+
+from audio_api.aws.dynamodb.models import (
+    DynamoDbItemModel,
+    DynamoDbPutItemModel,
+    DynamoDbUpdateItemModel,
+)
+
+
+class BaseRadioProgramFileReferenceModel(BaseModel):
+    """BaseRadioProgramFileReferenceModel class."""
+
+    references: int
+
+
+class RadioProgramFileReferenceItemModel(
+    DynamoDbItemModel, BaseRadioProgramFileReferenceModel
+):
+    """RadioProgramFileReferenceItemModel class."""
+
+    file_name: str
+
+
+class RadioProgramFileReferencePutItemModel(
+    DynamoDbPutItemModel, BaseRadioProgramFileReferenceModel
+):
+    """RadioProgramFileReferencePutItemModel class."""
+
+
+class RadioProgramFileReferenceUpdateItemModel(
+    DynamoDbUpdateItemModel, BaseRadioProgramFileReferenceModel
+):
+    """RadioProgramFileReferenceUpdateItemModel class."""
@@ -0,0 +1,38 @@
+"""RadioProgramJob DynamoDB Models."""
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from audio_api.aws.dynamodb.models import (
+    DynamoDbItemModel,
+    DynamoDbPutItemModel,
+    DynamoDbUpdateItemModel,
+)
+from audio_api.domain.models import (
+    BaseRadioProgramJobModel,
+    RadioProgramJobModel,
+    RadioProgramJobStatus,
+)
+
+
+class RadioProgramJobItemModel(DynamoDbItemModel, RadioProgramJobModel):
+    """RadioProgramJobItemModel class."""
+
+    # Running jobs can be claimed again once their lease expires
+    lease_expires_at: datetime | None
+
+
+class RadioProgramJobPutItemModel(DynamoDbPutItemModel, BaseRadioProgramJobModel):
+    """RadioProgramJobPutItemModel class."""
+
+    lease_expires_at: datetime | None
+
+
+class RadioProgramJobUpdateItemModel(DynamoDbUpdateItemModel, BaseModel):
+    """RadioProgramJobUpdateItemModel class."""
+
+    status: RadioProgramJobStatus | None
+    result: dict[str, Any] | None
+    error: str | None
+    updated_at: datetime | None
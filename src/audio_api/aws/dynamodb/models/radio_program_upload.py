@@ -0,0 +1,32 @@
+"""RadioProgramUpload DynamoDB Models."""
+from pydantic import BaseModel
+
+from audio_api.aws.dynamodb.models import (
+    DynamoDbItemModel,
+    DynamoDbPutItemModel,
+    DynamoDbUpdateItemModel,
+)
+
+
+class BaseRadioProgramUploadModel(BaseModel):
+    """BaseRadioProgramUploadModel class."""
+
+    upload_id: str | None
+    # Epoch seconds, so it can be used as the table TTL attribute
+    expires_at: int
+
+
+class RadioProgramUploadItemModel(DynamoDbItemModel, BaseRadioProgramUploadModel):
+    """RadioProgramUploadItemModel class."""
+
+    file_name: str
+
+
+class RadioProgramUploadPutItemModel(DynamoDbPutItemModel, BaseRadioProgramUploadModel):
+    """RadioProgramUploadPutItemModel class."""
+
+
+class RadioProgramUploadUpdateItemModel(
+    DynamoDbUpdateItemModel, BaseRadioProgramUploadModel
+):
+    """RadioProgramUploadUpdateItemModel class."""
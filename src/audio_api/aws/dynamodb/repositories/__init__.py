@@ -1,2 +1,11 @@
 from audio_api.aws.dynamodb.repositories.base_repository import BaseDynamoDbRepository
+from audio_api.aws.dynamodb.repositories.radio_program_file_references import (
+    radio_program_file_references_repository,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_jobs import (
+    radio_program_jobs_repository,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_uploads import (
+    radio_program_uploads_repository,
+)
 from audio_api.aws.dynamodb.repositories.radio_programs import radio_programs_repository
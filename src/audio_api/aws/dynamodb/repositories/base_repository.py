@@ -1,24 +1,42 @@
 """BaseDynamoDbRepository class."""
+import base64
+import json
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Any, Generic, TypeVar
 from uuid import UUID, uuid4
 
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
+from pydantic.utils import lenient_issubclass
 
 from audio_api.aws.aws_service import AwsService, AwsServices
+from audio_api.aws.cache import CacheStats, LRUCache
+from audio_api.aws.dynamodb.codec import encode_value, get_codec
 from audio_api.aws.dynamodb.exceptions import (
     DynamoDbClientError,
+    DynamoDbInvalidCursorError,
     DynamoDbItemNotFoundError,
     DynamoDbStatusError,
+    DynamoDbVersionConflictError,
 )
+from audio_api.aws.dynamodb.expressions import compile_update_expression
 from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemResult,
+    DynamoDbBatchItemStatus,
     DynamoDbItemModel,
+    DynamoDbPage,
     DynamoDbPutItemModel,
     DynamoDbUpdateItemModel,
 )
 from audio_api.aws.dynamodb.tables import dynamodb_tables
+from audio_api.aws.retries import exponential_backoff
 from audio_api.aws.settings import get_settings
 from audio_api.logger.logger import get_logger
 
@@ -30,15 +48,21 @@ ModelType = TypeVar("ModelType", bound=DynamoDbItemModel)
 PutItemModelType = TypeVar("PutItemModelType", bound=DynamoDbPutItemModel)
 UpdateItemModelType = TypeVar("UpdateItemModelType", bound=DynamoDbUpdateItemModel)
 
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+VERSION_ATTRIBUTE = "version"
+_SEGMENT_DONE = object()
+
 
 def serialize(obj_in: dict) -> dict:
     """Serialize a python object into DynamoDB."""
 
     def _get_type(v):
-        if isinstance(v, date):
-            return v.strftime("%Y-%m-%d")
+        # datetime is a subclass of date, so it must be checked first.
         if isinstance(v, datetime):
             return v.isoformat()
+        if isinstance(v, date):
+            return v.strftime("%Y-%m-%d")
         return v
 
     return {k: _get_type(v) for k, v in obj_in.items()}
@@ -52,63 +76,115 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
     def __init__(
         self,
         model: type[ModelType],
+        cache: LRUCache | None = None,
     ):
         """Repository with default methods to Create, Read, Update, Delete (CRUD).
 
         Args:
             model: A DynamoDbItemModel class.
+            cache: Optional read-through cache for items retrieved by id.
         """
         self.model = model
+        self.codec = get_codec(model)
+        self.cache = cache
         self.dynamodb_client = self.service.get_client()
         self.dynamodb_resource = self.service.get_resource()
         self.table_name = dynamodb_tables[self.model].table_name
         self.table = self.dynamodb_resource.Table(self.table_name)
 
-    @classmethod
-    def _build_update_query_expression(cls, update_item: ModelType) -> dict:
-        """Build a dict with the update query parameters from a pydantic BaseModel.
+    def _index_attributes(self, item: dict) -> dict:
+        """Return the attributes needed to index an item in the table GSIs.
+
+        Repositories whose tables declare global secondary indexes override this
+        to derive index keys from the item values.
+
+        Args:
+            item: Item values, before serialization.
+
+        Returns:
+            dict: Attributes to store together with the item.
+        """
+        return {}
+
+    @staticmethod
+    def _build_update_item_dict(update_item: BaseModel) -> dict:
+        """Build the top level attributes set by an update from a pydantic BaseModel.
 
         Args:
               update_item: Model containing the values to update.
 
         Returns:
-              dict: Containing the update_query values used in update_item.
+              dict: Serialized attributes to set, empty values are skipped.
         """
 
-        def _build_update_item_dict(item: BaseModel):
-            def _parse_value(val: Any):
-                if isinstance(val, dict):
-                    return {k: _parse_value(v) for k, v in val.items() if v}
-                return val
+        def _parse_value(val: Any):
+            if isinstance(val, dict):
+                return {k: _parse_value(v) for k, v in val.items() if v}
+            return val
 
-            return _parse_value(serialize(item.dict(exclude_none=True)))
+        return _parse_value(serialize(update_item.dict(exclude_none=True)))
 
-        update_item_dict = _build_update_item_dict(update_item)
-        attributes = {
-            param: {"name": f"#{param}", "value": value, "expression": f":{param}_"}
-            for param, value in update_item_dict.items()
-        }
+    @classmethod
+    def _build_update_query_expression(
+        cls,
+        update_item: ModelType,
+        extra_attributes: dict | None = None,
+        version_attribute: str | None = None,
+        document_paths: bool = True,
+    ) -> dict:
+        """Build a dict with the update query parameters from a pydantic BaseModel.
 
-        attribute_names = {
-            param["name"]: param_name for param_name, param in attributes.items()
-        }
-        attribute_values = {
-            param["expression"]: param["value"] for param in attributes.values()
-        }
-        update_values = [
-            f" {param['name']} = {param['expression']}" for param in attributes.values()
-        ]
-        update_expression = "SET" + ",".join(update_values)
+        The expression is compiled once per model and set of updated attributes.
+        Nested models are updated through document paths: their present fields
+        are set and their missing fields removed, instead of rewriting the map.
 
+        Args:
+              update_item: Model containing the values to update.
+              extra_attributes: Additional top level attributes to set.
+              version_attribute: Attribute to increment on every update, if any.
+              document_paths: Whether to update nested models field by field.
+
+        Returns:
+              dict: Containing the update_query values used in update_item.
+        """
+        update_item_dict = cls._build_update_item_dict(update_item)
+        update_item_dict.update(extra_attributes or {})
+
+        set_paths = []
+        remove_paths = []
+        for name, value in update_item_dict.items():
+            field = update_item.__fields__.get(name)
+            if (
+                document_paths
+                and isinstance(value, dict)
+                and field
+                and lenient_issubclass(field.type_, BaseModel)
+            ):
+                set_paths += [(name, key) for key in value]
+                remove_paths += [
+                    (name, key) for key in field.type_.__fields__ if key not in value
+                ]
+            else:
+                set_paths.append((name,))
+
+        template = compile_update_expression(
+            type(update_item),
+            tuple(set_paths),
+            tuple(remove_paths),
+            version_attribute,
+        )
         return {
-            "attribute_names": attribute_names,
-            "attribute_values": attribute_values,
-            "update_expression": update_expression,
+            "attribute_names": dict(template.attribute_names),
+            "attribute_values": template.bind(update_item_dict),
+            "update_expression": template.update_expression,
         }
 
     def get_item(self, item_id: UUID) -> ModelType:
         """Get a single DynamoDB item by item_id.
 
+        Read paths use the low-level client and decode items with the model
+        codec, skipping the resource deserializer and pydantic validation.
+
         Args:
             item_id: The item_id to retrieve.
 
@@ -120,11 +196,12 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
         Returns:
             ModelType: The retrieved item.
         """
-        key_condition = Key("id").eq(str(item_id))
+        if self.cache and (cached_item := self.cache.get(str(item_id))):
+            return cached_item.copy(deep=True)
 
         try:
-            response = self.table.query(
-                ScanIndexForward=False, KeyConditionExpression=key_condition
+            response = self.dynamodb_client.get_item(
+                TableName=self.table_name, Key={"id": {"S": str(item_id)}}
             )
         except ClientError as e:
             logger.error(f"Failed to get_item {item_id} from {self.table_name} table.")
@@ -133,27 +210,163 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
         if status := response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 200:
             logger.error(f"Failed to get_item {item_id} on {self.table_name} table.")
             raise DynamoDbStatusError(
-                f"Unsuccessful table.query response. Status: {status}"
+                f"Unsuccessful get_item response. Status: {status}"
             )
 
-        result_query = response.get("Items")
-        if not result_query:
+        wire_item = response.get("Item")
+        if not wire_item:
             raise DynamoDbItemNotFoundError(f"Item {item_id} does not exist.")
 
-        return self.model(**result_query[0])
+        item = self.codec.decode(wire_item)
+        if self.cache:
+            self.cache.set(str(item_id), item.copy(deep=True))
+        return item
 
-    def get_items(self) -> list[ModelType]:
-        """Get all DynamoDB items in the table.
+    def cache_stats(self) -> CacheStats | None:
+        """Return the read-through cache counters, None if there is no cache."""
+        return self.cache.stats() if self.cache else None
+
+    def _invalidate_cache(self, item_id: UUID | str) -> None:
+        """Remove an item from the read-through cache.
+
+        Args:
+            item_id: Id of the item to remove.
+        """
+        if self.cache:
+            self.cache.invalidate(str(item_id))
+
+    @staticmethod
+    def _encode_cursor(last_evaluated_key: dict) -> str:
+        """Encode a DynamoDB LastEvaluatedKey into an opaque, url-safe cursor.
+
+        Args:
+            last_evaluated_key: LastEvaluatedKey returned by a scan or query, in
+                wire format.
+
+        Returns:
+            str: Opaque cursor.
+        """
+        cursor = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True)
+        return base64.urlsafe_b64encode(cursor.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> dict:
+        """Decode an opaque cursor back into a DynamoDB ExclusiveStartKey.
+
+        Args:
+            cursor: Cursor previously returned by _encode_cursor.
+
+        Raises:
+            DynamoDbInvalidCursorError: If the cursor is malformed.
+
+        Returns:
+            dict: ExclusiveStartKey to resume a scan or query, in wire format.
+        """
+        deserializer = TypeDeserializer()
+        try:
+            padded_cursor = cursor + "=" * (-len(cursor) % 4)
+            wire_key = json.loads(base64.urlsafe_b64decode(padded_cursor.encode()))
+            # Only keep cursors made of valid attribute values.
+            for value in wire_key.values():
+                deserializer.deserialize(value)
+            return wire_key
+        except (ValueError, TypeError, AttributeError) as e:
+            raise DynamoDbInvalidCursorError(f"Invalid cursor {cursor}: {e}")
+
+    def _batch_get(self, keys: list[dict]) -> list[dict]:
+        """Get up to 100 items in a single BatchGetItem request.
+
+        Unprocessed keys are retried with exponential backoff.
+
+        Args:
+            keys: Primary keys of the items to retrieve, in wire format.
 
         Raises:
             DynamoDbClientError: If failed to get items from DynamoDB.
             DynamoDbStatusError: If received error status code.
 
         Returns:
-            list[ModelType]: List containing all received items.
+            list[dict]: Retrieved items in wire format, in no particular order.
+        """
+        items = []
+        request_items = {self.table_name: {"Keys": keys}}
+        for attempt in range(settings.DYNAMODB_BATCH_MAX_ATTEMPTS):
+            try:
+                response = self.dynamodb_client.batch_get_item(
+                    RequestItems=request_items
+                )
+            except ClientError as e:
+                logger.error(f"Failed to batch_get_item from {self.table_name} table.")
+                raise DynamoDbClientError(f"Failed to get items from DynamoDB: {e}")
+
+            status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status != 200:
+                logger.error(f"Failed to batch_get_item on {self.table_name} table.")
+                raise DynamoDbStatusError(
+                    f"Unsuccessful batch_get_item response. Status: {status}"
+                )
+
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                return items
+            time.sleep(exponential_backoff(attempt))
+
+        logger.error(f"Failed to batch_get_item from {self.table_name} table.")
+        raise DynamoDbClientError(
+            f"Failed to get {len(request_items[self.table_name]['Keys'])} items "
+            "from DynamoDB after retries."
+        )
+
+    def get_items_by_ids(self, item_ids: Iterable[UUID]) -> list[ModelType]:
+        """Get several DynamoDB items by id using BatchGetItem.
+
+        Ids are requested in chunks of 100 keys, the BatchGetItem limit. Ids found
+        in the read-through cache are not requested.
+
+        Args:
+            item_ids: The item ids to retrieve.
+
+        Returns:
+            list[ModelType]: Existing items in the requested order. Missing ids
+                are skipped.
+        """
+        unique_ids = list(dict.fromkeys(str(item_id) for item_id in item_ids))
+        items = {}
+        if self.cache:
+            for item_id in unique_ids:
+                if cached_item := self.cache.get(item_id):
+                    items[item_id] = cached_item.copy(deep=True)
+
+        missing_ids = [item_id for item_id in unique_ids if item_id not in items]
+        for start in range(0, len(missing_ids), BATCH_GET_MAX_KEYS):
+            end = start + BATCH_GET_MAX_KEYS
+            keys = [{"id": {"S": item_id}} for item_id in missing_ids[start:end]]
+            for wire_item in self._batch_get(keys):
+                item_id = wire_item["id"]["S"]
+                items[item_id] = self.codec.decode(wire_item)
+                if self.cache:
+                    self.cache.set(item_id, items[item_id].copy(deep=True))
+
+        return [items[item_id] for item_id in unique_ids if item_id in items]
+
+    def _scan(self, **scan_kwargs) -> dict:
+        """Run a single client.scan call and validate its response.
+
+        Args:
+            scan_kwargs: Extra arguments passed to client.scan, in wire format.
+
+        Raises:
+            DynamoDbClientError: If failed to get items from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            dict: The client.scan response.
         """
         try:
-            response = self.table.scan()
+            response = self.dynamodb_client.scan(
+                TableName=self.table_name, **scan_kwargs
+            )
         except ClientError as e:
             logger.error(f"Failed to get_items from {self.table_name} table.")
             raise DynamoDbClientError(f"Failed to get items from DynamoDB: {e}")
@@ -161,10 +374,178 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
         if status := response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 200:
             logger.error(f"Failed to get_items on {self.table_name} table.")
             raise DynamoDbStatusError(
-                f"Unsuccessful table.scan response. Status: {status}"
+                f"Unsuccessful client.scan response. Status: {status}"
+            )
+
+        return response
+
+    @staticmethod
+    def _build_key_condition(key_condition: ConditionBase) -> dict:
+        """Build the client.query arguments of a key condition.
+
+        Args:
+            key_condition: Key condition on the table or index keys.
+
+        Returns:
+            dict: KeyConditionExpression and its placeholders, in wire format.
+        """
+        (
+            expression,
+            attribute_names,
+            attribute_values,
+        ) = ConditionExpressionBuilder().build_expression(
+            key_condition, is_key_condition=True
+        )
+        return {
+            "KeyConditionExpression": expression,
+            "ExpressionAttributeNames": attribute_names,
+            "ExpressionAttributeValues": {
+                name: encode_value(value) for name, value in attribute_values.items()
+            },
+        }
+
+    def _query(self, **query_kwargs) -> dict:
+        """Run a single client.query call and validate its response.
+
+        Args:
+            query_kwargs: Extra arguments passed to client.query, in wire format.
+
+        Raises:
+            DynamoDbClientError: If failed to query items from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            dict: The client.query response.
+        """
+        try:
+            response = self.dynamodb_client.query(
+                TableName=self.table_name, **query_kwargs
+            )
+        except ClientError as e:
+            logger.error(f"Failed to query {self.table_name} table.")
+            raise DynamoDbClientError(f"Failed to query items from DynamoDB: {e}")
+
+        if status := response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 200:
+            logger.error(f"Failed to query {self.table_name} table.")
+            raise DynamoDbStatusError(
+                f"Unsuccessful client.query response. Status: {status}"
             )
 
-        return [self.model(**item) for item in response.get("Items", [])]
+        return response
+
+    def query_index(
+        self,
+        index_name: str,
+        key_condition: ConditionBase,
+        scan_forward: bool = True,
+    ) -> list[ModelType]:
+        """Get all items matching a key condition on a global secondary index.
+
+        Args:
+            index_name: Name of the index to query.
+            key_condition: Key condition on the index keys.
+            scan_forward: Whether to sort results by ascending sort key.
+
+        Returns:
+            list[ModelType]: Items matching the key condition.
+        """
+        query_kwargs = {
+            "IndexName": index_name,
+            "ScanIndexForward": scan_forward,
+            **self._build_key_condition(key_condition),
+        }
+        response = self._query(**query_kwargs)
+        items = [self.codec.decode(item) for item in response.get("Items", [])]
+        while last_evaluated_key := response.get("LastEvaluatedKey"):
+            response = self._query(**query_kwargs, ExclusiveStartKey=last_evaluated_key)
+            items.extend(self.codec.decode(item) for item in response.get("Items", []))
+
+        return items
+
+    def query_index_page(
+        self,
+        index_name: str,
+        key_condition: ConditionBase,
+        limit: int,
+        cursor: str | None = None,
+        scan_forward: bool = True,
+    ) -> DynamoDbPage[ModelType]:
+        """Get a single page of items matching a key condition on an index.
+
+        Args:
+            index_name: Name of the index to query.
+            key_condition: Key condition on the index keys.
+            limit: Maximum number of items to read in this page.
+            cursor: Cursor returned by a previous page, None to start from the top.
+            scan_forward: Whether to sort results by ascending sort key.
+
+        Returns:
+            DynamoDbPage[ModelType]: Page items and the cursor to the next page.
+        """
+        query_kwargs = {
+            "IndexName": index_name,
+            "ScanIndexForward": scan_forward,
+            "Limit": limit,
+            **self._build_key_condition(key_condition),
+        }
+        if cursor:
+            query_kwargs["ExclusiveStartKey"] = self._decode_cursor(cursor)
+
+        response = self._query(**query_kwargs)
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        return DynamoDbPage[self.model](
+            items=[self.codec.decode(item) for item in response.get("Items", [])],
+            next_cursor=(
+                self._encode_cursor(last_evaluated_key) if last_evaluated_key else None
+            ),
+        )
+
+    def get_items(self, total_segments: int = 1) -> list[ModelType]:
+        """Get all DynamoDB items in the table.
+
+        Follows LastEvaluatedKey until the whole table has been read.
+
+        Args:
+            total_segments: If greater than 1, read the table with a parallel scan.
+
+        Returns:
+            list[ModelType]: List containing all received items.
+        """
+        if total_segments > 1:
+            return list(self.iter_items(total_segments=total_segments))
+
+        response = self._scan()
+        items = [self.codec.decode(item) for item in response.get("Items", [])]
+        while last_evaluated_key := response.get("LastEvaluatedKey"):
+            response = self._scan(ExclusiveStartKey=last_evaluated_key)
+            items.extend(self.codec.decode(item) for item in response.get("Items", []))
+
+        return items
+
+    def get_items_page(
+        self, limit: int, cursor: str | None = None
+    ) -> DynamoDbPage[ModelType]:
+        """Get a single page of DynamoDB items in the table.
+
+        Args:
+            limit: Maximum number of items to evaluate in this page.
+            cursor: Cursor returned by a previous page, None to start from the top.
+
+        Returns:
+            DynamoDbPage[ModelType]: Page items and the cursor to the next page.
+        """
+        scan_kwargs = {"Limit": limit}
+        if cursor:
+            scan_kwargs["ExclusiveStartKey"] = self._decode_cursor(cursor)
+
+        response = self._scan(**scan_kwargs)
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        return DynamoDbPage[self.model](
+            items=[self.codec.decode(item) for item in response.get("Items", [])],
+            next_cursor=(
+                self._encode_cursor(last_evaluated_key) if last_evaluated_key else None
+            ),
+        )
 
     def put_item(self, item: PutItemModelType) -> ModelType:
         """Create a new item to DynamoDB table.
@@ -179,12 +560,16 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
         Returns:
             ModelType: Retrieved item from DynamoDB.
         """
-        item_dict = item.dict()
+        # Null attributes are not stored: they cannot be used as index keys.
+        item_dict = item.dict(exclude_none=True)
         item_id = str(uuid4())
         item_dict["id"] = item_id
+        item_dict[VERSION_ATTRIBUTE] = 1
 
         try:
-            response = self.table.put_item(Item=serialize(item_dict))
+            response = self.table.put_item(
+                Item=serialize({**item_dict, **self._index_attributes(item_dict)})
+            )
         except ClientError as e:
             logger.error(f"Failed to put_item {item_id} on {self.table_name} table.")
             raise DynamoDbClientError(f"Failed to store new item in DynamoDB: {e}")
@@ -195,36 +580,79 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
                 f"Unsuccessful put_object response. Status: {status}"
             )
 
+        self._invalidate_cache(item_id)
         logger.info(f"Successfully put_item {item_id} on {self.table_name} table.")
         return self.model(**item_dict)
 
-    def update_item(self, item_id: UUID, item: UpdateItemModelType) -> ModelType:
-        """Update an existing item in DynamoDB table.
+    def update_item_with_previous(
+        self,
+        item_id: UUID,
+        item: UpdateItemModelType,
+        expected_version: int | None = None,
+    ) -> tuple[ModelType, ModelType]:
+        """Update an existing item in a single round trip, returning both versions.
+
+        The stored item is returned by the write itself (ReturnValues=ALL_OLD) and
+        the updated item is built from it, so no separate read is needed. Every
+        update increments the item version. If expected_version is provided, the
+        update only succeeds if the stored item still has that version.
 
         Args:
             item_id: Item id to be updated.
             item: Model containing updated data.
+            expected_version: Version the stored item must have, if any.
 
         Raises:
             DynamoDbClientError: If failed to update item in DynamoDB.
             DynamoDbItemNotFoundError: If item_id does not exist.
             DynamoDbStatusError: If received error status code.
+            DynamoDbVersionConflictError: If the stored item has another version.
 
         Returns:
-            dict containing the updated solution.
+            tuple[ModelType, ModelType]: The item before and after the update.
         """
-        update_query = self._build_update_query_expression(item)
+        update_item_dict = self._build_update_item_dict(item)
+        index_attributes = self._index_attributes(
+            {**item.dict(exclude_none=True), "id": str(item_id)}
+        )
+        condition_expression = "attribute_exists(id)"
+        if expected_version is not None:
+            condition_expression += " AND #version = :expected_version"
 
-        try:
-            response = self.table.update_item(
+        def _update_item(document_paths: bool) -> dict:
+            update_query = self._build_update_query_expression(
+                item,
+                extra_attributes=index_attributes,
+                version_attribute=VERSION_ATTRIBUTE,
+                document_paths=document_paths,
+            )
+            attribute_values = update_query["attribute_values"]
+            if expected_version is not None:
+                attribute_values[":expected_version"] = expected_version
+            return self.table.update_item(
                 Key={"id": str(item_id)},
-                ConditionExpression="attribute_exists(id)",
+                ConditionExpression=condition_expression,
                 ExpressionAttributeNames=update_query["attribute_names"],
-                ExpressionAttributeValues=update_query["attribute_values"],
+                ExpressionAttributeValues=attribute_values,
                 UpdateExpression=update_query["update_expression"],
-                ReturnValues="ALL_NEW",
+                ReturnValues="ALL_OLD",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
             )
-        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+
+        try:
+            try:
+                response = _update_item(document_paths=True)
+            except ClientError as e:
+                # Document paths fail if the stored item lacks the nested map.
+                if "document path" not in e.response["Error"].get("Message", ""):
+                    raise
+                response = _update_item(document_paths=False)
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException as e:
+            if e.response.get("Item"):
+                logger.error(f"Item {item_id} is not at version {expected_version}.")
+                raise DynamoDbVersionConflictError(
+                    f"Item {item_id} is not at version {expected_version}."
+                )
             logger.error(f"Item {item_id} does not exist.")
             raise DynamoDbItemNotFoundError(f"Item {item_id} does not exist.")
         except ClientError as e:
@@ -236,8 +664,29 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
                 f"Unsuccessful put_object response. Status: {status}"
             )
 
+        self._invalidate_cache(item_id)
         logger.info(f"Successfully update_item {item_id} on {self.table_name} table.")
-        return self.model(**response["Attributes"])
+        previous_item = response["Attributes"]
+        updated_item = {
+            **previous_item,
+            **update_item_dict,
+            **index_attributes,
+            VERSION_ATTRIBUTE: previous_item.get(VERSION_ATTRIBUTE, 0) + 1,
+        }
+        return self.model(**previous_item), self.model(**updated_item)
+
+    def update_item(self, item_id: UUID, item: UpdateItemModelType) -> ModelType:
+        """Update an existing item in DynamoDB table.
+
+        Args:
+            item_id: Item id to be updated.
+            item: Model containing updated data.
+
+        Returns:
+            dict containing the updated solution.
+        """
+        _, updated_item = self.update_item_with_previous(item_id=item_id, item=item)
+        return updated_item
 
     def delete_item(self, item_id: UUID) -> None:
         """Delete an item from the DynamoDB table based on the provided id.
@@ -269,15 +718,541 @@ class BaseDynamoDbRepository(Generic[ModelType, PutItemModelType, UpdateItemMode
                 f"Unsuccessful delete_item response. Status: {status}"
             )
 
+        self._invalidate_cache(item_id)
         logger.info(f"Successfully delete_item {item_id} on {self.table_name} table.")
 
-    def delete_all(self) -> None:
-        """Delete all objects from dynamodb table."""
-        scan = self.table.scan(
-            ProjectionExpression="#k",
-            ExpressionAttributeNames={"#k": "id"},
+    def _iter_segment_pages(
+        self, segment: int, total_segments: int, deserialize: bool = True, **scan_kwargs
+    ) -> Iterator[list[dict]]:
+        """Scan a single segment of the table, yielding one list of items per page.
+
+        Uses the low-level client, which is safe to share between threads.
+
+        Args:
+            segment: Segment to scan.
+            total_segments: Total number of segments the table is split into.
+            deserialize: Whether to convert items from DynamoDB wire format.
+            scan_kwargs: Extra arguments passed to client.scan.
+
+        Raises:
+            DynamoDbClientError: If failed to get items from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Yields:
+            list[dict]: Items from a single scan page.
+        """
+        scan_kwargs = {
+            "TableName": self.table_name,
+            "Segment": segment,
+            "TotalSegments": total_segments,
+            **scan_kwargs,
+        }
+        while True:
+            try:
+                response = self.dynamodb_client.scan(**scan_kwargs)
+            except ClientError as e:
+                logger.error(
+                    f"Failed to scan segment {segment} from {self.table_name} table."
+                )
+                raise DynamoDbClientError(f"Failed to get items from DynamoDB: {e}")
+
+            status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status != 200:
+                logger.error(
+                    f"Failed to scan segment {segment} on {self.table_name} table."
+                )
+                raise DynamoDbStatusError(
+                    f"Unsuccessful client.scan response. Status: {status}"
+                )
+
+            items = response.get("Items", [])
+            if deserialize:
+                items = [self.codec.to_python(item) for item in items]
+            yield items
+
+            if not (last_evaluated_key := response.get("LastEvaluatedKey")):
+                return
+            scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def parallel_scan(
+        self,
+        total_segments: int | None = None,
+        max_workers: int | None = None,
+        deserialize: bool = True,
+        **scan_kwargs,
+    ) -> Iterator[dict]:
+        """Scan the whole table splitting it in segments scanned concurrently.
+
+        Segments run on a bounded worker pool and their pages are merged into a
+        single stream as soon as they arrive, so items are yielded in no
+        particular order. Memory is bounded by a few pages per worker. Errors
+        raised while scanning a segment are re-raised by the generator.
+
+        Args:
+            total_segments: Number of segments, defaults to DYNAMODB_SCAN_SEGMENTS.
+            max_workers: Worker pool size, defaults to DYNAMODB_SCAN_MAX_WORKERS.
+            deserialize: Whether to convert items from DynamoDB wire format.
+            scan_kwargs: Extra arguments passed to client.scan, in wire format.
+
+        Yields:
+            dict: Table items.
+        """
+        total_segments = total_segments or settings.DYNAMODB_SCAN_SEGMENTS
+        max_workers = min(
+            max_workers or settings.DYNAMODB_SCAN_MAX_WORKERS, total_segments
+        )
+        pages = queue.Queue(maxsize=max_workers * 2)
+        stop = threading.Event()
+
+        def _put(value: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(value, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _scan_segment(segment: int) -> None:
+            try:
+                for page in self._iter_segment_pages(
+                    segment, total_segments, deserialize=deserialize, **scan_kwargs
+                ):
+                    if stop.is_set():
+                        return
+                    _put(page)
+            finally:
+                _put(_SEGMENT_DONE)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dynamodb_scan"
+        )
+        try:
+            futures = [
+                executor.submit(_scan_segment, segment)
+                for segment in range(total_segments)
+            ]
+
+            pending_segments = total_segments
+            while pending_segments:
+                page = pages.get()
+                if page is not _SEGMENT_DONE:
+                    yield from page
+                    continue
+
+                pending_segments -= 1
+                for future in futures:
+                    if future.done():
+                        # Re-raise the error of a failed segment, if any.
+                        future.result()
+
+            for future in futures:
+                future.result()
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_items(
+        self, total_segments: int | None = None, max_workers: int | None = None
+    ) -> Iterator[ModelType]:
+        """Stream all table items using a parallel scan.
+
+        Items are decoded straight from the wire format by the model codec.
+
+        Args:
+            total_segments: Number of segments to split the table in.
+            max_workers: Number of segments scanned concurrently.
+
+        Yields:
+            ModelType: Table items, in no particular order.
+        """
+        for item in self.parallel_scan(
+            total_segments=total_segments, max_workers=max_workers, deserialize=False
+        ):
+            yield self.codec.decode(item)
+
+    def _batch_write_with_results(self, write_requests: Iterable[dict]) -> dict:
+        """Send write requests in BatchWriteItem calls of up to 25 items.
+
+        Unprocessed items are retried with exponential backoff. A failed call only
+        fails the items of its own chunk, the remaining chunks are still sent.
+
+        Args:
+            write_requests: PutRequest or DeleteRequest items in wire format.
+
+        Returns:
+            dict: Error message by key of every item that could not be written.
+        """
+        key_attribute = dynamodb_tables[self.model].attribute_name
+
+        def _request_key(write_request: dict) -> str:
+            if put_request := write_request.get("PutRequest"):
+                return put_request["Item"][key_attribute]["S"]
+            return write_request["DeleteRequest"]["Key"][key_attribute]["S"]
+
+        failed_items = {}
+        write_requests = list(write_requests)
+        for start in range(0, len(write_requests), BATCH_WRITE_MAX_ITEMS):
+            end = start + BATCH_WRITE_MAX_ITEMS
+            request_items = {self.table_name: write_requests[start:end]}
+            for attempt in range(settings.DYNAMODB_BATCH_MAX_ATTEMPTS):
+                try:
+                    response = self.dynamodb_client.batch_write_item(
+                        RequestItems=request_items
+                    )
+                except ClientError as e:
+                    logger.error(f"Failed to batch_write on {self.table_name} table.")
+                    error = f"Failed to write item to DynamoDB: {e}"
+                    break
+
+                request_items = response.get("UnprocessedItems")
+                if not request_items:
+                    break
+                time.sleep(exponential_backoff(attempt))
+            else:
+                logger.error(f"Failed to batch_write on {self.table_name} table.")
+                error = "Failed to write item to DynamoDB after retries."
+
+            if request_items:
+                for write_request in request_items[self.table_name]:
+                    failed_items[_request_key(write_request)] = error
+
+        return failed_items
+
+    def _batch_write(self, write_requests: Iterable[dict]) -> None:
+        """Send write requests in BatchWriteItem calls of up to 25 items.
+
+        Args:
+            write_requests: PutRequest or DeleteRequest items in wire format.
+
+        Raises:
+            DynamoDbClientError: If failed to write items to DynamoDB.
+        """
+        if failed_items := self._batch_write_with_results(write_requests):
+            raise DynamoDbClientError(
+                f"Failed to write {len(failed_items)} items to DynamoDB: "
+                f"{next(iter(failed_items.values()))}"
+            )
+
+    def _to_put_request(self, item_dict: dict) -> dict:
+        """Build a BatchWriteItem PutRequest storing an item and its index keys.
+
+        Args:
+            item_dict: Item values, before serialization.
+
+        Returns:
+            dict: PutRequest in wire format.
+        """
+        return {
+            "PutRequest": {
+                "Item": self.codec.encode(
+                    {**item_dict, **self._index_attributes(item_dict)}
+                )
+            }
+        }
+
+    def _get_raw_items(self, item_ids: Iterable[UUID | str]) -> dict[str, dict]:
+        """Get several items by id bypassing the read-through cache.
+
+        Args:
+            item_ids: The item ids to retrieve.
+
+        Returns:
+            dict[str, dict]: Existing items by id.
+        """
+        unique_ids = list(dict.fromkeys(str(item_id) for item_id in item_ids))
+        items = {}
+        for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+            end = start + BATCH_GET_MAX_KEYS
+            keys = [{"id": {"S": item_id}} for item_id in unique_ids[start:end]]
+            for wire_item in self._batch_get(keys):
+                raw_item = self.codec.to_python(wire_item)
+                items[raw_item["id"]] = raw_item
+        return items
+
+    def _build_batch_results(
+        self, item_dicts: dict[str, dict | None], failed_items: dict
+    ) -> list[DynamoDbBatchItemResult[ModelType]]:
+        """Build the per item results of a batch write.
+
+        Args:
+            item_dicts: Written item values by id, None for missing items.
+            failed_items: Error message by id of the items that were not written.
+
+        Returns:
+            list[DynamoDbBatchItemResult[ModelType]]: One result per item.
+        """
+        results = []
+        for item_id, item_dict in item_dicts.items():
+            if item_dict is None:
+                results.append(
+                    DynamoDbBatchItemResult[self.model](
+                        id=item_id,
+                        status=DynamoDbBatchItemStatus.not_found,
+                        error=f"Item {item_id} does not exist.",
+                    )
+                )
+            elif error := failed_items.get(item_id):
+                results.append(
+                    DynamoDbBatchItemResult[self.model](
+                        id=item_id, status=DynamoDbBatchItemStatus.failed, error=error
+                    )
+                )
+            else:
+                self._invalidate_cache(item_id)
+                results.append(
+                    DynamoDbBatchItemResult[self.model](
+                        id=item_id,
+                        status=DynamoDbBatchItemStatus.succeeded,
+                        item=self.model(**item_dict),
+                    )
+                )
+        return results
+
+    def put_items(
+        self, items: Iterable[PutItemModelType]
+    ) -> list[DynamoDbBatchItemResult[ModelType]]:
+        """Create several items using BatchWriteItem.
+
+        Args:
+            items: Items to be inserted in DynamoDB table.
+
+        Returns:
+            list[DynamoDbBatchItemResult[ModelType]]: One result per item, in the
+                same order as items.
+        """
+        item_dicts = {}
+        for item in items:
+            item_id = str(uuid4())
+            item_dicts[item_id] = {
+                **item.dict(exclude_none=True),
+                "id": item_id,
+                VERSION_ATTRIBUTE: 1,
+            }
+
+        failed_items = self._batch_write_with_results(
+            self._to_put_request(item_dict) for item_dict in item_dicts.values()
+        )
+        logger.info(
+            f"Batch put {len(item_dicts) - len(failed_items)} items on "
+            f"{self.table_name} table."
+        )
+        return self._build_batch_results(item_dicts, failed_items)
+
+    def _put_item_if_version(
+        self, item_id: str, item_dict: dict, version: int | None
+    ) -> DynamoDbBatchItemResult[ModelType]:
+        """Put an item only if the stored item is still at a version.
+
+        Args:
+            item_id: Id of the item.
+            item_dict: Item values, before serialization.
+            version: Version the stored item must have, None if it has none.
+
+        Returns:
+            DynamoDbBatchItemResult[ModelType]: Result of the item.
+        """
+        condition_kwargs = {
+            "ConditionExpression": "attribute_exists(id) AND "
+            "attribute_not_exists(#version)",
+            "ExpressionAttributeNames": {"#version": VERSION_ATTRIBUTE},
+        }
+        if version is not None:
+            condition_kwargs["ConditionExpression"] = "#version = :version"
+            condition_kwargs["ExpressionAttributeValues"] = {
+                ":version": encode_value(version)
+            }
+
+        try:
+            self.dynamodb_client.put_item(
+                TableName=self.table_name,
+                Item=self.codec.encode(
+                    {**item_dict, **self._index_attributes(item_dict)}
+                ),
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+                **condition_kwargs,
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException as e:
+            if e.response.get("Item"):
+                return DynamoDbBatchItemResult[self.model](
+                    id=item_id,
+                    status=DynamoDbBatchItemStatus.conflict,
+                    error=f"Item {item_id} was modified concurrently.",
+                )
+            return DynamoDbBatchItemResult[self.model](
+                id=item_id,
+                status=DynamoDbBatchItemStatus.not_found,
+                error=f"Item {item_id} does not exist.",
+            )
+        except ClientError as e:
+            logger.error(f"Failed to put_item {item_id} on {self.table_name} table.")
+            return DynamoDbBatchItemResult[self.model](
+                id=item_id,
+                status=DynamoDbBatchItemStatus.failed,
+                error=f"Failed to write item to DynamoDB: {e}",
+            )
+        finally:
+            self._invalidate_cache(item_id)
+
+        return DynamoDbBatchItemResult[self.model](
+            id=item_id,
+            status=DynamoDbBatchItemStatus.succeeded,
+            item=self.model(**item_dict),
+        )
+
+    def update_items(
+        self, items: dict[UUID, UpdateItemModelType]
+    ) -> list[DynamoDbBatchItemResult[ModelType]]:
+        """Update several existing items, reading them with BatchGetItem.
+
+        Stored items are merged with the new values and put back, each only if
+        it is still at the version read. A concurrent update is never
+        overwritten, its item gets a conflict result instead. BatchWriteItem
+        does not support conditions, so the puts are sent concurrently.
+
+        Args:
+            items: Models containing updated data by item id.
+
+        Returns:
+            list[DynamoDbBatchItemResult[ModelType]]: One result per item, in the
+                same order as items.
+        """
+        stored_items = self._get_raw_items(items)
+
+        def _update_item(item_id: UUID) -> DynamoDbBatchItemResult[ModelType]:
+            stored_item = stored_items.get(str(item_id))
+            if stored_item is None:
+                return DynamoDbBatchItemResult[self.model](
+                    id=str(item_id),
+                    status=DynamoDbBatchItemStatus.not_found,
+                    error=f"Item {item_id} does not exist.",
+                )
+            version = stored_item.get(VERSION_ATTRIBUTE)
+            return self._put_item_if_version(
+                str(item_id),
+                {
+                    **stored_item,
+                    **self._build_update_item_dict(items[item_id]),
+                    VERSION_ATTRIBUTE: (version or 0) + 1,
+                },
+                version=version,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=settings.DYNAMODB_BATCH_MAX_WORKERS,
+            thread_name_prefix="dynamodb_batch",
+        ) as executor:
+            results = list(executor.map(_update_item, items))
+
+        updated_items = sum(
+            result.status == DynamoDbBatchItemStatus.succeeded for result in results
+        )
+        logger.info(f"Batch update {updated_items} items on {self.table_name} table.")
+        return results
+
+    def delete_items(
+        self, item_ids: Iterable[UUID]
+    ) -> list[DynamoDbBatchItemResult[ModelType]]:
+        """Delete several existing items using BatchWriteItem.
+
+        Args:
+            item_ids: Item ids to be deleted from DynamoDB table.
+
+        Raises:
+            ValueError: If an item id is repeated.
+
+        Returns:
+            list[DynamoDbBatchItemResult[ModelType]]: One result per item id, in the
+                same order as item_ids. Results of deleted items hold their last
+                stored values.
+        """
+        item_ids = [str(item_id) for item_id in item_ids]
+        if len(set(item_ids)) != len(item_ids):
+            raise ValueError("Item ids must not be repeated.")
+
+        stored_items = self._get_raw_items(item_ids)
+        item_dicts = {item_id: stored_items.get(item_id) for item_id in item_ids}
+
+        failed_items = self._batch_write_with_results(
+            {"DeleteRequest": {"Key": {"id": {"S": item_id}}}}
+            for item_id in stored_items
+        )
+        logger.info(
+            f"Batch delete {len(stored_items) - len(failed_items)} items on "
+            f"{self.table_name} table."
         )
+        return self._build_batch_results(item_dicts, failed_items)
+
+    def delete_all(
+        self, total_segments: int | None = None, max_workers: int | None = None
+    ) -> None:
+        """Delete all objects from dynamodb table.
+
+        Every segment is scanned and deleted by its own worker.
+
+        Args:
+            total_segments: Number of segments to split the table in.
+            max_workers: Number of segments processed concurrently.
+        """
+        if self.cache:
+            self.cache.clear()
+
+        total_segments = total_segments or settings.DYNAMODB_SCAN_SEGMENTS
+        max_workers = max_workers or settings.DYNAMODB_SCAN_MAX_WORKERS
+        key_attribute = dynamodb_tables[self.model].attribute_name
+
+        def _delete_segment(segment: int) -> None:
+            for page in self._iter_segment_pages(
+                segment,
+                total_segments,
+                deserialize=False,
+                ProjectionExpression="#k",
+                ExpressionAttributeNames={"#k": key_attribute},
+            ):
+                self._batch_write({"DeleteRequest": {"Key": key}} for key in page)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [
+                executor.submit(_delete_segment, segment)
+                for segment in range(total_segments)
+            ]:
+                future.result()
+
+    def backfill_index_attributes(self) -> int:
+        """Add missing index attributes to items written before an index existed.
+
+        Raises:
+            DynamoDbClientError: If failed to update an item in DynamoDB.
+
+        Returns:
+            int: Number of updated items.
+        """
+        updated_items = 0
+        for item in self.parallel_scan():
+            index_attributes = {
+                name: value
+                for name, value in self._index_attributes(item).items()
+                if item.get(name) != value
+            }
+            if not index_attributes:
+                continue
+
+            update_query = self._build_update_query_expression(
+                DynamoDbUpdateItemModel(), extra_attributes=index_attributes
+            )
+            try:
+                self.table.update_item(
+                    Key={"id": item["id"]},
+                    ConditionExpression="attribute_exists(id)",
+                    ExpressionAttributeNames=update_query["attribute_names"],
+                    ExpressionAttributeValues=update_query["attribute_values"],
+                    UpdateExpression=update_query["update_expression"],
+                )
+            except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+                continue
+            except ClientError as e:
+                logger.error(f"Failed to backfill {item['id']} on {self.table_name}.")
+                raise DynamoDbClientError(f"Failed to update item in DynamoDB: {e}")
+            updated_items += 1
 
-        with self.table.batch_writer() as batch:
-            for each in scan.get("Items", []):
-                batch.delete_item(Key=each)
+        logger.info(f"Backfilled {updated_items} items on {self.table_name} table.")
+        return updated_items
@@ -0,0 +1,143 @@
+"""RadioProgramFileReferencesRepository class."""
+from botocore.exceptions import ClientError
+
+from audio_api.aws.dynamodb.exceptions import DynamoDbClientError, DynamoDbStatusError
+from audio_api.aws.dynamodb.models import (
+    RadioProgramFileReferenceItemModel,
+    RadioProgramFileReferencePutItemModel,
+    RadioProgramFileReferenceUpdateItemModel,
+)
+from audio_api.aws.dynamodb.repositories import BaseDynamoDbRepository
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("dynamodb_repository")
+
+
+class RadioProgramFileReferencesRepository(
+    BaseDynamoDbRepository[
+        RadioProgramFileReferenceItemModel,
+        RadioProgramFileReferencePutItemModel,
+        RadioProgramFileReferenceUpdateItemModel,
+    ]
+):
+    """RadioProgramFileReferencesRepository class.
+
+    Counts the programs referencing each content-addressed file, with atomic
+    counter updates so concurrent uploads and deletions never lose a reference.
+    """
+
+    def _add(
+        self, file_name: str, delta: int, only_referenced: bool = False
+    ) -> int | None:
+        """Atomically add delta to the references of a file.
+
+        Args:
+            file_name: Key of the file in S3.
+            delta: Number of references to add, negative to remove them.
+            only_referenced: Only update files with at least one reference.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            int | None: References of the file after the update, None if it was
+                not updated because the file is not referenced.
+        """
+        condition_kwargs = {}
+        attribute_values = {":delta": delta}
+        if only_referenced:
+            condition_kwargs["ConditionExpression"] = "#references > :zero"
+            attribute_values[":zero"] = 0
+
+        try:
+            response = self.table.update_item(
+                Key={"file_name": file_name},
+                UpdateExpression="ADD #references :delta",
+                ExpressionAttributeNames={"#references": "references"},
+                ExpressionAttributeValues=attribute_values,
+                ReturnValues="UPDATED_NEW",
+                **condition_kwargs,
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+            return None
+        except ClientError as e:
+            logger.error(f"Failed to count references of {file_name}.")
+            raise DynamoDbClientError(f"Failed to update item in DynamoDB: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(f"Failed to count references of {file_name}.")
+            raise DynamoDbStatusError(
+                f"Unsuccessful update_item response. Status: {status}"
+            )
+        return int(response["Attributes"]["references"])
+
+    def get_references(self, file_name: str) -> int:
+        """Get the number of programs referencing a file.
+
+        Args:
+            file_name: Key of the file in S3.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+
+        Returns:
+            int: References of the file, 0 if it is not referenced.
+        """
+        try:
+            response = self.table.get_item(
+                Key={"file_name": file_name}, ConsistentRead=True
+            )
+        except ClientError as e:
+            raise DynamoDbClientError(f"Failed to get item from DynamoDB: {e}")
+        return int(response.get("Item", {}).get("references", 0))
+
+    def add_references(self, file_name: str, count: int = 1) -> int:
+        """Add references to a file, creating its counter if needed.
+
+        Args:
+            file_name: Key of the file in S3.
+            count: Number of references to add.
+
+        Returns:
+            int: References of the file after adding them.
+        """
+        return self._add(file_name, count)
+
+    def remove_reference(self, file_name: str) -> int:
+        """Remove a reference to a file, deleting its counter when it reaches 0.
+
+        Args:
+            file_name: Key of the file in S3.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+
+        Returns:
+            int: References left, 0 if the file is no longer referenced.
+        """
+        references = self._add(file_name, -1, only_referenced=True)
+        if references is None:
+            logger.warning(f"File {file_name} has no references to remove.")
+            return 0
+
+        if references == 0:
+            try:
+                # A concurrent upload may have added a reference in between.
+                self.table.delete_item(
+                    Key={"file_name": file_name},
+                    ConditionExpression="#references = :zero",
+                    ExpressionAttributeNames={"#references": "references"},
+                    ExpressionAttributeValues={":zero": 0},
+                )
+            except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+                return self.get_references(file_name)
+            except ClientError as e:
+                raise DynamoDbClientError(f"Failed to delete item from DynamoDB: {e}")
+        return references
+
+
+radio_program_file_references_repository = RadioProgramFileReferencesRepository(
+    RadioProgramFileReferenceItemModel
+)
@@ -0,0 +1,257 @@
+"""RadioProgramJobsRepository class."""
+from datetime import datetime
+from uuid import UUID
+
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+from audio_api.aws.dynamodb.exceptions import DynamoDbClientError, DynamoDbStatusError
+from audio_api.aws.dynamodb.models import (
+    RadioProgramJobItemModel,
+    RadioProgramJobPutItemModel,
+    RadioProgramJobUpdateItemModel,
+)
+from audio_api.aws.dynamodb.repositories import BaseDynamoDbRepository
+from audio_api.aws.dynamodb.repositories.base_repository import VERSION_ATTRIBUTE
+from audio_api.aws.dynamodb.tables import (
+    RADIO_PROGRAM_JOBS_PROGRAM_INDEX,
+    RADIO_PROGRAM_JOBS_STATUS_INDEX,
+)
+from audio_api.domain.models import RadioProgramJobStatus
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("dynamodb_repository")
+
+
+class RadioProgramJobsRepository(
+    BaseDynamoDbRepository[
+        RadioProgramJobItemModel,
+        RadioProgramJobPutItemModel,
+        RadioProgramJobUpdateItemModel,
+    ]
+):
+    """RadioProgramJobsRepository class.
+
+    Queue of analysis jobs. Workers poll the pending jobs through the status
+    index and claim them with a conditional update, so each job runs once even
+    with several workers. A claim is a lease: running jobs whose lease expired,
+    because their worker died, are claimed again. A claim is identified by the
+    attempts count of the job, so a worker only writes to the jobs it still owns.
+    """
+
+    def get_items_by_program(self, program_id: UUID) -> list[RadioProgramJobItemModel]:
+        """Get the jobs of a RadioProgram, oldest first.
+
+        Args:
+            program_id: Id of the RadioProgram.
+
+        Returns:
+            list[RadioProgramJobItemModel]: Jobs of the RadioProgram.
+        """
+        return self.query_index(
+            index_name=RADIO_PROGRAM_JOBS_PROGRAM_INDEX,
+            key_condition=Key("program_id").eq(str(program_id)),
+        )
+
+    def get_pending_items(
+        self, limit: int, now: datetime
+    ) -> list[RadioProgramJobItemModel]:
+        """Get the oldest pending jobs, then the running jobs whose lease expired.
+
+        Args:
+            limit: Maximum number of jobs to get.
+            now: Time leases are checked against.
+
+        Returns:
+            list[RadioProgramJobItemModel]: Jobs to claim, oldest first.
+        """
+        jobs = self.query_index_page(
+            index_name=RADIO_PROGRAM_JOBS_STATUS_INDEX,
+            key_condition=Key("status").eq(RadioProgramJobStatus.pending.value),
+            limit=limit,
+        ).items
+        if len(jobs) < limit:
+            # Few jobs run at a time, at most one per worker process.
+            running_jobs = self.query_index(
+                index_name=RADIO_PROGRAM_JOBS_STATUS_INDEX,
+                key_condition=Key("status").eq(RadioProgramJobStatus.running.value),
+            )
+            jobs += [
+                job
+                for job in running_jobs
+                if job.lease_expires_at is None or job.lease_expires_at < now
+            ][: limit - len(jobs)]
+        return jobs
+
+    def claim_item(
+        self, item_id: UUID, now: datetime, lease_expires_at: datetime
+    ) -> RadioProgramJobItemModel | None:
+        """Atomically mark a job as running under a lease and count the attempt.
+
+        Pending jobs and running jobs whose lease expired can be claimed.
+
+        Args:
+            item_id: Id of the job.
+            now: Time the job starts running.
+            lease_expires_at: Time the job can be claimed again if still running.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            RadioProgramJobItemModel | None: Claimed job, None if it can no longer
+                be claimed because another worker claimed it.
+        """
+        try:
+            response = self.table.update_item(
+                Key={"id": str(item_id)},
+                UpdateExpression=(
+                    "SET #status = :running, #updated_at = :now, "
+                    "#lease_expires_at = :lease_expires_at "
+                    "ADD #attempts :one, #version :one"
+                ),
+                ConditionExpression=(
+                    "#status = :pending OR (#status = :running AND "
+                    "(attribute_not_exists(#lease_expires_at) OR "
+                    "#lease_expires_at < :now))"
+                ),
+                ExpressionAttributeNames={
+                    "#status": "status",
+                    "#updated_at": "updated_at",
+                    "#lease_expires_at": "lease_expires_at",
+                    "#attempts": "attempts",
+                    "#version": "version",
+                },
+                ExpressionAttributeValues={
+                    ":running": RadioProgramJobStatus.running.value,
+                    ":pending": RadioProgramJobStatus.pending.value,
+                    ":now": now.isoformat(),
+                    ":lease_expires_at": lease_expires_at.isoformat(),
+                    ":one": 1,
+                },
+                ReturnValues="ALL_NEW",
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+            return None
+        except ClientError as e:
+            logger.error(f"Failed to claim job {item_id}.")
+            raise DynamoDbClientError(f"Failed to update item in DynamoDB: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(f"Failed to claim job {item_id}.")
+            raise DynamoDbStatusError(
+                f"Unsuccessful update_item response. Status: {status}"
+            )
+        return self.model(**response["Attributes"])
+
+    def update_claimed_item(
+        self, item_id: UUID, item: RadioProgramJobUpdateItemModel, attempts: int
+    ) -> bool:
+        """Update a running job, only if it is still under the given claim.
+
+        Args:
+            item_id: Id of the job.
+            item: Model containing updated data.
+            attempts: Attempts count of the job when it was claimed.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            bool: Whether the job was updated, False if it was claimed again
+                since, because its lease expired.
+        """
+        update_query = self._build_update_query_expression(
+            item, version_attribute=VERSION_ATTRIBUTE, document_paths=False
+        )
+        try:
+            response = self.table.update_item(
+                Key={"id": str(item_id)},
+                UpdateExpression=update_query["update_expression"],
+                ConditionExpression=(
+                    "#claim_status = :running AND #attempts = :claimed_attempts"
+                ),
+                ExpressionAttributeNames={
+                    **update_query["attribute_names"],
+                    "#claim_status": "status",
+                    "#attempts": "attempts",
+                },
+                ExpressionAttributeValues={
+                    **update_query["attribute_values"],
+                    ":running": RadioProgramJobStatus.running.value,
+                    ":claimed_attempts": attempts,
+                },
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+            return False
+        except ClientError as e:
+            logger.error(f"Failed to update claimed job {item_id}.")
+            raise DynamoDbClientError(f"Failed to update item in DynamoDB: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(f"Failed to update claimed job {item_id}.")
+            raise DynamoDbStatusError(
+                f"Unsuccessful update_item response. Status: {status}"
+            )
+        return True
+
+    def renew_lease(
+        self, item_id: UUID, attempts: int, lease_expires_at: datetime
+    ) -> bool:
+        """Extend the lease of a running job, only if it is still under the claim.
+
+        Args:
+            item_id: Id of the job.
+            attempts: Attempts count of the job when it was claimed.
+            lease_expires_at: New time the job can be claimed again.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbStatusError: If received error status code.
+
+        Returns:
+            bool: Whether the lease was extended, False if the job was claimed
+                again since.
+        """
+        try:
+            response = self.table.update_item(
+                Key={"id": str(item_id)},
+                UpdateExpression=(
+                    "SET #lease_expires_at = :lease_expires_at ADD #version :one"
+                ),
+                ConditionExpression=(
+                    "#status = :running AND #attempts = :claimed_attempts"
+                ),
+                ExpressionAttributeNames={
+                    "#status": "status",
+                    "#lease_expires_at": "lease_expires_at",
+                    "#attempts": "attempts",
+                    "#version": "version",
+                },
+                ExpressionAttributeValues={
+                    ":running": RadioProgramJobStatus.running.value,
+                    ":claimed_attempts": attempts,
+                    ":lease_expires_at": lease_expires_at.isoformat(),
+                    ":one": 1,
+                },
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+            return False
+        except ClientError as e:
+            logger.error(f"Failed to renew the lease of job {item_id}.")
+            raise DynamoDbClientError(f"Failed to update item in DynamoDB: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(f"Failed to renew the lease of job {item_id}.")
+            raise DynamoDbStatusError(
+                f"Unsuccessful update_item response. Status: {status}"
+            )
+        return True
+
+
+radio_program_jobs_repository = RadioProgramJobsRepository(RadioProgramJobItemModel)
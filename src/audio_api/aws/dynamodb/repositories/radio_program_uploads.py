@@ -0,0 +1,140 @@
+"""RadioProgramUploadsRepository class."""
+import time
+
+from botocore.exceptions import ClientError
+
+from audio_api.aws.dynamodb.exceptions import (
+    DynamoDbClientError,
+    DynamoDbItemNotFoundError,
+)
+from audio_api.aws.dynamodb.models import (
+    RadioProgramUploadItemModel,
+    RadioProgramUploadPutItemModel,
+    RadioProgramUploadUpdateItemModel,
+)
+from audio_api.aws.dynamodb.repositories import BaseDynamoDbRepository
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("dynamodb_repository")
+
+
+class RadioProgramUploadsRepository(
+    BaseDynamoDbRepository[
+        RadioProgramUploadItemModel,
+        RadioProgramUploadPutItemModel,
+        RadioProgramUploadUpdateItemModel,
+    ]
+):
+    """RadioProgramUploadsRepository class.
+
+    Records the uploads created with presigned URLs, so only those files can be
+    used by a new RadioProgram, and only once.
+    """
+
+    @staticmethod
+    def _build_condition(upload_id: str | None) -> tuple[str, dict, dict]:
+        """Build the condition matching a pending, not expired upload.
+
+        Args:
+            upload_id: Multipart upload id, None for single PUT uploads.
+
+        Returns:
+            tuple[str, dict, dict]: ConditionExpression, ExpressionAttributeNames
+                and ExpressionAttributeValues.
+        """
+        names = {
+            "#file_name": "file_name",
+            "#expires_at": "expires_at",
+            "#upload_id": "upload_id",
+        }
+        values = {":now": int(time.time())}
+        condition = "attribute_exists(#file_name) AND #expires_at > :now"
+        if upload_id is None:
+            condition += " AND attribute_not_exists(#upload_id)"
+        else:
+            condition += " AND #upload_id = :upload_id"
+            values[":upload_id"] = upload_id
+        return condition, names, values
+
+    def add_upload(
+        self, file_name: str, upload_id: str | None, expires_in: int
+    ) -> None:
+        """Record a new upload until it is completed or expires.
+
+        Args:
+            file_name: Key of the file in S3.
+            upload_id: Multipart upload id, None for single PUT uploads.
+            expires_in: Seconds the upload can be completed for.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+        """
+        item = {"file_name": file_name, "expires_at": int(time.time()) + expires_in}
+        if upload_id is not None:
+            item["upload_id"] = upload_id
+        try:
+            self.table.put_item(Item=item)
+        except ClientError as e:
+            logger.error(f"Failed to record upload of {file_name}.")
+            raise DynamoDbClientError(f"Failed to put item in DynamoDB: {e}")
+
+    def get_upload(
+        self, file_name: str, upload_id: str | None
+    ) -> RadioProgramUploadItemModel:
+        """Get a pending upload, if it was created and has not expired.
+
+        Args:
+            file_name: Key of the file in S3.
+            upload_id: Multipart upload id, None for single PUT uploads.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbItemNotFoundError: If there is no such pending upload.
+
+        Returns:
+            RadioProgramUploadItemModel: The pending upload.
+        """
+        try:
+            response = self.table.get_item(
+                Key={"file_name": file_name}, ConsistentRead=True
+            )
+        except ClientError as e:
+            raise DynamoDbClientError(f"Failed to get item from DynamoDB: {e}")
+
+        item = response.get("Item")
+        if (
+            item is None
+            or item.get("upload_id") != upload_id
+            or item["expires_at"] <= time.time()
+        ):
+            raise DynamoDbItemNotFoundError(f"Upload of {file_name} not found.")
+        return self.model(**item)
+
+    def claim_upload(self, file_name: str, upload_id: str | None) -> None:
+        """Atomically remove a pending upload, so it can only be completed once.
+
+        Args:
+            file_name: Key of the file in S3.
+            upload_id: Multipart upload id, None for single PUT uploads.
+
+        Raises:
+            DynamoDbClientError: If received client error from DynamoDB.
+            DynamoDbItemNotFoundError: If there is no such pending upload.
+        """
+        condition, names, values = self._build_condition(upload_id)
+        try:
+            self.table.delete_item(
+                Key={"file_name": file_name},
+                ConditionExpression=condition,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+        except self.dynamodb_client.exceptions.ConditionalCheckFailedException:
+            raise DynamoDbItemNotFoundError(f"Upload of {file_name} not found.")
+        except ClientError as e:
+            raise DynamoDbClientError(f"Failed to delete item from DynamoDB: {e}")
+
+
+radio_program_uploads_repository = RadioProgramUploadsRepository(
+    RadioProgramUploadItemModel
+)
@@ -1,11 +1,31 @@
 """RadioProgramsRepository class."""
+import heapq
+import itertools
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import TypeVar
+from uuid import UUID
 
+from boto3.dynamodb.conditions import ConditionBase, Key
+
+from audio_api.aws.cache import LRUCache
+from audio_api.aws.dynamodb.exceptions import DynamoDbInvalidCursorError
 from audio_api.aws.dynamodb.models import (
+    DynamoDbPage,
     RadioProgramItemModel,
     RadioProgramPutItemModel,
     RadioProgramUpdateItemModel,
 )
 from audio_api.aws.dynamodb.repositories import BaseDynamoDbRepository
+from audio_api.aws.dynamodb.tables import RADIO_PROGRAMS_AIR_DATE_INDEX
+from audio_api.aws.settings import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+AIR_DATE_PARTITION = "radio_programs"
 
 
 class RadioProgramsRepository(
@@ -13,7 +33,267 @@ class RadioProgramsRepository(
         RadioProgramItemModel, RadioProgramPutItemModel, RadioProgramUpdateItemModel
     ]
 ):
-    """RadioProgramsRepository class."""
+    """RadioProgramsRepository class.
+
+    Programs with an air_date are spread over several air_date_index partitions
+    by id, so index writes and range queries are not limited to the throughput
+    of a single partition. Range queries fan out to every partition and merge
+    the results by air_date.
+    """
+
+    def __init__(
+        self,
+        model: type[RadioProgramItemModel],
+        cache: LRUCache | None = None,
+        air_date_shards: int = settings.DYNAMODB_AIR_DATE_SHARDS,
+    ):
+        """Repository of RadioPrograms.
+
+        Args:
+            model: A DynamoDbItemModel class.
+            cache: Optional read-through cache for items retrieved by id.
+            air_date_shards: Number of air_date_index partitions.
+        """
+        super().__init__(model, cache=cache)
+        self.air_date_partitions = [
+            f"{AIR_DATE_PARTITION}#{shard}" for shard in range(air_date_shards)
+        ]
+
+    def _index_attributes(self, item: dict) -> dict:
+        """Add the air_date_partition of the program id to programs with an air_date.
+
+        Args:
+            item: Item values, before serialization.
+
+        Returns:
+            dict: Attributes to store together with the item.
+        """
+        if item.get("air_date"):
+            shard = UUID(str(item["id"])).int % len(self.air_date_partitions)
+            return {"air_date_partition": self.air_date_partitions[shard]}
+        return {}
+
+    @staticmethod
+    def _build_air_date_condition(
+        partition: str, date_from: date | None, date_to: date | None
+    ) -> ConditionBase:
+        """Build the air_date_index key condition for an air_date range.
+
+        Args:
+            partition: air_date_index partition to query.
+            date_from: First air_date to include, unbounded if None.
+            date_to: Last air_date to include, unbounded if None.
+
+        Returns:
+            ConditionBase: Key condition for the air_date_index.
+        """
+        key_condition = Key("air_date_partition").eq(partition)
+        air_date = Key("air_date")
+        if date_from and date_to:
+            return key_condition & air_date.between(
+                date_from.isoformat(), date_to.isoformat()
+            )
+        if date_from:
+            return key_condition & air_date.gte(date_from.isoformat())
+        if date_to:
+            return key_condition & air_date.lte(date_to.isoformat())
+        return key_condition
+
+    def _map_partitions(
+        self, query: Callable[[str], T], partitions: list[str] | None = None
+    ) -> dict[str, T]:
+        """Query several air_date_index partitions concurrently.
+
+        Args:
+            query: Function querying a single partition.
+            partitions: Partitions to query, all of them if None.
+
+        Returns:
+            dict[str, T]: Result by partition.
+        """
+        partitions = self.air_date_partitions if partitions is None else partitions
+        if not partitions:
+            return {}
+
+        max_workers = min(len(partitions), settings.DYNAMODB_SCAN_MAX_WORKERS)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dynamodb_query"
+        ) as executor:
+            return dict(zip(partitions, executor.map(query, partitions)))
+
+    def get_items_by_air_date(
+        self, date_from: date | None = None, date_to: date | None = None
+    ) -> list[RadioProgramItemModel]:
+        """Get all programs aired in a date range, sorted by air_date.
+
+        Args:
+            date_from: First air_date to include, unbounded if None.
+            date_to: Last air_date to include, unbounded if None.
+
+        Returns:
+            list[RadioProgramItemModel]: Programs aired in the date range.
+        """
+        partition_items = self._map_partitions(
+            lambda partition: self.query_index(
+                index_name=RADIO_PROGRAMS_AIR_DATE_INDEX,
+                key_condition=self._build_air_date_condition(
+                    partition, date_from, date_to
+                ),
+            )
+        )
+        return list(
+            heapq.merge(*partition_items.values(), key=lambda item: item.air_date)
+        )
 
+    def _build_partition_cursor(
+        self, partition: str, item: RadioProgramItemModel
+    ) -> str:
+        """Build the cursor to resume an air_date_index partition after an item.
 
-radio_programs_repository = RadioProgramsRepository(RadioProgramItemModel)
+        Args:
+            partition: air_date_index partition of the item.
+            item: Last program read from the partition.
+
+        Returns:
+            str: Cursor of the partition.
+        """
+        return self._encode_cursor(
+            {
+                "id": {"S": str(item.id)},
+                "air_date_partition": {"S": partition},
+                "air_date": {"S": item.air_date.isoformat()},
+            }
+        )
+
+    def _decode_partition_cursors(self, cursor: str | None) -> dict[str, str]:
+        """Decode a page cursor into the cursor of every partition left to read.
+
+        Args:
+            cursor: Cursor returned by get_items_by_air_date_page, if any.
+
+        Raises:
+            DynamoDbInvalidCursorError: If the cursor is malformed.
+
+        Returns:
+            dict[str, str]: Cursor by partition, empty for partitions not read yet.
+        """
+        if not cursor:
+            return dict.fromkeys(self.air_date_partitions, "")
+
+        wire_cursors = self._decode_cursor(cursor)
+        if not wire_cursors.keys() <= set(self.air_date_partitions) or not all(
+            "S" in value for value in wire_cursors.values()
+        ):
+            raise DynamoDbInvalidCursorError(f"Invalid cursor {cursor}.")
+        return {partition: value["S"] for partition, value in wire_cursors.items()}
+
+    def get_items_by_air_date_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> DynamoDbPage[RadioProgramItemModel]:
+        """Get a single page of programs aired in a date range, sorted by air_date.
+
+        Every partition left to read is queried for up to limit programs and the
+        first limit programs by air_date are returned. The cursor holds where
+        each partition was left, so no program is skipped or repeated.
+
+        Args:
+            limit: Maximum number of programs to read in this page.
+            cursor: Cursor returned by a previous page, None to start from the top.
+            date_from: First air_date to include, unbounded if None.
+            date_to: Last air_date to include, unbounded if None.
+
+        Returns:
+            DynamoDbPage[RadioProgramItemModel]: Programs and the next page cursor.
+        """
+        partition_cursors = self._decode_partition_cursors(cursor)
+        pages = self._map_partitions(
+            lambda partition: self.query_index_page(
+                index_name=RADIO_PROGRAMS_AIR_DATE_INDEX,
+                key_condition=self._build_air_date_condition(
+                    partition, date_from, date_to
+                ),
+                limit=limit,
+                cursor=partition_cursors[partition] or None,
+            ),
+            partitions=list(partition_cursors),
+        )
+
+        items = []
+        read_items = dict.fromkeys(pages, 0)
+        for partition, item in itertools.islice(
+            heapq.merge(
+                *(
+                    [(partition, item) for item in page.items]
+                    for partition, page in pages.items()
+                ),
+                key=lambda partition_item: partition_item[1].air_date,
+            ),
+            limit,
+        ):
+            items.append(item)
+            read_items[partition] += 1
+
+        next_cursors = {}
+        for partition, page in pages.items():
+            if read_items[partition] < len(page.items):
+                next_cursors[partition] = (
+                    self._build_partition_cursor(
+                        partition, page.items[read_items[partition] - 1]
+                    )
+                    if read_items[partition]
+                    else partition_cursors[partition]
+                )
+            elif page.next_cursor:
+                next_cursors[partition] = page.next_cursor
+
+        return DynamoDbPage[self.model](
+            items=items,
+            next_cursor=(
+                self._encode_cursor(
+                    {
+                        partition: {"S": partition_cursor}
+                        for partition, partition_cursor in next_cursors.items()
+                    }
+                )
+                if next_cursors
+                else None
+            ),
+        )
+
+    def iter_file_names(self) -> Iterator[str]:
+        """Stream the file name of every program with a projected parallel scan.
+
+        Only the file name attribute is read and items are not deserialized, so
+        the whole table can be streamed with bounded memory.
+
+        Yields:
+            str: File name of a program, in no particular order.
+        """
+        for item in self.parallel_scan(
+            deserialize=False,
+            ProjectionExpression="#radio_program.#file_name",
+            ExpressionAttributeNames={
+                "#radio_program": "radio_program",
+                "#file_name": "file_name",
+            },
+        ):
+            radio_program = item.get("radio_program", {}).get("M", {})
+            if file_name := radio_program.get("file_name", {}).get("S"):
+                yield file_name
+
+
+radio_programs_repository = RadioProgramsRepository(
+    RadioProgramItemModel,
+    cache=(
+        LRUCache(
+            max_size=settings.DYNAMODB_CACHE_MAX_ITEMS,
+            ttl_seconds=settings.DYNAMODB_CACHE_TTL_SECONDS,
+        )
+        if settings.DYNAMODB_CACHE_ENABLED
+        else None
+    ),
+)
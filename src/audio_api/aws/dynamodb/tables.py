@@ -2,9 +2,31 @@
 
 from pydantic import BaseModel
 
-from audio_api.aws.dynamodb.models import RadioProgramItemModel
+from audio_api.aws.dynamodb.models import (
+    RadioProgramFileReferenceItemModel,
+    RadioProgramItemModel,
+    RadioProgramJobItemModel,
+    RadioProgramUploadItemModel,
+)
 from audio_api.aws.settings import DynamoDbTables
 
+RADIO_PROGRAMS_AIR_DATE_INDEX = "air_date_index"
+RADIO_PROGRAM_JOBS_PROGRAM_INDEX = "program_id_index"
+RADIO_PROGRAM_JOBS_STATUS_INDEX = "status_index"
+
+
+class DynamoDbGlobalSecondaryIndex(BaseModel):
+    """DynamoDbGlobalSecondaryIndex class with Global Secondary Index properties."""
+
+    index_name: str
+    partition_key_name: str
+    partition_key_type: str
+    sort_key_name: str | None
+    sort_key_type: str | None
+    projection_type: str = "ALL"
+    read_capacity_units: int
+    write_capacity_units: int
+
 
 class DynamoDbTable(BaseModel):
     """DynamoDbTable class with Table properties."""
@@ -15,6 +37,43 @@ class DynamoDbTable(BaseModel):
     key_type: str
     read_capacity_units: int
     write_capacity_units: int
+    global_secondary_indexes: list[DynamoDbGlobalSecondaryIndex] = []
+
+    def get_attribute_definitions(self) -> list[dict]:
+        """Return the AttributeDefinitions of the table keys and its indexes."""
+        attributes = {self.attribute_name: self.attribute_type}
+        for index in self.global_secondary_indexes:
+            attributes[index.partition_key_name] = index.partition_key_type
+            if index.sort_key_name:
+                attributes[index.sort_key_name] = index.sort_key_type
+        return [
+            {"AttributeName": name, "AttributeType": attribute_type}
+            for name, attribute_type in attributes.items()
+        ]
+
+    def get_global_secondary_indexes(self) -> list[dict]:
+        """Return the GlobalSecondaryIndexes used to create the table."""
+        indexes = []
+        for index in self.global_secondary_indexes:
+            key_schema = [
+                {"AttributeName": index.partition_key_name, "KeyType": "HASH"}
+            ]
+            if index.sort_key_name:
+                key_schema.append(
+                    {"AttributeName": index.sort_key_name, "KeyType": "RANGE"}
+                )
+            indexes.append(
+                {
+                    "IndexName": index.index_name,
+                    "KeySchema": key_schema,
+                    "Projection": {"ProjectionType": index.projection_type},
+                    "ProvisionedThroughput": {
+                        "ReadCapacityUnits": index.read_capacity_units,
+                        "WriteCapacityUnits": index.write_capacity_units,
+                    },
+                }
+            )
+        return indexes
 
 
 dynamodb_tables = {
@@ -25,5 +84,65 @@ dynamodb_tables = {
         key_type="HASH",
         read_capacity_units=5,
         write_capacity_units=5,
-    )
+        global_secondary_indexes=[
+            # Sparse index: only programs with an air_date have air_date_partition.
+            # Programs are spread over DYNAMODB_AIR_DATE_SHARDS partitions by id
+            # and range queries merge every partition by air_date.
+            DynamoDbGlobalSecondaryIndex(
+                index_name=RADIO_PROGRAMS_AIR_DATE_INDEX,
+                partition_key_name="air_date_partition",
+                partition_key_type="S",
+                sort_key_name="air_date",
+                sort_key_type="S",
+                read_capacity_units=5,
+                write_capacity_units=5,
+            )
+        ],
+    ),
+    RadioProgramFileReferenceItemModel: DynamoDbTable(
+        table_name=DynamoDbTables.radio_program_files,
+        attribute_name="file_name",
+        attribute_type="S",
+        key_type="HASH",
+        read_capacity_units=5,
+        write_capacity_units=5,
+    ),
+    RadioProgramJobItemModel: DynamoDbTable(
+        table_name=DynamoDbTables.radio_program_jobs,
+        attribute_name="id",
+        attribute_type="S",
+        key_type="HASH",
+        read_capacity_units=5,
+        write_capacity_units=5,
+        global_secondary_indexes=[
+            DynamoDbGlobalSecondaryIndex(
+                index_name=RADIO_PROGRAM_JOBS_PROGRAM_INDEX,
+                partition_key_name="program_id",
+                partition_key_type="S",
+                sort_key_name="created_at",
+                sort_key_type="S",
+                read_capacity_units=5,
+                write_capacity_units=5,
+            ),
+            # Workers poll the pending jobs, oldest first
+            DynamoDbGlobalSecondaryIndex(
+                index_name=RADIO_PROGRAM_JOBS_STATUS_INDEX,
+                partition_key_name="status",
+                partition_key_type="S",
+                sort_key_name="created_at",
+                sort_key_type="S",
+                read_capacity_units=5,
+                write_capacity_units=5,
+            ),
+        ],
+    ),
+    # Uploads created with presigned URLs and not completed yet
+    RadioProgramUploadItemModel: DynamoDbTable(
+        table_name=DynamoDbTables.radio_program_uploads,
+        attribute_name="file_name",
+        attribute_type="S",
+        key_type="HASH",
+        read_capacity_units=5,
+        write_capacity_units=5,
+    ),
 }
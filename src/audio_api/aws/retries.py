@@ -0,0 +1,18 @@
+"""Retry helpers shared by the AWS repositories."""
+import random
+
+
+def exponential_backoff(
+    attempt: int, base_delay: float = 0.05, max_delay: float = 5.0
+) -> float:
+    """Return a full jitter exponential backoff delay for a retry attempt.
+
+    Args:
+        attempt: Zero based retry attempt.
+        base_delay: Delay in seconds used for the first attempt.
+        max_delay: Upper bound for the delay in seconds.
+
+    Returns:
+        float: Seconds to wait before retrying.
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
@@ -0,0 +1,142 @@
+"""S3BlockCache class used as an on-disk cache of S3 object blocks."""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from audio_api.aws.cache import CacheStats
+
+
+class S3BlockCache:
+    """S3BlockCache class.
+
+    Thread safe on-disk cache of fixed-size blocks of S3 objects, bounded by
+    bytes with LRU eviction. Blocks are keyed by object key, ETag and offset, so
+    an overwritten object never serves stale blocks. Blocks found on disk when
+    the cache is created are kept, oldest first in the LRU order.
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int, block_size: int):
+        """Create a new cache, indexing the blocks already stored in path.
+
+        Args:
+            path: Directory where blocks are stored.
+            max_bytes: Maximum bytes of all blocks, least recently used are evicted.
+            block_size: Size of every block but the last block of each object.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        self._entries: OrderedDict[Path, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_size=max_bytes)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        stored_blocks = []
+        for block in self.path.glob("*/*/*"):
+            # Temporary files of blocks being written are not indexed.
+            if not block.name.isdigit():
+                continue
+            block_stat = block.stat()
+            stored_blocks.append(
+                (block_stat.st_mtime, block.relative_to(self.path), block_stat.st_size)
+            )
+        with self._lock:
+            for _, block_path, block_bytes in sorted(stored_blocks):
+                self._entries[block_path] = block_bytes
+                self._size += block_bytes
+            self._evict()
+
+    @staticmethod
+    def _block_path(object_key: str, etag: str, index: int) -> Path:
+        """Get the path of a block, relative to the cache directory.
+
+        Args:
+            object_key: The key (path) of the object in the S3 bucket.
+            etag: ETag of the object.
+            index: Index of the block in the object.
+
+        Returns:
+            Path: Relative path of the block.
+        """
+        digest = hashlib.sha256(f"{object_key}\n{etag}".encode()).hexdigest()
+        return Path(digest[:2], digest, str(index))
+
+    def _evict(self) -> None:
+        """Delete least recently used blocks until the cache fits in max_bytes."""
+        while self._size > self.max_bytes and self._entries:
+            block_path, block_bytes = self._entries.popitem(last=False)
+            self._size -= block_bytes
+            self._stats.evictions += 1
+            (self.path / block_path).unlink(missing_ok=True)
+
+    def get(self, object_key: str, etag: str, index: int) -> bytes | None:
+        """Get a block from the cache.
+
+        Args:
+            object_key: The key (path) of the object in the S3 bucket.
+            etag: ETag of the object.
+            index: Index of the block in the object.
+
+        Returns:
+            bytes | None: Content of the block, None if it is not cached.
+        """
+        block_path = self._block_path(object_key, etag, index)
+        with self._lock:
+            if block_path not in self._entries:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(block_path)
+            self._stats.hits += 1
+
+        try:
+            return (self.path / block_path).read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                if (block_bytes := self._entries.pop(block_path, None)) is not None:
+                    self._size -= block_bytes
+            return None
+
+    def set(self, object_key: str, etag: str, index: int, data: bytes) -> None:
+        """Store a block, evicting least recently used blocks if needed.
+
+        Blocks are written to a temporary file and renamed, so readers never
+        see a partially written block.
+
+        Args:
+            object_key: The key (path) of the object in the S3 bucket.
+            etag: ETag of the object.
+            index: Index of the block in the object.
+            data: Content of the block.
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        block_path = self._block_path(object_key, etag, index)
+        directory = (self.path / block_path).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".")
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, self.path / block_path)
+
+        with self._lock:
+            self._size += len(data) - self._entries.pop(block_path, 0)
+            self._entries[block_path] = len(data)
+            self._evict()
+
+    def clear(self) -> None:
+        """Delete every block from the cache."""
+        with self._lock:
+            for block_path in self._entries:
+                (self.path / block_path).unlink(missing_ok=True)
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        """Return a copy of the cache counters, sizes are in bytes."""
+        with self._lock:
+            return self._stats.copy(update={"size": self._size})
@@ -1,4 +1,12 @@
-from audio_api.aws.s3.models.base_models import S3BaseModel, S3CreateModel, S3FileModel
+from audio_api.aws.s3.models.base_models import (
+    S3BaseModel,
+    S3CreateModel,
+    S3FileModel,
+    S3ObjectMetadata,
+    S3ObjectSummary,
+    S3PresignedUpload,
+    S3PresignedUploadPart,
+)
 from audio_api.aws.s3.models.radio_program_file import (
     RadioProgramFile,
     RadioProgramFileCreate,
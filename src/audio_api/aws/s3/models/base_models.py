@@ -1,4 +1,5 @@
 """S3BaseModel Models."""
+from datetime import datetime
 from tempfile import SpooledTemporaryFile
 from typing import Any
 
@@ -17,6 +18,44 @@ class S3FileModel(S3BaseModel):
     file_url: str
 
 
+class S3ObjectMetadata(S3BaseModel):
+    """S3ObjectMetadata class."""
+
+    content_length: int
+    content_type: str | None
+    etag: str
+    last_modified: datetime
+
+
+class S3ObjectSummary(S3BaseModel):
+    """S3ObjectSummary class."""
+
+    size: int
+    etag: str
+    last_modified: datetime
+
+
+class S3PresignedUploadPart(BaseModel):
+    """S3PresignedUploadPart class."""
+
+    part_number: int
+    url: str
+
+
+class S3PresignedUpload(S3BaseModel):
+    """S3PresignedUpload class.
+
+    Small files are uploaded with a single PUT to upload_url. Big files are
+    uploaded as a multipart upload, with one PUT of part_size bytes per part.
+    """
+
+    expires_in: int
+    upload_url: str | None = None
+    upload_id: str | None = None
+    part_size: int | None = None
+    parts: list[S3PresignedUploadPart] = []
+
+
 class S3CreateModel(S3BaseModel):
     """S3CreateModel class."""
 
@@ -1,4 +1,6 @@
 from audio_api.aws.s3.repositories.base_repository import BaseS3Repository
+from audio_api.aws.s3.repositories.deletion_queue import S3DeletionQueue
 from audio_api.aws.s3.repositories.radio_program_files import (
+    radio_program_files_deletion_queue,
     radio_program_files_repository,
 )
@@ -1,11 +1,20 @@
 """BaseS3Repository class to write and read files from S3."""
+import hashlib
+import math
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Generic, TypeVar
+from typing import BinaryIO, Generic, TypeVar
 
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 from botocore.response import StreamingBody
 
 from audio_api.aws.aws_service import AwsService, AwsServices
+from audio_api.aws.cache import CacheStats, LRUCache
+from audio_api.aws.retries import exponential_backoff
+from audio_api.aws.s3.block_cache import S3BlockCache
 from audio_api.aws.s3.buckets import S3_BUCKETS
 from audio_api.aws.s3.exceptions import (
     S3BucketNotImplementedError,
@@ -13,7 +22,14 @@ from audio_api.aws.s3.exceptions import (
     S3FileNotFoundError,
     S3PersistenceError,
 )
-from audio_api.aws.s3.models import S3CreateModel, S3FileModel
+from audio_api.aws.s3.models import (
+    S3CreateModel,
+    S3FileModel,
+    S3ObjectMetadata,
+    S3ObjectSummary,
+    S3PresignedUpload,
+    S3PresignedUploadPart,
+)
 from audio_api.aws.settings import S3Buckets, get_settings
 from audio_api.logger.logger import get_logger
 from audio_api.settings import EnvironmentEnum
@@ -21,6 +37,16 @@ from audio_api.settings import EnvironmentEnum
 logger = get_logger("s3_repository")
 settings = get_settings()
 
+# S3 limit of parts in a multipart upload
+MAX_MULTIPART_PARTS = 10000
+# S3 limit of keys in a single delete_objects request
+MAX_DELETE_OBJECTS = 1000
+# Prefix of the keys of objects stored under the hash of their content
+CONTENT_ADDRESSED_PREFIX = "sha256/"
+HASH_CHUNK_SIZE = 1024 * 1024
+# Separator between the key of an object and the name of a file derived from it
+SIDECAR_SEPARATOR = ".sidecar."
+
 
 ModelType = TypeVar("ModelType", bound=S3FileModel)
 CreateModelType = TypeVar("CreateModelType", bound=S3CreateModel)
@@ -31,13 +57,22 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
 
     service: AwsService = AwsService(AwsServices.s3)
 
-    def __init__(self, model: type[ModelType]):
+    def __init__(
+        self,
+        model: type[ModelType],
+        url_cache: LRUCache | None = None,
+        block_cache: S3BlockCache | None = None,
+    ):
         """Repository with default methods to Store, Read, and Delete files from S3.
 
         Args:
             model: A pydantic BaseModel class.
+            url_cache: Optional cache of presigned GET URLs by object key.
+            block_cache: Optional on-disk cache of object blocks.
         """
         self.model = model
+        self.url_cache = url_cache
+        self.block_cache = block_cache
         self.bucket_name = self._get_s3_bucket_name()
         self.s3_client = self.service.get_client()
         self.s3_bucket = self.service.get_resource().Bucket(self.bucket_name)
@@ -63,11 +98,251 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
             return f"{endpoint_url}/{self.bucket_name}/{object_key}"
         return f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}"
 
-    def put_object(self, item: CreateModelType) -> type[ModelType]:
+    @staticmethod
+    def _build_object_key(file_name: str) -> str:
+        """Return a unique object key for a new file.
+
+        Args:
+            file_name: Name of the file, without extension.
+
+        Returns:
+            str: Timestamped object key.
+        """
+        current_time = datetime.now()
+        timestamp = current_time.strftime("%Y-%m-%d_%H-%M-%S")
+        # TODO: Make filename url friendly.
+        return f"{timestamp}_{file_name}.mp3"
+
+    @staticmethod
+    def build_content_addressed_key(file: BinaryIO) -> str:
+        """Return the object key of a file stored under the hash of its content.
+
+        Args:
+            file: File to hash, read in chunks and rewound afterwards.
+
+        Returns:
+            str: Object key with the SHA-256 digest of the file.
+        """
+        file.seek(0)
+        file_hash = hashlib.sha256()
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+        file.seek(0)
+        return f"{CONTENT_ADDRESSED_PREFIX}{file_hash.hexdigest()}.mp3"
+
+    @staticmethod
+    def is_content_addressed_key(object_key: str) -> bool:
+        """Return whether an object is stored under the hash of its content.
+
+        Args:
+            object_key: The key (path) of the object in the S3 bucket.
+
+        Returns:
+            bool: True if the key was built by build_content_addressed_key.
+        """
+        return object_key.startswith(CONTENT_ADDRESSED_PREFIX)
+
+    @staticmethod
+    def build_sidecar_key(object_key: str, name: str) -> str:
+        """Return the key of a file derived from an object, stored next to it.
+
+        Args:
+            object_key: The key (path) of the source object in the S3 bucket.
+            name: Name of the derived file.
+
+        Returns:
+            str: Object key of the derived file.
+        """
+        return f"{object_key}{SIDECAR_SEPARATOR}{name}"
+
+    @staticmethod
+    def get_source_key(object_key: str) -> str:
+        """Return the key of the object a sidecar file was derived from.
+
+        Args:
+            object_key: The key (path) of an object in the S3 bucket.
+
+        Returns:
+            str: Key of the source object, the same key if it is not a sidecar.
+        """
+        return object_key.split(SIDECAR_SEPARATOR, 1)[0]
+
+    def get_object_urls(self, object_keys: Iterable[str]) -> dict[str, str]:
+        """Return the URLs to download several objects.
+
+        If S3_PRESIGNED_URLS is enabled, URLs are presigned GET URLs, reused from
+        the URL cache while they are not close to expiring. Otherwise they are
+        public object URLs.
+
+        Args:
+            object_keys: Keys of the objects.
+
+        Returns:
+            dict[str, str]: URL by object key.
+        """
+        if not settings.S3_PRESIGNED_URLS:
+            return {key: self._build_object_url(key) for key in object_keys}
+
+        urls = {}
+        for object_key in object_keys:
+            if object_key in urls:
+                continue
+            if self.url_cache and (url := self.url_cache.get(object_key)):
+                urls[object_key] = url
+                continue
+            urls[object_key] = self.s3_client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket_name, "Key": object_key},
+                ExpiresIn=settings.S3_PRESIGNED_URL_EXPIRATION,
+            )
+            if self.url_cache:
+                self.url_cache.set(object_key, urls[object_key])
+        return urls
+
+    def set_file_urls(self, files: list[ModelType]) -> list[ModelType]:
+        """Set the download URL of several files, signing them in a single batch.
+
+        Stored file URLs are kept unless S3_PRESIGNED_URLS is enabled.
+
+        Args:
+            files: Files to update in place.
+
+        Returns:
+            list[ModelType]: The same files.
+        """
+        if settings.S3_PRESIGNED_URLS and files:
+            urls = self.get_object_urls(file.file_name for file in files)
+            for file in files:
+                file.file_url = urls[file.file_name]
+        return files
+
+    def url_cache_stats(self) -> CacheStats | None:
+        """Return the presigned URL cache counters, None if there is no cache."""
+        return self.url_cache.stats() if self.url_cache else None
+
+    def _upload_part(
+        self, object_key: str, upload_id: str, part_number: int, body: bytes
+    ) -> dict:
+        """Upload a single part of a multipart upload, retrying on failure.
+
+        Args:
+            object_key: Key of the object being uploaded.
+            upload_id: Multipart upload id.
+            part_number: 1-based number of the part.
+            body: Part content.
+
+        Raises:
+            S3ClientError: If failed to upload the part after retries.
+
+        Returns:
+            dict: Part number and ETag, as expected by complete_multipart_upload.
+        """
+        for attempt in range(settings.S3_MULTIPART_MAX_ATTEMPTS):
+            try:
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            except (BotoCoreError, ClientError) as e:
+                logger.warning(
+                    f"Failed to upload_part {part_number} of {object_key}, "
+                    f"attempt {attempt + 1}: {e}"
+                )
+                error = e
+                if attempt + 1 < settings.S3_MULTIPART_MAX_ATTEMPTS:
+                    time.sleep(exponential_backoff(attempt))
+
+        raise S3ClientError(f"Failed to upload part {part_number} to S3: {error}")
+
+    def _put_multipart_object(self, object_key: str, file: BinaryIO) -> None:
+        """Upload a file in parts, several parts at a time.
+
+        Parts are read sequentially from the file and uploaded concurrently, so
+        at most S3_MULTIPART_CONCURRENCY parts are held in memory. A failed part
+        is retried on its own. If the upload can not be completed for any reason,
+        the parts not started yet are cancelled and the upload is aborted, so S3
+        does not keep the uploaded parts.
+
+        Args:
+            object_key: Key of the object to upload.
+            file: File to upload, positioned at its start.
+
+        Raises:
+            S3ClientError: If failed to get response from S3.
+            Exception: Any other error, such as failing to read the file, once
+                the upload is aborted.
+        """
+        try:
+            upload_id = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=object_key
+            )["UploadId"]
+        except (BotoCoreError, ClientError) as e:
+            raise S3ClientError(f"Failed to get response from S3: {e}")
+
+        try:
+            parts = []
+            pending: set[Future] = set()
+            with ThreadPoolExecutor(
+                max_workers=settings.S3_MULTIPART_CONCURRENCY,
+                thread_name_prefix="s3_upload",
+            ) as executor:
+                try:
+                    part_number = 1
+                    while body := file.read(settings.S3_MULTIPART_PART_SIZE):
+                        if len(pending) >= settings.S3_MULTIPART_CONCURRENCY:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            parts += [future.result() for future in done]
+                        pending.add(
+                            executor.submit(
+                                self._upload_part,
+                                object_key,
+                                upload_id,
+                                part_number,
+                                body,
+                            )
+                        )
+                        part_number += 1
+                    parts += [future.result() for future in pending]
+                finally:
+                    # On failure, only wait for the parts already being uploaded.
+                    executor.shutdown(cancel_futures=True)
+
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": sorted(parts, key=lambda part: part["PartNumber"])
+                },
+            )
+        except Exception as e:
+            logger.error(f"Aborting multipart upload of {object_key}.")
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=object_key, UploadId=upload_id
+                )
+            except (BotoCoreError, ClientError):
+                logger.error(f"Failed to abort multipart upload of {object_key}.")
+            if isinstance(e, (BotoCoreError, ClientError, S3ClientError)):
+                raise S3ClientError(f"Failed to upload {object_key} to S3: {e}")
+            raise e
+
+    def put_object(
+        self, item: CreateModelType, object_key: str | None = None
+    ) -> type[ModelType]:
         """Put an object to the S3 bucket.
 
+        Files of at least S3_MULTIPART_THRESHOLD bytes are sent as a multipart
+        upload, smaller files in a single request.
+
         Args:
             item: Item to be stored in S3 bucket.
+            object_key: Key of the object, defaults to a timestamped key built
+                from the item file name.
 
         Raises:
             S3ClientError: If failed to get response from S3.
@@ -76,10 +351,21 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
         Returns:
             ModelType: Object containing file_name and file_url.
         """
-        current_time = datetime.now()
-        timestamp = current_time.strftime("%Y-%m-%d_%H-%M-%S")
-        # TODO: Make filename url friendly.
-        item.file_name = f"{timestamp}_{item.file_name}.mp3"
+        item.file_name = object_key or self._build_object_key(item.file_name)
+
+        file_size = item.file.seek(0, os.SEEK_END)
+        item.file.seek(0)
+        if file_size >= settings.S3_MULTIPART_THRESHOLD:
+            self._put_multipart_object(object_key=item.file_name, file=item.file)
+            logger.info(
+                f"Successfully uploaded {item.file_name} in parts to "
+                f"{self.bucket_name} bucket."
+            )
+            return self.model(
+                file_name=item.file_name,
+                file_url=self._build_object_url(item.file_name),
+            )
+
         try:
             response = self.s3_client.put_object(
                 Bucket=self.bucket_name, Key=item.file_name, Body=item.file
@@ -106,11 +392,250 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
             file_name=item.file_name, file_url=self._build_object_url(item.file_name)
         )
 
-    def get_object(self, object_key: str) -> StreamingBody:
-        """Get an object from the S3 bucket.
+    def put_bytes(
+        self,
+        object_key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """Put a small object held in memory to the S3 bucket.
+
+        Args:
+            object_key: Key of the object.
+            data: Content of the object.
+            content_type: Media type of the content.
+
+        Raises:
+            S3ClientError: If failed to get response from S3.
+            S3PersistenceError: If failed to store object in S3.
+        """
+        try:
+            response = self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                Body=data,
+                ContentType=content_type,
+            )
+        except ClientError as e:
+            logger.error(
+                f"Failed to put_object {object_key} in {self.bucket_name} bucket."
+            )
+            raise S3ClientError(f"Failed to get response from S3: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(
+                f"Failed to put_object {object_key} in {self.bucket_name} bucket."
+            )
+            raise S3PersistenceError(
+                f"Unsuccessful S3 put_object response. Status: {status}"
+            )
+
+    def put_object_if_missing(
+        self, item: CreateModelType, object_key: str
+    ) -> type[ModelType]:
+        """Put an object to the S3 bucket, unless an object with its key exists.
+
+        Meant for content-addressed keys, where an existing key already holds
+        the same content.
+
+        Args:
+            item: Item to be stored in S3 bucket.
+            object_key: Key of the object.
+
+        Returns:
+            ModelType: Object containing file_name and file_url.
+        """
+        try:
+            self.head_object(object_key)
+        except S3FileNotFoundError:
+            return self.put_object(item, object_key=object_key)
+
+        logger.info(f"Skipped put_object {object_key}, already in {self.bucket_name}.")
+        return self.model(
+            file_name=object_key, file_url=self._build_object_url(object_key)
+        )
+
+    def create_presigned_upload(
+        self, file_name: str, file_size: int
+    ) -> S3PresignedUpload:
+        """Create presigned URLs to upload a new object directly to S3.
+
+        Files of at least S3_MULTIPART_THRESHOLD bytes get a multipart upload
+        with a presigned URL per part, smaller files a single presigned PUT URL.
+        Uploads must be completed with complete_presigned_upload.
+
+        Args:
+            file_name: Name of the file, without extension.
+            file_size: Size of the file to upload, in bytes.
+
+        Raises:
+            S3ClientError: If failed to get response from S3.
+
+        Returns:
+            S3PresignedUpload: Object key and presigned URLs of the upload.
+        """
+        object_key = self._build_object_key(file_name)
+        expires_in = settings.S3_PRESIGNED_UPLOAD_EXPIRATION
+        object_params = {"Bucket": self.bucket_name, "Key": object_key}
+
+        try:
+            if file_size < settings.S3_MULTIPART_THRESHOLD:
+                return S3PresignedUpload(
+                    file_name=object_key,
+                    expires_in=expires_in,
+                    upload_url=self.s3_client.generate_presigned_url(
+                        "put_object", Params=object_params, ExpiresIn=expires_in
+                    ),
+                )
+
+            upload_id = self.s3_client.create_multipart_upload(**object_params)[
+                "UploadId"
+            ]
+            part_size = max(
+                settings.S3_MULTIPART_PART_SIZE,
+                math.ceil(file_size / MAX_MULTIPART_PARTS),
+            )
+            parts = [
+                S3PresignedUploadPart(
+                    part_number=part_number,
+                    url=self.s3_client.generate_presigned_url(
+                        "upload_part",
+                        Params={
+                            **object_params,
+                            "UploadId": upload_id,
+                            "PartNumber": part_number,
+                        },
+                        ExpiresIn=expires_in,
+                    ),
+                )
+                for part_number in range(1, math.ceil(file_size / part_size) + 1)
+            ]
+        except ClientError as e:
+            logger.error(
+                f"Failed to presign upload of {object_key} to {self.bucket_name}."
+            )
+            raise S3ClientError(f"Failed to get response from S3: {e}")
+
+        return S3PresignedUpload(
+            file_name=object_key,
+            expires_in=expires_in,
+            upload_id=upload_id,
+            part_size=part_size,
+            parts=parts,
+        )
+
+    def complete_presigned_upload(
+        self, object_key: str, upload_id: str | None = None
+    ) -> type[ModelType]:
+        """Complete an upload created with create_presigned_upload.
+
+        Multipart uploads are completed with the parts uploaded to S3. The object
+        is then checked to exist.
+
+        Args:
+            object_key: Object key of the upload.
+            upload_id: Multipart upload id, None for single PUT uploads.
+
+        Raises:
+            S3FileNotFoundError: If the multipart upload or its parts do not exist.
+            S3ClientError: If failed to get response from S3.
+
+        Returns:
+            ModelType: Object containing file_name and file_url.
+        """
+        if upload_id is not None:
+            try:
+                paginator = self.s3_client.get_paginator("list_parts")
+                parts = [
+                    {"PartNumber": part["PartNumber"], "ETag": part["ETag"]}
+                    for page in paginator.paginate(
+                        Bucket=self.bucket_name, Key=object_key, UploadId=upload_id
+                    )
+                    for part in page.get("Parts", [])
+                ]
+                if not parts:
+                    raise S3FileNotFoundError(f"No parts uploaded to {object_key}.")
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            except self.s3_client.exceptions.NoSuchUpload as e:
+                raise S3FileNotFoundError(f"Upload of {object_key} not found: {e}")
+            except ClientError as e:
+                logger.error(
+                    f"Failed to complete upload of {object_key} to {self.bucket_name}."
+                )
+                raise S3ClientError(f"Failed to complete multipart upload: {e}")
+
+        self.head_object(object_key)
+        return self.model(
+            file_name=object_key, file_url=self._build_object_url(object_key)
+        )
+
+    def head_object(self, object_key: str) -> S3ObjectMetadata:
+        """Get the metadata of an object from the S3 bucket.
+
+        Args:
+            object_key: The key (path) of the object in the S3 bucket.
+
+        Raises:
+            S3FileNotFoundError: If file does not exist in S3 bucket.
+            S3ClientError: If failed to get response from S3.
+            S3PersistenceError: If failed to retrieve object metadata from S3.
+
+        Returns:
+            S3ObjectMetadata: Size, type, ETag and modification time of the file.
+        """
+        try:
+            response = self.s3_client.head_object(
+                Bucket=self.bucket_name, Key=object_key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                logger.error(
+                    f"File {object_key} not found in {self.bucket_name} bucket."
+                )
+                raise S3FileNotFoundError(
+                    f"File {object_key} not found in {self.bucket_name} bucket: {e}"
+                )
+            logger.error(
+                f"Failed to head_object {object_key} from {self.bucket_name} bucket."
+            )
+            raise S3ClientError(f"Failed to get response from S3: {e}")
+
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status != 200:
+            logger.error(
+                f"Failed to head_object {object_key} from {self.bucket_name} bucket."
+            )
+            raise S3PersistenceError(
+                f"Unsuccessful S3 head_object response. Status - {status}"
+            )
+
+        return S3ObjectMetadata(
+            file_name=object_key,
+            content_length=response["ContentLength"],
+            content_type=response.get("ContentType"),
+            etag=response["ETag"],
+            last_modified=response["LastModified"],
+        )
+
+    def get_object(
+        self,
+        object_key: str,
+        byte_range: tuple[int, int] | None = None,
+        if_match: str | None = None,
+    ) -> StreamingBody:
+        """Get an object, or a range of its bytes, from the S3 bucket.
 
         Args:
             object_key (str): The key (path) of the object in the S3 bucket.
+            byte_range: First and last byte to get, inclusive. None for the
+                whole object.
+            if_match: Only get the object if it still has this ETag.
 
         Raises:
             S3FileNotFoundError: If file does not exist in S3 bucket.
@@ -120,9 +645,15 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
         Returns:
             StreamingBody: The content of the file.
         """
+        range_kwargs = {}
+        if byte_range is not None:
+            range_kwargs["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        if if_match is not None:
+            range_kwargs["IfMatch"] = if_match
+
         try:
             response = self.s3_client.get_object(
-                Bucket=self.bucket_name, Key=object_key
+                Bucket=self.bucket_name, Key=object_key, **range_kwargs
             )
         except self.s3_client.exceptions.NoSuchKey as e:
             logger.error(f"File {object_key} not found in {self.bucket_name} bucket.")
@@ -136,7 +667,7 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
             raise S3ClientError(f"Failed to get response from S3: {e}")
 
         status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
-        if status != 200:
+        if status not in (200, 206):
             logger.error(
                 f"Failed to get_object {object_key} from {self.bucket_name} bucket."
             )
@@ -146,26 +677,215 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
 
         return response.get("Body")
 
-    def list_objects(self) -> list[type[ModelType]]:
-        """Get a list with all objects created in S3 Bucket.
+    def _get_block(self, metadata: S3ObjectMetadata, index: int) -> bytes:
+        """Get a block of an object, from the block cache or from S3.
+
+        Missing blocks are read with a ranged GET conditional on the object
+        ETag, so a block is never cached under the ETag of another version.
+
+        Args:
+            metadata: Metadata of the object.
+            index: Index of the block in the object.
+
+        Returns:
+            bytes: Content of the block.
+        """
+        object_key, etag = metadata.file_name, metadata.etag
+        if (block := self.block_cache.get(object_key, etag, index)) is not None:
+            return block
+
+        block_start = index * self.block_cache.block_size
+        block_end = min(
+            block_start + self.block_cache.block_size, metadata.content_length
+        )
+        body = self.get_object(
+            object_key, byte_range=(block_start, block_end - 1), if_match=etag
+        )
+        try:
+            block = body.read()
+        finally:
+            body.close()
+        self.block_cache.set(object_key, etag, index, block)
+        return block
+
+    def _iter_blocks(
+        self,
+        metadata: S3ObjectMetadata,
+        first_block: bytes,
+        byte_range: tuple[int, int],
+        chunk_size: int,
+    ) -> Iterator[bytes]:
+        """Read a range of an object block by block, in chunks.
+
+        Args:
+            metadata: Metadata of the object.
+            first_block: Content of the block holding the first byte of the range.
+            byte_range: First and last byte to read, inclusive.
+            chunk_size: Maximum size of each chunk, in bytes.
+
+        Yields:
+            bytes: Next chunk of the range.
+        """
+        start, end = byte_range
+        block_size = self.block_cache.block_size
+        block = first_block
+        for index in range(start // block_size, end // block_size + 1):
+            if block is None:
+                block = self._get_block(metadata, index)
+            block_start = index * block_size
+            offset = max(start - block_start, 0)
+            block_end = min(end - block_start + 1, len(block))
+            while offset < block_end:
+                chunk_end = min(offset + chunk_size, block_end)
+                yield block[offset:chunk_end]
+                offset = chunk_end
+            block = None
+
+    def iter_cached_object(
+        self,
+        metadata: S3ObjectMetadata,
+        chunk_size: int,
+        byte_range: tuple[int, int] | None = None,
+    ) -> Iterator[bytes]:
+        """Read an object, or a range of its bytes, through the block cache.
+
+        Blocks are read from local disk when cached, and fetched from S3 and
+        cached on demand otherwise. The first block is read before returning, so
+        errors reading it are raised here and not while iterating.
+
+        Args:
+            metadata: Metadata of the object, as returned by head_object.
+            chunk_size: Maximum size of each chunk, in bytes.
+            byte_range: First and last byte to read, inclusive. None for the
+                whole object.
+
+        Returns:
+            Iterator[bytes]: Chunks of the object.
+        """
+        start, end = byte_range or (0, metadata.content_length - 1)
+        if end < start:
+            return iter(())
+        first_block = self._get_block(metadata, start // self.block_cache.block_size)
+        return self._iter_blocks(metadata, first_block, (start, end), chunk_size)
+
+    def block_cache_stats(self) -> CacheStats | None:
+        """Return the block cache counters, None if the cache is disabled."""
+        return self.block_cache.stats() if self.block_cache else None
+
+    def iter_object_summaries(
+        self,
+        prefix: str | None = None,
+        start_after: str | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[S3ObjectSummary]:
+        """Lazily iterate over the objects in the S3 bucket, in key order.
+
+        Pages are requested with continuation tokens as the iterator is consumed,
+        so every key is listed while only a single page is held in memory.
+
+        Args:
+            prefix: Only list keys starting with this prefix.
+            start_after: Only list keys after this one.
+            page_size: Maximum number of keys requested per page, up to 1000.
 
         Raises:
             S3ClientError: If failed to receive response from S3
 
+        Yields:
+            S3ObjectSummary: Key, size, ETag and modification time of each object.
+        """
+        list_kwargs = {"Bucket": self.bucket_name}
+        if prefix:
+            list_kwargs["Prefix"] = prefix
+        if start_after:
+            list_kwargs["StartAfter"] = start_after
+        if page_size:
+            list_kwargs["MaxKeys"] = page_size
+
+        while True:
+            try:
+                page = self.s3_client.list_objects_v2(**list_kwargs)
+            except ClientError as e:
+                logger.error(
+                    f"Failed to list_objects_v2 from {self.bucket_name} bucket."
+                )
+                raise S3ClientError(f"Failed to get response from S3: {e}")
+
+            for obj in page.get("Contents", []):
+                yield S3ObjectSummary(
+                    file_name=obj["Key"],
+                    size=obj["Size"],
+                    etag=obj["ETag"],
+                    last_modified=obj["LastModified"],
+                )
+
+            if not page.get("IsTruncated"):
+                return
+            list_kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    def iter_objects(
+        self,
+        prefix: str | None = None,
+        start_after: str | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[ModelType]:
+        """Lazily iterate over the files in the S3 bucket, in key order.
+
+        Args:
+            prefix: Only list keys starting with this prefix.
+            start_after: Only list keys after this one.
+            page_size: Maximum number of keys requested per page, up to 1000.
+
+        Yields:
+            ModelType: Object containing file_name and file_url.
+        """
+        for summary in self.iter_object_summaries(
+            prefix=prefix, start_after=start_after, page_size=page_size
+        ):
+            yield self.model(
+                file_name=summary.file_name,
+                file_url=self._build_object_url(summary.file_name),
+            )
+
+    def iter_object_batches(
+        self,
+        batch_size: int = 1000,
+        prefix: str | None = None,
+        start_after: str | None = None,
+    ) -> Iterator[list[ModelType]]:
+        """Lazily iterate over the files in the S3 bucket in batches.
+
+        Args:
+            batch_size: Number of files per batch, the last one may be smaller.
+            prefix: Only list keys starting with this prefix.
+            start_after: Only list keys after this one.
+
+        Yields:
+            list[ModelType]: Next batch of files, in key order.
+        """
+        batch = []
+        for file in self.iter_objects(
+            prefix=prefix, start_after=start_after, page_size=min(batch_size, 1000)
+        ):
+            batch.append(file)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def list_objects(self, prefix: str | None = None) -> list[type[ModelType]]:
+        """Get a list with all objects created in S3 Bucket.
+
+        Prefer iter_objects for big buckets, this list holds every file in memory.
+
+        Args:
+            prefix: Only list keys starting with this prefix.
+
         Returns:
             list[type[ModelType]]: List containing all files in S3 bucket.
         """
-        try:
-            files = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
-        except ClientError as e:
-            logger.error(f"Failed to list_objects_v2 from {self.bucket_name} bucket.")
-            raise S3ClientError(f"Failed to get response from S3: {e}")
-        return [
-            self.model(
-                file_name=obj["Key"], file_url=self._build_object_url(obj["Key"])
-            )
-            for obj in files.get("Contents", [])
-        ]
+        return list(self.iter_objects(prefix=prefix))
 
     def delete_object(self, object_key: str) -> None:
         """Delete an object from the S3 bucket.
@@ -201,6 +921,45 @@ class BaseS3Repository(Generic[ModelType, CreateModelType]):
             f"Successfully delete_object {object_key} from {self.bucket_name} bucket."
         )
 
+    def delete_objects(self, object_keys: list[str]) -> list[str]:
+        """Delete several objects from the S3 bucket, up to 1000 per request.
+
+        Keys that do not exist are deleted successfully.
+
+        Args:
+            object_keys: The keys (paths) of the objects in the S3 bucket.
+
+        Returns:
+            list[str]: Keys that could not be deleted.
+        """
+        failed_keys = []
+        for start in range(0, len(object_keys), MAX_DELETE_OBJECTS):
+            end = start + MAX_DELETE_OBJECTS
+            chunk = object_keys[start:end]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": object_key} for object_key in chunk],
+                        "Quiet": True,
+                    },
+                )
+            except ClientError as e:
+                logger.error(
+                    f"Failed to delete_objects from {self.bucket_name} bucket: {e}"
+                )
+                failed_keys += chunk
+                continue
+
+            if errors := response.get("Errors", []):
+                logger.error(
+                    f"Failed to delete {len(errors)} objects from "
+                    f"{self.bucket_name} bucket."
+                )
+                failed_keys += [error["Key"] for error in errors]
+
+        return failed_keys
+
     def _delete_all(self) -> list:
         """Delete all objects in the S3 bucket.
 
@@ -0,0 +1,212 @@
+"""S3DeletionQueue class to delete S3 objects in background batches."""
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from audio_api.aws.retries import exponential_backoff
+from audio_api.aws.s3.repositories.base_repository import (
+    MAX_DELETE_OBJECTS,
+    BaseS3Repository,
+)
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("s3_deletion_queue")
+
+CREATE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS s3_deletions (
+    bucket TEXT NOT NULL,
+    object_key TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    PRIMARY KEY (bucket, object_key)
+)
+"""
+
+
+class S3DeletionQueue:
+    """S3DeletionQueue class.
+
+    Object keys are stored in a SQLite table, so pending deletions survive
+    restarts, and deleted with delete_objects in batches of up to 1000 keys by a
+    background thread. Keys that fail to be deleted are retried with an
+    exponential backoff. Keys reported in use by get_keys_in_use right before
+    a batch is deleted are dropped from the queue instead, so an object used
+    again after being queued, even from another process, is kept.
+    """
+
+    def __init__(
+        self,
+        repository: BaseS3Repository,
+        path: Path | str,
+        flush_interval: float = 5,
+        retry_max_delay: float = 300,
+        timer: Callable[[], float] = time.time,
+        get_keys_in_use: Callable[[list[str]], set[str]] | None = None,
+    ):
+        """Open the queue, creating its SQLite table if needed.
+
+        Args:
+            repository: Repository of the bucket the objects are deleted from.
+            path: SQLite file of the queue, ":memory:" for a non persistent queue.
+            flush_interval: Seconds between background flushes.
+            retry_max_delay: Maximum seconds before retrying a failed deletion.
+            timer: Wall clock used to schedule retries.
+            get_keys_in_use: Return the keys of a batch that must not be deleted.
+        """
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.retry_max_delay = retry_max_delay
+        self._timer = timer
+        self._get_keys_in_use = get_keys_in_use
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(CREATE_TABLE_QUERY)
+
+    @property
+    def bucket_name(self) -> str:
+        """Name of the bucket the objects are deleted from."""
+        return self.repository.bucket_name
+
+    def enqueue(self, object_keys: Iterable[str]) -> None:
+        """Add objects to delete in the next flush.
+
+        Args:
+            object_keys: The keys (paths) of the objects in the S3 bucket.
+        """
+        now = self._timer()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO s3_deletions (bucket, object_key, "
+                "next_attempt_at) VALUES (?, ?, ?)",
+                [(self.bucket_name, object_key, now) for object_key in object_keys],
+            )
+
+    def cancel(self, object_keys: Iterable[str]) -> None:
+        """Remove objects from the queue, if they were waiting to be deleted.
+
+        Args:
+            object_keys: The keys (paths) of the objects in the S3 bucket.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM s3_deletions WHERE bucket = ? AND object_key = ?",
+                [(self.bucket_name, object_key) for object_key in object_keys],
+            )
+
+    def pending(self) -> int:
+        """Return the number of objects waiting to be deleted."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM s3_deletions WHERE bucket = ?",
+                (self.bucket_name,),
+            ).fetchone()
+        return count
+
+    def _due_batch(self) -> list[tuple[str, int]]:
+        """Get the next batch of objects whose deletion is due.
+
+        Returns:
+            list[tuple[str, int]]: Object keys and their failed attempts.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT object_key, attempts FROM s3_deletions "
+                "WHERE bucket = ? AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (self.bucket_name, self._timer(), MAX_DELETE_OBJECTS),
+            ).fetchall()
+
+    def flush(self) -> int:
+        """Delete every object whose deletion is due, in batches.
+
+        Returns:
+            int: Number of objects deleted.
+        """
+        deleted = 0
+        while batch := self._due_batch():
+            object_keys = [object_key for object_key, _ in batch]
+            kept_keys = (
+                self._get_keys_in_use(object_keys) if self._get_keys_in_use else set()
+            )
+            failed_keys = set(
+                self.repository.delete_objects(
+                    [
+                        object_key
+                        for object_key in object_keys
+                        if object_key not in kept_keys
+                    ]
+                )
+            )
+            now = self._timer()
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "DELETE FROM s3_deletions WHERE bucket = ? AND object_key = ?",
+                    [
+                        (self.bucket_name, object_key)
+                        for object_key, _ in batch
+                        if object_key not in failed_keys
+                    ],
+                )
+                self._connection.executemany(
+                    "UPDATE s3_deletions SET attempts = ?, next_attempt_at = ? "
+                    "WHERE bucket = ? AND object_key = ?",
+                    [
+                        (
+                            attempts + 1,
+                            now
+                            + exponential_backoff(
+                                attempts, base_delay=1, max_delay=self.retry_max_delay
+                            ),
+                            self.bucket_name,
+                            object_key,
+                        )
+                        for object_key, attempts in batch
+                        if object_key in failed_keys
+                    ],
+                )
+            deleted += len(batch) - len(kept_keys) - len(failed_keys)
+            if kept_keys:
+                logger.info(f"Kept {len(kept_keys)} objects used again since queued.")
+            if failed_keys:
+                logger.warning(
+                    f"Failed to delete {len(failed_keys)} objects, retrying."
+                )
+        return deleted
+
+    def _run(self) -> None:
+        """Flush the queue every flush_interval seconds until stopped."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush the S3 deletion queue: {e}")
+
+    def start(self) -> None:
+        """Start flushing the queue in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="s3_deletion_queue", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, flushing the queue one last time."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush the S3 deletion queue: {e}")
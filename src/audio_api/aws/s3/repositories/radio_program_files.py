@@ -1,7 +1,13 @@
 """RadioProgramFilesRepository class."""
 
+from audio_api.aws.cache import LRUCache
+from audio_api.aws.dynamodb.repositories import radio_program_file_references_repository
+from audio_api.aws.s3.block_cache import S3BlockCache
 from audio_api.aws.s3.models import RadioProgramFile, RadioProgramFileCreate
-from audio_api.aws.s3.repositories import BaseS3Repository
+from audio_api.aws.s3.repositories import BaseS3Repository, S3DeletionQueue
+from audio_api.aws.settings import get_settings
+
+settings = get_settings()
 
 
 class RadioProgramFilesRepository(
@@ -10,4 +16,62 @@ class RadioProgramFilesRepository(
     """RadioProgramFilesRepository class."""
 
 
-radio_program_files_repository = RadioProgramFilesRepository(RadioProgramFile)
+radio_program_files_repository = RadioProgramFilesRepository(
+    RadioProgramFile,
+    url_cache=(
+        LRUCache(
+            max_size=settings.S3_PRESIGNED_URL_CACHE_MAX_ITEMS,
+            ttl_seconds=max(
+                settings.S3_PRESIGNED_URL_EXPIRATION
+                - settings.S3_PRESIGNED_URL_REFRESH_MARGIN,
+                0,
+            ),
+        )
+        if settings.S3_PRESIGNED_URLS
+        else None
+    ),
+    block_cache=(
+        S3BlockCache(
+            path=settings.S3_BLOCK_CACHE_PATH,
+            max_bytes=settings.S3_BLOCK_CACHE_MAX_BYTES,
+            block_size=settings.S3_BLOCK_CACHE_BLOCK_SIZE,
+        )
+        if settings.S3_BLOCK_CACHE_ENABLED
+        else None
+    ),
+)
+
+
+def get_referenced_keys(object_keys: list[str]) -> set[str]:
+    """Return the keys of content-addressed files, and their sidecars, in use.
+
+    Args:
+        object_keys: The keys (paths) of the objects in the S3 bucket.
+
+    Returns:
+        set[str]: Keys whose source file is referenced by a RadioProgram.
+    """
+    source_keys = {
+        object_key: RadioProgramFilesRepository.get_source_key(object_key)
+        for object_key in object_keys
+    }
+    referenced = {
+        source_key
+        for source_key in set(source_keys.values())
+        if RadioProgramFilesRepository.is_content_addressed_key(source_key)
+        and radio_program_file_references_repository.get_references(source_key) > 0
+    }
+    return {
+        object_key
+        for object_key, source_key in source_keys.items()
+        if source_key in referenced
+    }
+
+
+radio_program_files_deletion_queue = S3DeletionQueue(
+    radio_program_files_repository,
+    path=settings.S3_DELETION_QUEUE_PATH,
+    flush_interval=settings.S3_DELETION_QUEUE_FLUSH_INTERVAL,
+    retry_max_delay=settings.S3_DELETION_RETRY_MAX_DELAY,
+    get_keys_in_use=get_referenced_keys,
+)
@@ -1,8 +1,10 @@
 """Persistence settings."""
+import tempfile
 from enum import Enum
 from functools import lru_cache
+from pathlib import Path
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, PositiveFloat, PositiveInt, conint
 
 from audio_api.settings import EnvironmentSettings
 
@@ -11,6 +13,9 @@ class DynamoDbTables(str, Enum):
     """DynamoDbTable Enum."""
 
     radio_programs = "radio_programs"
+    radio_program_files = "radio_program_files"
+    radio_program_jobs = "radio_program_jobs"
+    radio_program_uploads = "radio_program_uploads"
 
 
 class S3Buckets(str, Enum):
@@ -19,6 +24,14 @@ class S3Buckets(str, Enum):
     radio_programs = "radio-programs"
 
 
+class AwsRetryMode(str, Enum):
+    """AwsRetryMode Enum with the botocore retry modes."""
+
+    legacy = "legacy"
+    standard = "standard"
+    adaptive = "adaptive"
+
+
 class AwsSettings(EnvironmentSettings, BaseSettings):
     """AwsSettings class."""
 
@@ -28,6 +41,87 @@ class AwsSettings(EnvironmentSettings, BaseSettings):
     AWS_DEFAULT_REGION: str
     RADIO_PROGRAMS_BUCKET: str
 
+    # Shared botocore client settings. Every repository and worker thread of a
+    # service uses the same client, so its connection pool must be at least as
+    # large as the number of concurrent requests.
+    AWS_MAX_POOL_CONNECTIONS: PositiveInt = 50
+    AWS_CONNECT_TIMEOUT: PositiveFloat = 5
+    AWS_READ_TIMEOUT: PositiveFloat = 60
+    AWS_RETRY_MODE: AwsRetryMode = AwsRetryMode.adaptive
+    AWS_MAX_ATTEMPTS: PositiveInt = 5
+    AWS_TCP_KEEPALIVE: bool = True
+
+    # Parallel scan settings used by full-table DynamoDB operations
+    DYNAMODB_SCAN_SEGMENTS: PositiveInt = 4
+    DYNAMODB_SCAN_MAX_WORKERS: PositiveInt = 4
+    # Attempts before giving up on unprocessed batch items
+    DYNAMODB_BATCH_MAX_ATTEMPTS: PositiveInt = 5
+    # Conditional writes of a batch sent concurrently
+    DYNAMODB_BATCH_MAX_WORKERS: PositiveInt = 8
+    # Partitions the air_date_index is spread over. Changing it requires
+    # running `manage backfill-indexes` to move stored programs.
+    DYNAMODB_AIR_DATE_SHARDS: PositiveInt = 4
+
+    # Read-through item cache. Entries may be stale for up to the TTL when
+    # items are written by other processes.
+    DYNAMODB_CACHE_ENABLED: bool = False
+    DYNAMODB_CACHE_MAX_ITEMS: PositiveInt = 1024
+    DYNAMODB_CACHE_TTL_SECONDS: PositiveFloat = 30
+
+    # Files of at least S3_MULTIPART_THRESHOLD bytes are uploaded in parts,
+    # S3_MULTIPART_CONCURRENCY at a time. S3 parts must be at least 5 MiB.
+    S3_MULTIPART_THRESHOLD: PositiveInt = 64 * 1024 * 1024
+    S3_MULTIPART_PART_SIZE: conint(ge=5 * 1024 * 1024) = 16 * 1024 * 1024
+    S3_MULTIPART_CONCURRENCY: PositiveInt = 4
+    # Attempts of a single part before aborting the multipart upload
+    S3_MULTIPART_MAX_ATTEMPTS: PositiveInt = 3
+    # Seconds presigned upload URLs stay valid
+    S3_PRESIGNED_UPLOAD_EXPIRATION: PositiveInt = 3600
+
+    # Serve file URLs as presigned GET URLs instead of public object URLs.
+    # Signatures are cached per file and renewed once less than
+    # S3_PRESIGNED_URL_REFRESH_MARGIN seconds are left before they expire.
+    S3_PRESIGNED_URLS: bool = False
+    S3_PRESIGNED_URL_EXPIRATION: PositiveInt = 3600
+    S3_PRESIGNED_URL_REFRESH_MARGIN: PositiveInt = 300
+    S3_PRESIGNED_URL_CACHE_MAX_ITEMS: PositiveInt = 4096
+
+    # Store uploaded files under the SHA-256 of their content, so identical
+    # files are stored once. References are counted in the radio_program_files
+    # table and a file is deleted when its last program is.
+    S3_CONTENT_ADDRESSED_STORAGE: bool = False
+
+    # On-disk cache of fixed-size blocks of S3 objects, keyed by object key,
+    # ETag and offset. Least recently used blocks are evicted once the cache
+    # holds more than S3_BLOCK_CACHE_MAX_BYTES.
+    S3_BLOCK_CACHE_ENABLED: bool = False
+    S3_BLOCK_CACHE_PATH: Path = Path(tempfile.gettempdir()) / "audio_api_s3_blocks"
+    S3_BLOCK_CACHE_BLOCK_SIZE: PositiveInt = 1024 * 1024
+    S3_BLOCK_CACHE_MAX_BYTES: PositiveInt = 1024 * 1024 * 1024
+
+    # Parsed MP3 seek indexes kept in memory, by file. Indexes never change
+    # once uploaded, so entries are only evicted when the cache is full.
+    S3_SEEK_INDEX_CACHE_MAX_ITEMS: PositiveInt = 1024
+
+    # SQLite file of the queue of S3 objects to delete in the background. Point
+    # it to a persistent volume, so pending deletions survive restarts.
+    S3_DELETION_QUEUE_PATH: Path = (
+        Path(tempfile.gettempdir()) / "audio_api_s3_deletion_queue.sqlite3"
+    )
+    S3_DELETION_QUEUE_FLUSH_INTERVAL: PositiveFloat = 5
+    # Failed deletions are retried with an exponential backoff up to this delay
+    S3_DELETION_RETRY_MAX_DELAY: PositiveFloat = 300
+
+    # Analysis jobs of uploaded files, queued in the radio_program_jobs table
+    # and run by `manage worker` on ANALYSIS_WORKER_PROCESSES processes. Failed
+    # jobs are queued again until they reach ANALYSIS_JOB_MAX_ATTEMPTS attempts.
+    ANALYSIS_WORKER_PROCESSES: PositiveInt = 2
+    ANALYSIS_WORKER_POLL_INTERVAL: PositiveFloat = 5
+    ANALYSIS_JOB_MAX_ATTEMPTS: PositiveInt = 3
+    # Jobs still running this long after being claimed are assumed to belong to
+    # a dead worker and are claimed again
+    ANALYSIS_JOB_LEASE_SECONDS: PositiveFloat = 900
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> AwsSettings:
@@ -0,0 +1,306 @@
+"""AnalysisWorker interface to run the analysis jobs of RadioProgram files."""
+import multiprocessing
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from audio_api.aws.dynamodb.exceptions import DynamoDbClientError, DynamoDbStatusError
+from audio_api.aws.dynamodb.models import (
+    RadioProgramJobItemModel,
+    RadioProgramJobUpdateItemModel,
+)
+from audio_api.aws.dynamodb.repositories import radio_program_jobs_repository
+from audio_api.aws.dynamodb.repositories.radio_program_jobs import (
+    RadioProgramJobsRepository,
+)
+from audio_api.aws.settings import get_settings
+from audio_api.domain.models import (
+    AnalysisWorkerReport,
+    RadioProgramJobKind,
+    RadioProgramJobStatus,
+)
+from audio_api.domain.radio_programs import RadioPrograms
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("analysis_worker")
+settings = get_settings()
+
+
+def _index_file(program_id: uuid.UUID, file_name: str) -> dict[str, Any]:
+    """Compute the duration and the seek index of a RadioProgram file.
+
+    Args:
+        program_id: Id of the RadioProgram.
+        file_name: S3 key of the RadioProgram file.
+
+    Returns:
+        dict[str, Any]: Duration and S3 key of the seek index, empty if the
+            RadioProgram has another file since.
+    """
+    radio_program_file = RadioPrograms.index_file(
+        program_id=program_id, file_name=file_name
+    )
+    if radio_program_file is None:
+        return {}
+    return radio_program_file.dict(include={"program_length", "seek_index"})
+
+
+def _generate_waveforms(program_id: uuid.UUID, file_name: str) -> dict[str, Any]:
+    """Compute the waveforms of a RadioProgram file.
+
+    Args:
+        program_id: Id of the RadioProgram.
+        file_name: S3 key of the RadioProgram file.
+
+    Returns:
+        dict[str, Any]: Stored resolutions.
+    """
+    resolutions = RadioPrograms.generate_waveforms(file_name=file_name)
+    return {"resolutions": [resolution.value for resolution in resolutions]}
+
+
+# Analysis steps by job kind. Steps run in worker processes, so they must be
+# module level functions.
+ANALYSIS_STEPS: dict[RadioProgramJobKind, Callable[[uuid.UUID, str], dict]] = {
+    RadioProgramJobKind.seek_index: _index_file,
+    RadioProgramJobKind.waveform: _generate_waveforms,
+}
+
+
+def _run_job(
+    kind: RadioProgramJobKind, program_id: uuid.UUID, file_name: str
+) -> dict[str, Any]:
+    """Run the analysis step of a job, in a worker process.
+
+    Args:
+        kind: Kind of the job.
+        program_id: Id of the RadioProgram.
+        file_name: S3 key of the RadioProgram file.
+
+    Returns:
+        dict[str, Any]: Result of the analysis step.
+    """
+    return ANALYSIS_STEPS[kind](program_id, file_name)
+
+
+class AnalysisWorker:
+    """AnalysisWorker class used to run the queued analysis jobs.
+
+    Pending jobs are claimed in the jobs table and run on a process pool, so
+    decoding never blocks the API and scales with the number of processes.
+    Leases of long jobs are renewed while they run, and results and errors are
+    written back when they finish, unless the job was claimed again meanwhile.
+    """
+
+    radio_program_jobs_repository: RadioProgramJobsRepository = (
+        radio_program_jobs_repository
+    )
+
+    @classmethod
+    def _claim_jobs(
+        cls,
+        limit: int,
+        max_attempts: int,
+        lease_seconds: float,
+        report: AnalysisWorkerReport,
+    ) -> list[RadioProgramJobItemModel]:
+        """Claim up to limit pending jobs, or jobs of dead workers, oldest first.
+
+        Jobs of dead workers that reached max_attempts are marked as failed
+        instead of run again.
+
+        Args:
+            limit: Maximum number of jobs to claim.
+            max_attempts: Attempts before a job is no longer retried.
+            lease_seconds: Seconds before a running job can be claimed again.
+            report: Report updated with the jobs marked as failed.
+
+        Returns:
+            list[RadioProgramJobItemModel]: Claimed jobs.
+        """
+        jobs = []
+        now = datetime.now(timezone.utc)
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        for pending_job in cls.radio_program_jobs_repository.get_pending_items(
+            limit, now
+        ):
+            # Another worker may have claimed the job since it was listed.
+            job = cls.radio_program_jobs_repository.claim_item(
+                pending_job.id, now, lease_expires_at
+            )
+            if job is None:
+                continue
+            if job.attempts > max_attempts:
+                cls._fail_expired_job(job)
+                report.failed_jobs += 1
+            else:
+                jobs.append(job)
+        return jobs
+
+    @classmethod
+    def _fail_expired_job(cls, job: RadioProgramJobItemModel) -> None:
+        """Mark as failed a job whose worker died on its last attempt.
+
+        Args:
+            job: Job claimed again after its lease expired.
+        """
+        logger.error(f"Job {job.id} lease expired on its last attempt.")
+        cls._write_job(
+            job,
+            RadioProgramJobUpdateItemModel(
+                status=RadioProgramJobStatus.failed,
+                error="Worker lease expired.",
+                updated_at=datetime.now(timezone.utc),
+            ),
+        )
+
+    @classmethod
+    def _write_job(
+        cls, job: RadioProgramJobItemModel, update_job: RadioProgramJobUpdateItemModel
+    ) -> None:
+        """Write the outcome of a job, dropping it if the job was claimed again.
+
+        Args:
+            job: Job as claimed by this worker.
+            update_job: Outcome of the job.
+        """
+        try:
+            if not cls.radio_program_jobs_repository.update_claimed_item(
+                item_id=job.id, item=update_job, attempts=job.attempts
+            ):
+                logger.warning(
+                    f"Dropped the stale {update_job.status.value} result of job "
+                    f"{job.id}, claimed again after attempt {job.attempts}."
+                )
+        except (DynamoDbClientError, DynamoDbStatusError) as e:
+            logger.error(f"Failed to write the result of job {job.id}: {e}")
+
+    @classmethod
+    def _finish_job(
+        cls,
+        job: RadioProgramJobItemModel,
+        future: Future,
+        max_attempts: int,
+        report: AnalysisWorkerReport,
+    ) -> None:
+        """Write the result of a finished job, queueing it again if it failed.
+
+        Args:
+            job: Finished job.
+            future: Future of the analysis step.
+            max_attempts: Attempts before a failed job is no longer retried.
+            report: Report updated with the outcome of the job.
+        """
+        update_job = RadioProgramJobUpdateItemModel(
+            updated_at=datetime.now(timezone.utc)
+        )
+        try:
+            update_job.result = future.result()
+            update_job.status = RadioProgramJobStatus.succeeded
+            report.succeeded_jobs += 1
+        except Exception as e:
+            logger.error(f"Job {job.id} failed on attempt {job.attempts}: {e}")
+            update_job.error = str(e)
+            if job.attempts < max_attempts:
+                update_job.status = RadioProgramJobStatus.pending
+                report.retried_jobs += 1
+            else:
+                update_job.status = RadioProgramJobStatus.failed
+                report.failed_jobs += 1
+        cls._write_job(job, update_job)
+
+    @classmethod
+    def _renew_leases(
+        cls, jobs: list[RadioProgramJobItemModel], lease_seconds: float
+    ) -> None:
+        """Extend the leases of running jobs past half of their duration.
+
+        Args:
+            jobs: Jobs running on this worker.
+            lease_seconds: Seconds before a running job can be claimed again.
+        """
+        now = datetime.now(timezone.utc)
+        renew_before = now + timedelta(seconds=lease_seconds / 2)
+        for job in jobs:
+            if job.lease_expires_at is not None and job.lease_expires_at > renew_before:
+                continue
+            lease_expires_at = now + timedelta(seconds=lease_seconds)
+            try:
+                if cls.radio_program_jobs_repository.renew_lease(
+                    item_id=job.id,
+                    attempts=job.attempts,
+                    lease_expires_at=lease_expires_at,
+                ):
+                    job.lease_expires_at = lease_expires_at
+                else:
+                    logger.warning(f"Job {job.id} was claimed again by another worker.")
+            except (DynamoDbClientError, DynamoDbStatusError) as e:
+                logger.error(f"Failed to renew the lease of job {job.id}: {e}")
+
+    @classmethod
+    def run(
+        cls,
+        *,
+        processes: int = settings.ANALYSIS_WORKER_PROCESSES,
+        poll_interval: float = settings.ANALYSIS_WORKER_POLL_INTERVAL,
+        max_attempts: int = settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+        lease_seconds: float = settings.ANALYSIS_JOB_LEASE_SECONDS,
+        until_idle: bool = False,
+    ) -> AnalysisWorkerReport:
+        """Run pending jobs on a process pool, claiming new ones as slots free up.
+
+        Worker processes are spawned rather than forked, so each one creates
+        its own AWS clients.
+
+        Args:
+            processes: Number of jobs run at the same time.
+            poll_interval: Seconds between polls of the pending jobs when idle.
+            max_attempts: Attempts before a failed job is no longer retried.
+            lease_seconds: Seconds before a running job is assumed to belong to
+                a dead worker and is claimed again.
+            until_idle: Return once no job is pending or running, instead of
+                polling forever.
+
+        Returns:
+            AnalysisWorkerReport: Outcome of the jobs run.
+        """
+        report = AnalysisWorkerReport()
+        running: dict[Future, RadioProgramJobItemModel] = {}
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            while True:
+                if len(running) < processes:
+                    try:
+                        jobs = cls._claim_jobs(
+                            processes - len(running),
+                            max_attempts,
+                            lease_seconds,
+                            report,
+                        )
+                    except (DynamoDbClientError, DynamoDbStatusError) as e:
+                        # Keep finishing the running jobs, claiming again later.
+                        logger.error(f"Failed to claim jobs: {e}")
+                        jobs = []
+                    for job in jobs:
+                        future = executor.submit(
+                            _run_job, job.kind, job.program_id, job.file_name
+                        )
+                        running[future] = job
+
+                if not running:
+                    if until_idle:
+                        return report
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(
+                    running, timeout=poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    cls._finish_job(running.pop(future), future, max_attempts, report)
+                # Long jobs keep their lease, so they are not claimed again.
+                cls._renew_leases(list(running.values()), lease_seconds)
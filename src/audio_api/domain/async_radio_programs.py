@@ -0,0 +1,372 @@
+"""AsyncRadioPrograms interface to handle use cases from asyncio code."""
+import uuid
+from collections.abc import Iterator
+from datetime import date
+from typing import BinaryIO
+
+from fastapi.concurrency import run_in_threadpool
+
+from audio_api.api.schemas import (
+    RadioProgramBatchCreateInSchema,
+    RadioProgramCreateInSchema,
+    RadioProgramUpdateInSchema,
+)
+from audio_api.audio.waveform import WaveformResolution
+from audio_api.aws.dynamodb.models import DynamoDbBatchItemResult, DynamoDbPage
+from audio_api.aws.s3.models import S3ObjectMetadata, S3PresignedUpload
+from audio_api.domain.models import (
+    RadioProgramAudioMetadata,
+    RadioProgramJobModel,
+    RadioProgramModel,
+)
+from audio_api.domain.radio_programs import RadioPrograms
+
+
+class AsyncRadioPrograms:
+    """AsyncRadioPrograms class with awaitable RadioPrograms use cases.
+
+    Each use case runs on the worker thread pool as a whole, so multi-step use
+    cases keep their S3 and DynamoDB rollback logic in RadioPrograms while the
+    event loop keeps serving other requests.
+    """
+
+    radio_programs: type[RadioPrograms] = RadioPrograms
+
+    @classmethod
+    async def get(cls, *, program_id: uuid.UUID) -> RadioProgramModel:
+        """Get a RadioProgram by program_id from DB.
+
+        Args:
+            program_id: program_id of the RadioProgram to retrieve.
+
+        Returns:
+            RadioProgramModel: Model containing stored data.
+        """
+        return await run_in_threadpool(cls.radio_programs.get, program_id=program_id)
+
+    @classmethod
+    async def get_all(
+        cls, *, date_from: date | None = None, date_to: date | None = None
+    ) -> list[RadioProgramModel]:
+        """Get all RadioPrograms from DB, optionally filtered by air_date.
+
+        Args:
+            date_from: First air_date to include.
+            date_to: Last air_date to include.
+
+        Returns:
+            list[RadioProgramModel]: List containing all stored RadioPrograms.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_all, date_from=date_from, date_to=date_to
+        )
+
+    @classmethod
+    async def get_many(cls, *, program_ids: list[uuid.UUID]) -> list[RadioProgramModel]:
+        """Get several RadioPrograms by program_id from DB.
+
+        Args:
+            program_ids: program_ids of the RadioPrograms to retrieve.
+
+        Returns:
+            list[RadioProgramModel]: Existing RadioPrograms in the requested order.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_many, program_ids=program_ids
+        )
+
+    @classmethod
+    async def get_page(
+        cls,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> DynamoDbPage[RadioProgramModel]:
+        """Get a single page of RadioPrograms from DB.
+
+        Args:
+            limit: Maximum number of RadioPrograms to read.
+            cursor: Cursor returned by the previous page, if any.
+            date_from: First air_date to include.
+            date_to: Last air_date to include.
+
+        Returns:
+            DynamoDbPage[RadioProgramModel]: RadioPrograms and the next page cursor.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_page,
+            limit=limit,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    @classmethod
+    async def get_audio_metadata(
+        cls, *, program_id: uuid.UUID
+    ) -> RadioProgramAudioMetadata:
+        """Get the metadata of the MP3 file of a RadioProgram.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+
+        Returns:
+            RadioProgramAudioMetadata: Size, type, ETag and modification time of
+                the file, and the S3 key of its seek index.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_audio_metadata, program_id=program_id
+        )
+
+    @classmethod
+    async def get_audio_offset(
+        cls, *, metadata: RadioProgramAudioMetadata, start: float
+    ) -> int | None:
+        """Get the byte offset of the frame playing at a time of a RadioProgram file.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+            start: Playback time, in seconds.
+
+        Returns:
+            int | None: Offset of the frame, None if start is after the end.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_audio_offset, metadata=metadata, start=start
+        )
+
+    @classmethod
+    async def get_clip_range(
+        cls, *, metadata: RadioProgramAudioMetadata, start: float, end: float
+    ) -> tuple[int, int] | None:
+        """Get the frame-aligned byte range of a clip of a RadioProgram file.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+            start: Start of the clip, in seconds.
+            end: End of the clip, in seconds, clamped to the end of the file.
+
+        Returns:
+            tuple[int, int] | None: First and last byte, inclusive. None if
+                start is after the end of the file.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_clip_range, metadata=metadata, start=start, end=end
+        )
+
+    @classmethod
+    async def iter_audio(
+        cls,
+        *,
+        file_name: str,
+        chunk_size: int,
+        byte_range: tuple[int, int] | None = None,
+        metadata: S3ObjectMetadata | None = None,
+    ) -> Iterator[bytes]:
+        """Stream a RadioProgram MP3 file, or a range of its bytes, from S3.
+
+        Iterating the returned chunks blocks, so it must run on worker threads,
+        as StreamingResponse does with synchronous iterators.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+            chunk_size: Maximum size of each chunk, in bytes.
+            byte_range: First and last byte to read, inclusive. None for the
+                whole file.
+            metadata: Metadata of the file, as returned by get_audio_metadata.
+
+        Returns:
+            Iterator[bytes]: Chunks of the file.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.iter_audio,
+            file_name=file_name,
+            chunk_size=chunk_size,
+            byte_range=byte_range,
+            metadata=metadata,
+        )
+
+    @classmethod
+    async def get_waveform(
+        cls, *, program_id: uuid.UUID, resolution: WaveformResolution
+    ) -> bytes:
+        """Get the precomputed waveform of a RadioProgram.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+            resolution: Peaks per second of the waveform.
+
+        Returns:
+            bytes: Waveform in the audiowaveform binary format.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_waveform,
+            program_id=program_id,
+            resolution=resolution,
+        )
+
+    @classmethod
+    async def get_jobs(cls, *, program_id: uuid.UUID) -> list[RadioProgramJobModel]:
+        """Get the analysis jobs of a RadioProgram, oldest first.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+
+        Returns:
+            list[RadioProgramJobModel]: Jobs of the RadioProgram.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.get_jobs, program_id=program_id
+        )
+
+    @classmethod
+    async def create(
+        cls,
+        *,
+        radio_program: RadioProgramCreateInSchema,
+        program_file: BinaryIO,
+    ) -> RadioProgramModel:
+        """Create a new RadioProgram by uploading to s3 and storing metadata in DB.
+
+        Args:
+            radio_program: Input data.
+            program_file: MP3 file containing the radio program.
+
+        Returns:
+            RadioProgramModel: Model containing stored data.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.create,
+            radio_program=radio_program,
+            program_file=program_file,
+        )
+
+    @classmethod
+    async def create_upload(cls, *, title: str, file_size: int) -> S3PresignedUpload:
+        """Create presigned URLs to upload a RadioProgram file directly to S3.
+
+        Args:
+            title: Title of the RadioProgram, used to name the file.
+            file_size: Size of the MP3 file, in bytes.
+
+        Returns:
+            S3PresignedUpload: File name and presigned URLs of the upload.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.create_upload, title=title, file_size=file_size
+        )
+
+    @classmethod
+    async def complete_upload(
+        cls,
+        *,
+        radio_program: RadioProgramCreateInSchema,
+        file_name: str,
+        upload_id: str | None = None,
+    ) -> RadioProgramModel:
+        """Create a new RadioProgram from a file uploaded with create_upload.
+
+        Args:
+            radio_program: Input data.
+            file_name: File name returned by create_upload.
+            upload_id: Multipart upload id returned by create_upload, if any.
+
+        Returns:
+            RadioProgramModel: Model containing stored data.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.complete_upload,
+            radio_program=radio_program,
+            file_name=file_name,
+            upload_id=upload_id,
+        )
+
+    @classmethod
+    async def update(
+        cls,
+        *,
+        program_id: uuid.UUID,
+        new_program: RadioProgramUpdateInSchema,
+        program_file: BinaryIO = None,
+        expected_version: int | None = None,
+    ) -> RadioProgramModel:
+        """Update an existing RadioProgram with new properties and new file if included.
+
+        Args:
+            program_id: of the RadioProgram to retrieve.
+            new_program: RadioProgramUpdateIn model with new data.
+            program_file: If there is a program file, it will be uploaded to S3.
+            expected_version: If provided, only update RadioProgram at this version.
+
+        Returns:
+            RadioProgramModel: Model containing updated data.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.update,
+            program_id=program_id,
+            new_program=new_program,
+            program_file=program_file,
+            expected_version=expected_version,
+        )
+
+    @classmethod
+    async def delete(cls, *, program_id: uuid.UUID) -> None:
+        """Remove an existing RadioProgram and S3 file if exists.
+
+        Args:
+            program_id: of the RadioProgram to be removed.
+        """
+        await run_in_threadpool(cls.radio_programs.delete, program_id=program_id)
+
+    @classmethod
+    async def create_many(
+        cls, *, radio_programs: list[RadioProgramBatchCreateInSchema]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Store the metadata of several RadioPrograms in a few DB round trips.
+
+        Args:
+            radio_programs: Input data.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                RadioProgram, in the same order as radio_programs.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.create_many, radio_programs=radio_programs
+        )
+
+    @classmethod
+    async def update_many(
+        cls, *, new_programs: dict[uuid.UUID, RadioProgramUpdateInSchema]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Update the metadata of several existing RadioPrograms.
+
+        Args:
+            new_programs: RadioProgramUpdateIn models with new data by program_id.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                RadioProgram, in the same order as new_programs.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.update_many, new_programs=new_programs
+        )
+
+    @classmethod
+    async def delete_many(
+        cls, *, program_ids: list[uuid.UUID]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Remove several existing RadioPrograms and their S3 files.
+
+        Args:
+            program_ids: program_ids of the RadioPrograms to be removed.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                program_id, in the same order as program_ids.
+        """
+        return await run_in_threadpool(
+            cls.radio_programs.delete_many, program_ids=program_ids
+        )
@@ -0,0 +1,166 @@
+"""FileReconciliation interface to find files out of sync between S3 and DynamoDB."""
+import json
+import tempfile
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TextIO
+
+from audio_api.aws.dynamodb.repositories import radio_programs_repository
+from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
+from audio_api.aws.s3.repositories import radio_program_files_repository
+from audio_api.aws.s3.repositories.base_repository import MAX_DELETE_OBJECTS
+from audio_api.aws.s3.repositories.radio_program_files import (
+    RadioProgramFilesRepository,
+)
+from audio_api.domain.models import FileReconciliationReport
+
+
+def _partition(key: str, partitions: int) -> int:
+    """Get the partition of a key, stable across processes.
+
+    Args:
+        key: S3 object key or file name.
+        partitions: Number of partitions.
+
+    Returns:
+        int: Partition index.
+    """
+    return zlib.crc32(key.encode()) % partitions
+
+
+class FileReconciliation:
+    """FileReconciliation class used to find and delete orphaned S3 files.
+
+    S3 keys and referenced file names are streamed into hash partitions on disk,
+    then each partition is diffed on its own, so memory is bounded by the size
+    of a single partition instead of the whole bucket. Sidecar files are
+    partitioned by the key of their source file, and kept while it is
+    referenced.
+    """
+
+    radio_programs_repository: RadioProgramsRepository = radio_programs_repository
+    radio_program_files_repository: RadioProgramFilesRepository = (
+        radio_program_files_repository
+    )
+
+    @classmethod
+    def _write_partitions(
+        cls, directory: Path, partitions: int, cutoff: datetime
+    ) -> tuple[int, int]:
+        """Stream S3 keys and referenced file names into partition files.
+
+        The bucket is listed before the table is scanned, so a program written
+        while listing is always seen as referenced.
+
+        Args:
+            directory: Directory where partition files are written.
+            partitions: Number of partitions.
+            cutoff: Objects modified before this datetime can be deleted.
+
+        Returns:
+            tuple[int, int]: Number of scanned objects and referenced files.
+        """
+        scanned_objects = referenced_files = 0
+        object_files: list[TextIO] = []
+        file_name_files: list[TextIO] = []
+        try:
+            for index in range(partitions):
+                object_files.append(open(directory / f"objects_{index}", "w"))
+                file_name_files.append(open(directory / f"file_names_{index}", "w"))
+
+            for summary in cls.radio_program_files_repository.iter_object_summaries():
+                expired = summary.last_modified < cutoff
+                source_key = cls.radio_program_files_repository.get_source_key(
+                    summary.file_name
+                )
+                object_files[_partition(source_key, partitions)].write(
+                    f"{json.dumps([summary.file_name, expired])}\n"
+                )
+                scanned_objects += 1
+
+            for file_name in cls.radio_programs_repository.iter_file_names():
+                file_name_files[_partition(file_name, partitions)].write(
+                    f"{json.dumps(file_name)}\n"
+                )
+                referenced_files += 1
+        finally:
+            for partition_file in object_files + file_name_files:
+                partition_file.close()
+        return scanned_objects, referenced_files
+
+    @classmethod
+    def _delete_objects(
+        cls, object_keys: list[str], report: FileReconciliationReport
+    ) -> None:
+        """Delete a batch of orphaned objects, updating the report counters.
+
+        Args:
+            object_keys: Keys of the objects to delete.
+            report: Report to update.
+        """
+        failed_keys = cls.radio_program_files_repository.delete_objects(object_keys)
+        report.deleted_objects += len(object_keys) - len(failed_keys)
+        report.failed_deletions += len(failed_keys)
+
+    @classmethod
+    def run(
+        cls,
+        *,
+        grace_period: timedelta,
+        partitions: int = 16,
+        dry_run: bool = False,
+        now: datetime | None = None,
+    ) -> FileReconciliationReport:
+        """Find S3 objects without a program and programs without a S3 object.
+
+        Orphaned objects modified within the grace period are kept, since they
+        can belong to an upload that is still in progress. The grace period
+        should be longer than the presigned upload expiration.
+
+        Args:
+            grace_period: Minimum age of the orphaned objects to delete.
+            partitions: Number of partitions to split keys into.
+            dry_run: Only report orphaned objects, without deleting them.
+            now: Reference datetime for the grace period, defaults to now.
+
+        Returns:
+            FileReconciliationReport: Counters of the reconciliation.
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - grace_period
+        report = FileReconciliationReport()
+        pending_deletions: list[str] = []
+        get_source_key = cls.radio_program_files_repository.get_source_key
+
+        with tempfile.TemporaryDirectory() as directory_name:
+            directory = Path(directory_name)
+            (
+                report.scanned_objects,
+                report.referenced_files,
+            ) = cls._write_partitions(directory, partitions, cutoff)
+
+            for index in range(partitions):
+                with open(directory / f"file_names_{index}") as file_names:
+                    referenced = {json.loads(line) for line in file_names}
+                stored = set()
+                with open(directory / f"objects_{index}") as objects:
+                    for line in objects:
+                        object_key, expired = json.loads(line)
+                        source_key = get_source_key(object_key)
+                        if source_key == object_key:
+                            stored.add(object_key)
+                        if source_key in referenced:
+                            continue
+                        report.orphaned_objects += 1
+                        if not expired:
+                            report.recent_orphaned_objects += 1
+                        elif not dry_run:
+                            pending_deletions.append(object_key)
+                        if len(pending_deletions) >= MAX_DELETE_OBJECTS:
+                            cls._delete_objects(pending_deletions, report)
+                            pending_deletions = []
+                report.missing_files += len(referenced - stored)
+
+        if pending_deletions:
+            cls._delete_objects(pending_deletions, report)
+        return report
@@ -1,5 +1,14 @@
+from audio_api.domain.models.analysis_worker import AnalysisWorkerReport
+from audio_api.domain.models.file_reconciliation import FileReconciliationReport
 from audio_api.domain.models.radio_program import (
     BaseRadioProgramModel,
+    RadioProgramAudioMetadata,
     RadioProgramFileModel,
     RadioProgramModel,
 )
+from audio_api.domain.models.radio_program_job import (
+    BaseRadioProgramJobModel,
+    RadioProgramJobKind,
+    RadioProgramJobModel,
+    RadioProgramJobStatus,
+)
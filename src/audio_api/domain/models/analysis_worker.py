@@ -0,0 +1,10 @@
+"""AnalysisWorker Models."""
+from pydantic import BaseModel
+
+
+class AnalysisWorkerReport(BaseModel):
+    """AnalysisWorkerReport class."""
+
+    succeeded_jobs: int = 0
+    retried_jobs: int = 0
+    failed_jobs: int = 0
@@ -0,0 +1,14 @@
+"""FileReconciliation Models."""
+from pydantic import BaseModel
+
+
+class FileReconciliationReport(BaseModel):
+    """FileReconciliationReport class."""
+
+    scanned_objects: int = 0
+    referenced_files: int = 0
+    orphaned_objects: int = 0
+    recent_orphaned_objects: int = 0
+    missing_files: int = 0
+    deleted_objects: int = 0
+    failed_deletions: int = 0
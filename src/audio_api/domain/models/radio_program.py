@@ -4,13 +4,20 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from audio_api.aws.s3.models import RadioProgramFile
+from audio_api.aws.s3.models import RadioProgramFile, S3ObjectMetadata
 
 
 class RadioProgramFileModel(RadioProgramFile):
     """RadioProgramFileModel class."""
 
     program_length: int | None
+    seek_index: str | None
+
+
+class RadioProgramAudioMetadata(S3ObjectMetadata):
+    """RadioProgramAudioMetadata class."""
+
+    seek_index: str | None
 
 
 class BaseRadioProgramSchema(BaseModel):
@@ -35,3 +42,4 @@ class RadioProgramModel(BaseRadioProgramModel):
 
     # TODO: This shouldn't be None
     id: UUID | None
+    version: int | None = Field(example=1)
@@ -0,0 +1,44 @@
+"""RadioProgramJob Models."""
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class RadioProgramJobKind(str, Enum):
+    """Analysis step run on a RadioProgram file."""
+
+    seek_index = "seek_index"
+    waveform = "waveform"
+
+
+class RadioProgramJobStatus(str, Enum):
+    """Status of a RadioProgram job."""
+
+    pending = "pending"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class BaseRadioProgramJobModel(BaseModel):
+    """BaseRadioProgramJobModel class."""
+
+    program_id: UUID
+    file_name: str
+    kind: RadioProgramJobKind = Field(example=RadioProgramJobKind.waveform)
+    status: RadioProgramJobStatus = Field(example=RadioProgramJobStatus.succeeded)
+    attempts: int = Field(0, example=1)
+    result: dict[str, Any] | None
+    error: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class RadioProgramJobModel(BaseRadioProgramJobModel):
+    """RadioProgramJobModel class."""
+
+    id: UUID
+    version: int | None = Field(example=1)
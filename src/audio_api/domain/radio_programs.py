@@ -1,22 +1,110 @@
 """RadioPrograms interface to handle use cases."""
+import math
+import shutil
+import tempfile
 import uuid
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timezone
 from typing import BinaryIO
 
-from audio_api.api.schemas import RadioProgramCreateInSchema, RadioProgramUpdateInSchema
-from audio_api.aws.dynamodb.exceptions import DynamoDbClientError
+from botocore.response import StreamingBody
+
+from audio_api.api.schemas import (
+    RadioProgramBatchCreateInSchema,
+    RadioProgramCreateInSchema,
+    RadioProgramUpdateInSchema,
+)
+from audio_api.audio.mp3 import get_mp3_duration
+from audio_api.audio.seek_index import (
+    MAX_FRAME_LENGTH,
+    SeekIndex,
+    find_frame,
+    index_audio_frames,
+)
+from audio_api.audio.waveform import (
+    WAVEFORM_RESOLUTIONS,
+    WaveformResolution,
+    compute_waveforms,
+)
+from audio_api.aws.cache import CacheStats, LRUCache
+from audio_api.aws.dynamodb.exceptions import (
+    DynamoDbClientError,
+    DynamoDbItemNotFoundError,
+    DynamoDbStatusError,
+    DynamoDbVersionConflictError,
+)
 from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemResult,
+    DynamoDbBatchItemStatus,
+    DynamoDbPage,
+    RadioProgramJobPutItemModel,
     RadioProgramPutItemModel,
     RadioProgramUpdateItemModel,
 )
-from audio_api.aws.dynamodb.repositories import radio_programs_repository
+from audio_api.aws.dynamodb.repositories import (
+    radio_program_file_references_repository,
+    radio_program_jobs_repository,
+    radio_program_uploads_repository,
+    radio_programs_repository,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_file_references import (
+    RadioProgramFileReferencesRepository,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_jobs import (
+    RadioProgramJobsRepository,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_uploads import (
+    RadioProgramUploadsRepository,
+)
 from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
-from audio_api.aws.s3.exceptions import S3ClientError, S3PersistenceError
-from audio_api.aws.s3.models import RadioProgramFileCreate
-from audio_api.aws.s3.repositories import radio_program_files_repository
+from audio_api.aws.s3.exceptions import (
+    S3ClientError,
+    S3FileNotFoundError,
+    S3PersistenceError,
+)
+from audio_api.aws.s3.models import (
+    RadioProgramFile,
+    RadioProgramFileCreate,
+    S3ObjectMetadata,
+    S3PresignedUpload,
+)
+from audio_api.aws.s3.repositories import (
+    radio_program_files_deletion_queue,
+    radio_program_files_repository,
+)
+from audio_api.aws.s3.repositories.deletion_queue import S3DeletionQueue
 from audio_api.aws.s3.repositories.radio_program_files import (
     RadioProgramFilesRepository,
 )
-from audio_api.domain.models import RadioProgramModel
+from audio_api.aws.settings import get_settings
+from audio_api.domain.models import (
+    RadioProgramAudioMetadata,
+    RadioProgramFileModel,
+    RadioProgramJobKind,
+    RadioProgramJobModel,
+    RadioProgramJobStatus,
+    RadioProgramModel,
+)
+from audio_api.logger.logger import get_logger
+
+logger = get_logger("radio_programs_domain")
+settings = get_settings()
+
+
+def _iter_chunks(body: StreamingBody, chunk_size: int) -> Iterator[bytes]:
+    """Read a S3 object body in chunks, closing it when done or abandoned.
+
+    Args:
+        body: Body of a S3 get_object response.
+        chunk_size: Maximum size of each chunk, in bytes.
+
+    Yields:
+        bytes: Next chunk of the body.
+    """
+    try:
+        yield from body.iter_chunks(chunk_size=chunk_size)
+    finally:
+        body.close()
 
 
 class RadioPrograms:
@@ -26,22 +114,295 @@ class RadioPrograms:
     radio_program_files_repository: RadioProgramFilesRepository = (
         radio_program_files_repository
     )
+    radio_program_file_references_repository: RadioProgramFileReferencesRepository = (
+        radio_program_file_references_repository
+    )
+    radio_program_jobs_repository: RadioProgramJobsRepository = (
+        radio_program_jobs_repository
+    )
+    radio_program_uploads_repository: RadioProgramUploadsRepository = (
+        radio_program_uploads_repository
+    )
+    deletion_queue: S3DeletionQueue = radio_program_files_deletion_queue
+    content_addressed_storage: bool = settings.S3_CONTENT_ADDRESSED_STORAGE
+    seek_index_cache: LRUCache = LRUCache(
+        max_size=settings.S3_SEEK_INDEX_CACHE_MAX_ITEMS, ttl_seconds=math.inf
+    )
 
     @classmethod
-    def _delete_file_from_s3(cls, file_name: str):
-        """Delete file from S3 by file_name.
+    def _upload_file(
+        cls, *, file_name: str, program_file: BinaryIO
+    ) -> RadioProgramFileModel:
+        """Upload a RadioProgram file to S3, together with its duration.
+
+        The duration is read before uploading, from the Xing/Info header when
+        the file has one. The seek index needs every frame header, so it is left
+        to the seek index analysis job. With content-addressed storage the file
+        is stored under the hash of its content and referenced once more, so
+        the upload is skipped when an identical file is already stored.
 
         Args:
-            file_name: File to be deleted.
+            file_name: Name of the file, without extension.
+            program_file: MP3 file containing the radio program.
+
+        Returns:
+            RadioProgramFileModel: Uploaded file and its duration in seconds.
         """
+        duration = get_mp3_duration(program_file)
+        uploaded_file = cls._put_file(file_name=file_name, program_file=program_file)
+        return RadioProgramFileModel(
+            **uploaded_file.dict(),
+            program_length=round(duration) if duration is not None else None,
+        )
+
+    @staticmethod
+    def _read_file_index(program_file: BinaryIO) -> tuple[int | None, SeekIndex | None]:
+        """Read the duration and the seek index of a MP3 file in a single frame walk.
+
+        Args:
+            program_file: MP3 file containing the radio program.
+
+        Returns:
+            tuple[int | None, SeekIndex | None]: Duration in seconds and seek
+                index, None if no MP3 frame is found.
+        """
+        frame_index = index_audio_frames(program_file)
+        if frame_index is None:
+            return None, None
+        duration, seek_index = frame_index
+        return round(duration), seek_index
+
+    @classmethod
+    def _put_file(cls, *, file_name: str, program_file: BinaryIO) -> RadioProgramFile:
+        """Put a RadioProgram file to S3, deduplicated if content-addressed.
+
+        Args:
+            file_name: Name of the file, without extension.
+            program_file: MP3 file containing the radio program.
+
+        Raises:
+            S3ClientError: If failed to get response from S3.
+            S3PersistenceError: If failed to store object in S3.
+
+        Returns:
+            RadioProgramFile: Uploaded file.
+        """
+        file_create = RadioProgramFileCreate(file_name=file_name, file=program_file)
+        if not cls.content_addressed_storage:
+            return cls.radio_program_files_repository.put_object(file_create)
+
+        object_key = cls.radio_program_files_repository.build_content_addressed_key(
+            program_file
+        )
+        references = cls.radio_program_file_references_repository.add_references(
+            object_key
+        )
+        # The file may be waiting to be deleted since its last reference was removed.
+        cls.deletion_queue.cancel([object_key, *cls._sidecar_keys(object_key)])
         try:
-            # Remove uploaded file in s3
-            cls.radio_program_files_repository.delete_object(object_key=file_name)
-        except (S3ClientError, S3PersistenceError):
-            pass
-            # TODO: Should we care if we failed to delete?
-            # TODO: Run a monthly job to cleanup orphan programs?
-            # This could potentially remove new uploaded programs during cleanup
+            if references > 1:
+                return cls.radio_program_files_repository.put_object_if_missing(
+                    file_create, object_key=object_key
+                )
+            return cls.radio_program_files_repository.put_object(
+                file_create, object_key=object_key
+            )
+        except (S3ClientError, S3PersistenceError) as e:
+            cls.radio_program_file_references_repository.remove_reference(object_key)
+            raise e
+
+    @classmethod
+    def _waveform_key(cls, file_name: str, resolution: WaveformResolution) -> str:
+        """Get the S3 key of the waveform of a RadioProgram file.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+            resolution: Peaks per second of the waveform.
+
+        Returns:
+            str: S3 key of the waveform, stored next to the file.
+        """
+        return cls.radio_program_files_repository.build_sidecar_key(
+            file_name, f"waveform_{resolution.value}.dat"
+        )
+
+    @classmethod
+    def _seek_index_key(cls, file_name: str) -> str:
+        """Get the S3 key of the seek index of a RadioProgram file.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+
+        Returns:
+            str: S3 key of the seek index, stored next to the file.
+        """
+        return cls.radio_program_files_repository.build_sidecar_key(
+            file_name, "seek_index.bin"
+        )
+
+    @classmethod
+    def _sidecar_keys(cls, file_name: str) -> list[str]:
+        """Get the S3 keys of every file derived from a RadioProgram file.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+
+        Returns:
+            list[str]: S3 keys of the derived files, which may not exist.
+        """
+        return [
+            cls._seek_index_key(file_name),
+            *(
+                cls._waveform_key(file_name, resolution)
+                for resolution in WAVEFORM_RESOLUTIONS
+            ),
+        ]
+
+    @classmethod
+    def _release_files(cls, file_names: Iterable[str]):
+        """Queue files no longer used by a RadioProgram to be deleted from S3.
+
+        Content-addressed files are only deleted once their last reference is
+        removed. Files derived from them are deleted together.
+
+        Args:
+            file_names: Files no longer used by a RadioProgram.
+        """
+        cls.deletion_queue.enqueue(
+            object_key
+            for file_name in file_names
+            if not cls.radio_program_files_repository.is_content_addressed_key(
+                file_name
+            )
+            or cls.radio_program_file_references_repository.remove_reference(file_name)
+            == 0
+            for object_key in (file_name, *cls._sidecar_keys(file_name))
+        )
+
+    @classmethod
+    def _enqueue_analysis(
+        cls, program: RadioProgramModel
+    ) -> list[RadioProgramJobModel]:
+        """Queue the analysis jobs of the file of a RadioProgram.
+
+        The jobs are run by the analysis worker, so uploads do not wait for
+        them. The seek index is only computed by a job for files that were not
+        read on upload. Failures are only logged, the RadioProgram is served
+        without the analysis results.
+
+        Args:
+            program: RadioProgram with a new file.
+
+        Returns:
+            list[RadioProgramJobModel]: Queued jobs.
+        """
+        kinds = [RadioProgramJobKind.waveform]
+        if program.radio_program.seek_index is None:
+            kinds.insert(0, RadioProgramJobKind.seek_index)
+
+        now = datetime.now(timezone.utc)
+        results = cls.radio_program_jobs_repository.put_items(
+            RadioProgramJobPutItemModel(
+                program_id=program.id,
+                file_name=program.radio_program.file_name,
+                kind=kind,
+                status=RadioProgramJobStatus.pending,
+                created_at=now,
+                updated_at=now,
+            )
+            for kind in kinds
+        )
+        jobs = []
+        for result in results:
+            if result.status != DynamoDbBatchItemStatus.succeeded:
+                logger.error(
+                    f"Failed to queue a job of RadioProgram {program.id}: "
+                    f"{result.error}"
+                )
+            else:
+                jobs.append(result.item)
+        return jobs
+
+    @classmethod
+    def _set_file_urls(
+        cls, radio_programs: list[RadioProgramModel]
+    ) -> list[RadioProgramModel]:
+        """Set the download URL of the files of several RadioPrograms.
+
+        All URLs of a response are signed in a single batch, if presigned URLs
+        are enabled.
+
+        Args:
+            radio_programs: RadioPrograms to update in place.
+
+        Returns:
+            list[RadioProgramModel]: The same RadioPrograms.
+        """
+        cls.radio_program_files_repository.set_file_urls(
+            [
+                program.radio_program
+                for program in radio_programs
+                if program.radio_program
+            ]
+        )
+        return radio_programs
+
+    @classmethod
+    def _set_result_file_urls(
+        cls, results: list[DynamoDbBatchItemResult[RadioProgramModel]]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Set the download URL of the files of the succeeded items of a batch.
+
+        Args:
+            results: Batch results to update in place.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: The same results.
+        """
+        cls._set_file_urls(
+            [
+                result.item
+                for result in results
+                if result.status == DynamoDbBatchItemStatus.succeeded and result.item
+            ]
+        )
+        return results
+
+    @classmethod
+    def get_pending_file_deletions(cls) -> int:
+        """Get the number of RadioProgram files waiting to be deleted from S3.
+
+        Returns:
+            int: Number of files in the deletion queue.
+        """
+        return cls.deletion_queue.pending()
+
+    @classmethod
+    def get_url_cache_stats(cls) -> CacheStats | None:
+        """Get the presigned file URL cache counters, if enabled.
+
+        Returns:
+            CacheStats | None: Cache counters, None if the cache is disabled.
+        """
+        return cls.radio_program_files_repository.url_cache_stats()
+
+    @classmethod
+    def get_block_cache_stats(cls) -> CacheStats | None:
+        """Get the counters of the RadioProgram files block cache.
+
+        Returns:
+            CacheStats | None: Cache counters, None if the cache is disabled.
+        """
+        return cls.radio_program_files_repository.block_cache_stats()
+
+    @classmethod
+    def get_cache_stats(cls) -> CacheStats | None:
+        """Get the RadioPrograms read-through cache counters, if enabled.
+
+        Returns:
+            CacheStats | None: Cache counters, None if the cache is disabled.
+        """
+        return cls.radio_programs_repository.cache_stats()
 
     @classmethod
     def get(cls, *, program_id: uuid.UUID) -> RadioProgramModel:
@@ -53,16 +414,359 @@ class RadioPrograms:
         Returns:
             RadioProgramModel: Model containing stored data.
         """
-        return cls.radio_programs_repository.get_item(item_id=program_id)
+        program = cls.radio_programs_repository.get_item(item_id=program_id)
+        return cls._set_file_urls([program])[0]
 
     @classmethod
-    def get_all(cls) -> list[RadioProgramModel]:
+    def get_all(
+        cls, *, date_from: date | None = None, date_to: date | None = None
+    ) -> list[RadioProgramModel]:
         """Get all RadioPrograms from DB.
 
+        If date_from or date_to are provided, only RadioPrograms aired in that date
+        range are returned, sorted by air_date.
+
+        Args:
+            date_from: First air_date to include.
+            date_to: Last air_date to include.
+
         Returns:
             list[RadioProgramModel]: List containing all stored RadioPrograms.
         """
-        return cls.radio_programs_repository.get_items()
+        if date_from or date_to:
+            programs = cls.radio_programs_repository.get_items_by_air_date(
+                date_from=date_from, date_to=date_to
+            )
+        else:
+            programs = cls.radio_programs_repository.get_items()
+        return cls._set_file_urls(programs)
+
+    @classmethod
+    def get_many(cls, *, program_ids: list[uuid.UUID]) -> list[RadioProgramModel]:
+        """Get several RadioPrograms by program_id from DB in a few round trips.
+
+        Args:
+            program_ids: program_ids of the RadioPrograms to retrieve.
+
+        Returns:
+            list[RadioProgramModel]: Existing RadioPrograms in the requested order.
+        """
+        return cls._set_file_urls(
+            cls.radio_programs_repository.get_items_by_ids(item_ids=program_ids)
+        )
+
+    @classmethod
+    def get_page(
+        cls,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> DynamoDbPage[RadioProgramModel]:
+        """Get a single page of RadioPrograms from DB.
+
+        Args:
+            limit: Maximum number of RadioPrograms to read.
+            cursor: Cursor returned by the previous page, if any.
+            date_from: First air_date to include.
+            date_to: Last air_date to include.
+
+        Returns:
+            DynamoDbPage[RadioProgramModel]: RadioPrograms and the next page cursor.
+        """
+        if date_from or date_to:
+            page = cls.radio_programs_repository.get_items_by_air_date_page(
+                limit=limit, cursor=cursor, date_from=date_from, date_to=date_to
+            )
+        else:
+            page = cls.radio_programs_repository.get_items_page(
+                limit=limit, cursor=cursor
+            )
+        cls._set_file_urls(page.items)
+        return page
+
+    @classmethod
+    def get_audio_metadata(cls, *, program_id: uuid.UUID) -> RadioProgramAudioMetadata:
+        """Get the metadata of the MP3 file of a RadioProgram.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+
+        Returns:
+            RadioProgramAudioMetadata: Size, type, ETag and modification time of
+                the file, and the S3 key of its seek index.
+        """
+        program = cls.radio_programs_repository.get_item(item_id=program_id)
+        metadata = cls.radio_program_files_repository.head_object(
+            object_key=program.radio_program.file_name
+        )
+        return RadioProgramAudioMetadata(
+            **metadata.dict(), seek_index=program.radio_program.seek_index
+        )
+
+    @classmethod
+    def get_audio_offset(
+        cls, *, metadata: RadioProgramAudioMetadata, start: float
+    ) -> int | None:
+        """Get the byte offset of the frame playing at a time of a RadioProgram file.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+            start: Playback time, in seconds.
+
+        Returns:
+            int | None: Offset of the frame, None if start is after the end.
+        """
+        return cls._get_seek_index(metadata).get_offset(start)
+
+    @classmethod
+    def _get_seek_index(cls, metadata: RadioProgramAudioMetadata) -> SeekIndex:
+        """Get the seek index of a RadioProgram file.
+
+        The seek index referenced by the RadioProgram is read from S3 once and
+        kept in memory.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+
+        Raises:
+            S3FileNotFoundError: If the file has not been indexed.
+
+        Returns:
+            SeekIndex: Seek index of the file.
+        """
+        if metadata.seek_index is None:
+            raise S3FileNotFoundError(f"File {metadata.file_name} is not indexed.")
+
+        seek_index = cls.seek_index_cache.get(metadata.seek_index)
+        if seek_index is None:
+            body = cls.radio_program_files_repository.get_object(
+                object_key=metadata.seek_index
+            )
+            try:
+                seek_index = SeekIndex.from_bytes(body.read())
+            finally:
+                body.close()
+            cls.seek_index_cache.set(metadata.seek_index, seek_index)
+        return seek_index
+
+    @classmethod
+    def _find_frame_offset(
+        cls,
+        metadata: RadioProgramAudioMetadata,
+        seek_index: SeekIndex,
+        start: float,
+        after: bool = False,
+    ) -> int | None:
+        """Get the exact offset of a frame of a RadioProgram file.
+
+        Only the bytes between the indexed frames around start are read.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+            seek_index: Seek index of the file.
+            start: Playback time, in seconds.
+            after: Find the first frame starting at or after start instead of
+                the frame playing at start.
+
+        Returns:
+            int | None: Offset of the frame, None if start is after the end.
+        """
+        interval = seek_index.get_interval(start)
+        if interval is None:
+            return None
+        indexed_time, first, next_offset = interval
+        last = metadata.content_length - 1
+        if next_offset is not None:
+            # The frame found may start right after the next indexed frame
+            last = min(next_offset + MAX_FRAME_LENGTH + 3, last)
+
+        data = b"".join(
+            cls.iter_audio(
+                file_name=metadata.file_name,
+                chunk_size=last - first + 1,
+                byte_range=(first, last),
+                metadata=metadata,
+            )
+        )
+        position = find_frame(data, indexed_time, start, after=after)
+        return first + position if position is not None else None
+
+    @classmethod
+    def get_clip_range(
+        cls, *, metadata: RadioProgramAudioMetadata, start: float, end: float
+    ) -> tuple[int, int] | None:
+        """Get the frame-aligned byte range of a clip of a RadioProgram file.
+
+        The clip holds every frame playing between start and end. Its bounds are
+        found with the seek index of the file and by reading the frame headers
+        around them, so the bytes read do not depend on the program length.
+
+        Args:
+            metadata: Metadata of the RadioProgram file.
+            start: Start of the clip, in seconds.
+            end: End of the clip, in seconds, clamped to the end of the file.
+
+        Returns:
+            tuple[int, int] | None: First and last byte, inclusive. None if
+                start is after the end of the file.
+        """
+        seek_index = cls._get_seek_index(metadata)
+        first = cls._find_frame_offset(metadata, seek_index, start)
+        if first is None:
+            return None
+        last = cls._find_frame_offset(metadata, seek_index, end, after=True)
+        return first, (last if last is not None else metadata.content_length) - 1
+
+    @classmethod
+    def iter_audio(
+        cls,
+        *,
+        file_name: str,
+        chunk_size: int,
+        byte_range: tuple[int, int] | None = None,
+        metadata: S3ObjectMetadata | None = None,
+    ) -> Iterator[bytes]:
+        """Stream a RadioProgram MP3 file, or a range of its bytes, from S3.
+
+        The S3 request is sent before returning, so errors are raised here and
+        not while iterating. Only one chunk at a time is held in memory. If the
+        block cache is enabled and the file metadata is known, the file is read
+        through the block cache.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+            chunk_size: Maximum size of each chunk, in bytes.
+            byte_range: First and last byte to read, inclusive. None for the
+                whole file.
+            metadata: Metadata of the file, as returned by get_audio_metadata.
+
+        Returns:
+            Iterator[bytes]: Chunks of the file.
+        """
+        if metadata is not None and cls.radio_program_files_repository.block_cache:
+            return cls.radio_program_files_repository.iter_cached_object(
+                metadata=metadata, chunk_size=chunk_size, byte_range=byte_range
+            )
+
+        body = cls.radio_program_files_repository.get_object(
+            object_key=file_name, byte_range=byte_range
+        )
+        return _iter_chunks(body, chunk_size)
+
+    @classmethod
+    def generate_waveforms(cls, *, file_name: str) -> list[WaveformResolution]:
+        """Compute the waveform of a RadioProgram file and store it in S3.
+
+        The file is streamed from S3 and decoded once. A waveform is stored next
+        to the file for every resolution, in the audiowaveform binary format.
+
+        Args:
+            file_name: S3 key of the RadioProgram file.
+
+        Returns:
+            list[WaveformResolution]: Stored resolutions.
+        """
+        body = cls.radio_program_files_repository.get_object(object_key=file_name)
+        try:
+            waveforms = compute_waveforms(body)
+        finally:
+            body.close()
+
+        for resolution, waveform in waveforms.items():
+            cls.radio_program_files_repository.put_bytes(
+                object_key=cls._waveform_key(file_name, resolution),
+                data=waveform.to_bytes(),
+            )
+        return list(waveforms)
+
+    @classmethod
+    def index_file(
+        cls, *, program_id: uuid.UUID, file_name: str
+    ) -> RadioProgramFileModel | None:
+        """Compute the duration and the seek index of a stored RadioProgram file.
+
+        Files uploaded with presigned URLs are not read on upload, so they are
+        downloaded to a temporary file instead. The seek index is stored next to
+        the file, and both are written to the RadioProgram only if it is at the
+        version read, so a concurrent update is never overwritten.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+            file_name: S3 key of the RadioProgram file.
+
+        Returns:
+            RadioProgramFileModel | None: Updated file of the RadioProgram, None
+                if the RadioProgram has another file since.
+        """
+        body = cls.radio_program_files_repository.get_object(object_key=file_name)
+        with tempfile.TemporaryFile() as program_file:
+            try:
+                shutil.copyfileobj(body, program_file)
+            finally:
+                body.close()
+            program_length, seek_index = cls._read_file_index(program_file)
+
+        program = cls.radio_programs_repository.get_item(item_id=program_id)
+        if program.radio_program.file_name != file_name:
+            return None
+
+        seek_index_key = None
+        if seek_index is not None:
+            seek_index_key = cls._seek_index_key(file_name)
+            cls.radio_program_files_repository.put_bytes(
+                object_key=seek_index_key, data=seek_index.to_bytes()
+            )
+        radio_program_file = program.radio_program.copy(
+            update={"program_length": program_length, "seek_index": seek_index_key}
+        )
+        cls.radio_programs_repository.update_item_with_previous(
+            item_id=program_id,
+            item=RadioProgramUpdateItemModel.construct(
+                radio_program=radio_program_file
+            ),
+            expected_version=program.version,
+        )
+        return radio_program_file
+
+    @classmethod
+    def get_jobs(cls, *, program_id: uuid.UUID) -> list[RadioProgramJobModel]:
+        """Get the analysis jobs of a RadioProgram, oldest first.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+
+        Returns:
+            list[RadioProgramJobModel]: Jobs of the RadioProgram.
+        """
+        jobs = cls.radio_program_jobs_repository.get_items_by_program(program_id)
+        if not jobs:
+            # Raises DynamoDbItemNotFoundError if the RadioProgram does not exist.
+            cls.radio_programs_repository.get_item(item_id=program_id)
+        return jobs
+
+    @classmethod
+    def get_waveform(
+        cls, *, program_id: uuid.UUID, resolution: WaveformResolution
+    ) -> bytes:
+        """Get the precomputed waveform of a RadioProgram.
+
+        Args:
+            program_id: program_id of the RadioProgram.
+            resolution: Peaks per second of the waveform.
+
+        Returns:
+            bytes: Waveform in the audiowaveform binary format.
+        """
+        program = cls.radio_programs_repository.get_item(item_id=program_id)
+        body = cls.radio_program_files_repository.get_object(
+            object_key=cls._waveform_key(program.radio_program.file_name, resolution)
+        )
+        try:
+            return body.read()
+        finally:
+            body.close()
 
     @classmethod
     def create(
@@ -77,15 +781,100 @@ class RadioPrograms:
             radio_program: Input data.
             program_file: MP3 file containing the radio program.
 
+        Returns:
+            RadioProgramModel: Model containing stored data.
+        """
+        uploaded_file = cls._upload_file(
+            file_name=radio_program.title, program_file=program_file
+        )
+        return cls._put_program(
+            radio_program=radio_program, uploaded_file=uploaded_file
+        )
+
+    @classmethod
+    def create_upload(cls, *, title: str, file_size: int) -> S3PresignedUpload:
+        """Create presigned URLs to upload a RadioProgram file directly to S3.
+
+        The upload is recorded until it is completed or its URLs expire.
+
+        Args:
+            title: Title of the RadioProgram, used to name the file.
+            file_size: Size of the MP3 file, in bytes.
+
+        Returns:
+            S3PresignedUpload: File name and presigned URLs of the upload.
+        """
+        upload = cls.radio_program_files_repository.create_presigned_upload(
+            file_name=title, file_size=file_size
+        )
+        cls.radio_program_uploads_repository.add_upload(
+            file_name=upload.file_name,
+            upload_id=upload.upload_id,
+            expires_in=upload.expires_in,
+        )
+        return upload
+
+    @classmethod
+    def complete_upload(
+        cls,
+        *,
+        radio_program: RadioProgramCreateInSchema,
+        file_name: str,
+        upload_id: str | None = None,
+    ) -> RadioProgramModel:
+        """Create a new RadioProgram from a file uploaded with create_upload.
+
+        Only files of uploads created with create_upload, not expired and not
+        completed yet are accepted, so a RadioProgram can not reference a file
+        of another one.
+
+        Args:
+            radio_program: Input data.
+            file_name: File name returned by create_upload.
+            upload_id: Multipart upload id returned by create_upload, if any.
+
         Raises:
-            DynamoDbClientError: If failed to store new RadioProgram in DB.
+            DynamoDbItemNotFoundError: If there is no such pending upload.
 
         Returns:
             RadioProgramModel: Model containing stored data.
         """
-        uploaded_file = cls.radio_program_files_repository.put_object(
-            RadioProgramFileCreate(file_name=radio_program.title, file=program_file)
+        if cls.radio_program_files_repository.is_content_addressed_key(file_name):
+            raise DynamoDbItemNotFoundError(f"Upload of {file_name} not found.")
+        # Fail before touching S3, the upload is only claimed once completed so
+        # it can be retried until the file is uploaded.
+        cls.radio_program_uploads_repository.get_upload(
+            file_name=file_name, upload_id=upload_id
+        )
+        uploaded_file = cls.radio_program_files_repository.complete_presigned_upload(
+            object_key=file_name, upload_id=upload_id
         )
+        cls.radio_program_uploads_repository.claim_upload(
+            file_name=file_name, upload_id=upload_id
+        )
+        return cls._put_program(
+            radio_program=radio_program, uploaded_file=uploaded_file
+        )
+
+    @classmethod
+    def _put_program(
+        cls,
+        *,
+        radio_program: RadioProgramCreateInSchema,
+        uploaded_file: RadioProgramFile,
+    ) -> RadioProgramModel:
+        """Store a new RadioProgram in DB, deleting its file if it fails.
+
+        Args:
+            radio_program: Input data.
+            uploaded_file: RadioProgram file already stored in S3.
+
+        Raises:
+            DynamoDbClientError: If failed to store new RadioProgram in DB.
+
+        Returns:
+            RadioProgramModel: Model containing stored data.
+        """
         radio_program_db = RadioProgramPutItemModel(
             **radio_program.dict(), radio_program=uploaded_file
         )
@@ -93,10 +882,11 @@ class RadioPrograms:
             new_program = cls.radio_programs_repository.put_item(item=radio_program_db)
         except DynamoDbClientError as e:
             if uploaded_file.file_url:
-                cls._delete_file_from_s3(file_name=uploaded_file.file_name)
+                cls._release_files([uploaded_file.file_name])
             raise e
 
-        return new_program
+        cls._enqueue_analysis(new_program)
+        return cls._set_file_urls([new_program])[0]
 
     @classmethod
     def update(
@@ -105,53 +895,80 @@ class RadioPrograms:
         program_id: uuid.UUID,
         new_program: RadioProgramUpdateInSchema,
         program_file: BinaryIO = None,
+        expected_version: int | None = None,
     ) -> RadioProgramModel:
         """Update an existing RadioProgram with new properties and new file if included.
 
+        The update is a single conditional write that returns the previous
+        RadioProgram. The stored program is only read beforehand to name a new
+        file sent without a title.
+
         Args:
             program_id: of the RadioProgram to retrieve.
             new_program: RadioProgramUpdateIn model with new data.
             program_file: If there is a program file, it will be uploaded to S3.
+            expected_version: If provided, only update RadioProgram at this version.
 
         Raises:
             DynamoDbClientError: If failed to update RadioProgram in DB.
+            DynamoDbItemNotFoundError: If RadioProgram does not exist.
+            DynamoDbStatusError: If received error status code.
+            DynamoDbVersionConflictError: If RadioProgram is at another version.
 
         Returns:
             RadioProgramModel: Model containing updated data.
         """
-        db_program = cls.get(program_id=program_id)
-        existing_file = None
-        if db_program.radio_program:
-            existing_file = db_program.radio_program.file_name
-
-        update_program = RadioProgramUpdateItemModel(**db_program.dict())
-        update_program = update_program.copy(update=new_program.dict(exclude_none=True))
+        # Fields left out keep their stored values, so skip validation.
+        update_program = RadioProgramUpdateItemModel.construct(
+            **new_program.dict(exclude_none=True)
+        )
 
         if program_file:
+            # The file is named after the title before the write, so a new file
+            # without a title needs the stored one.
+            title = new_program.title
+            if title is None:
+                title = cls.radio_programs_repository.get_item(item_id=program_id).title
             # Will throw RadioProgramS3Error if fails to persist program.
-            uploaded_file = cls.radio_program_files_repository.put_object(
-                RadioProgramFileCreate(
-                    file_name=update_program.title, file=program_file
-                )
-            )
+            uploaded_file = cls._upload_file(file_name=title, program_file=program_file)
             update_program.radio_program = uploaded_file
 
         try:
-            updated_program = radio_programs_repository.update_item(
-                item_id=program_id, item=update_program
+            (
+                db_program,
+                updated_program,
+            ) = cls.radio_programs_repository.update_item_with_previous(
+                item_id=program_id,
+                item=update_program,
+                expected_version=expected_version,
             )
-        except DynamoDbClientError as e:
+        except (
+            DynamoDbClientError,
+            DynamoDbStatusError,
+            DynamoDbItemNotFoundError,
+            DynamoDbVersionConflictError,
+        ) as e:
             if program_file:
-                cls._delete_file_from_s3(
-                    file_name=update_program.radio_program.file_name
-                )
+                cls._release_files([update_program.radio_program.file_name])
 
             raise e
 
-        if program_file and db_program.radio_program:
-            cls._delete_file_from_s3(file_name=existing_file)
+        if program_file:
+            previous_file_name = (
+                db_program.radio_program.file_name if db_program.radio_program else None
+            )
+            # A file uploaded with the same title in the same second overwrites
+            # the previous one under the same key, which must then be kept.
+            if previous_file_name and (
+                previous_file_name != updated_program.radio_program.file_name
+                or cls.radio_program_files_repository.is_content_addressed_key(
+                    previous_file_name
+                )
+            ):
+                cls._release_files([previous_file_name])
+            cls._enqueue_analysis(updated_program)
 
-        return updated_program
+        return cls._set_file_urls([updated_program])[0]
 
     @classmethod
     def delete(
@@ -164,7 +981,92 @@ class RadioPrograms:
         Args:
             program_id: of the RadioProgram to be removed.
         """
-        existing_program = cls.get(program_id=program_id)
+        existing_program = cls.radio_programs_repository.get_item(item_id=program_id)
         cls.radio_programs_repository.delete_item(item_id=program_id)
         if existing_program.radio_program:
-            cls._delete_file_from_s3(file_name=existing_program.radio_program.file_name)
+            cls._release_files([existing_program.radio_program.file_name])
+
+    @classmethod
+    def create_many(
+        cls, *, radio_programs: list[RadioProgramBatchCreateInSchema]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Store the metadata of several RadioPrograms in a few DB round trips.
+
+        Program files are not uploaded: every RadioProgram references a file that
+        is already stored in S3.
+
+        Args:
+            radio_programs: Input data.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                RadioProgram, in the same order as radio_programs.
+        """
+        # Reference content-addressed files before storing the programs, so
+        # they cannot be deleted in between.
+        for radio_program in radio_programs:
+            file_name = radio_program.radio_program.file_name
+            if cls.radio_program_files_repository.is_content_addressed_key(file_name):
+                cls.radio_program_file_references_repository.add_references(file_name)
+
+        results = cls.radio_programs_repository.put_items(
+            items=[
+                RadioProgramPutItemModel(**radio_program.dict())
+                for radio_program in radio_programs
+            ]
+        )
+        cls._release_files(
+            radio_program.radio_program.file_name
+            for radio_program, result in zip(radio_programs, results)
+            if result.status != DynamoDbBatchItemStatus.succeeded
+            and cls.radio_program_files_repository.is_content_addressed_key(
+                radio_program.radio_program.file_name
+            )
+        )
+        return cls._set_result_file_urls(results)
+
+    @classmethod
+    def update_many(
+        cls, *, new_programs: dict[uuid.UUID, RadioProgramUpdateInSchema]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Update the metadata of several existing RadioPrograms.
+
+        Args:
+            new_programs: RadioProgramUpdateIn models with new data by program_id.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                RadioProgram, in the same order as new_programs.
+        """
+        results = cls.radio_programs_repository.update_items(
+            items={
+                # Missing fields keep their stored values, so skip validation.
+                program_id: RadioProgramUpdateItemModel.construct(
+                    **new_program.dict(exclude_none=True)
+                )
+                for program_id, new_program in new_programs.items()
+            }
+        )
+        return cls._set_result_file_urls(results)
+
+    @classmethod
+    def delete_many(
+        cls, *, program_ids: list[uuid.UUID]
+    ) -> list[DynamoDbBatchItemResult[RadioProgramModel]]:
+        """Remove several existing RadioPrograms and their S3 files.
+
+        Args:
+            program_ids: program_ids of the RadioPrograms to be removed.
+
+        Returns:
+            list[DynamoDbBatchItemResult[RadioProgramModel]]: One result per
+                program_id, in the same order as program_ids.
+        """
+        results = cls.radio_programs_repository.delete_items(item_ids=program_ids)
+        cls._release_files(
+            result.item.radio_program.file_name
+            for result in results
+            if result.status == DynamoDbBatchItemStatus.succeeded
+            and result.item.radio_program
+        )
+        return cls._set_result_file_urls(results)
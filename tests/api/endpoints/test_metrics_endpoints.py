@@ -0,0 +1,63 @@
+"""Test /metrics endpoints."""
+import unittest
+from unittest import mock
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from audio_api.api.schemas import MetricsSchema
+from audio_api.aws.cache import CacheStats
+
+
+@pytest.mark.usefixtures("test_client")
+class TestMetricsEndpoints(unittest.TestCase):
+    """TestMetricsEndpoints class."""
+
+    client: TestClient
+
+    @mock.patch("audio_api.api.endpoints.metrics.RadioPrograms")
+    def test_get_metrics(self, radio_programs_mock):
+        """Get the RadioPrograms cache counters."""
+        # Given
+        cache_stats = CacheStats(hits=3, misses=1, size=1, max_size=10)
+        url_cache_stats = CacheStats(hits=5, misses=2, size=2, max_size=100)
+        block_cache_stats = CacheStats(hits=7, misses=3, size=2048, max_size=4096)
+        radio_programs_mock.get_cache_stats.return_value = cache_stats
+        radio_programs_mock.get_url_cache_stats.return_value = url_cache_stats
+        radio_programs_mock.get_block_cache_stats.return_value = block_cache_stats
+        radio_programs_mock.get_pending_file_deletions.return_value = 4
+
+        # When
+        response = self.client.get("/metrics")
+        received = MetricsSchema.parse_obj(response.json())
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert received.radio_programs_cache.dict() == cache_stats.dict()
+        assert received.radio_program_urls_cache.dict() == url_cache_stats.dict()
+        assert (
+            received.radio_program_files_block_cache.dict() == block_cache_stats.dict()
+        )
+        assert received.pending_file_deletions == 4
+
+    @mock.patch("audio_api.api.endpoints.metrics.RadioPrograms")
+    def test_get_metrics_without_cache(self, radio_programs_mock):
+        """Get empty cache metrics if the caches are disabled."""
+        # Given
+        radio_programs_mock.get_cache_stats.return_value = None
+        radio_programs_mock.get_url_cache_stats.return_value = None
+        radio_programs_mock.get_block_cache_stats.return_value = None
+        radio_programs_mock.get_pending_file_deletions.return_value = 0
+
+        # When
+        response = self.client.get("/metrics")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == {
+            "radioProgramsCache": None,
+            "radioProgramUrlsCache": None,
+            "radioProgramFilesBlockCache": None,
+            "pendingFileDeletions": 0,
+        }
@@ -1,5 +1,7 @@
 """Test /programs endpoints."""
 import unittest
+import uuid
+from datetime import date, datetime, timezone
 from unittest import mock
 
 import pytest
@@ -7,21 +9,57 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from audio_api.api.schemas import (
+    RadioProgramBatchOutSchema,
     RadioProgramCreateInSchema,
     RadioProgramCreateOutSchema,
     RadioProgramGetSchema,
     RadioProgramListSchema,
     RadioProgramUpdateInSchema,
     RadioProgramUpdateOutSchema,
+    RadioProgramUploadOutSchema,
 )
+from audio_api.api.settings import get_settings
+from audio_api.audio.waveform import WaveformResolution
 from audio_api.aws.dynamodb.exceptions import (
     DynamoDbClientError,
+    DynamoDbInvalidCursorError,
     DynamoDbItemNotFoundError,
     DynamoDbStatusError,
+    DynamoDbVersionConflictError,
+)
+from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemResult,
+    DynamoDbBatchItemStatus,
+    DynamoDbPage,
+)
+from audio_api.aws.s3.exceptions import (
+    S3ClientError,
+    S3FileNotFoundError,
+    S3PersistenceError,
+)
+from audio_api.aws.s3.models import S3PresignedUpload, S3PresignedUploadPart
+from audio_api.domain.models import (
+    RadioProgramAudioMetadata,
+    RadioProgramJobKind,
+    RadioProgramJobModel,
+    RadioProgramJobStatus,
 )
-from audio_api.aws.s3.exceptions import S3ClientError, S3PersistenceError
 from tests.api.test_utils import create_temp_file, radio_program
 
+settings = get_settings()
+
+RADIO_PROGRAMS_MOCK_PATH = "audio_api.api.endpoints.radio_programs.AsyncRadioPrograms"
+
+AUDIO_CONTENT = b"0123456789"
+AUDIO_METADATA = RadioProgramAudioMetadata(
+    file_name="test_file",
+    seek_index="test_file.sidecar.seek_index.bin",
+    content_length=len(AUDIO_CONTENT),
+    content_type="audio/mpeg",
+    etag='"test-etag"',
+    last_modified=datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+)
+
 
 @pytest.mark.usefixtures("test_client")
 class TestRadioProgramsEndpoints(unittest.TestCase):
@@ -29,7 +67,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
 
     client: TestClient
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_get_program(self, radio_programs_mock):
         """Get a program by id."""
         # Given
@@ -46,7 +84,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         assert received == expected
         radio_programs_mock.get.assert_called_once_with(program_id=get_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_get_program_raises_404_if_not_found(self, radio_programs_mock):
         """Get RadioProgram should raise 404 if RadioProgram does not exist."""
         # Given
@@ -62,7 +100,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
         radio_programs_mock.get.assert_called_once_with(program_id=get_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_get_program_raises_500_if_dynamodb_client_error(self, radio_programs_mock):
         """Get RadioProgram should raise 500 if DynamoDbClientError."""
         # Given
@@ -80,7 +118,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         ), response.text
         radio_programs_mock.get.assert_called_once_with(program_id=get_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_get_program_raises_500_if_dynamodb_status_error(self, radio_programs_mock):
         """Get RadioProgram should raise 500 if DynamoDbStatusError."""
         # Given
@@ -98,7 +136,446 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         ), response.text
         radio_programs_mock.get.assert_called_once_with(program_id=get_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio(self, radio_programs_mock):
+        """Get the whole audio file of a program."""
+        # Given
+        program_id = uuid.uuid4()
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.iter_audio.return_value = iter(
+            [AUDIO_CONTENT[:5], AUDIO_CONTENT[5:]]
+        )
+
+        # When
+        response = self.client.get(f"/programs/{program_id}/audio")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.content == AUDIO_CONTENT
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.headers["Content-Length"] == str(len(AUDIO_CONTENT))
+        assert response.headers["Content-Type"] == "audio/mpeg"
+        assert response.headers["ETag"] == AUDIO_METADATA.etag
+        assert response.headers["Last-Modified"] == "Mon, 02 Jan 2023 03:04:05 GMT"
+        radio_programs_mock.get_audio_metadata.assert_called_once_with(
+            program_id=program_id
+        )
+        radio_programs_mock.iter_audio.assert_called_once_with(
+            file_name=AUDIO_METADATA.file_name,
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=None,
+            metadata=AUDIO_METADATA,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_range(self, radio_programs_mock):
+        """Get a byte range of the audio file of a program."""
+        # Given
+        program_id = uuid.uuid4()
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.iter_audio.return_value = iter([AUDIO_CONTENT[2:6]])
+
+        # When
+        response = self.client.get(
+            f"/programs/{program_id}/audio", headers={"Range": "bytes=2-5"}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT, response.text
+        assert response.content == AUDIO_CONTENT[2:6]
+        assert response.headers["Content-Range"] == "bytes 2-5/10"
+        assert response.headers["Content-Length"] == "4"
+        radio_programs_mock.iter_audio.assert_called_once_with(
+            file_name=AUDIO_METADATA.file_name,
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=(2, 5),
+            metadata=AUDIO_METADATA,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_open_ranges(self, radio_programs_mock):
+        """Open ended and suffix ranges are clamped to the audio file."""
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        for range_header, expected_range in (
+            ("bytes=7-", (7, 9)),
+            ("bytes=-3", (7, 9)),
+            ("bytes=-30", (0, 9)),
+            ("bytes=4-100", (4, 9)),
+        ):
+            # Given
+            radio_programs_mock.iter_audio.reset_mock()
+            radio_programs_mock.iter_audio.return_value = iter([b""])
+
+            # When
+            response = self.client.get(
+                f"/programs/{uuid.uuid4()}/audio", headers={"Range": range_header}
+            )
+
+            # Then
+            assert (
+                response.status_code == status.HTTP_206_PARTIAL_CONTENT
+            ), response.text
+            assert (
+                response.headers["Content-Range"]
+                == f"bytes {expected_range[0]}-{expected_range[1]}/10"
+            )
+            assert (
+                radio_programs_mock.iter_audio.call_args.kwargs["byte_range"]
+                == expected_range
+            )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_ignores_invalid_ranges(self, radio_programs_mock):
+        """Malformed and multiple ranges are ignored and the whole file is sent."""
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        for range_header in ("items=0-1", "bytes=0-1,4-5", "bytes=5-2", "bytes=a-"):
+            # Given
+            radio_programs_mock.iter_audio.return_value = iter([AUDIO_CONTENT])
+
+            # When
+            response = self.client.get(
+                f"/programs/{uuid.uuid4()}/audio", headers={"Range": range_header}
+            )
+
+            # Then
+            assert response.status_code == status.HTTP_200_OK, response.text
+            assert response.content == AUDIO_CONTENT
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_raises_416_if_range_not_satisfiable(
+        self, radio_programs_mock
+    ):
+        """Get program audio should raise 416 if the range is after the file."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/audio", headers={"Range": "bytes=10-"}
+        )
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        ), response.text
+        assert response.headers["Content-Range"] == "bytes */10"
+        radio_programs_mock.iter_audio.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_if_range(self, radio_programs_mock):
+        """Range is only applied if If-Range matches the ETag or Last-Modified."""
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        for if_range, expected_status in (
+            (AUDIO_METADATA.etag, status.HTTP_206_PARTIAL_CONTENT),
+            ("Mon, 02 Jan 2023 03:04:05 GMT", status.HTTP_206_PARTIAL_CONTENT),
+            ('"stale-etag"', status.HTTP_200_OK),
+            (f"W/{AUDIO_METADATA.etag}", status.HTTP_200_OK),
+            ("Sun, 01 Jan 2023 00:00:00 GMT", status.HTTP_200_OK),
+        ):
+            # Given
+            radio_programs_mock.iter_audio.return_value = iter([b""])
+
+            # When
+            response = self.client.get(
+                f"/programs/{uuid.uuid4()}/audio",
+                headers={"Range": "bytes=0-1", "If-Range": if_range},
+            )
+
+            # Then
+            assert response.status_code == expected_status, if_range
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_from_start(self, radio_programs_mock):
+        """GET program audio with start streams from the indexed frame."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_audio_offset.return_value = 4
+        radio_programs_mock.iter_audio.return_value = iter([AUDIO_CONTENT[4:]])
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/audio",
+            params={"start": 90.5},
+            headers={"Range": "bytes=0-1"},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT, response.text
+        assert response.content == AUDIO_CONTENT[4:]
+        assert response.headers["Content-Range"] == "bytes 4-9/10"
+        radio_programs_mock.get_audio_offset.assert_called_once_with(
+            metadata=AUDIO_METADATA, start=90.5
+        )
+        radio_programs_mock.iter_audio.assert_called_once_with(
+            file_name="test_file",
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=(4, 9),
+            metadata=AUDIO_METADATA,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_raises_416_if_start_after_end(self, radio_programs_mock):
+        """GET program audio raises 416 if start is after the end of the file."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_audio_offset.return_value = None
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/audio", params={"start": 7200}
+        )
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        ), response.text
+        assert response.headers["Content-Range"] == "bytes */10"
+        radio_programs_mock.iter_audio.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_raises_404_if_no_seek_index(self, radio_programs_mock):
+        """GET program audio with start raises 404 if the file has no seek index."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_audio_offset.side_effect = S3FileNotFoundError(
+            "test error"
+        )
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/audio", params={"start": 1}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_clip(self, radio_programs_mock):
+        """GET program clip streams the frame-aligned range of the clip."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_clip_range.return_value = (2, 7)
+        radio_programs_mock.iter_audio.return_value = iter([AUDIO_CONTENT[2:8]])
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/clip", params={"start": 30, "end": 90}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.content == AUDIO_CONTENT[2:8]
+        assert response.headers["Content-Length"] == "6"
+        assert response.headers["Content-Type"] == "audio/mpeg"
+        radio_programs_mock.get_clip_range.assert_called_once_with(
+            metadata=AUDIO_METADATA, start=30, end=90
+        )
+        radio_programs_mock.iter_audio.assert_called_once_with(
+            file_name="test_file",
+            chunk_size=settings.AUDIO_CHUNK_SIZE,
+            byte_range=(2, 7),
+            metadata=AUDIO_METADATA,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_clip_raises_400_if_end_before_start(self, radio_programs_mock):
+        """GET program clip raises 400 if end is not after start."""
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/clip", params={"start": 30, "end": 30}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        radio_programs_mock.get_audio_metadata.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_clip_raises_416_if_start_after_end(self, radio_programs_mock):
+        """GET program clip raises 416 if start is after the end of the file."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_clip_range.return_value = None
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/clip", params={"start": 7200, "end": 7260}
+        )
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        ), response.text
+        radio_programs_mock.iter_audio.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_clip_raises_404_if_no_seek_index(self, radio_programs_mock):
+        """GET program clip raises 404 if the file has no seek index."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.get_clip_range.side_effect = S3FileNotFoundError(
+            "test error"
+        )
+
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/clip", params={"start": 0, "end": 1}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_head_program_audio(self, radio_programs_mock):
+        """HEAD program audio returns the headers without reading the file."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+
+        # When
+        response = self.client.head(
+            f"/programs/{uuid.uuid4()}/audio", headers={"Range": "bytes=0-3"}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT, response.text
+        assert response.content == b""
+        assert response.headers["Content-Length"] == "4"
+        assert response.headers["Content-Range"] == "bytes 0-3/10"
+        radio_programs_mock.iter_audio.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_raises_404_if_not_found(self, radio_programs_mock):
+        """Get program audio should raise 404 if RadioProgram does not exist."""
+        # Given
+        radio_programs_mock.get_audio_metadata.side_effect = DynamoDbItemNotFoundError(
+            "RadioProgram does not exist."
+        )
+
+        # When
+        response = self.client.get(f"/programs/{uuid.uuid4()}/audio")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_audio_raises_500_if_s3_client_error(self, radio_programs_mock):
+        """Get program audio should raise 500 if failed to read from S3."""
+        # Given
+        radio_programs_mock.get_audio_metadata.return_value = AUDIO_METADATA
+        radio_programs_mock.iter_audio.side_effect = S3ClientError("test error")
+
+        # When
+        response = self.client.get(f"/programs/{uuid.uuid4()}/audio")
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        ), response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_jobs(self, radio_programs_mock):
+        """Get program jobs returns the status of every analysis job."""
+        # Given
+        program_id = uuid.uuid4()
+        now = datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        job = RadioProgramJobModel(
+            id=uuid.uuid4(),
+            program_id=program_id,
+            file_name="test_file",
+            kind=RadioProgramJobKind.waveform,
+            status=RadioProgramJobStatus.succeeded,
+            attempts=1,
+            result={"resolutions": [1, 4, 16, 64]},
+            created_at=now,
+            updated_at=now,
+            version=3,
+        )
+        radio_programs_mock.get_jobs.return_value = [job]
+
+        # When
+        response = self.client.get(f"/programs/{program_id}/jobs")
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == [
+            {
+                "id": str(job.id),
+                "programId": str(program_id),
+                "fileName": "test_file",
+                "kind": "waveform",
+                "status": "succeeded",
+                "attempts": 1,
+                "result": {"resolutions": [1, 4, 16, 64]},
+                "error": None,
+                "createdAt": "2023-01-02T03:04:05+00:00",
+                "updatedAt": "2023-01-02T03:04:05+00:00",
+                "version": 3,
+            }
+        ]
+        radio_programs_mock.get_jobs.assert_called_once_with(program_id=program_id)
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_jobs_raises_404_if_not_found(self, radio_programs_mock):
+        """Get program jobs should raise 404 if the program does not exist."""
+        # Given
+        radio_programs_mock.get_jobs.side_effect = DynamoDbItemNotFoundError(
+            "test error"
+        )
+
+        # When
+        response = self.client.get(f"/programs/{uuid.uuid4()}/jobs")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_waveform(self, radio_programs_mock):
+        """Get program waveform returns the stored waveform."""
+        # Given
+        program_id = uuid.uuid4()
+        radio_programs_mock.get_waveform.return_value = b"waveform"
+
+        # When
+        response = self.client.get(
+            f"/programs/{program_id}/waveform", params={"resolution": 16}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.content == b"waveform"
+        assert response.headers["Content-Type"] == "application/octet-stream"
+        radio_programs_mock.get_waveform.assert_called_once_with(
+            program_id=program_id, resolution=WaveformResolution.high
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_waveform_raises_422_if_invalid_resolution(
+        self, radio_programs_mock
+    ):
+        """Get program waveform should raise 422 if the resolution is not stored."""
+        # When
+        response = self.client.get(
+            f"/programs/{uuid.uuid4()}/waveform", params={"resolution": 5}
+        )
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        ), response.text
+        radio_programs_mock.get_waveform.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_get_program_waveform_raises_404_if_not_found(self, radio_programs_mock):
+        """Get program waveform should raise 404 if it was not computed yet."""
+        # Given
+        radio_programs_mock.get_waveform.side_effect = S3FileNotFoundError("test error")
+
+        # When
+        response = self.client.get(f"/programs/{uuid.uuid4()}/waveform")
+
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_list_programs(self, radio_programs_mock):
         """Get a list of programs."""
         # Given
@@ -122,7 +599,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         assert received == expected
         radio_programs_mock.get_all.assert_called_once()
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_list_radio_programs_empty(self, radio_programs_mock):
         """Get an empty list of programs if none created."""
         # Given
@@ -136,7 +613,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         assert response.json() == []
         radio_programs_mock.get_all.assert_called_once()
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_list_programs_raises_500_if_dynamodb_client_error(
         self, radio_programs_mock
     ):
@@ -155,7 +632,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         ), response.text
         radio_programs_mock.get_all.assert_called_once()
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_list_programs_raises_500_if_dynamodb_status_error(
         self, radio_programs_mock
     ):
@@ -174,7 +651,127 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         ), response.text
         radio_programs_mock.get_all.assert_called_once()
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_page(self, radio_programs_mock):
+        """Get a single page of programs with the next page cursor."""
+        # Given
+        radio_programs = [radio_program(title="Test program page #1")]
+        radio_programs_mock.get_page.return_value = DynamoDbPage(
+            items=radio_programs, next_cursor="next_cursor"
+        )
+        expected = [
+            RadioProgramListSchema.from_orm(program) for program in radio_programs
+        ]
+
+        # When
+        response = self.client.get("/programs", params={"limit": 1, "cursor": "cursor"})
+        received = [
+            RadioProgramListSchema.parse_obj(program) for program in response.json()
+        ]
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert received == expected
+        assert response.headers["X-Next-Cursor"] == "next_cursor"
+        radio_programs_mock.get_page.assert_called_once_with(
+            limit=1, cursor="cursor", date_from=None, date_to=None
+        )
+        radio_programs_mock.get_all.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_last_page_has_no_cursor(self, radio_programs_mock):
+        """Get the last page of programs without a next page cursor."""
+        # Given
+        radio_programs_mock.get_page.return_value = DynamoDbPage(
+            items=[], next_cursor=None
+        )
+
+        # When
+        response = self.client.get("/programs", params={"limit": 10})
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+        assert "X-Next-Cursor" not in response.headers
+        radio_programs_mock.get_page.assert_called_once_with(
+            limit=10, cursor=None, date_from=None, date_to=None
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_raises_400_if_invalid_cursor(self, radio_programs_mock):
+        """Get RadioPrograms page should raise 400 if the cursor is invalid."""
+        # Given
+        radio_programs_mock.get_page.side_effect = DynamoDbInvalidCursorError(
+            "Invalid cursor"
+        )
+
+        # When
+        response = self.client.get("/programs", params={"cursor": "invalid"})
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        radio_programs_mock.get_page.assert_called_once()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_by_ids(self, radio_programs_mock):
+        """Get several programs by id in a single request."""
+        # Given
+        radio_programs = [
+            radio_program(title="Test program ids #1"),
+            radio_program(title="Test program ids #2"),
+        ]
+        radio_programs_mock.get_many.return_value = radio_programs
+        program_ids = [program.id for program in radio_programs]
+        expected = [
+            RadioProgramListSchema.from_orm(program) for program in radio_programs
+        ]
+
+        # When
+        response = self.client.get(
+            "/programs", params={"ids": [str(program_id) for program_id in program_ids]}
+        )
+        received = [
+            RadioProgramListSchema.parse_obj(program) for program in response.json()
+        ]
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert received == expected
+        radio_programs_mock.get_many.assert_called_once_with(program_ids=program_ids)
+        radio_programs_mock.get_all.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_by_air_date(self, radio_programs_mock):
+        """Get programs aired in a date range."""
+        # Given
+        radio_programs = [radio_program(title="Test program air date")]
+        radio_programs_mock.get_all.return_value = radio_programs
+
+        # When
+        response = self.client.get(
+            "/programs", params={"from": "2023-03-01", "to": "2023-03-31"}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(response.json()) == 1
+        radio_programs_mock.get_all.assert_called_once_with(
+            date_from=date(2023, 3, 1), date_to=date(2023, 3, 31)
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_list_programs_raises_400_if_from_after_to(self, radio_programs_mock):
+        """Get RadioPrograms should raise 400 if from is after to."""
+        # When
+        response = self.client.get(
+            "/programs", params={"from": "2023-04-01", "to": "2023-03-01"}
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        radio_programs_mock.get_all.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program(self, radio_programs_mock):
         """Create a RadioProgram via POST."""
         # Given
@@ -196,7 +793,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             radio_program=radio_program_in, program_file=mock.ANY
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program_without_file_raises_error(self, radio_programs_mock):
         """Create a RadioProgram via POST."""
         # Given
@@ -211,6 +808,103 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         ), response.text
 
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_create_program_upload(self, radio_programs_mock):
+        """Get presigned URLs to upload a RadioProgram file via POST."""
+        # Given
+        upload = S3PresignedUpload(
+            file_name="test_file",
+            expires_in=3600,
+            upload_id="upload_id",
+            part_size=10,
+            parts=[
+                S3PresignedUploadPart(part_number=1, url="part_1_url"),
+                S3PresignedUploadPart(part_number=2, url="part_2_url"),
+            ],
+        )
+        radio_programs_mock.create_upload.return_value = upload
+
+        # When
+        response = self.client.post(
+            "/programs/uploads", json={"title": "Test upload", "fileSize": 20}
+        )
+        received = RadioProgramUploadOutSchema.parse_raw(response.text)
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        assert response.json()["parts"][0] == {"partNumber": 1, "url": "part_1_url"}
+        assert received == RadioProgramUploadOutSchema.parse_obj(upload.dict())
+        radio_programs_mock.create_upload.assert_called_once_with(
+            title="Test upload", file_size=20
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_complete_program_upload(self, radio_programs_mock):
+        """Create a RadioProgram from a direct upload via POST."""
+        # Given
+        created_program = radio_program(title="Test program upload")
+        radio_program_in = RadioProgramCreateInSchema(**created_program.dict())
+        radio_programs_mock.complete_upload.return_value = created_program
+        expected = RadioProgramCreateOutSchema.parse_obj(created_program.dict())
+
+        # When
+        response = self.client.post(
+            "/programs/uploads/complete",
+            json={
+                **radio_program_in.dict(by_alias=True),
+                "fileName": "test_file",
+                "uploadId": "upload_id",
+            },
+        )
+        received = RadioProgramCreateOutSchema.parse_raw(response.text)
+
+        # Then
+        assert response.status_code == status.HTTP_201_CREATED, response.text
+        assert received == expected
+        radio_programs_mock.complete_upload.assert_called_once_with(
+            radio_program=radio_program_in,
+            file_name="test_file",
+            upload_id="upload_id",
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_complete_program_upload_raises_400_if_file_not_found(
+        self, radio_programs_mock
+    ):
+        """Complete upload should raise 400 if the file was not uploaded."""
+        # Given
+        radio_programs_mock.complete_upload.side_effect = S3FileNotFoundError(
+            "test error"
+        )
+
+        # When
+        response = self.client.post(
+            "/programs/uploads/complete",
+            json={"title": "Test program upload", "fileName": "test_file"},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_complete_program_upload_raises_400_if_upload_not_found(
+        self, radio_programs_mock
+    ):
+        """Complete upload should raise 400 if the upload was not created."""
+        # Given
+        radio_programs_mock.complete_upload.side_effect = DynamoDbItemNotFoundError(
+            "test error"
+        )
+
+        # When
+        response = self.client.post(
+            "/programs/uploads/complete",
+            json={"title": "Test program upload", "fileName": "test_file"},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
     def test_create_program_without_radio_program_title_raises_error(self):
         """Cannot create a RadioProgram via POST without required title."""
         # Given
@@ -228,7 +922,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         ), response.text
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program_raises_500_if_s3_client_error(self, radio_programs_mock):
         """Create RadioProgram should raise 500 if S3ClientError."""
         # Given
@@ -251,7 +945,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             radio_program=radio_program_in, program_file=mock.ANY
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program_raises_500_if_s3_persistence_error(
         self, radio_programs_mock
     ):
@@ -276,7 +970,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             radio_program=radio_program_in, program_file=mock.ANY
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program_raises_500_if_dynamodb_client_error(
         self, radio_programs_mock
     ):
@@ -301,7 +995,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             radio_program=radio_program_in, program_file=mock.ANY
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_create_program_raises_500_if_dynamodb_status_error(
         self, radio_programs_mock
     ):
@@ -326,7 +1020,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             radio_program=radio_program_in, program_file=mock.ANY
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program(self, radio_programs_mock):
         """Update RadioProgram via PUT."""
         # Given
@@ -350,9 +1044,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=data_to_send,
             program_file=mock.ANY,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_without_file(self, radio_programs_mock):
         """Update RadioProgram via PUT without file."""
         # Given
@@ -374,9 +1069,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=data_to_send,
             program_file=None,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_file(self, radio_programs_mock):
         """Update RadioProgram file via PUT."""
         # Given
@@ -397,9 +1093,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=RadioProgramUpdateInSchema(),
             program_file=mock.ANY,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_raises_404_if_not_found(self, radio_programs_mock):
         """Update RadioProgram raises 404 if program is not found."""
         # Given
@@ -418,9 +1115,97 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=data_to_send,
             program_file=None,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_update_program_with_if_match(self, radio_programs_mock):
+        """Update RadioProgram should send If-Match version and return the ETag."""
+        # Given
+        updated_program = radio_program(title="test_program_update").copy(
+            update={"version": 4}
+        )
+        radio_programs_mock.update.return_value = updated_program
+        data_to_send = RadioProgramUpdateInSchema(title=updated_program.title)
+
+        # When
+        response = self.client.put(
+            f"/programs/{updated_program.id}",
+            data=data_to_send.dict(),
+            headers={"If-Match": '"3"'},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers["ETag"] == '"4"'
+        radio_programs_mock.update.assert_called_once_with(
+            program_id=updated_program.id,
+            new_program=data_to_send,
+            program_file=None,
+            expected_version=3,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_update_program_raises_400_if_invalid_if_match(self, radio_programs_mock):
+        """Update RadioProgram should raise 400 if If-Match is not a version."""
+        # Given
+        updated_program = radio_program(title="test_program_update")
+
+        # When
+        response = self.client.put(
+            f"/programs/{updated_program.id}",
+            data={"title": updated_program.title},
+            headers={"If-Match": '"latest"'},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        radio_programs_mock.update.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_update_program_with_if_match_any(self, radio_programs_mock):
+        """Update RadioProgram should accept If-Match * as any existing version."""
+        # Given
+        updated_program = radio_program(title="test_program_update")
+        radio_programs_mock.update.return_value = updated_program
+        data_to_send = RadioProgramUpdateInSchema(title=updated_program.title)
+
+        # When
+        response = self.client.put(
+            f"/programs/{updated_program.id}",
+            data=data_to_send.dict(),
+            headers={"If-Match": "*"},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        radio_programs_mock.update.assert_called_once_with(
+            program_id=updated_program.id,
+            new_program=data_to_send,
+            program_file=None,
+            expected_version=None,
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_update_program_raises_409_if_version_conflict(self, radio_programs_mock):
+        """Update RadioProgram should raise 409 if the If-Match version is stale."""
+        # Given
+        updated_program = radio_program(title="test_program_update")
+        radio_programs_mock.update.side_effect = DynamoDbVersionConflictError(
+            f"Item {updated_program.id} is not at version 1."
+        )
+
+        # When
+        response = self.client.put(
+            f"/programs/{updated_program.id}",
+            data={"title": updated_program.title},
+            headers={"If-Match": '"1"'},
+        )
+
+        # Then
+        assert response.status_code == status.HTTP_409_CONFLICT, response.text
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_raises_500_if_s3_client_error(self, radio_programs_mock):
         """Update RadioProgram should raise 500 if S3ClientError."""
         # Given
@@ -445,9 +1230,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=radio_program_in,
             program_file=mock.ANY,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_raises_500_if_s3_persistence_error(
         self, radio_programs_mock
     ):
@@ -474,9 +1260,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=radio_program_in,
             program_file=mock.ANY,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_raises_500_if_dynamodb_client_error(
         self, radio_programs_mock
     ):
@@ -501,9 +1288,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=radio_program_in,
             program_file=None,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_update_program_raises_500_if_dynamodb_status_error(
         self, radio_programs_mock
     ):
@@ -528,9 +1316,10 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id,
             new_program=radio_program_in,
             program_file=None,
+            expected_version=None,
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_delete_program(self, radio_programs_mock):
         """Delete a RadioProgram."""
         # Given
@@ -545,7 +1334,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             program_id=updated_program.id
         )
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_delete_program_raises_404_if_not_found(self, radio_programs_mock):
         """Delete RadioProgram should raise 404 if RadioProgram does not exist."""
         # Given
@@ -561,7 +1350,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
         radio_programs_mock.delete.assert_called_once_with(program_id=delete_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_delete_program_raises_500_dynamodb_client_error(self, radio_programs_mock):
         """Delete RadioProgram should raise 500 if DynamoDbClientError."""
         # Given
@@ -579,7 +1368,7 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
         ), response.text
         radio_programs_mock.delete.assert_called_once_with(program_id=delete_program.id)
 
-    @mock.patch("audio_api.api.endpoints.radio_programs.RadioPrograms")
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
     def test_delete_program_raises_500_dynamodb_status_error(self, radio_programs_mock):
         """Delete RadioProgram should raise 500 if DynamoDbStatusError."""
         # Given
@@ -596,3 +1385,115 @@ class TestRadioProgramsEndpoints(unittest.TestCase):
             response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         ), response.text
         radio_programs_mock.delete.assert_called_once_with(program_id=delete_program.id)
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_batch_programs(self, radio_programs_mock):
+        """Batch should return a result with its own status code per program."""
+        # Given
+        created = radio_program("test program batch create")
+        updated = radio_program("test program batch update")
+        missing_id = uuid.uuid4()
+        radio_programs_mock.create_many.return_value = [
+            DynamoDbBatchItemResult(
+                id=str(created.id),
+                status=DynamoDbBatchItemStatus.succeeded,
+                item=created,
+            )
+        ]
+        radio_programs_mock.update_many.return_value = [
+            DynamoDbBatchItemResult(
+                id=str(updated.id),
+                status=DynamoDbBatchItemStatus.succeeded,
+                item=updated,
+            )
+        ]
+        radio_programs_mock.delete_many.return_value = [
+            DynamoDbBatchItemResult(
+                id=str(missing_id),
+                status=DynamoDbBatchItemStatus.not_found,
+                error="not found",
+            )
+        ]
+        batch_in = {
+            "create": [
+                {"title": created.title, "radioProgram": created.radio_program.dict()}
+            ],
+            "update": [{"id": str(updated.id), "title": updated.title}],
+            "delete": [str(missing_id)],
+        }
+
+        # When
+        response = self.client.post("/programs/batch", json=batch_in)
+        received = RadioProgramBatchOutSchema.parse_obj(response.json())
+
+        # Then
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [r.status_code for r in received.results] == [
+            status.HTTP_201_CREATED,
+            status.HTTP_200_OK,
+            status.HTTP_404_NOT_FOUND,
+        ]
+        assert received.results[0].program.id == created.id
+        assert received.results[2].program is None
+        radio_programs_mock.update_many.assert_called_once_with(
+            new_programs={updated.id: RadioProgramUpdateInSchema(title=updated.title)}
+        )
+        radio_programs_mock.delete_many.assert_called_once_with(
+            program_ids=[missing_id]
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_batch_programs_raises_400_if_too_many_items(self, radio_programs_mock):
+        """Batch should raise 400 if it has more than MAX_BATCH_SIZE programs."""
+        # Given
+        batch_in = {
+            "delete": [str(uuid.uuid4()) for _ in range(settings.MAX_BATCH_SIZE + 1)]
+        }
+
+        # When
+        response = self.client.post("/programs/batch", json=batch_in)
+
+        # Then
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+        radio_programs_mock.delete_many.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_batch_programs_raises_422_if_ids_are_repeated(self, radio_programs_mock):
+        """Batch should raise 422 if a RadioProgram is updated or deleted twice."""
+        # Given
+        program_id = str(uuid.uuid4())
+
+        # When
+        update_response = self.client.post(
+            "/programs/batch",
+            json={"update": [{"id": program_id}, {"id": program_id, "title": "t"}]},
+        )
+        delete_response = self.client.post(
+            "/programs/batch", json={"delete": [program_id, program_id]}
+        )
+
+        # Then
+        assert update_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert delete_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        radio_programs_mock.update_many.assert_not_called()
+        radio_programs_mock.delete_many.assert_not_called()
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH, new_callable=mock.AsyncMock)
+    def test_batch_programs_raises_500_if_dynamodb_client_error(
+        self, radio_programs_mock
+    ):
+        """Batch should raise 500 if failed to read programs from DynamoDB."""
+        # Given
+        radio_programs_mock.delete_many.side_effect = DynamoDbClientError(
+            "Failed to get items from DynamoDB: test error"
+        )
+
+        # When
+        response = self.client.post(
+            "/programs/batch", json={"delete": [str(uuid.uuid4())]}
+        )
+
+        # Then
+        assert (
+            response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        ), response.text
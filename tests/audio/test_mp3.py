@@ -0,0 +1,90 @@
+"""Test MP3 duration parser."""
+import io
+import unittest
+
+import pytest
+
+from audio_api.audio.mp3 import get_mp3_duration, parse_frame_header
+from tests.api.test_utils import UploadFileModel
+
+# MPEG 1 layer III, 128 kbps, 44.1 kHz, stereo
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+FRAME_DURATION = 1152 / 44100
+ID3V2_TAG = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"\x00" * 5
+XING_OFFSET = 36
+
+
+def _frame(payload: bytes = b"", offset: int = 4) -> bytes:
+    frame = bytearray(FRAME_HEADER + b"\x00" * (FRAME_LENGTH - 4))
+    frame[offset : offset + len(payload)] = payload  # noqa: E203
+    return bytes(frame)
+
+
+@pytest.mark.usefixtures("upload_file")
+class TestMp3Duration(unittest.TestCase):
+    """TestMp3Duration class."""
+
+    upload_file: UploadFileModel
+
+    def test_parse_frame_header(self):
+        """Should parse the frame length and samples of a frame header."""
+        # When
+        header = parse_frame_header(FRAME_HEADER)
+
+        # Then
+        assert header.frame_length == FRAME_LENGTH
+        assert (header.samples, header.sample_rate, header.mono) == (
+            1152,
+            44100,
+            False,
+        )
+
+    def test_parse_invalid_frame_header(self):
+        """Should return None without a frame sync or with reserved values."""
+        assert parse_frame_header(b"ID3\x04") is None
+        assert parse_frame_header(b"\xff\xfb\xf0\x00") is None
+
+    def test_duration_from_xing_header(self):
+        """Should use the frame count of a Xing header."""
+        # Given
+        xing = b"Xing" + (1).to_bytes(4, "big") + (100).to_bytes(4, "big")
+        file = io.BytesIO(ID3V2_TAG + _frame(xing, XING_OFFSET) + _frame() * 2)
+
+        # When
+        duration = get_mp3_duration(file)
+
+        # Then
+        assert duration == 100 * 1152 / 44100
+        assert file.tell() == 0
+
+    def test_duration_from_vbri_header(self):
+        """Should use the frame count of a VBRI header."""
+        # Given
+        vbri = b"VBRI" + b"\x00" * 10 + (50).to_bytes(4, "big")
+        file = io.BytesIO(_frame(vbri, XING_OFFSET) + _frame() * 2)
+
+        # When
+        duration = get_mp3_duration(file)
+
+        # Then
+        assert duration == 50 * 1152 / 44100
+
+    def test_duration_from_frame_walk(self):
+        """Should walk every frame without a Xing or VBRI header."""
+        # Given
+        file = io.BytesIO(ID3V2_TAG + _frame() * 300 + b"TAG" + b"\x00" * 125)
+
+        # When
+        duration = get_mp3_duration(file)
+
+        # Then
+        assert abs(duration - 300 * FRAME_DURATION) < 1e-9
+
+    def test_duration_of_test_audio_file(self):
+        """Should read the duration of a LAME encoded file."""
+        assert get_mp3_duration(self.upload_file.file) == 60 * 576 / 22050
+
+    def test_duration_of_non_mp3_file(self):
+        """Should return None if there are no MP3 frames."""
+        assert get_mp3_duration(io.BytesIO(b"not an mp3 file" * 100)) is None
@@ -0,0 +1,118 @@
+"""Test MP3 seek index."""
+import io
+import unittest
+
+import numpy as np
+import pytest
+
+from audio_api.audio.mp3 import get_mp3_duration
+from audio_api.audio.seek_index import (
+    SeekIndex,
+    build_seek_index,
+    find_frame,
+    index_audio_frames,
+)
+from tests.api.test_utils import UploadFileModel
+
+# MPEG 1 layer III, 44.1 kHz, stereo, at 128 and 320 kbps
+FRAME_128_KBPS = b"\xff\xfb\x90\x00" + b"\x00" * 413
+FRAME_320_KBPS = b"\xff\xfb\xe0\x00" + b"\x00" * 1040
+FRAME_DURATION = 1152 / 44100
+
+
+@pytest.mark.usefixtures("upload_file")
+class TestSeekIndex(unittest.TestCase):
+    """TestSeekIndex class."""
+
+    upload_file: UploadFileModel
+
+    def test_build_seek_index_of_vbr_file(self):
+        """Should index the frame playing at every interval of a VBR file."""
+        # Given
+        file = io.BytesIO(FRAME_128_KBPS * 20 + FRAME_320_KBPS * 20)
+
+        # When
+        seek_index = build_seek_index(file, interval=0.5)
+
+        # Then
+        assert int(0.5 // FRAME_DURATION) == 19
+        assert int(1.0 // FRAME_DURATION) == 38
+        assert seek_index.offsets.tolist() == [0, 19 * 417, 20 * 417 + 18 * 1044]
+        assert seek_index.get_offset(0.75) == 19 * 417
+        assert seek_index.get_offset(1.5) is None
+        assert file.tell() == 0
+
+    def test_find_frame(self):
+        """Should walk the frames from an index entry to the one playing at a time."""
+        # Given
+        data = FRAME_128_KBPS * 20 + FRAME_320_KBPS * 20
+        seek_index = build_seek_index(io.BytesIO(data), interval=0.5)
+        indexed_time, first, next_offset = seek_index.get_interval(0.75)
+
+        # When
+        position = find_frame(data[first:], indexed_time, 0.75)
+        next_position = find_frame(data[first:], indexed_time, 0.75, after=True)
+
+        # Then
+        assert (indexed_time, first, next_offset) == (
+            0.5,
+            19 * 417,
+            20 * 417 + 18 * 1044,
+        )
+        assert first + position == 20 * 417 + 8 * 1044
+        assert first + next_position == 20 * 417 + 9 * 1044
+        assert find_frame(data[first:], indexed_time, 2.0) is None
+        assert seek_index.get_interval(1.0)[2] is None
+        assert seek_index.get_interval(1.5) is None
+
+    def test_build_seek_index(self):
+        """Should index a frame every second of a MP3 file."""
+        # When
+        seek_index = build_seek_index(self.upload_file.file)
+
+        # Then
+        duration = get_mp3_duration(self.upload_file.file)
+        assert len(seek_index.offsets) == int(duration) + 1
+        assert seek_index.offsets[0] > 0
+        assert np.all(np.diff(seek_index.offsets) > 0)
+
+    def test_index_audio_frames(self):
+        """Should get the duration and the seek index in the same frame walk."""
+        # When
+        duration, seek_index = index_audio_frames(self.upload_file.file)
+
+        # Then
+        assert duration == pytest.approx(get_mp3_duration(self.upload_file.file))
+        assert np.array_equal(
+            seek_index.offsets, build_seek_index(self.upload_file.file).offsets
+        )
+
+    def test_build_seek_index_without_frames(self):
+        """Should return None if the file has no MP3 frame."""
+        assert build_seek_index(io.BytesIO(b"not a MP3 file")) is None
+
+    def test_encode_seek_index(self):
+        """Should encode offset deltas in 2 bytes, or 4 if they do not fit."""
+        # Given
+        small_seek_index = SeekIndex(
+            interval=1.0, offsets=np.array([100, 16100, 32100], dtype=np.int64)
+        )
+        large_seek_index = SeekIndex(
+            interval=0.5, offsets=np.array([100, 100100, 100200], dtype=np.int64)
+        )
+
+        # When
+        small_data = small_seek_index.to_bytes()
+        large_data = large_seek_index.to_bytes()
+        decoded_seek_index = SeekIndex.from_bytes(large_data)
+
+        # Then
+        assert len(large_data) - len(small_data) == 4
+        assert SeekIndex.from_bytes(small_data).offsets.tolist() == [100, 16100, 32100]
+        assert decoded_seek_index.interval == 0.5
+        assert decoded_seek_index.offsets.tolist() == [100, 100100, 100200]
+
+    def test_decode_invalid_seek_index(self):
+        """Should raise ValueError if the seek index version is not supported."""
+        with pytest.raises(ValueError, match="Unsupported seek index"):
+            SeekIndex.from_bytes(b"\x02\x02" + b"\x00" * 14)
@@ -0,0 +1,114 @@
+"""Test waveform peaks."""
+import io
+import struct
+import unittest
+
+import numpy as np
+import pytest
+
+from audio_api.audio.exceptions import AudioDecodeError
+from audio_api.audio.waveform import (
+    DAT_FLAG_8_BITS,
+    DAT_HEADER,
+    WAVEFORM_RESOLUTIONS,
+    WAVEFORM_SAMPLE_RATE,
+    Waveform,
+    WaveformResolution,
+    _compute_peaks,
+    compute_waveforms,
+)
+from tests.api.test_utils import UploadFileModel
+
+
+@pytest.mark.usefixtures("upload_file")
+class TestWaveform(unittest.TestCase):
+    """TestWaveform class."""
+
+    upload_file: UploadFileModel
+
+    def test_compute_peaks_across_chunks(self):
+        """Should carry samples between chunks and keep a last partial peak."""
+        # Given
+        samples = np.array([1, -2, 3, -4, 5, -6, 7], dtype=np.int16)
+        chunks = iter([samples[:3], samples[3:5], samples[5:]])
+
+        # When
+        mins, maxs = _compute_peaks(chunks, samples_per_peak=2)
+
+        # Then
+        assert mins.tolist() == [-2, -4, -6, 7]
+        assert maxs.tolist() == [1, 3, 5, 7]
+
+    def test_downsample(self):
+        """Should merge consecutive peaks into coarser peaks."""
+        # Given
+        waveform = Waveform(
+            sample_rate=WAVEFORM_SAMPLE_RATE,
+            samples_per_peak=10,
+            mins=np.array([-1, -5, -2, -3, -4], dtype=np.int16),
+            maxs=np.array([1, 2, 6, 3, 4], dtype=np.int16),
+        )
+
+        # When
+        coarse_waveform = waveform.downsample(2)
+
+        # Then
+        assert coarse_waveform.samples_per_peak == 20
+        assert coarse_waveform.mins.tolist() == [-5, -3, -4]
+        assert coarse_waveform.maxs.tolist() == [2, 6, 4]
+
+    def test_to_bytes(self):
+        """Should encode interleaved peaks after an audiowaveform header."""
+        # Given
+        waveform = Waveform(
+            sample_rate=WAVEFORM_SAMPLE_RATE,
+            samples_per_peak=250,
+            mins=np.array([-32768, -256], dtype=np.int16),
+            maxs=np.array([32767, 511], dtype=np.int16),
+        )
+
+        # When
+        data_8_bits = waveform.to_bytes()
+        data_16_bits = waveform.to_bytes(bits=16)
+
+        # Then
+        assert DAT_HEADER.unpack_from(data_8_bits) == (
+            1,
+            DAT_FLAG_8_BITS,
+            WAVEFORM_SAMPLE_RATE,
+            250,
+            2,
+        )
+        assert struct.unpack_from("<4b", data_8_bits, DAT_HEADER.size) == (
+            -128,
+            127,
+            -1,
+            1,
+        )
+        assert struct.unpack_from("<4h", data_16_bits, DAT_HEADER.size) == (
+            -32768,
+            32767,
+            -256,
+            511,
+        )
+
+    def test_compute_waveforms(self):
+        """Should compute every resolution of a MP3 file."""
+        # When
+        waveforms = compute_waveforms(self.upload_file.file)
+
+        # Then
+        assert list(waveforms) == list(WAVEFORM_RESOLUTIONS)
+        full_waveform = waveforms[WaveformResolution.full]
+        low_waveform = waveforms[WaveformResolution.low]
+        assert full_waveform.samples_per_peak == WAVEFORM_SAMPLE_RATE // 64
+        assert low_waveform.samples_per_peak == WAVEFORM_SAMPLE_RATE
+        assert len(low_waveform.mins) == -(-len(full_waveform.mins) // 64)
+        assert low_waveform.mins.min() == full_waveform.mins.min()
+        assert low_waveform.maxs.max() == full_waveform.maxs.max()
+        assert full_waveform.maxs.max() > 0
+
+    def test_compute_waveforms_invalid_file(self):
+        """Should raise AudioDecodeError if the file is not a MP3 file."""
+        with pytest.raises(AudioDecodeError):
+            compute_waveforms(io.BytesIO(b"not a MP3 file" * 100))
@@ -0,0 +1,96 @@
+"""Test ItemCodec."""
+import unittest
+from datetime import date
+from uuid import uuid4
+
+from pydantic import validator
+
+from audio_api.aws.dynamodb.codec import get_codec
+from audio_api.aws.dynamodb.models import RadioProgramItemModel
+
+
+def radio_program_item() -> dict:
+    """Return RadioProgram values as stored in DynamoDB."""
+    return {
+        "id": str(uuid4()),
+        "title": "Shopping 2.0 #001",
+        "air_date": date(2018, 8, 11),
+        "version": 3,
+        "air_date_partition": "radio_programs",
+        "radio_program": {
+            "file_name": "program.mp3",
+            "file_url": "https://bucket/program.mp3",
+            "program_length": 3600,
+        },
+    }
+
+
+class ValidatedModel(RadioProgramItemModel):
+    """RadioProgramItemModel with a field validator."""
+
+    @validator("title")
+    def upper_title(cls, value):
+        """Upper case the title."""
+        return value.upper()
+
+
+class TestItemCodec(unittest.TestCase):
+    """TestItemCodec class."""
+
+    def setUp(self):
+        """Get the RadioProgramItemModel codec."""
+        self.codec = get_codec(RadioProgramItemModel)
+
+    def test_decode_matches_validated_model(self):
+        """Should decode wire items into the same model pydantic validates."""
+        # Given
+        item = radio_program_item()
+
+        # When
+        decoded = self.codec.decode(self.codec.encode(item))
+
+        # Then
+        assert self.codec.compiled
+        assert decoded == RadioProgramItemModel(**item)
+        assert decoded.radio_program.program_length == 3600
+        assert not hasattr(decoded, "air_date_partition")
+
+    def test_encode_matches_wire_format(self):
+        """Should encode dates, UUIDs, numbers and nested maps, skipping None."""
+        # Given
+        item_id = uuid4()
+
+        # When
+        wire_item = self.codec.encode(
+            {"id": item_id, "air_date": date(2018, 8, 11), "description": None}
+            | {"radio_program": {"program_length": 10, "file_url": None}}
+        )
+
+        # Then
+        assert wire_item == {
+            "id": {"S": str(item_id)},
+            "air_date": {"S": "2018-08-11"},
+            "radio_program": {"M": {"program_length": {"N": "10"}}},
+        }
+
+    def test_decode_falls_back_to_validation(self):
+        """Should validate items that do not match the model annotations."""
+        # Given
+        wire_item = self.codec.encode(radio_program_item())
+        wire_item["title"] = {"N": "1"}
+
+        # When
+        decoded = self.codec.decode(wire_item)
+
+        # Then
+        assert decoded.title == "1"
+
+    def test_models_with_validators_are_not_compiled(self):
+        """Should not skip validation for models with validators."""
+        # When
+        codec = get_codec(ValidatedModel)
+        decoded = codec.decode(codec.encode(radio_program_item()))
+
+        # Then
+        assert not codec.compiled
+        assert decoded.title == "SHOPPING 2.0 #001"
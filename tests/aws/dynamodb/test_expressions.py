@@ -0,0 +1,47 @@
+"""Test compiled update expressions."""
+import unittest
+
+from audio_api.aws.dynamodb.expressions import compile_update_expression
+from audio_api.aws.dynamodb.models import RadioProgramUpdateItemModel
+
+
+class TestCompileUpdateExpression(unittest.TestCase):
+    """TestCompileUpdateExpression class."""
+
+    def test_compile_update_expression(self):
+        """Should set document paths, remove paths and increment the version."""
+        # When
+        template = compile_update_expression(
+            RadioProgramUpdateItemModel,
+            (("title",), ("radio_program", "file_name")),
+            (("radio_program", "program_length"),),
+            "version",
+        )
+
+        # Then
+        assert template.update_expression == (
+            "SET #n0 = :v0, #n1.#n2 = :v1, "
+            "#version = if_not_exists(#version, :version_zero) + :version_one "
+            "REMOVE #n1.#n3"
+        )
+        assert template.attribute_names == {
+            "#n0": "title",
+            "#n1": "radio_program",
+            "#n2": "file_name",
+            "#n3": "program_length",
+            "#version": "version",
+        }
+
+    def test_compiled_templates_are_cached_and_bind_values(self):
+        """Should reuse the template of the same fields and only bind values."""
+        # Given
+        paths = (("title",), ("radio_program", "file_name"))
+        template = compile_update_expression(RadioProgramUpdateItemModel, paths)
+
+        # When
+        cached_template = compile_update_expression(RadioProgramUpdateItemModel, paths)
+        values = template.bind({"title": "a", "radio_program": {"file_name": "b"}})
+
+        # Then
+        assert cached_template is template
+        assert values == {":v0": "a", ":v1": "b"}
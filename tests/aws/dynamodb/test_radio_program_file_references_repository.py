@@ -0,0 +1,55 @@
+"""Test RadioProgramFileReferencesRepository."""
+import unittest
+
+import pytest
+
+from audio_api.aws.dynamodb.repositories.radio_program_file_references import (
+    radio_program_file_references_repository,
+)
+
+FILE_NAME = "sha256/test.mp3"
+
+
+@pytest.mark.usefixtures("localstack")
+class TestRadioProgramFileReferencesRepository(unittest.TestCase):
+    """TestRadioProgramFileReferencesRepository class."""
+
+    repository = radio_program_file_references_repository
+
+    @pytest.fixture(autouse=True)
+    def _clear_db(self):
+        self.repository.delete_all()
+
+    def test_add_references(self):
+        """Should count the references added to a file."""
+        # When
+        first_count = self.repository.add_references(FILE_NAME)
+        second_count = self.repository.add_references(FILE_NAME, count=2)
+
+        # Then
+        assert (first_count, second_count) == (1, 3)
+        assert self.repository.get_references(FILE_NAME) == 3
+
+    def test_remove_reference(self):
+        """Should delete the counter when the last reference is removed."""
+        # Given
+        self.repository.add_references(FILE_NAME, count=2)
+
+        # When
+        references = [
+            self.repository.remove_reference(FILE_NAME),
+            self.repository.remove_reference(FILE_NAME),
+        ]
+
+        # Then
+        assert references == [1, 0]
+        assert self.repository.get_items() == []
+
+    def test_remove_reference_of_unreferenced_file(self):
+        """Should not create a negative counter for an unreferenced file."""
+        # When
+        references = self.repository.remove_reference(FILE_NAME)
+
+        # Then
+        assert references == 0
+        assert self.repository.get_items() == []
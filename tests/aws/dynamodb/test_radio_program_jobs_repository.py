@@ -0,0 +1,174 @@
+"""Test RadioProgramJobsRepository."""
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemStatus,
+    RadioProgramJobPutItemModel,
+    RadioProgramJobUpdateItemModel,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_jobs import (
+    radio_program_jobs_repository,
+)
+from audio_api.domain.models import RadioProgramJobKind, RadioProgramJobStatus
+
+NOW = datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+LEASE_EXPIRES_AT = NOW + timedelta(minutes=15)
+
+
+@pytest.mark.usefixtures("localstack")
+class TestRadioProgramJobsRepository(unittest.TestCase):
+    """TestRadioProgramJobsRepository class."""
+
+    repository = radio_program_jobs_repository
+
+    @pytest.fixture(autouse=True)
+    def _clear_db(self):
+        self.repository.delete_all()
+
+    def _put_jobs(self, program_id: uuid.UUID, count: int) -> list:
+        results = self.repository.put_items(
+            RadioProgramJobPutItemModel(
+                program_id=program_id,
+                file_name="test.mp3",
+                kind=RadioProgramJobKind.waveform,
+                status=RadioProgramJobStatus.pending,
+                created_at=NOW + timedelta(seconds=index),
+                updated_at=NOW + timedelta(seconds=index),
+            )
+            for index in range(count)
+        )
+        assert all(
+            result.status == DynamoDbBatchItemStatus.succeeded for result in results
+        )
+        return [result.item for result in results]
+
+    def test_get_items_by_program(self):
+        """Should get the jobs of a program, oldest first."""
+        # Given
+        program_id = uuid.uuid4()
+        jobs = self._put_jobs(program_id, 3)
+        self._put_jobs(uuid.uuid4(), 1)
+
+        # When
+        program_jobs = self.repository.get_items_by_program(program_id)
+
+        # Then
+        assert [job.id for job in program_jobs] == [job.id for job in jobs]
+        assert program_jobs[0].created_at == NOW
+
+    def test_claim_item(self):
+        """Should claim a pending job once and count the attempt."""
+        # Given
+        job, other_job = self._put_jobs(uuid.uuid4(), 2)
+
+        # When
+        claimed_job = self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+        claimed_again_job = self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+        pending_jobs = self.repository.get_pending_items(limit=10, now=NOW)
+
+        # Then
+        assert claimed_job.status == RadioProgramJobStatus.running
+        assert claimed_job.attempts == 1
+        assert claimed_job.version == 2
+        assert claimed_job.lease_expires_at == LEASE_EXPIRES_AT
+        assert claimed_again_job is None
+        assert [pending_job.id for pending_job in pending_jobs] == [other_job.id]
+
+    def test_claim_item_with_expired_lease(self):
+        """Should claim again a running job once its lease expired."""
+        # Given
+        (job,) = self._put_jobs(uuid.uuid4(), 1)
+        self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+        expired_at = LEASE_EXPIRES_AT + timedelta(seconds=1)
+
+        # When
+        expired_jobs = self.repository.get_pending_items(limit=10, now=expired_at)
+        claimed_job = self.repository.claim_item(
+            job.id, expired_at, expired_at + timedelta(minutes=15)
+        )
+
+        # Then
+        assert [expired_job.id for expired_job in expired_jobs] == [job.id]
+        assert claimed_job.status == RadioProgramJobStatus.running
+        assert claimed_job.attempts == 2
+        assert claimed_job.lease_expires_at == expired_at + timedelta(minutes=15)
+
+    def test_update_item_result(self):
+        """Should write the result of a job and queue it again if pending."""
+        # Given
+        (job,) = self._put_jobs(uuid.uuid4(), 1)
+        self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+
+        # When
+        updated_job = self.repository.update_item(
+            item_id=job.id,
+            item=RadioProgramJobUpdateItemModel(
+                status=RadioProgramJobStatus.succeeded,
+                result={"resolutions": [1, 4]},
+                updated_at=NOW + timedelta(minutes=1),
+            ),
+        )
+
+        # Then
+        assert updated_job == self.repository.get_item(job.id)
+        assert updated_job.status == RadioProgramJobStatus.succeeded
+        assert updated_job.result == {"resolutions": [1, 4]}
+        assert updated_job.updated_at == NOW + timedelta(minutes=1)
+        assert self.repository.get_pending_items(limit=10, now=NOW) == []
+
+    def test_update_claimed_item(self):
+        """Should write the result of a job only under its current claim."""
+        # Given
+        (job,) = self._put_jobs(uuid.uuid4(), 1)
+        claimed_job = self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+        expired_at = LEASE_EXPIRES_AT + timedelta(seconds=1)
+        self.repository.claim_item(
+            job.id, expired_at, expired_at + timedelta(minutes=15)
+        )
+        update_job = RadioProgramJobUpdateItemModel(
+            status=RadioProgramJobStatus.succeeded,
+            result={"resolutions": [1, 4]},
+            updated_at=NOW + timedelta(minutes=1),
+        )
+
+        # When
+        stale_updated = self.repository.update_claimed_item(
+            item_id=job.id, item=update_job, attempts=claimed_job.attempts
+        )
+        updated = self.repository.update_claimed_item(
+            item_id=job.id, item=update_job, attempts=claimed_job.attempts + 1
+        )
+
+        # Then
+        updated_job = self.repository.get_item(job.id)
+        assert not stale_updated
+        assert updated
+        assert updated_job.status == RadioProgramJobStatus.succeeded
+        assert updated_job.result == {"resolutions": [1, 4]}
+
+    def test_renew_lease(self):
+        """Should extend the lease of a running job only under its claim."""
+        # Given
+        (job,) = self._put_jobs(uuid.uuid4(), 1)
+        claimed_job = self.repository.claim_item(job.id, NOW, LEASE_EXPIRES_AT)
+        renewed_at = LEASE_EXPIRES_AT + timedelta(minutes=15)
+
+        # When
+        renewed = self.repository.renew_lease(
+            item_id=job.id, attempts=claimed_job.attempts, lease_expires_at=renewed_at
+        )
+        stale_renewed = self.repository.renew_lease(
+            item_id=job.id,
+            attempts=claimed_job.attempts - 1,
+            lease_expires_at=renewed_at + timedelta(minutes=15),
+        )
+
+        # Then
+        assert renewed
+        assert not stale_renewed
+        assert self.repository.get_item(job.id).lease_expires_at == renewed_at
+        assert self.repository.get_pending_items(limit=10, now=LEASE_EXPIRES_AT) == []
@@ -1,26 +1,34 @@
 """Test TestRadioProgramsRepository."""
 import unittest
+from datetime import date
 from unittest import mock
 from uuid import uuid4
 
 import pytest
-from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
+from audio_api.aws.cache import LRUCache
 from audio_api.aws.dynamodb.exceptions import (
     DynamoDbClientError,
+    DynamoDbInvalidCursorError,
     DynamoDbItemNotFoundError,
     DynamoDbStatusError,
+    DynamoDbVersionConflictError,
 )
 from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemStatus,
+    RadioProgramItemModel,
     RadioProgramPutItemModel,
     RadioProgramUpdateItemModel,
 )
 from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
+from audio_api.domain.models import RadioProgramFileModel
 
-DYNAMODB_TABLE_MOCK_PATH = (
-    "audio_api.aws.dynamodb.repositories.radio_programs.radio_programs_repository.table"
+RADIO_PROGRAMS_REPOSITORY_PATH = (
+    "audio_api.aws.dynamodb.repositories.radio_programs.radio_programs_repository"
 )
+DYNAMODB_TABLE_MOCK_PATH = f"{RADIO_PROGRAMS_REPOSITORY_PATH}.table"
+DYNAMODB_CLIENT_MOCK_PATH = f"{RADIO_PROGRAMS_REPOSITORY_PATH}.dynamodb_client"
 
 
 @pytest.mark.usefixtures("localstack")
@@ -53,12 +61,12 @@ class TestRadioProgramsRepository(unittest.TestCase):
         # Then
         assert db_radio_program == expected_radio_program
 
-    @mock.patch(DYNAMODB_TABLE_MOCK_PATH)
-    def test_get_item_raises_dynamodb_client_error(self, table_mock: mock.patch):
-        """Should raise DynamoDbClientError if table.query raises ClientError."""
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_item_raises_dynamodb_client_error(self, client_mock: mock.patch):
+        """Should raise DynamoDbClientError if client.get_item raises ClientError."""
         # When
         item_id = uuid4()
-        table_mock.query.side_effect = ClientError(
+        client_mock.get_item.side_effect = ClientError(
             error_response={"Error": {"Code": 500, "Message": "test_error"}},
             operation_name="test_error",
         )
@@ -66,24 +74,26 @@ class TestRadioProgramsRepository(unittest.TestCase):
         # Then
         with pytest.raises(DynamoDbClientError):
             self.radio_programs_repository.get_item(item_id=item_id)
-        table_mock.query.assert_called_once_with(
-            ScanIndexForward=False, KeyConditionExpression=Key("id").eq(str(item_id))
+        client_mock.get_item.assert_called_once_with(
+            TableName=self.radio_programs_repository.table_name,
+            Key={"id": {"S": str(item_id)}},
         )
 
-    @mock.patch(DYNAMODB_TABLE_MOCK_PATH)
-    def test_get_item_raises_dynamodb_status_error(self, table_mock: mock.patch):
-        """Should raise DynamoDbStatusError if table.query status code is not 200."""
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_item_raises_dynamodb_status_error(self, client_mock: mock.patch):
+        """Should raise DynamoDbStatusError if get_item status code is not 200."""
         # Given
         item_id = uuid4()
 
         # When
-        table_mock.query.return_value = {"ResponseMetadata": {"HTTPStatsCode": 500}}
+        client_mock.get_item.return_value = {"ResponseMetadata": {"HTTPStatsCode": 500}}
 
         # Then
         with pytest.raises(DynamoDbStatusError):
             self.radio_programs_repository.get_item(item_id=item_id)
-        table_mock.query.assert_called_once_with(
-            ScanIndexForward=False, KeyConditionExpression=Key("id").eq(str(item_id))
+        client_mock.get_item.assert_called_once_with(
+            TableName=self.radio_programs_repository.table_name,
+            Key={"id": {"S": str(item_id)}},
         )
 
     def test_get_item_raises_dynamodb_item_not_found_error(self):
@@ -122,11 +132,661 @@ class TestRadioProgramsRepository(unittest.TestCase):
         # Then
         assert db_radio_programs == expected_radio_programs
 
+    def test_get_items_page(self):
+        """Should page through all RadioPrograms using the returned cursor."""
+        # Given
+        expected_radio_programs = sorted(
+            [
+                self.radio_programs_repository.put_item(item=self.create_program_model)
+                for _ in range(3)
+            ],
+            key=lambda x: x.id,
+        )
+
+        # When
+        db_radio_programs = []
+        cursor = None
+        for _ in range(len(expected_radio_programs) + 1):
+            page = self.radio_programs_repository.get_items_page(limit=2, cursor=cursor)
+            db_radio_programs.extend(page.items)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+
+        # Then
+        assert cursor is None
+        assert sorted(db_radio_programs, key=lambda x: x.id) == expected_radio_programs
+
+    def test_get_items_page_raises_dynamodb_invalid_cursor_error(self):
+        """Should raise DynamoDbInvalidCursorError if the cursor is malformed."""
+        # Then
+        with pytest.raises(DynamoDbInvalidCursorError):
+            self.radio_programs_repository.get_items_page(limit=1, cursor="invalid")
+
+    def _wire_item(self) -> dict:
+        return self.radio_programs_repository.codec.encode(
+            {**self.create_program_model.dict(), "id": str(uuid4()), "version": 1}
+        )
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_follows_last_evaluated_key(self, client_mock: mock.patch):
+        """Should keep scanning while DynamoDB returns a LastEvaluatedKey."""
+        # Given
+        radio_program_1, radio_program_2 = self._wire_item(), self._wire_item()
+        last_evaluated_key = {"id": radio_program_1["id"]}
+
+        # When
+        client_mock.scan.side_effect = [
+            {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Items": [radio_program_1],
+                "LastEvaluatedKey": last_evaluated_key,
+            },
+            {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Items": [radio_program_2],
+            },
+        ]
+        db_radio_programs = self.radio_programs_repository.get_items()
+
+        # Then
+        assert [str(item.id) for item in db_radio_programs] == [
+            radio_program_1["id"]["S"],
+            radio_program_2["id"]["S"],
+        ]
+        client_mock.scan.assert_called_with(
+            TableName=self.radio_programs_repository.table_name,
+            ExclusiveStartKey=last_evaluated_key,
+        )
+
+    def test_get_items_by_ids(self):
+        """Should retrieve existing RadioPrograms in the requested order."""
+        # Given
+        radio_programs = [
+            self.radio_programs_repository.put_item(item=self.create_program_model)
+            for _ in range(3)
+        ]
+        expected_radio_programs = list(reversed(radio_programs))
+        item_ids = [uuid4()] + [program.id for program in expected_radio_programs]
+
+        # When
+        db_radio_programs = self.radio_programs_repository.get_items_by_ids(
+            item_ids=item_ids
+        )
+
+        # Then
+        assert db_radio_programs == expected_radio_programs
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_by_ids_chunks_keys(self, client_mock: mock.patch):
+        """Should split ids in BatchGetItem requests of up to 100 keys."""
+        # Given
+        item_ids = [uuid4() for _ in range(150)]
+
+        # When
+        client_mock.batch_get_item.return_value = {
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+            "Responses": {},
+        }
+        db_radio_programs = self.radio_programs_repository.get_items_by_ids(
+            item_ids=item_ids
+        )
+
+        # Then
+        table_name = self.radio_programs_repository.table_name
+        assert db_radio_programs == []
+        assert [
+            len(call.kwargs["RequestItems"][table_name]["Keys"])
+            for call in client_mock.batch_get_item.call_args_list
+        ] == [100, 50]
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_by_ids_retries_unprocessed_keys(self, client_mock: mock.patch):
+        """Should retry BatchGetItem with the returned UnprocessedKeys."""
+        # Given
+        table_name = self.radio_programs_repository.table_name
+        radio_program_1, radio_program_2 = self._wire_item(), self._wire_item()
+        unprocessed_keys = {table_name: {"Keys": [{"id": radio_program_2["id"]}]}}
+
+        # When
+        client_mock.batch_get_item.side_effect = [
+            {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Responses": {table_name: [radio_program_1]},
+                "UnprocessedKeys": unprocessed_keys,
+            },
+            {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Responses": {table_name: [radio_program_2]},
+            },
+        ]
+        item_ids = [radio_program_1["id"]["S"], radio_program_2["id"]["S"]]
+        db_radio_programs = self.radio_programs_repository.get_items_by_ids(
+            item_ids=item_ids
+        )
+
+        # Then
+        assert [str(item.id) for item in db_radio_programs] == item_ids
+        client_mock.batch_get_item.assert_called_with(RequestItems=unprocessed_keys)
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_by_ids_raises_dynamodb_client_error(
+        self, client_mock: mock.patch
+    ):
+        """Should raise DynamoDbClientError if batch_get_item raises ClientError."""
+        # When
+        client_mock.batch_get_item.side_effect = ClientError(
+            error_response={"Error": {"Code": 500, "Message": "test_error"}},
+            operation_name="test_error",
+        )
+
+        # Then
+        with pytest.raises(DynamoDbClientError):
+            self.radio_programs_repository.get_items_by_ids(item_ids=[uuid4()])
+        client_mock.batch_get_item.assert_called_once()
+
+    def _put_programs_by_air_date(self, air_dates: list[date | None]) -> list:
+        return [
+            self.radio_programs_repository.put_item(
+                item=self.create_program_model.copy(update={"air_date": air_date})
+            )
+            for air_date in air_dates
+        ]
+
+    def test_get_items_by_air_date(self):
+        """Should retrieve RadioPrograms aired in a date range sorted by air_date."""
+        # Given
+        march_31, march_1, _, _ = self._put_programs_by_air_date(
+            [date(2023, 3, 31), date(2023, 3, 1), date(2023, 4, 1), None]
+        )
+
+        # When
+        db_radio_programs = self.radio_programs_repository.get_items_by_air_date(
+            date_from=date(2023, 3, 1), date_to=date(2023, 3, 31)
+        )
+
+        # Then
+        assert db_radio_programs == [march_1, march_31]
+
+    def test_get_items_by_air_date_open_range(self):
+        """Should retrieve RadioPrograms aired from a date with no upper bound."""
+        # Given
+        _, april_1, may_1, _ = self._put_programs_by_air_date(
+            [date(2023, 3, 1), date(2023, 4, 1), date(2023, 5, 1), None]
+        )
+
+        # When
+        db_radio_programs = self.radio_programs_repository.get_items_by_air_date(
+            date_from=date(2023, 4, 1)
+        )
+
+        # Then
+        assert db_radio_programs == [april_1, may_1]
+
+    def test_get_items_by_air_date_page(self):
+        """Should page through RadioPrograms aired in a date range."""
+        # Given
+        expected_radio_programs = self._put_programs_by_air_date(
+            [date(2023, 3, day) for day in range(1, 4)]
+        )
+
+        # When
+        first_page = self.radio_programs_repository.get_items_by_air_date_page(
+            limit=2, date_to=date(2023, 3, 31)
+        )
+        second_page = self.radio_programs_repository.get_items_by_air_date_page(
+            limit=2, cursor=first_page.next_cursor, date_to=date(2023, 3, 31)
+        )
+
+        # Then
+        assert first_page.items == expected_radio_programs[:2]
+        assert second_page.items == expected_radio_programs[2:]
+        assert second_page.next_cursor is None
+
+    def test_get_items_by_air_date_page_merges_partitions(self):
+        """Should page through every air_date partition sorted by air_date."""
+        # Given
+        expected_radio_programs = self._put_programs_by_air_date(
+            [date(2023, 3, day) for day in range(1, 11)]
+        )
+
+        # When
+        db_radio_programs = []
+        cursor = None
+        for _ in range(len(expected_radio_programs)):
+            page = self.radio_programs_repository.get_items_by_air_date_page(
+                limit=3, cursor=cursor, date_from=date(2023, 3, 1)
+            )
+            db_radio_programs.extend(page.items)
+            if not (cursor := page.next_cursor):
+                break
+
+        # Then
+        partitions = {
+            item["air_date_partition"]
+            for item in self.radio_programs_repository.parallel_scan()
+        }
+        assert len(partitions) > 1
+        assert cursor is None
+        assert db_radio_programs == expected_radio_programs
+
+    def test_get_items_by_air_date_page_raises_dynamodb_invalid_cursor_error(self):
+        """Should raise DynamoDbInvalidCursorError if the cursor has no partitions."""
+        # Given
+        cursor = self.radio_programs_repository._encode_cursor({"id": {"S": "id"}})
+
+        # Then
+        with pytest.raises(DynamoDbInvalidCursorError):
+            self.radio_programs_repository.get_items_by_air_date_page(
+                limit=1, cursor=cursor
+            )
+
+    def test_update_item_updates_nested_fields(self):
+        """Should set and remove nested RadioProgram file fields by document path."""
+        # Given
+        created_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model.copy(
+                update={
+                    "radio_program": RadioProgramFileModel(
+                        file_name="old", file_url="old_url", program_length=60
+                    )
+                }
+            )
+        )
+        update_program_model = RadioProgramUpdateItemModel(
+            title="new file",
+            radio_program=RadioProgramFileModel(file_name="new", file_url="new_url"),
+        )
+
+        # When
+        updated_program = self.radio_programs_repository.update_item(
+            item_id=created_program.id, item=update_program_model
+        )
+
+        # Then
+        db_radio_program = self.radio_programs_repository.get_item(
+            item_id=created_program.id
+        )
+        assert db_radio_program == updated_program
+        assert db_radio_program.radio_program == RadioProgramFileModel(
+            file_name="new", file_url="new_url"
+        )
+
     @mock.patch(DYNAMODB_TABLE_MOCK_PATH)
-    def test_get_items_raises_dynamodb_client_error(self, table_mock: mock.patch):
-        """Should raise DynamoDbClientError if table.scan raises ClientError."""
+    def test_update_item_sets_missing_nested_map(self, table_mock: mock.patch):
+        """Should set the whole nested map if the stored item does not have it."""
+        # Given
+        created_program = RadioProgramItemModel(
+            **self.create_program_model.dict(), id=uuid4(), version=1
+        )
+        update_program_model = RadioProgramUpdateItemModel(
+            title="with file",
+            radio_program=RadioProgramFileModel(file_name="new", file_url="new_url"),
+        )
+
+        # When
+        table_mock.update_item.side_effect = [
+            ClientError(
+                {
+                    "Error": {
+                        "Code": "ValidationException",
+                        "Message": "The document path provided in the update "
+                        "expression is invalid for update",
+                    }
+                },
+                "UpdateItem",
+            ),
+            {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "Attributes": created_program.dict(exclude_none=True),
+            },
+        ]
+        updated_program = self.radio_programs_repository.update_item(
+            item_id=created_program.id, item=update_program_model
+        )
+
+        # Then
+        assert updated_program.radio_program == update_program_model.radio_program
+        update_expression = table_mock.update_item.call_args.kwargs["UpdateExpression"]
+        assert "." not in update_expression
+        assert "REMOVE" not in update_expression
+
+    def test_update_item_indexes_new_air_date(self):
+        """Should index a RadioProgram when an air_date is set by update_item."""
+        # Given
+        (created_program,) = self._put_programs_by_air_date([None])
+        update_program_model = RadioProgramUpdateItemModel(
+            title="aired program", air_date=date(2023, 3, 1)
+        )
+
+        # When
+        updated_program = self.radio_programs_repository.update_item(
+            item_id=created_program.id, item=update_program_model
+        )
+        db_radio_programs = self.radio_programs_repository.get_items_by_air_date(
+            date_from=date(2023, 3, 1)
+        )
+
+        # Then
+        assert db_radio_programs == [updated_program]
+
+    def test_backfill_index_attributes(self):
+        """Should index RadioPrograms stored before the air_date_index existed."""
+        # Given
+        (created_program,) = self._put_programs_by_air_date([date(2023, 3, 1)])
+        self.radio_programs_repository.table.update_item(
+            Key={"id": str(created_program.id)},
+            UpdateExpression="REMOVE air_date_partition",
+        )
+        assert self.radio_programs_repository.get_items_by_air_date() == []
+
+        # When
+        updated_items = self.radio_programs_repository.backfill_index_attributes()
+
+        # Then
+        assert updated_items == 1
+        assert self.radio_programs_repository.get_items_by_air_date() == [
+            created_program
+        ]
+
+    def test_get_item_with_cache(self):
+        """Should serve repeated reads from the cache until the item changes."""
+        # Given
+        repository = RadioProgramsRepository(
+            RadioProgramItemModel, cache=LRUCache(max_size=10, ttl_seconds=60)
+        )
+        created_program = repository.put_item(item=self.create_program_model)
+
+        # When
+        first_read = repository.get_item(item_id=created_program.id)
+        with mock.patch.object(repository, "dynamodb_client") as client_mock:
+            cached_read = repository.get_item(item_id=created_program.id)
+            client_mock.get_item.assert_not_called()
+        updated_program = repository.update_item(
+            item_id=created_program.id, item=self.update_program_model
+        )
+        read_after_update = repository.get_item(item_id=created_program.id)
+
+        # Then
+        assert first_read == cached_read == created_program
+        assert read_after_update == updated_program
+        stats = repository.cache_stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+    def test_get_items_by_ids_with_cache(self):
+        """Should only request ids missing from the cache."""
+        # Given
+        repository = RadioProgramsRepository(
+            RadioProgramItemModel, cache=LRUCache(max_size=10, ttl_seconds=60)
+        )
+        radio_programs = [
+            repository.put_item(item=self.create_program_model) for _ in range(2)
+        ]
+        repository.get_item(item_id=radio_programs[0].id)
+
+        # When
+        with mock.patch.object(
+            repository, "_batch_get", wraps=repository._batch_get
+        ) as batch_get_mock:
+            db_radio_programs = repository.get_items_by_ids(
+                item_ids=[program.id for program in radio_programs]
+            )
+
+        # Then
+        assert db_radio_programs == radio_programs
+        batch_get_mock.assert_called_once_with(
+            [{"id": {"S": str(radio_programs[1].id)}}]
+        )
+
+    def test_delete_item_invalidates_cache(self):
+        """Should not serve deleted items from the cache."""
+        # Given
+        repository = RadioProgramsRepository(
+            RadioProgramItemModel, cache=LRUCache(max_size=10, ttl_seconds=60)
+        )
+        created_program = repository.put_item(item=self.create_program_model)
+        repository.get_item(item_id=created_program.id)
+
+        # When
+        repository.delete_item(item_id=created_program.id)
+
+        # Then
+        with pytest.raises(DynamoDbItemNotFoundError):
+            repository.get_item(item_id=created_program.id)
+
+    def test_parallel_scan(self):
+        """Should stream every RadioProgram when scanning segments in parallel."""
+        # Given
+        expected_ids = sorted(
+            str(
+                self.radio_programs_repository.put_item(
+                    item=self.create_program_model
+                ).id
+            )
+            for _ in range(10)
+        )
+
+        # When
+        db_items = list(
+            self.radio_programs_repository.parallel_scan(
+                total_segments=4, max_workers=2
+            )
+        )
+
+        # Then
+        assert sorted(item["id"] for item in db_items) == expected_ids
+
+    def test_iter_file_names(self):
+        """Should stream the file name of every RadioProgram."""
+        # Given
+        for _ in range(3):
+            self.radio_programs_repository.put_item(item=self.create_program_model)
+
+        # When
+        file_names = list(self.radio_programs_repository.iter_file_names())
+
+        # Then
+        assert file_names == [self.create_program_model.radio_program.file_name] * 3
+
+    def test_get_items_with_total_segments(self):
+        """Should retrieve all RadioPrograms using a parallel scan."""
+        # Given
+        expected_radio_programs = sorted(
+            [
+                self.radio_programs_repository.put_item(item=self.create_program_model)
+                for _ in range(5)
+            ],
+            key=lambda x: x.id,
+        )
+
+        # When
+        db_radio_programs = self.radio_programs_repository.get_items(total_segments=3)
+
+        # Then
+        assert sorted(db_radio_programs, key=lambda x: x.id) == expected_radio_programs
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_parallel_scan_raises_dynamodb_client_error(self, client_mock: mock.patch):
+        """Should raise DynamoDbClientError if a segment scan raises ClientError."""
+        # When
+        client_mock.scan.side_effect = ClientError(
+            error_response={"Error": {"Code": 500, "Message": "test_error"}},
+            operation_name="test_error",
+        )
+
+        # Then
+        with pytest.raises(DynamoDbClientError):
+            list(self.radio_programs_repository.parallel_scan(total_segments=2))
+        client_mock.scan.assert_called()
+
+    def test_delete_all(self):
+        """Should delete every RadioProgram scanning segments in parallel."""
+        # Given
+        for _ in range(30):
+            self.radio_programs_repository.put_item(item=self.create_program_model)
+
+        # When
+        self.radio_programs_repository.delete_all(total_segments=3, max_workers=3)
+
+        # Then
+        assert self.radio_programs_repository.get_items() == []
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_delete_all_retries_unprocessed_items(self, client_mock: mock.patch):
+        """Should retry BatchWriteItem with the returned UnprocessedItems."""
+        # Given
+        table_name = self.radio_programs_repository.table_name
+        keys = [{"id": {"S": str(uuid4())}} for _ in range(2)]
+        unprocessed_items = {table_name: [{"DeleteRequest": {"Key": keys[1]}}]}
+
+        # When
+        client_mock.scan.return_value = {
+            "ResponseMetadata": {"HTTPStatusCode": 200},
+            "Items": keys,
+        }
+        client_mock.batch_write_item.side_effect = [
+            {"UnprocessedItems": unprocessed_items},
+            {"UnprocessedItems": {}},
+        ]
+        self.radio_programs_repository.delete_all(total_segments=1)
+
+        # Then
+        assert client_mock.batch_write_item.call_count == 2
+        client_mock.batch_write_item.assert_called_with(RequestItems=unprocessed_items)
+
+    def test_put_items(self):
+        """Should store several RadioPrograms in BatchWriteItem calls."""
+        # Given
+        items = [self.create_program_model] * 30
+
         # When
-        table_mock.scan.side_effect = ClientError(
+        results = self.radio_programs_repository.put_items(items=items)
+
+        # Then
+        assert len(results) == 30
+        assert all(r.status == DynamoDbBatchItemStatus.succeeded for r in results)
+        db_radio_programs = self.radio_programs_repository.get_items_by_ids(
+            item_ids=[r.id for r in results]
+        )
+        assert db_radio_programs == [r.item for r in results]
+
+    def test_update_items(self):
+        """Should merge new values into stored RadioPrograms and report missing."""
+        # Given
+        stored_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model
+        )
+        missing_id = uuid4()
+        update_item = RadioProgramUpdateItemModel(
+            title="batch updated", air_date=date(2020, 1, 1)
+        )
+
+        # When
+        results = self.radio_programs_repository.update_items(
+            items={stored_program.id: update_item, missing_id: update_item}
+        )
+
+        # Then
+        assert [r.status for r in results] == [
+            DynamoDbBatchItemStatus.succeeded,
+            DynamoDbBatchItemStatus.not_found,
+        ]
+        db_radio_program = self.radio_programs_repository.get_item(
+            item_id=stored_program.id
+        )
+        assert db_radio_program == results[0].item
+        assert db_radio_program.title == "batch updated"
+        assert db_radio_program.radio_program == stored_program.radio_program
+        assert self.radio_programs_repository.get_items_by_air_date(
+            date_from=date(2020, 1, 1), date_to=date(2020, 1, 1)
+        ) == [db_radio_program]
+
+    def test_update_items_reports_version_conflict(self):
+        """Should not overwrite a RadioProgram updated after it was read."""
+        # Given
+        stored_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model
+        )
+        stale_items = self.radio_programs_repository._get_raw_items([stored_program.id])
+        concurrent_program = self.radio_programs_repository.update_item(
+            item_id=stored_program.id, item=self.update_program_model
+        )
+
+        # When
+        with mock.patch.object(
+            self.radio_programs_repository, "_get_raw_items", return_value=stale_items
+        ):
+            results = self.radio_programs_repository.update_items(
+                items={stored_program.id: RadioProgramUpdateItemModel(title="stale")}
+            )
+
+        # Then
+        assert [r.status for r in results] == [DynamoDbBatchItemStatus.conflict]
+        assert (
+            self.radio_programs_repository.get_item(item_id=stored_program.id)
+            == concurrent_program
+        )
+
+    def test_delete_items_raises_value_error_if_ids_are_repeated(self):
+        """Should raise ValueError instead of deleting a RadioProgram twice."""
+        # Given
+        item_id = uuid4()
+
+        # Then
+        with pytest.raises(ValueError, match="must not be repeated"):
+            self.radio_programs_repository.delete_items(item_ids=[item_id, item_id])
+
+    def test_delete_items(self):
+        """Should delete several RadioPrograms and return their last values."""
+        # Given
+        stored_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model
+        )
+        missing_id = uuid4()
+
+        # When
+        results = self.radio_programs_repository.delete_items(
+            item_ids=[stored_program.id, missing_id]
+        )
+
+        # Then
+        assert [r.status for r in results] == [
+            DynamoDbBatchItemStatus.succeeded,
+            DynamoDbBatchItemStatus.not_found,
+        ]
+        assert results[0].item == stored_program
+        assert self.radio_programs_repository.get_items() == []
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_put_items_reports_unprocessed_items(self, client_mock: mock.patch):
+        """Should report items still unprocessed after retries as failed."""
+        # Given
+        table_name = self.radio_programs_repository.table_name
+
+        def _batch_write_item(RequestItems):  # noqa: N803
+            return {"UnprocessedItems": {table_name: RequestItems[table_name][-1:]}}
+
+        client_mock.batch_write_item.side_effect = _batch_write_item
+
+        # When
+        with mock.patch("time.sleep"):
+            results = self.radio_programs_repository.put_items(
+                items=[self.create_program_model] * 2
+            )
+
+        # Then
+        assert [r.status for r in results] == [
+            DynamoDbBatchItemStatus.succeeded,
+            DynamoDbBatchItemStatus.failed,
+        ]
+        assert results[1].item is None
+        assert results[1].error
+
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_raises_dynamodb_client_error(self, client_mock: mock.patch):
+        """Should raise DynamoDbClientError if client.scan raises ClientError."""
+        # When
+        client_mock.scan.side_effect = ClientError(
             error_response={"Error": {"Code": 500, "Message": "test_error"}},
             operation_name="test_error",
         )
@@ -134,18 +794,18 @@ class TestRadioProgramsRepository(unittest.TestCase):
         # Then
         with pytest.raises(DynamoDbClientError):
             self.radio_programs_repository.get_items()
-        table_mock.scan.assert_called_once()
+        client_mock.scan.assert_called_once()
 
-    @mock.patch(DYNAMODB_TABLE_MOCK_PATH)
-    def test_get_items_raises_dynamodb_status_error(self, table_mock: mock.patch):
-        """Should raise DynamoDbStatusError if table.scan status code is not 200."""
+    @mock.patch(DYNAMODB_CLIENT_MOCK_PATH)
+    def test_get_items_raises_dynamodb_status_error(self, client_mock: mock.patch):
+        """Should raise DynamoDbStatusError if client.scan status code is not 200."""
         # When
-        table_mock.scan.return_value = {"ResponseMetadata": {"HTTPStatsCode": 500}}
+        client_mock.scan.return_value = {"ResponseMetadata": {"HTTPStatsCode": 500}}
 
         # Then
         with pytest.raises(DynamoDbStatusError):
             self.radio_programs_repository.get_items()
-        table_mock.scan.assert_called_once()
+        client_mock.scan.assert_called_once()
 
     def test_put_item(self):
         """Should successfully create a new RadioProgram."""
@@ -194,7 +854,7 @@ class TestRadioProgramsRepository(unittest.TestCase):
             item=self.create_program_model
         )
         expected_program = created_program.copy(
-            update=self.update_program_model.dict(exclude_none=True)
+            update={**self.update_program_model.dict(exclude_none=True), "version": 2}
         )
 
         # When
@@ -205,6 +865,51 @@ class TestRadioProgramsRepository(unittest.TestCase):
         # Then
         assert updated_program == expected_program
         assert updated_program != created_program
+        assert self.radio_programs_repository.get_item(item_id=created_program.id) == (
+            expected_program
+        )
+
+    def test_update_item_with_previous(self):
+        """Should return the stored RadioProgram together with the updated one."""
+        # Given
+        created_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model
+        )
+
+        # When
+        (
+            previous_program,
+            updated_program,
+        ) = self.radio_programs_repository.update_item_with_previous(
+            item_id=created_program.id,
+            item=self.update_program_model,
+            expected_version=1,
+        )
+
+        # Then
+        assert previous_program == created_program
+        assert updated_program.version == 2
+        assert updated_program == self.radio_programs_repository.get_item(
+            item_id=created_program.id
+        )
+
+    def test_update_item_with_previous_raises_version_conflict_error(self):
+        """Should raise DynamoDbVersionConflictError if the version is stale."""
+        # Given
+        created_program = self.radio_programs_repository.put_item(
+            item=self.create_program_model
+        )
+        self.radio_programs_repository.update_item(
+            item_id=created_program.id, item=self.update_program_model
+        )
+
+        # Then
+        with pytest.raises(DynamoDbVersionConflictError):
+            self.radio_programs_repository.update_item_with_previous(
+                item_id=created_program.id,
+                item=self.update_program_model,
+                expected_version=1,
+            )
 
     def test_update_item_raises_dynamo_db_item_not_found_error(self):
         """Should raise DynamoDbItemNotFoundError if RadioProgram does not exist."""
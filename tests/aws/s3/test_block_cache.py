@@ -0,0 +1,70 @@
+"""Test S3BlockCache."""
+import tempfile
+import unittest
+
+from audio_api.aws.s3.block_cache import S3BlockCache
+
+
+class TestS3BlockCache(unittest.TestCase):
+    """TestS3BlockCache class."""
+
+    def setUp(self):
+        """Create a cache of up to 10 bytes in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = S3BlockCache(self.directory.name, max_bytes=10, block_size=4)
+
+    def test_get_counts_hits_and_misses(self):
+        """Should return stored blocks and count hits and misses."""
+        # Given
+        self.cache.set("key", "etag", 0, b"abcd")
+
+        # When
+        hit = self.cache.get("key", "etag", 0)
+        miss = self.cache.get("key", "other_etag", 0)
+
+        # Then
+        stats = self.cache.stats()
+        assert (hit, miss) == (b"abcd", None)
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 4)
+
+    def test_set_evicts_least_recently_used_blocks_by_bytes(self):
+        """Should evict least recently used blocks once max_bytes is exceeded."""
+        # Given
+        self.cache.set("key", "etag", 0, b"abcd")
+        self.cache.set("key", "etag", 1, b"efgh")
+        self.cache.get("key", "etag", 0)
+
+        # When
+        self.cache.set("key", "etag", 2, b"ij")
+        self.cache.set("key", "etag", 3, b"k")
+
+        # Then
+        stats = self.cache.stats()
+        assert self.cache.get("key", "etag", 1) is None
+        assert self.cache.get("key", "etag", 0) == b"abcd"
+        assert (stats.evictions, stats.size) == (1, 7)
+
+    def test_blocks_survive_reopening_the_cache(self):
+        """Should index blocks already stored on disk."""
+        # Given
+        self.cache.set("key", "etag", 0, b"abcd")
+
+        # When
+        reopened_cache = S3BlockCache(self.directory.name, max_bytes=10, block_size=4)
+
+        # Then
+        assert reopened_cache.get("key", "etag", 0) == b"abcd"
+        assert reopened_cache.stats().size == 4
+
+    def test_clear(self):
+        """Should delete every block."""
+        # Given
+        self.cache.set("key", "etag", 0, b"abcd")
+
+        # When
+        self.cache.clear()
+
+        # Then
+        assert self.cache.get("key", "etag", 0) is None
+        assert self.cache.stats().size == 0
@@ -0,0 +1,166 @@
+"""Test S3DeletionQueue."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from audio_api.aws.s3.exceptions import S3FileNotFoundError
+from audio_api.aws.s3.repositories.deletion_queue import S3DeletionQueue
+from audio_api.aws.s3.repositories.radio_program_files import (
+    RadioProgramFilesRepository,
+)
+
+
+@pytest.mark.usefixtures("localstack")
+@pytest.mark.usefixtures("radio_program_files_repository")
+class TestS3DeletionQueue(unittest.TestCase):
+    """TestS3DeletionQueue class."""
+
+    radio_program_files_repository: RadioProgramFilesRepository
+
+    @pytest.fixture(autouse=True)
+    def _empty_bucket(self):
+        self.radio_program_files_repository.delete_all()
+
+    def _put_objects(self, object_keys: list[str]) -> None:
+        for object_key in object_keys:
+            self.radio_program_files_repository.s3_client.put_object(
+                Bucket=self.radio_program_files_repository.bucket_name,
+                Key=object_key,
+                Body=b"content",
+            )
+
+    def test_flush_deletes_queued_objects_in_a_batch(self):
+        """Test flush deletes every queued object with a single request."""
+        # Given
+        object_keys = ["1.mp3", "2.mp3", "3.mp3"]
+        self._put_objects([*object_keys, "kept.mp3"])
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository, path=":memory:"
+        )
+        deletion_queue.enqueue(object_keys)
+        deletion_queue.enqueue(object_keys[:1])
+
+        # When
+        with mock.patch.object(
+            self.radio_program_files_repository,
+            "delete_objects",
+            wraps=self.radio_program_files_repository.delete_objects,
+        ) as delete_objects_mock:
+            deleted = deletion_queue.flush()
+
+        # Then
+        assert deleted == 3
+        assert deletion_queue.pending() == 0
+        delete_objects_mock.assert_called_once()
+        assert sorted(delete_objects_mock.call_args.args[0]) == object_keys
+        remaining_files = self.radio_program_files_repository.list_objects()
+        assert [file.file_name for file in remaining_files] == ["kept.mp3"]
+
+    def test_flush_retries_failed_deletions_with_backoff(self):
+        """Test failed deletions stay queued until their retry is due."""
+        # Given
+        now = [1000.0]
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository,
+            path=":memory:",
+            retry_max_delay=10,
+            timer=lambda: now[0],
+        )
+        deletion_queue.enqueue(["1.mp3", "2.mp3"])
+
+        # When
+        with mock.patch.object(
+            self.radio_program_files_repository,
+            "delete_objects",
+            side_effect=[["2.mp3"], []],
+        ) as delete_objects_mock:
+            first_deleted = deletion_queue.flush()
+            not_due_deleted = deletion_queue.flush()
+            now[0] += 10
+            retried_deleted = deletion_queue.flush()
+
+        # Then
+        assert (first_deleted, not_due_deleted, retried_deleted) == (1, 0, 1)
+        assert delete_objects_mock.call_args_list[1].args[0] == ["2.mp3"]
+        assert deletion_queue.pending() == 0
+
+    def test_cancel_removes_queued_objects(self):
+        """Test cancelled objects are not deleted."""
+        # Given
+        self._put_objects(["1.mp3", "2.mp3"])
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository, path=":memory:"
+        )
+        deletion_queue.enqueue(["1.mp3", "2.mp3"])
+
+        # When
+        deletion_queue.cancel(["2.mp3"])
+        deleted = deletion_queue.flush()
+
+        # Then
+        assert deleted == 1
+        remaining_files = self.radio_program_files_repository.list_objects()
+        assert [file.file_name for file in remaining_files] == ["2.mp3"]
+
+    def test_queue_is_persisted(self):
+        """Test queued objects survive reopening the queue."""
+        # Given
+        self._put_objects(["1.mp3"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "queue" / "deletions.sqlite3"
+            S3DeletionQueue(self.radio_program_files_repository, path=path).enqueue(
+                ["1.mp3"]
+            )
+
+            # When
+            deletion_queue = S3DeletionQueue(
+                self.radio_program_files_repository, path=path
+            )
+            pending = deletion_queue.pending()
+            deleted = deletion_queue.flush()
+
+        # Then
+        assert pending == 1
+        assert deleted == 1
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.get_object("1.mp3")
+
+    def test_flush_keeps_objects_in_use(self):
+        """Test flush drops objects in use from the queue without deleting them."""
+        # Given
+        self._put_objects(["1.mp3", "2.mp3"])
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository,
+            path=":memory:",
+            get_keys_in_use=lambda object_keys: {"2.mp3"} & set(object_keys),
+        )
+        deletion_queue.enqueue(["1.mp3", "2.mp3"])
+
+        # When
+        deleted = deletion_queue.flush()
+
+        # Then
+        assert deleted == 1
+        assert deletion_queue.pending() == 0
+        remaining_files = self.radio_program_files_repository.list_objects()
+        assert [file.file_name for file in remaining_files] == ["2.mp3"]
+
+    def test_stop_flushes_pending_deletions(self):
+        """Test stopping the background thread flushes the queue."""
+        # Given
+        self._put_objects(["1.mp3"])
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository, path=":memory:", flush_interval=60
+        )
+
+        # When
+        deletion_queue.start()
+        deletion_queue.enqueue(["1.mp3"])
+        deletion_queue.stop()
+
+        # Then
+        assert deletion_queue.pending() == 0
+        assert self.radio_program_files_repository.list_objects() == []
@@ -1,20 +1,24 @@
 """Test RadioProgramFilesRepository."""
+import tempfile
 import time
 import unittest
+from datetime import datetime, timezone
 from unittest import mock
 from unittest.mock import patch
 
 import pytest
 import requests
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, EndpointConnectionError
 
+from audio_api.aws.cache import LRUCache
+from audio_api.aws.s3.block_cache import S3BlockCache
 from audio_api.aws.s3.exceptions import (
     S3BucketNotImplementedError,
     S3ClientError,
     S3FileNotFoundError,
     S3PersistenceError,
 )
-from audio_api.aws.s3.models import RadioProgramFileCreate
+from audio_api.aws.s3.models import RadioProgramFile, RadioProgramFileCreate
 from audio_api.aws.s3.repositories.radio_program_files import (
     RadioProgramFilesRepository,
 )
@@ -34,6 +38,11 @@ S3_GET_OBJECT_MOCK_PATCH = f"{S3_CLIENT_PATH}.get_object"
 S3_PUT_OBJECT_MOCK_PATCH = f"{S3_CLIENT_PATH}.put_object"
 S3_LIST_OBJECTS_MOCK_PATCH = f"{S3_CLIENT_PATH}.list_objects_v2"
 S3_DELETE_OBJECT_MOCK_PATCH = f"{S3_CLIENT_PATH}.delete_object"
+S3_DELETE_OBJECTS_MOCK_PATCH = f"{S3_CLIENT_PATH}.delete_objects"
+S3_GENERATE_PRESIGNED_URL_MOCK_PATCH = f"{S3_CLIENT_PATH}.generate_presigned_url"
+S3_UPLOAD_PART_MOCK_PATCH = f"{S3_CLIENT_PATH}.upload_part"
+S3_ABORT_MULTIPART_UPLOAD_MOCK_PATCH = f"{S3_CLIENT_PATH}.abort_multipart_upload"
+S3_COMPLETE_MULTIPART_UPLOAD_MOCK_PATCH = f"{S3_CLIENT_PATH}.complete_multipart_upload"
 S3_DELETE_ALL_MOCK_PATCH = f"{RADIO_PROGRAM_FILES_REPOSITORY_PATH}._delete_all"
 
 
@@ -111,6 +120,201 @@ class TestRadioProgramFilesRepository(unittest.TestCase):
             Body=radio_program_create_model.file,
         )
 
+    def test_multipart_upload_file_to_s3(self):
+        """Test that files above the multipart threshold are uploaded in parts."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        part_size = 5 * 1024 * 1024
+        file_content = bytes(range(256)) * (part_size * 2 // 256 + 1024)
+        file = tempfile.SpooledTemporaryFile()
+        file.write(file_content)
+        radio_program_create_model = RadioProgramFileCreate(
+            file_name="multipart", file=file
+        )
+
+        # When
+        with patch.object(settings, "S3_MULTIPART_THRESHOLD", part_size), patch.object(
+            settings, "S3_MULTIPART_PART_SIZE", part_size
+        ), patch.object(settings, "S3_MULTIPART_CONCURRENCY", 2):
+            uploaded_file = self.radio_program_files_repository.put_object(
+                radio_program_create_model
+            )
+        uploaded_object = self.radio_program_files_repository.get_object(
+            uploaded_file.file_name
+        )
+
+        # Then
+        assert uploaded_object.read() == file_content
+        assert "multipart" in uploaded_file.file_name
+
+    @mock.patch(S3_ABORT_MULTIPART_UPLOAD_MOCK_PATCH)
+    @mock.patch(S3_UPLOAD_PART_MOCK_PATCH)
+    def test_multipart_upload_file_to_s3_aborts_on_error(
+        self, upload_part_mock: mock.patch, abort_multipart_upload_mock: mock.patch
+    ):
+        """Test a multipart upload is aborted if a part fails after retries."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        file = tempfile.SpooledTemporaryFile()
+        file.write(b"0" * 1024)
+        radio_program_create_model = RadioProgramFileCreate(
+            file_name="multipart", file=file
+        )
+        upload_part_mock.side_effect = ClientError(
+            error_response={"Error": {"Code": 500, "Message": "test_error"}},
+            operation_name="test_error",
+        )
+
+        # When
+        with patch.object(settings, "S3_MULTIPART_THRESHOLD", 1), patch.object(
+            settings, "S3_MULTIPART_MAX_ATTEMPTS", 2
+        ), pytest.raises(S3ClientError):
+            self.radio_program_files_repository.put_object(radio_program_create_model)
+
+        # Then
+        assert upload_part_mock.call_count == 2
+        abort_multipart_upload_mock.assert_called_once_with(
+            Bucket=self.radio_program_files_repository.bucket_name,
+            Key=radio_program_create_model.file_name,
+            UploadId=mock.ANY,
+        )
+
+    @mock.patch(S3_ABORT_MULTIPART_UPLOAD_MOCK_PATCH)
+    @mock.patch(S3_COMPLETE_MULTIPART_UPLOAD_MOCK_PATCH)
+    def test_multipart_upload_file_to_s3_aborts_on_connection_error(
+        self,
+        complete_multipart_upload_mock: mock.patch,
+        abort_multipart_upload_mock: mock.patch,
+    ):
+        """Test a multipart upload is aborted if S3 can not be reached."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        file = tempfile.SpooledTemporaryFile()
+        file.write(b"0" * 1024)
+        radio_program_create_model = RadioProgramFileCreate(
+            file_name="multipart", file=file
+        )
+        complete_multipart_upload_mock.side_effect = EndpointConnectionError(
+            endpoint_url="http://s3"
+        )
+
+        # When
+        with patch.object(settings, "S3_MULTIPART_THRESHOLD", 1), pytest.raises(
+            S3ClientError
+        ):
+            self.radio_program_files_repository.put_object(radio_program_create_model)
+
+        # Then
+        abort_multipart_upload_mock.assert_called_once_with(
+            Bucket=self.radio_program_files_repository.bucket_name,
+            Key=radio_program_create_model.file_name,
+            UploadId=mock.ANY,
+        )
+
+    @mock.patch(S3_ABORT_MULTIPART_UPLOAD_MOCK_PATCH)
+    @mock.patch(S3_UPLOAD_PART_MOCK_PATCH)
+    def test_multipart_upload_file_to_s3_aborts_on_read_error(
+        self, upload_part_mock: mock.patch, abort_multipart_upload_mock: mock.patch
+    ):
+        """Test a multipart upload is aborted and the error raised if a read fails."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        file = mock.MagicMock()
+        file.read.side_effect = [b"0" * 512, OSError("test_error")]
+        upload_part_mock.return_value = {"ETag": "etag"}
+
+        # When
+        with patch.object(settings, "S3_MULTIPART_PART_SIZE", 512), pytest.raises(
+            OSError, match="test_error"
+        ):
+            self.radio_program_files_repository._put_multipart_object(
+                object_key="multipart", file=file
+            )
+
+        # Then
+        abort_multipart_upload_mock.assert_called_once_with(
+            Bucket=self.radio_program_files_repository.bucket_name,
+            Key="multipart",
+            UploadId=mock.ANY,
+        )
+
+    def test_presigned_upload_file_to_s3(self):
+        """Test that a file uploaded to a presigned URL can be completed."""
+        # Given
+        file_content = self.upload_file.file_content
+
+        # When
+        upload = self.radio_program_files_repository.create_presigned_upload(
+            file_name="presigned", file_size=len(file_content)
+        )
+        upload_response = requests.put(upload.upload_url, data=file_content)
+        uploaded_file = self.radio_program_files_repository.complete_presigned_upload(
+            upload.file_name
+        )
+        uploaded_object = self.radio_program_files_repository.get_object(
+            uploaded_file.file_name
+        )
+
+        # Then
+        assert upload_response.status_code == 200, upload_response.text
+        assert upload.upload_id is None
+        assert upload.parts == []
+        assert "presigned" in uploaded_file.file_name
+        assert uploaded_object.read() == file_content
+
+    def test_presigned_multipart_upload_file_to_s3(self):
+        """Test that a file uploaded to presigned part URLs can be completed."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        part_size = 5 * 1024 * 1024
+        file_content = bytes(range(256)) * (part_size // 256 + 1024)
+
+        # When
+        with patch.object(settings, "S3_MULTIPART_THRESHOLD", part_size), patch.object(
+            settings, "S3_MULTIPART_PART_SIZE", part_size
+        ):
+            upload = self.radio_program_files_repository.create_presigned_upload(
+                file_name="presigned", file_size=len(file_content)
+            )
+        for part in upload.parts:
+            start = (part.part_number - 1) * upload.part_size
+            end = start + upload.part_size
+            requests.put(part.url, data=file_content[start:end])
+        uploaded_file = self.radio_program_files_repository.complete_presigned_upload(
+            upload.file_name, upload_id=upload.upload_id
+        )
+        uploaded_object = self.radio_program_files_repository.get_object(
+            uploaded_file.file_name
+        )
+
+        # Then
+        assert upload.upload_url is None
+        assert upload.part_size == part_size
+        assert [part.part_number for part in upload.parts] == [1, 2]
+        assert uploaded_object.read() == file_content
+
+    def test_complete_presigned_upload_raises_s3_file_not_found_error(self):
+        """Test S3FileNotFoundError is raised if nothing was uploaded."""
+        # Given
+        upload = self.radio_program_files_repository.create_presigned_upload(
+            file_name="presigned", file_size=1024
+        )
+
+        # Then
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.complete_presigned_upload(
+                upload.file_name
+            )
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.complete_presigned_upload(
+                upload.file_name, upload_id="non_existent_upload"
+            )
+
     def test_get_file_from_s3(self):
         """Test that we can retrieve a file successfully from S3."""
         # Given
@@ -128,6 +332,97 @@ class TestRadioProgramFilesRepository(unittest.TestCase):
         # Then
         assert uploaded_object.read() == expected_content
 
+    def test_get_file_range_from_s3(self):
+        """Test that we can retrieve a byte range of a file from S3."""
+        # Given
+        radio_program_create_model = RadioProgramFileCreate(**self.upload_file.dict())
+        expected_content = self.upload_file.file_content[10:20]
+
+        # When
+        uploaded_file = self.radio_program_files_repository.put_object(
+            radio_program_create_model
+        )
+        uploaded_object = self.radio_program_files_repository.get_object(
+            uploaded_file.file_name, byte_range=(10, 19)
+        )
+
+        # Then
+        assert uploaded_object.read() == expected_content
+
+    def test_head_file_from_s3(self):
+        """Test that we can retrieve the metadata of a file from S3."""
+        # Given
+        radio_program_create_model = RadioProgramFileCreate(**self.upload_file.dict())
+
+        # When
+        uploaded_file = self.radio_program_files_repository.put_object(
+            radio_program_create_model
+        )
+        metadata = self.radio_program_files_repository.head_object(
+            uploaded_file.file_name
+        )
+
+        # Then
+        assert metadata.file_name == uploaded_file.file_name
+        assert metadata.content_length == len(self.upload_file.file_content)
+        assert metadata.etag.startswith('"')
+
+    def test_iter_cached_object_serves_repeated_reads_from_the_block_cache(self):
+        """Test ranges are read from S3 once per block and then from local disk."""
+        # Given
+        uploaded_file = self.radio_program_files_repository.put_object(
+            RadioProgramFileCreate(**self.upload_file.dict())
+        )
+        file_content = self.upload_file.file_content
+        with tempfile.TemporaryDirectory() as directory:
+            repository = RadioProgramFilesRepository(
+                RadioProgramFile,
+                block_cache=S3BlockCache(
+                    directory, max_bytes=len(file_content), block_size=1024
+                ),
+            )
+            metadata = repository.head_object(uploaded_file.file_name)
+
+            # When
+            with patch.object(
+                repository.s3_client,
+                "get_object",
+                wraps=repository.s3_client.get_object,
+            ) as get_object_mock:
+                first_range = b"".join(
+                    repository.iter_cached_object(
+                        metadata, chunk_size=100, byte_range=(1000, 2100)
+                    )
+                )
+                second_range = b"".join(
+                    repository.iter_cached_object(
+                        metadata, chunk_size=100, byte_range=(1500, 2047)
+                    )
+                )
+                whole_file = b"".join(
+                    repository.iter_cached_object(metadata, chunk_size=4096)
+                )
+
+        # Then
+        assert first_range == file_content[1000:2101]
+        assert second_range == file_content[1500:2048]
+        assert whole_file == file_content
+        blocks = (len(file_content) + 1023) // 1024
+        assert get_object_mock.call_count == blocks
+        get_object_mock.assert_any_call(
+            Bucket=repository.bucket_name,
+            Key=uploaded_file.file_name,
+            Range="bytes=1024-2047",
+            IfMatch=metadata.etag,
+        )
+        block_cache_stats = repository.block_cache_stats()
+        assert (block_cache_stats.hits, block_cache_stats.misses) == (4, blocks)
+
+    def test_head_non_existent_file_from_s3_raises_s3_file_not_found_error(self):
+        """Test S3FileNotFoundError is raised if head_object finds no file."""
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.head_object("non_existent_file")
+
     @mock.patch(S3_GET_OBJECT_MOCK_PATCH)
     def test_get_file_from_s3_raises_s3_client_error(self, get_object_mock: mock.patch):
         """Test S3ClientError is raised if get_object raises ClientError."""
@@ -209,6 +504,109 @@ class TestRadioProgramFilesRepository(unittest.TestCase):
         # Then
         assert objects_list == expected_results
 
+    def _put_raw_objects(self, object_keys: list[str]) -> None:
+        for object_key in object_keys:
+            self.radio_program_files_repository.s3_client.put_object(
+                Bucket=self.radio_program_files_repository.bucket_name,
+                Key=object_key,
+                Body=b"content",
+            )
+
+    def test_iter_object_summaries_paginates(self):
+        """Test iter_object_summaries lists every key across pages."""
+        # Given
+        object_keys = ["a/1.mp3", "a/2.mp3", "b/1.mp3"]
+        self._put_raw_objects(object_keys)
+
+        # When
+        summaries = list(
+            self.radio_program_files_repository.iter_object_summaries(page_size=1)
+        )
+
+        # Then
+        assert [summary.file_name for summary in summaries] == object_keys
+        assert all(summary.size == len(b"content") for summary in summaries)
+
+    def test_iter_objects_with_prefix_and_start_after(self):
+        """Test iter_objects filters keys by prefix and start_after."""
+        # Given
+        self._put_raw_objects(["a/1.mp3", "a/2.mp3", "a/3.mp3", "b/1.mp3"])
+
+        # When
+        files = list(
+            self.radio_program_files_repository.iter_objects(
+                prefix="a/", start_after="a/1.mp3", page_size=1
+            )
+        )
+
+        # Then
+        assert [file.file_name for file in files] == ["a/2.mp3", "a/3.mp3"]
+        assert files[0].file_url == (
+            self.radio_program_files_repository._build_object_url("a/2.mp3")
+        )
+
+    def test_iter_object_batches(self):
+        """Test iter_object_batches yields batches of batch_size files."""
+        # Given
+        self._put_raw_objects(["1.mp3", "2.mp3", "3.mp3"])
+
+        # When
+        batches = list(
+            self.radio_program_files_repository.iter_object_batches(batch_size=2)
+        )
+
+        # Then
+        assert [[file.file_name for file in batch] for batch in batches] == [
+            ["1.mp3", "2.mp3"],
+            ["3.mp3"],
+        ]
+
+    @mock.patch(S3_LIST_OBJECTS_MOCK_PATCH)
+    def test_iter_object_summaries_requests_pages_lazily(
+        self, list_objects_mock: mock.patch
+    ):
+        """Test iter_object_summaries only requests a page when it is consumed."""
+        # Given
+        last_modified = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        list_objects_mock.side_effect = [
+            {
+                "Contents": [
+                    {
+                        "Key": "1.mp3",
+                        "Size": 1,
+                        "ETag": '"1"',
+                        "LastModified": last_modified,
+                    }
+                ],
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+            },
+            {
+                "Contents": [
+                    {
+                        "Key": "2.mp3",
+                        "Size": 2,
+                        "ETag": '"2"',
+                        "LastModified": last_modified,
+                    }
+                ],
+                "IsTruncated": False,
+            },
+        ]
+        bucket_name = self.radio_program_files_repository.bucket_name
+
+        # When
+        summaries = self.radio_program_files_repository.iter_object_summaries()
+        first_summary = next(summaries)
+
+        # Then
+        assert first_summary.file_name == "1.mp3"
+        list_objects_mock.assert_called_once_with(Bucket=bucket_name)
+        assert [summary.file_name for summary in summaries] == ["2.mp3"]
+        list_objects_mock.assert_called_with(
+            Bucket=bucket_name, ContinuationToken="token"
+        )
+
     @mock.patch(S3_LIST_OBJECTS_MOCK_PATCH)
     def test_list_objects_from_s3_raises_s3_client_error(
         self, list_objects_mock: mock.patch
@@ -288,6 +686,44 @@ class TestRadioProgramFilesRepository(unittest.TestCase):
             Bucket=self.radio_program_files_repository.bucket_name, Key=delete_key
         )
 
+    def test_delete_objects(self):
+        """Test delete_objects removes several objects from S3 bucket."""
+        # Given
+        uploaded_file = self.radio_program_files_repository.put_object(
+            RadioProgramFileCreate(**self.upload_file.dict())
+        )
+
+        # When
+        failed_keys = self.radio_program_files_repository.delete_objects(
+            [uploaded_file.file_name, "non_existent_file"]
+        )
+
+        # Then
+        assert failed_keys == []
+        assert self.radio_program_files_repository.list_objects() == []
+
+    @mock.patch(S3_DELETE_OBJECTS_MOCK_PATCH)
+    def test_delete_objects_returns_failed_keys(self, delete_objects_mock: mock.patch):
+        """Test delete_objects returns keys that failed or got a ClientError."""
+        # Given
+        object_keys = [f"{index}.mp3" for index in range(1001)]
+        delete_objects_mock.side_effect = [
+            {"Errors": [{"Key": "1.mp3", "Code": "AccessDenied"}]},
+            ClientError(
+                error_response={"Error": {"Code": 500, "Message": "test_error"}},
+                operation_name="test_error",
+            ),
+        ]
+
+        # When
+        failed_keys = self.radio_program_files_repository.delete_objects(object_keys)
+
+        # Then
+        assert failed_keys == ["1.mp3", "1000.mp3"]
+        assert delete_objects_mock.call_count == 2
+        first_request = delete_objects_mock.call_args_list[0].kwargs["Delete"]
+        assert len(first_request["Objects"]) == 1000
+
     def test_delete_all(self):
         """Test delete_all removes all objects from S3 bucket."""
         # Given
@@ -349,3 +785,59 @@ class TestRadioProgramFilesRepository(unittest.TestCase):
 
         # Then
         assert url == expected_url
+
+    def test_get_object_urls_returns_public_urls(self):
+        """Test get_object_urls returns object URLs if presigned URLs are disabled."""
+        # When
+        urls = self.radio_program_files_repository.get_object_urls(["key_1", "key_2"])
+
+        # Then
+        assert urls == {
+            "key_1": self.radio_program_files_repository._build_object_url("key_1"),
+            "key_2": self.radio_program_files_repository._build_object_url("key_2"),
+        }
+
+    def test_set_file_urls_presigns_and_caches_urls(self):
+        """Test set_file_urls signs every file once and reuses cached signatures."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        repository = RadioProgramFilesRepository(
+            RadioProgramFile, url_cache=LRUCache(max_size=10, ttl_seconds=60)
+        )
+        files = [
+            RadioProgramFile(file_name=file_name, file_url="stored_url")
+            for file_name in ("key_1", "key_2", "key_1")
+        ]
+
+        # When
+        with patch.object(settings, "S3_PRESIGNED_URLS", True), patch.object(
+            repository.s3_client,
+            "generate_presigned_url",
+            wraps=repository.s3_client.generate_presigned_url,
+        ) as generate_presigned_url_mock:
+            repository.set_file_urls(files)
+            cached_urls = repository.get_object_urls(["key_1", "key_2"])
+
+        # Then
+        assert generate_presigned_url_mock.call_count == 2
+        generate_presigned_url_mock.assert_any_call(
+            "get_object",
+            Params={"Bucket": repository.bucket_name, "Key": "key_1"},
+            ExpiresIn=settings.S3_PRESIGNED_URL_EXPIRATION,
+        )
+        assert "Signature=" in files[0].file_url
+        assert files[0].file_url == files[2].file_url != files[1].file_url
+        assert cached_urls == {"key_1": files[0].file_url, "key_2": files[1].file_url}
+        assert repository.url_cache_stats().hits == 2
+
+    def test_set_file_urls_keeps_stored_urls(self):
+        """Test set_file_urls keeps stored URLs if presigned URLs are disabled."""
+        # Given
+        files = [RadioProgramFile(file_name="key", file_url="stored_url")]
+
+        # When
+        self.radio_program_files_repository.set_file_urls(files)
+
+        # Then
+        assert files[0].file_url == "stored_url"
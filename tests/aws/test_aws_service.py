@@ -0,0 +1,43 @@
+"""Test AwsService."""
+import unittest
+
+from audio_api.aws.aws_service import AwsService, AwsServices
+from audio_api.aws.settings import get_settings
+
+settings = get_settings()
+
+
+class TestAwsService(unittest.TestCase):
+    """TestAwsService class."""
+
+    def test_get_client_is_shared_per_service(self):
+        """Should reuse the client of a service and not share it across services."""
+        # When
+        s3_client = AwsService(AwsServices.s3).get_client()
+        other_s3_client = AwsService(AwsServices.s3).get_client()
+        dynamodb_client = AwsService(AwsServices.dynamodb).get_client()
+
+        # Then
+        assert s3_client is other_s3_client
+        assert s3_client is not dynamodb_client
+        assert s3_client.meta.service_model.service_name == "s3"
+
+    def test_get_resource_is_shared_per_service(self):
+        """Should reuse the resource of a service."""
+        # When
+        resource = AwsService(AwsServices.dynamodb).get_resource()
+
+        # Then
+        assert resource is AwsService(AwsServices.dynamodb).get_resource()
+
+    def test_get_client_applies_settings(self):
+        """Should configure the pool size, timeouts and retries from AwsSettings."""
+        # When
+        config = AwsService(AwsServices.dynamodb).get_client().meta.config
+
+        # Then
+        assert config.max_pool_connections == settings.AWS_MAX_POOL_CONNECTIONS
+        assert config.connect_timeout == settings.AWS_CONNECT_TIMEOUT
+        assert config.read_timeout == settings.AWS_READ_TIMEOUT
+        assert config.retries["mode"] == settings.AWS_RETRY_MODE.value
+        assert config.tcp_keepalive == settings.AWS_TCP_KEEPALIVE
@@ -0,0 +1,83 @@
+"""Test LRUCache."""
+import unittest
+
+from audio_api.aws.cache import LRUCache
+
+
+class FakeTimer:
+    """Controllable monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at 0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    """TestLRUCache class."""
+
+    def setUp(self):
+        """Create a cache with a controllable clock."""
+        self.timer = FakeTimer()
+        self.cache = LRUCache(max_size=2, ttl_seconds=10, timer=self.timer)
+
+    def test_get_counts_hits_and_misses(self):
+        """Should return stored values and count hits and misses."""
+        # Given
+        self.cache.set("a", 1)
+
+        # When
+        hit = self.cache.get("a")
+        miss = self.cache.get("b")
+
+        # Then
+        stats = self.cache.stats()
+        assert (hit, miss) == (1, None)
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_set_evicts_least_recently_used(self):
+        """Should evict the least recently used entry when full."""
+        # Given
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+
+        # When
+        self.cache.set("c", 3)
+
+        # Then
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+        assert self.cache.stats().evictions == 1
+
+    def test_get_expires_entries_after_ttl(self):
+        """Should not serve entries older than the TTL."""
+        # Given
+        self.cache.set("a", 1)
+
+        # When
+        self.timer.now = 10
+
+        # Then
+        assert self.cache.get("a") is None
+        stats = self.cache.stats()
+        assert (stats.expirations, stats.misses, stats.size) == (1, 1, 0)
+
+    def test_invalidate_and_clear(self):
+        """Should remove invalidated and cleared entries."""
+        # Given
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+
+        # When
+        self.cache.invalidate("a")
+        self.cache.invalidate("missing")
+        self.cache.clear()
+
+        # Then
+        assert self.cache.get("b") is None
+        assert self.cache.stats().invalidations == 2
@@ -28,14 +28,10 @@ class LocalStackContainer(LocalStackContainer_):
 
     def _create_dynamodb_tables(self):
         for table in dynamodb_tables.values():
+            global_secondary_indexes = table.get_global_secondary_indexes()
             self.dynamodb_client.create_table(
                 TableName=table.table_name,
-                AttributeDefinitions=[
-                    {
-                        "AttributeName": table.attribute_name,
-                        "AttributeType": table.attribute_type,
-                    },
-                ],
+                AttributeDefinitions=table.get_attribute_definitions(),
                 KeySchema=[
                     {
                         "AttributeName": table.attribute_name,
@@ -46,6 +42,11 @@ class LocalStackContainer(LocalStackContainer_):
                     "ReadCapacityUnits": table.read_capacity_units,
                     "WriteCapacityUnits": table.write_capacity_units,
                 },
+                **(
+                    {"GlobalSecondaryIndexes": global_secondary_indexes}
+                    if global_secondary_indexes
+                    else {}
+                ),
             )
 
     def start(self, **kwargs):
@@ -0,0 +1,82 @@
+"""Benchmark decoding a 10k items scan with the generic path and ItemCodec.
+
+Run with: python -m tests.benchmarks.benchmark_dynamodb_codec
+"""
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from uuid import uuid4
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from audio_api.aws.dynamodb.codec import get_codec
+from audio_api.aws.dynamodb.models import RadioProgramItemModel
+
+SCAN_ITEMS = 10_000
+ROUNDS = 5
+
+
+def build_scan_page() -> list[dict]:
+    """Build scan items in the wire format returned by the low-level client."""
+    codec = get_codec(RadioProgramItemModel)
+    return [
+        codec.encode(
+            {
+                "id": str(uuid4()),
+                "title": f"Shopping 2.0 #{n:03}",
+                "description": "Pilot program",
+                "air_date": date(2018, 8, 11) + timedelta(days=n),
+                "version": 1,
+                "air_date_partition": "radio_programs",
+                "radio_program": {
+                    "file_name": f"program_{n}.mp3",
+                    "file_url": f"https://bucket/program_{n}.mp3",
+                    "program_length": 3600 + n,
+                },
+            }
+        )
+        for n in range(SCAN_ITEMS)
+    ]
+
+
+def generic_decode(wire_items: list[dict]) -> list[RadioProgramItemModel]:
+    """Decode items like the resource layer: TypeDeserializer and validation."""
+    deserializer = TypeDeserializer()
+    return [
+        RadioProgramItemModel(
+            **{k: deserializer.deserialize(v) for k, v in item.items()}
+        )
+        for item in wire_items
+    ]
+
+
+def codec_decode(wire_items: list[dict]) -> list[RadioProgramItemModel]:
+    """Decode items with the precompiled RadioProgramItemModel codec."""
+    codec = get_codec(RadioProgramItemModel)
+    return [codec.decode(item) for item in wire_items]
+
+
+def best_cpu_time(decode: Callable[[list[dict]], list], wire_items: list[dict]):
+    """Return the best process CPU time of decoding all items."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        decode(wire_items)
+        timings.append(time.process_time() - start)
+    return min(timings)
+
+
+def main():
+    """Print the CPU time per item of both decoding paths."""
+    wire_items = build_scan_page()
+    assert generic_decode(wire_items) == codec_decode(wire_items)
+
+    generic = best_cpu_time(generic_decode, wire_items)
+    codec = best_cpu_time(codec_decode, wire_items)
+    for name, timing in (("generic", generic), ("codec", codec)):
+        print(f"{name:>8}: {timing * 1e6 / SCAN_ITEMS:7.2f} us/item")
+    print(f" speedup: {generic / codec:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
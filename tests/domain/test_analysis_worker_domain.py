@@ -0,0 +1,260 @@
+"""Test AnalysisWorker domain."""
+import unittest
+import uuid
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+import requests
+
+from audio_api.api.schemas import RadioProgramCreateInSchema
+from audio_api.audio.waveform import WAVEFORM_RESOLUTIONS, WaveformResolution
+from audio_api.aws.dynamodb.exceptions import DynamoDbClientError
+from audio_api.aws.dynamodb.models import (
+    RadioProgramJobPutItemModel,
+    RadioProgramPutItemModel,
+)
+from audio_api.aws.dynamodb.repositories.radio_program_jobs import (
+    radio_program_jobs_repository,
+)
+from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
+from audio_api.aws.s3.repositories.radio_program_files import (
+    RadioProgramFilesRepository,
+)
+from audio_api.domain.analysis_worker import AnalysisWorker
+from audio_api.domain.models import (
+    AnalysisWorkerReport,
+    RadioProgramJobKind,
+    RadioProgramJobStatus,
+)
+from audio_api.domain.radio_programs import RadioPrograms
+from tests.api.test_utils import UploadFileModel
+
+GET_PENDING_ITEMS_MOCK_PATH = (
+    "audio_api.domain.analysis_worker.AnalysisWorker."
+    "radio_program_jobs_repository.get_pending_items"
+)
+
+
+@pytest.mark.usefixtures("localstack")
+@pytest.mark.usefixtures("radio_programs")
+@pytest.mark.usefixtures("radio_programs_repository")
+@pytest.mark.usefixtures("radio_program_files_repository")
+@pytest.mark.usefixtures("create_program_model")
+@pytest.mark.usefixtures("upload_file")
+class TestAnalysisWorkerDomain(unittest.TestCase):
+    """TestAnalysisWorkerDomain class."""
+
+    radio_programs: RadioPrograms
+    radio_programs_repository: RadioProgramsRepository
+    radio_program_files_repository: RadioProgramFilesRepository
+    create_program_model: RadioProgramPutItemModel
+    upload_file: UploadFileModel
+
+    @pytest.fixture(autouse=True)
+    def _clear_db(self):
+        self.radio_programs_repository.delete_all()
+        radio_program_jobs_repository.delete_all()
+
+    def test_run_queued_jobs(self):
+        """Should run the jobs of an upload and write their results back."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        file_content = self.upload_file.file_content
+        upload = self.radio_programs.create_upload(
+            title=radio_program_in.title, file_size=len(file_content)
+        )
+        requests.put(upload.upload_url, data=file_content)
+        db_radio_program = self.radio_programs.complete_upload(
+            radio_program=radio_program_in, file_name=upload.file_name
+        )
+
+        # When
+        report = AnalysisWorker.run(processes=2, poll_interval=0.1, until_idle=True)
+
+        # Then
+        assert report == AnalysisWorkerReport(succeeded_jobs=2)
+        jobs = {
+            job.kind: job
+            for job in self.radio_programs.get_jobs(program_id=db_radio_program.id)
+        }
+        assert {job.status for job in jobs.values()} == {
+            RadioProgramJobStatus.succeeded
+        }
+        assert jobs[RadioProgramJobKind.waveform].result == {
+            "resolutions": [resolution.value for resolution in WAVEFORM_RESOLUTIONS]
+        }
+        radio_program_file = self.radio_programs.get(
+            program_id=db_radio_program.id
+        ).radio_program
+        assert jobs[RadioProgramJobKind.seek_index].result == {
+            "program_length": 2,
+            "seek_index": radio_program_file.seek_index,
+        }
+        assert radio_program_file.program_length == 2
+        assert self.radio_programs.get_waveform(
+            program_id=db_radio_program.id, resolution=WaveformResolution.low
+        )
+
+    def test_run_retries_failed_jobs(self):
+        """Should retry a failed job until it reaches the maximum attempts."""
+        # Given
+        now = datetime.now(timezone.utc)
+        (result,) = radio_program_jobs_repository.put_items(
+            [
+                RadioProgramJobPutItemModel(
+                    program_id=uuid.uuid4(),
+                    file_name="missing.mp3",
+                    kind=RadioProgramJobKind.waveform,
+                    status=RadioProgramJobStatus.pending,
+                    created_at=now,
+                    updated_at=now,
+                )
+            ]
+        )
+
+        # When
+        report = AnalysisWorker.run(
+            processes=1, poll_interval=0.1, max_attempts=2, until_idle=True
+        )
+
+        # Then
+        job = radio_program_jobs_repository.get_item(result.item.id)
+        assert report == AnalysisWorkerReport(retried_jobs=1, failed_jobs=1)
+        assert job.status == RadioProgramJobStatus.failed
+        assert job.attempts == 2
+        assert "missing.mp3" in job.error
+
+    def test_run_fails_job_of_dead_worker_on_last_attempt(self):
+        """Should claim a job whose lease expired, failing it if out of attempts."""
+        # Given
+        now = datetime.now(timezone.utc)
+        (result,) = radio_program_jobs_repository.put_items(
+            [
+                RadioProgramJobPutItemModel(
+                    program_id=uuid.uuid4(),
+                    file_name="missing.mp3",
+                    kind=RadioProgramJobKind.waveform,
+                    status=RadioProgramJobStatus.running,
+                    attempts=1,
+                    created_at=now,
+                    updated_at=now,
+                    lease_expires_at=now - timedelta(seconds=1),
+                )
+            ]
+        )
+
+        # When
+        report = AnalysisWorker.run(
+            processes=1, poll_interval=0.1, max_attempts=1, until_idle=True
+        )
+
+        # Then
+        job = radio_program_jobs_repository.get_item(result.item.id)
+        assert report == AnalysisWorkerReport(failed_jobs=1)
+        assert job.status == RadioProgramJobStatus.failed
+        assert job.attempts == 2
+        assert job.error == "Worker lease expired."
+
+    def test_finish_job_drops_stale_result(self):
+        """Should drop the result of a job claimed again by another worker."""
+        # Given
+        now = datetime.now(timezone.utc)
+        (result,) = radio_program_jobs_repository.put_items(
+            [
+                RadioProgramJobPutItemModel(
+                    program_id=uuid.uuid4(),
+                    file_name="test.mp3",
+                    kind=RadioProgramJobKind.waveform,
+                    status=RadioProgramJobStatus.pending,
+                    created_at=now,
+                    updated_at=now,
+                )
+            ]
+        )
+        job = radio_program_jobs_repository.claim_item(
+            result.item.id, now, now - timedelta(seconds=1)
+        )
+        radio_program_jobs_repository.claim_item(
+            result.item.id, now, now + timedelta(minutes=15)
+        )
+        future = Future()
+        future.set_result({"resolutions": [1]})
+
+        # When
+        AnalysisWorker._finish_job(job, future, 3, AnalysisWorkerReport())
+
+        # Then
+        stored_job = radio_program_jobs_repository.get_item(job.id)
+        assert stored_job.status == RadioProgramJobStatus.running
+        assert stored_job.attempts == 2
+        assert stored_job.result is None
+
+    def test_renew_leases_of_running_jobs(self):
+        """Should extend the leases of running jobs close to expiring."""
+        # Given
+        now = datetime.now(timezone.utc)
+        (result,) = radio_program_jobs_repository.put_items(
+            [
+                RadioProgramJobPutItemModel(
+                    program_id=uuid.uuid4(),
+                    file_name="test.mp3",
+                    kind=RadioProgramJobKind.waveform,
+                    status=RadioProgramJobStatus.pending,
+                    created_at=now,
+                    updated_at=now,
+                )
+            ]
+        )
+        job = radio_program_jobs_repository.claim_item(
+            result.item.id, now, now + timedelta(seconds=1)
+        )
+
+        # When
+        AnalysisWorker._renew_leases([job], lease_seconds=60)
+
+        # Then
+        stored_job = radio_program_jobs_repository.get_item(job.id)
+        assert stored_job.lease_expires_at == job.lease_expires_at
+        assert stored_job.lease_expires_at > now + timedelta(seconds=30)
+        assert (
+            radio_program_jobs_repository.get_pending_items(
+                limit=10, now=now + timedelta(seconds=2)
+            )
+            == []
+        )
+
+    def test_run_keeps_finishing_jobs_if_claim_fails(self):
+        """Should finish the running jobs when claiming new jobs fails."""
+        # Given
+        now = datetime.now(timezone.utc)
+        (result,) = radio_program_jobs_repository.put_items(
+            [
+                RadioProgramJobPutItemModel(
+                    program_id=uuid.uuid4(),
+                    file_name="missing.mp3",
+                    kind=RadioProgramJobKind.waveform,
+                    status=RadioProgramJobStatus.pending,
+                    created_at=now,
+                    updated_at=now,
+                )
+            ]
+        )
+        pending_jobs = radio_program_jobs_repository.get_pending_items(10, now)
+
+        # When
+        with mock.patch(GET_PENDING_ITEMS_MOCK_PATH) as get_pending_items_mock:
+            get_pending_items_mock.side_effect = [pending_jobs] + [
+                DynamoDbClientError("Failed to query index.")
+            ] * 100
+            report = AnalysisWorker.run(
+                processes=2, poll_interval=0.1, max_attempts=1, until_idle=True
+            )
+
+        # Then
+        job = radio_program_jobs_repository.get_item(result.item.id)
+        assert report == AnalysisWorkerReport(failed_jobs=1)
+        assert job.status == RadioProgramJobStatus.failed
@@ -0,0 +1,70 @@
+"""Test AsyncRadioPrograms domain."""
+
+import unittest
+import uuid
+from unittest import mock
+
+import pytest
+
+from audio_api.domain.async_radio_programs import AsyncRadioPrograms
+from tests.api.test_utils import radio_program
+
+ASYNC_RADIO_PROGRAMS_PATH = "audio_api.domain.async_radio_programs.AsyncRadioPrograms"
+RADIO_PROGRAMS_MOCK_PATH = f"{ASYNC_RADIO_PROGRAMS_PATH}.radio_programs"
+
+
+class TestAsyncRadioProgramsDomain(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncRadioPrograms domain delegates to RadioPrograms."""
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH)
+    async def test_get(self, radio_programs_mock):
+        """Test get runs RadioPrograms.get on the thread pool."""
+        # Given
+        program_id = uuid.uuid4()
+        expected_program = radio_program("title")
+        radio_programs_mock.get.return_value = expected_program
+
+        # When
+        result = await AsyncRadioPrograms.get(program_id=program_id)
+
+        # Then
+        radio_programs_mock.get.assert_called_once_with(program_id=program_id)
+        assert result == expected_program
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH)
+    async def test_get_page(self, radio_programs_mock):
+        """Test get_page forwards pagination and air_date filters."""
+        # When
+        await AsyncRadioPrograms.get_page(limit=10, cursor="cursor")
+
+        # Then
+        radio_programs_mock.get_page.assert_called_once_with(
+            limit=10, cursor="cursor", date_from=None, date_to=None
+        )
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH)
+    async def test_iter_audio(self, radio_programs_mock):
+        """Test iter_audio opens the file stream on the thread pool."""
+        # Given
+        radio_programs_mock.iter_audio.return_value = iter([b"chunk"])
+
+        # When
+        chunks = await AsyncRadioPrograms.iter_audio(
+            file_name="file_name", chunk_size=10, byte_range=(0, 4)
+        )
+
+        # Then
+        radio_programs_mock.iter_audio.assert_called_once_with(
+            file_name="file_name", chunk_size=10, byte_range=(0, 4), metadata=None
+        )
+        assert list(chunks) == [b"chunk"]
+
+    @mock.patch(RADIO_PROGRAMS_MOCK_PATH)
+    async def test_delete_propagates_errors(self, radio_programs_mock):
+        """Test errors raised on the thread pool reach the caller."""
+        # Given
+        radio_programs_mock.delete.side_effect = ValueError("boom")
+
+        # When / Then
+        with pytest.raises(ValueError, match="boom"):
+            await AsyncRadioPrograms.delete(program_id=uuid.uuid4())
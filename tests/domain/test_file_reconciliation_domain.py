@@ -0,0 +1,145 @@
+"""Test FileReconciliation domain."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from audio_api.aws.dynamodb.models import RadioProgramPutItemModel
+from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
+from audio_api.aws.s3.exceptions import S3FileNotFoundError
+from audio_api.aws.s3.repositories.radio_program_files import (
+    RadioProgramFilesRepository,
+)
+from audio_api.domain.file_reconciliation import FileReconciliation
+from audio_api.domain.models import FileReconciliationReport
+from audio_api.domain.models.radio_program import RadioProgramFileModel
+
+GRACE_PERIOD = timedelta(days=1)
+
+
+@pytest.mark.usefixtures("localstack")
+@pytest.mark.usefixtures("radio_programs_repository")
+@pytest.mark.usefixtures("radio_program_files_repository")
+@pytest.mark.usefixtures("create_program_model")
+class TestFileReconciliationDomain(unittest.TestCase):
+    """TestFileReconciliationDomain class."""
+
+    radio_programs_repository: RadioProgramsRepository
+    radio_program_files_repository: RadioProgramFilesRepository
+    create_program_model: RadioProgramPutItemModel
+
+    @pytest.fixture(autouse=True)
+    def _empty_bucket(self):
+        self.radio_program_files_repository.delete_all()
+
+    @pytest.fixture(autouse=True)
+    def _clear_db(self):
+        self.radio_programs_repository.delete_all()
+
+    def _put_objects(self, object_keys: list[str]) -> None:
+        for object_key in object_keys:
+            self.radio_program_files_repository.s3_client.put_object(
+                Bucket=self.radio_program_files_repository.bucket_name,
+                Key=object_key,
+                Body=b"content",
+            )
+
+    def _put_programs(self, file_names: list[str]) -> None:
+        for file_name in file_names:
+            self.radio_programs_repository.put_item(
+                item=self.create_program_model.copy(
+                    update={
+                        "radio_program": RadioProgramFileModel(
+                            file_name=file_name, file_url=file_name
+                        )
+                    }
+                )
+            )
+
+    def _stored_keys(self) -> list[str]:
+        return sorted(
+            file.file_name
+            for file in self.radio_program_files_repository.list_objects()
+        )
+
+    def test_run_deletes_expired_orphaned_objects(self):
+        """Test orphaned objects older than the grace period are deleted."""
+        # Given
+        self._put_objects(["1.mp3", "2.mp3", "orphan_1.mp3", "orphan_2.mp3"])
+        self._put_programs(["1.mp3", "2.mp3", "missing.mp3"])
+
+        # When
+        report = FileReconciliation.run(
+            grace_period=GRACE_PERIOD,
+            partitions=3,
+            now=datetime.now(timezone.utc) + 2 * GRACE_PERIOD,
+        )
+
+        # Then
+        assert report == FileReconciliationReport(
+            scanned_objects=4,
+            referenced_files=3,
+            orphaned_objects=2,
+            missing_files=1,
+            deleted_objects=2,
+        )
+        assert self._stored_keys() == ["1.mp3", "2.mp3"]
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.get_object("orphan_1.mp3")
+
+    def test_run_keeps_recent_orphaned_objects(self):
+        """Test orphaned objects within the grace period are not deleted."""
+        # Given
+        self._put_objects(["1.mp3", "uploading.mp3"])
+        self._put_programs(["1.mp3"])
+
+        # When
+        report = FileReconciliation.run(grace_period=GRACE_PERIOD, partitions=2)
+
+        # Then
+        assert report.orphaned_objects == 1
+        assert report.recent_orphaned_objects == 1
+        assert report.deleted_objects == 0
+        assert self._stored_keys() == ["1.mp3", "uploading.mp3"]
+
+    def test_run_dry_run(self):
+        """Test a dry run reports orphaned objects without deleting them."""
+        # Given
+        self._put_objects(["orphan.mp3"])
+
+        # When
+        report = FileReconciliation.run(
+            grace_period=GRACE_PERIOD,
+            dry_run=True,
+            now=datetime.now(timezone.utc) + 2 * GRACE_PERIOD,
+        )
+
+        # Then
+        assert report.orphaned_objects == 1
+        assert report.deleted_objects == 0
+        assert self._stored_keys() == ["orphan.mp3"]
+
+    def test_run_keeps_sidecars_of_referenced_files(self):
+        """Test sidecar files are only orphaned together with their source file."""
+        # Given
+        kept_sidecar = self.radio_program_files_repository.build_sidecar_key(
+            "1.mp3", "waveform_1.dat"
+        )
+        orphaned_sidecar = self.radio_program_files_repository.build_sidecar_key(
+            "orphan.mp3", "waveform_1.dat"
+        )
+        self._put_objects(["1.mp3", kept_sidecar, "orphan.mp3", orphaned_sidecar])
+        self._put_programs(["1.mp3"])
+
+        # When
+        report = FileReconciliation.run(
+            grace_period=GRACE_PERIOD,
+            partitions=3,
+            now=datetime.now(timezone.utc) + 2 * GRACE_PERIOD,
+        )
+
+        # Then
+        assert report.orphaned_objects == 2
+        assert report.missing_files == 0
+        assert self._stored_keys() == ["1.mp3", kept_sidecar]
@@ -1,25 +1,37 @@
 """Test RadioPrograms domain."""
 
+import math
 import unittest
+import uuid
 from unittest import mock
 
 import pytest
+import requests
 
-from audio_api.api.schemas import RadioProgramCreateInSchema, RadioProgramUpdateInSchema
+from audio_api.api.schemas import (
+    RadioProgramBatchCreateInSchema,
+    RadioProgramCreateInSchema,
+    RadioProgramUpdateInSchema,
+)
+from audio_api.audio.mp3 import iter_audio_frames
+from audio_api.audio.waveform import WAVEFORM_RESOLUTIONS, WaveformResolution
 from audio_api.aws.dynamodb.exceptions import (
     DynamoDbClientError,
     DynamoDbItemNotFoundError,
+    DynamoDbVersionConflictError,
 )
-from audio_api.aws.dynamodb.models import RadioProgramPutItemModel
-from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
-from audio_api.aws.s3.exceptions import (
-    S3ClientError,
-    S3FileNotFoundError,
-    S3PersistenceError,
+from audio_api.aws.dynamodb.models import (
+    DynamoDbBatchItemStatus,
+    RadioProgramPutItemModel,
 )
+from audio_api.aws.dynamodb.repositories.radio_programs import RadioProgramsRepository
+from audio_api.aws.s3.exceptions import S3ClientError, S3FileNotFoundError
+from audio_api.aws.s3.repositories.deletion_queue import S3DeletionQueue
 from audio_api.aws.s3.repositories.radio_program_files import (
     RadioProgramFilesRepository,
+    get_referenced_keys,
 )
+from audio_api.domain.models import RadioProgramJobKind, RadioProgramJobStatus
 from audio_api.domain.radio_programs import RadioPrograms
 from tests.api.test_utils import UploadFileModel
 
@@ -29,14 +41,17 @@ RADIO_PROGRAMS_REPOSITORY_PUT_ITEM_MOCK_PATCH = (
     f"{RADIO_PROGRAMS_REPOSITORY_PATH}.put_item"
 )
 RADIO_PROGRAMS_REPOSITORY_UPDATE_ITEM_MOCK_PATCH = (
-    f"{RADIO_PROGRAMS_REPOSITORY_PATH}.update_item"
+    f"{RADIO_PROGRAMS_REPOSITORY_PATH}.update_item_with_previous"
 )
 RADIO_PROGRAM_FILES_REPOSITORY_PATH = (
     f"{RADIO_PROGRAMS_PATH}.radio_program_files_repository"
 )
-RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECT_MOCK_PATCH = (
-    f"{RADIO_PROGRAM_FILES_REPOSITORY_PATH}.delete_object"
+RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECTS_MOCK_PATCH = (
+    f"{RADIO_PROGRAM_FILES_REPOSITORY_PATH}.delete_objects"
 )
+# Objects queued for deletion with each released file: the file, its seek
+# index and its waveforms
+RELEASED_OBJECTS = 2 + len(WAVEFORM_RESOLUTIONS)
 
 
 @pytest.mark.usefixtures("localstack")
@@ -64,6 +79,16 @@ class TestRadioProgramsDomain(unittest.TestCase):
     def _clear_db(self):
         self.radio_programs_repository.delete_all()
 
+    @pytest.fixture(autouse=True)
+    def _deletion_queue(self):
+        deletion_queue = S3DeletionQueue(
+            self.radio_program_files_repository,
+            path=":memory:",
+            get_keys_in_use=get_referenced_keys,
+        )
+        with mock.patch.object(RadioPrograms, "deletion_queue", deletion_queue):
+            yield
+
     def test_create_radio_program(self):
         """Should create a new RadioProgram."""
         # Given
@@ -85,6 +110,7 @@ class TestRadioProgramsDomain(unittest.TestCase):
         assert db_radio_program.description == radio_program_in.description
         assert db_radio_program.air_date == radio_program_in.air_date
         assert db_radio_program.spotify_playlist == radio_program_in.spotify_playlist
+        assert db_radio_program.radio_program.program_length == 2
         assert uploaded_object.read() == radio_program_file.file_content
 
     @mock.patch(RADIO_PROGRAMS_REPOSITORY_PUT_ITEM_MOCK_PATCH)
@@ -107,6 +133,206 @@ class TestRadioProgramsDomain(unittest.TestCase):
                 radio_program=radio_program_in, program_file=radio_program_file.file
             )
 
+    @mock.patch(RADIO_PROGRAMS_REPOSITORY_PUT_ITEM_MOCK_PATCH)
+    def test_complete_upload_raises_dynamo_db_client_error_and_deletes_file(
+        self, put_item_mock: mock.patch
+    ):
+        """Should delete a directly uploaded file if fails to store in DynamoDB."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        file_content = self.upload_file.file_content
+        upload = self.radio_programs.create_upload(
+            title=radio_program_in.title, file_size=len(file_content)
+        )
+        requests.put(upload.upload_url, data=file_content)
+        put_item_mock.side_effect = DynamoDbClientError("Test error")
+
+        # When
+        with pytest.raises(DynamoDbClientError):
+            self.radio_programs.complete_upload(
+                radio_program=radio_program_in, file_name=upload.file_name
+            )
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.get_object(upload.file_name)
+
+    def test_complete_upload(self):
+        """Should create a new RadioProgram from a directly uploaded file."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        file_content = self.upload_file.file_content
+        upload = self.radio_programs.create_upload(
+            title=radio_program_in.title, file_size=len(file_content)
+        )
+        requests.put(upload.upload_url, data=file_content)
+
+        # When
+        db_radio_program = self.radio_programs.complete_upload(
+            radio_program=radio_program_in, file_name=upload.file_name
+        )
+
+        # Then
+        assert db_radio_program.title == radio_program_in.title
+        assert db_radio_program.radio_program.file_name == upload.file_name
+        assert db_radio_program == self.radio_programs.get(
+            program_id=db_radio_program.id
+        )
+
+    def test_complete_upload_twice_raises_not_found(self):
+        """Should not create a second RadioProgram from the same upload."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        file_content = self.upload_file.file_content
+        upload = self.radio_programs.create_upload(
+            title=radio_program_in.title, file_size=len(file_content)
+        )
+        requests.put(upload.upload_url, data=file_content)
+        self.radio_programs.complete_upload(
+            radio_program=radio_program_in, file_name=upload.file_name
+        )
+
+        # When / Then
+        with pytest.raises(DynamoDbItemNotFoundError):
+            self.radio_programs.complete_upload(
+                radio_program=radio_program_in, file_name=upload.file_name
+            )
+
+    def test_complete_upload_of_file_not_uploaded_with_urls_raises_not_found(self):
+        """Should only create RadioPrograms from uploads created with create_upload."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        db_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+
+        # When / Then
+        with pytest.raises(DynamoDbItemNotFoundError):
+            self.radio_programs.complete_upload(
+                radio_program=radio_program_in,
+                file_name=db_radio_program.radio_program.file_name,
+            )
+        with pytest.raises(DynamoDbItemNotFoundError):
+            self.radio_programs.complete_upload(
+                radio_program=radio_program_in, file_name="sha256/0.mp3"
+            )
+
+    def test_create_radio_program_queues_analysis_jobs(self):
+        """Should queue the analysis jobs of the file, without running them."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+
+        # When
+        db_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        jobs = self.radio_programs.get_jobs(program_id=db_radio_program.id)
+
+        # Then
+        assert {(job.kind, job.status) for job in jobs} == {
+            (RadioProgramJobKind.seek_index, RadioProgramJobStatus.pending),
+            (RadioProgramJobKind.waveform, RadioProgramJobStatus.pending),
+        }
+        assert {job.file_name for job in jobs} == {
+            db_radio_program.radio_program.file_name
+        }
+        assert db_radio_program.radio_program.program_length == 2
+        assert db_radio_program.radio_program.seek_index is None
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_programs.get_waveform(
+                program_id=db_radio_program.id, resolution=WaveformResolution.low
+            )
+
+    def test_index_directly_uploaded_file(self):
+        """Should queue and compute the seek index of a directly uploaded file."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        file_content = self.upload_file.file_content
+        upload = self.radio_programs.create_upload(
+            title=radio_program_in.title, file_size=len(file_content)
+        )
+        requests.put(upload.upload_url, data=file_content)
+        db_radio_program = self.radio_programs.complete_upload(
+            radio_program=radio_program_in, file_name=upload.file_name
+        )
+
+        # When
+        jobs = self.radio_programs.get_jobs(program_id=db_radio_program.id)
+        radio_program_file = self.radio_programs.index_file(
+            program_id=db_radio_program.id, file_name=upload.file_name
+        )
+        indexed_radio_program = self.radio_programs.get(program_id=db_radio_program.id)
+
+        # Then
+        assert db_radio_program.radio_program.seek_index is None
+        assert {job.kind for job in jobs} == {
+            RadioProgramJobKind.seek_index,
+            RadioProgramJobKind.waveform,
+        }
+        assert radio_program_file.program_length == 2
+        assert indexed_radio_program.radio_program == radio_program_file
+        metadata = self.radio_programs.get_audio_metadata(
+            program_id=db_radio_program.id
+        )
+        assert self.radio_programs.get_audio_offset(
+            metadata=metadata, start=1
+        ) == self.radio_programs.get_audio_offset(metadata=metadata, start=1.5)
+
+    def test_index_replaced_file_is_skipped(self):
+        """Should not write the seek index of a file the program no longer has."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        db_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        updated_radio_program = self.radio_programs.update(
+            program_id=db_radio_program.id,
+            new_program=RadioProgramUpdateInSchema(title="Replaced title"),
+            program_file=self.new_upload_file.file,
+        )
+
+        # When
+        radio_program_file = self.radio_programs.index_file(
+            program_id=db_radio_program.id,
+            file_name=db_radio_program.radio_program.file_name,
+        )
+
+        # Then
+        assert radio_program_file is None
+        assert (
+            self.radio_programs.get(program_id=db_radio_program.id)
+            == updated_radio_program
+        )
+        assert [
+            job.file_name
+            for job in self.radio_programs.get_jobs(program_id=db_radio_program.id)
+        ] == [
+            db_radio_program.radio_program.file_name,
+            db_radio_program.radio_program.file_name,
+            updated_radio_program.radio_program.file_name,
+            updated_radio_program.radio_program.file_name,
+        ]
+
+    def test_get_jobs_of_missing_radio_program_raises_not_found(self):
+        """Should raise DynamoDbItemNotFoundError if the program does not exist."""
+        with pytest.raises(DynamoDbItemNotFoundError):
+            self.radio_programs.get_jobs(program_id=uuid.uuid4())
+
     def test_get_radio_program(self):
         """Should retrieve an existing RadioProgram."""
         # Given
@@ -120,6 +346,181 @@ class TestRadioProgramsDomain(unittest.TestCase):
         # Then
         assert db_radio_program == created_radio_program
 
+    def test_get_radio_program_audio(self):
+        """Should stream the MP3 file of a RadioProgram, whole or a byte range."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        file_content = self.upload_file.file_content
+
+        # When
+        metadata = self.radio_programs.get_audio_metadata(
+            program_id=created_radio_program.id
+        )
+        chunks = list(
+            self.radio_programs.iter_audio(
+                file_name=metadata.file_name, chunk_size=1024
+            )
+        )
+        range_chunks = list(
+            self.radio_programs.iter_audio(
+                file_name=metadata.file_name, chunk_size=1024, byte_range=(100, 2147)
+            )
+        )
+
+        # Then
+        assert metadata.file_name == created_radio_program.radio_program.file_name
+        assert metadata.content_length == len(file_content)
+        assert b"".join(chunks) == file_content
+        assert max(len(chunk) for chunk in chunks) <= 1024
+        assert b"".join(range_chunks) == file_content[100:2148]
+
+    def test_get_radio_program_audio_offset(self):
+        """Should resolve a playback time with the seek index of the file."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        file_name = created_radio_program.radio_program.file_name
+        indexed_file = self.radio_programs.index_file(
+            program_id=created_radio_program.id, file_name=file_name
+        )
+        metadata = self.radio_programs.get_audio_metadata(
+            program_id=created_radio_program.id
+        )
+
+        # When
+        offset = self.radio_programs.get_audio_offset(metadata=metadata, start=1.5)
+        with mock.patch.object(
+            self.radio_program_files_repository, "get_object"
+        ) as get_object_mock:
+            cached_offset = self.radio_programs.get_audio_offset(
+                metadata=metadata, start=1.5
+            )
+            end_offset = self.radio_programs.get_audio_offset(
+                metadata=metadata, start=60
+            )
+
+        # Then
+        assert indexed_file.seek_index.startswith(file_name)
+        assert metadata.seek_index == indexed_file.seek_index
+        assert 0 < offset < len(self.upload_file.file_content)
+        assert cached_offset == offset
+        assert end_offset is None
+        get_object_mock.assert_not_called()
+
+    def test_get_audio_offset_of_file_not_indexed_raises_not_found(self):
+        """Should raise S3FileNotFoundError if the RadioProgram has no seek index."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        metadata = self.radio_programs.get_audio_metadata(
+            program_id=created_radio_program.id
+        )
+
+        # When / Then
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_programs.get_audio_offset(
+                metadata=metadata.copy(update={"seek_index": None}), start=1.5
+            )
+
+    def test_get_radio_program_clip_range(self):
+        """Should resolve a clip to complete frames of the file."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        self.radio_programs.index_file(
+            program_id=created_radio_program.id,
+            file_name=created_radio_program.radio_program.file_name,
+        )
+        metadata = self.radio_programs.get_audio_metadata(
+            program_id=created_radio_program.id
+        )
+        frames = list(iter_audio_frames(self.upload_file.file))
+        frame_duration = frames[0][1].samples / frames[0][1].sample_rate
+
+        # When
+        byte_range = self.radio_programs.get_clip_range(
+            metadata=metadata, start=0.25, end=1.25
+        )
+        end_of_file_range = self.radio_programs.get_clip_range(
+            metadata=metadata, start=0.25, end=7200
+        )
+        after_end_range = self.radio_programs.get_clip_range(
+            metadata=metadata, start=7200, end=7260
+        )
+
+        # Then
+        first_frame, _ = frames[math.floor(0.25 / frame_duration)]
+        next_frame, _ = frames[math.ceil(1.25 / frame_duration)]
+        assert byte_range == (first_frame, next_frame - 1)
+        assert end_of_file_range == (first_frame, metadata.content_length - 1)
+        assert after_end_range is None
+
+    def test_generate_and_get_radio_program_waveform(self):
+        """Should store the waveforms next to the file and delete them with it."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        file_name = created_radio_program.radio_program.file_name
+
+        # When
+        resolutions = self.radio_programs.generate_waveforms(file_name=file_name)
+        waveform = self.radio_programs.get_waveform(
+            program_id=created_radio_program.id,
+            resolution=WaveformResolution.medium,
+        )
+        self.radio_programs.delete(program_id=created_radio_program.id)
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        assert resolutions == list(WAVEFORM_RESOLUTIONS)
+        assert waveform.startswith(b"\x01\x00\x00\x00\x01\x00\x00\x00")
+        assert len(waveform) < len(self.upload_file.file_content)
+        assert self.radio_program_files_repository.list_objects() == []
+
+    def test_get_all_radio_programs_with_presigned_urls(self):
+        """Should return presigned file URLs without changing stored URLs."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        created_radio_program = self.radio_programs_repository.put_item(
+            self.create_program_model
+        )
+
+        # When
+        with mock.patch.object(settings, "S3_PRESIGNED_URLS", True):
+            db_radio_programs = self.radio_programs.get_all()
+
+        # Then
+        stored_radio_program = self.radio_programs_repository.get_item(
+            item_id=created_radio_program.id
+        )
+        assert "Signature=" in db_radio_programs[0].radio_program.file_url
+        assert (
+            stored_radio_program.radio_program.file_url
+            == created_radio_program.radio_program.file_url
+        )
+
     def test_get_all_radio_programs(self):
         """Should retrieve all existing RadioPrograms."""
         # Given
@@ -181,6 +582,7 @@ class TestRadioProgramsDomain(unittest.TestCase):
             new_program=update_program,
             program_file=new_radio_program_file.file,
         )
+        self.radio_programs.deletion_queue.flush()
         uploaded_object = self.radio_program_files_repository.get_object(
             updated_program.radio_program.file_name
         )
@@ -193,6 +595,31 @@ class TestRadioProgramsDomain(unittest.TestCase):
                 created_radio_program.radio_program.file_name
             )
 
+    def test_update_radio_program_file_without_title(self):
+        """Should name a new file after the stored title if no title is sent."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        created_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+
+        # When
+        updated_program = self.radio_programs.update(
+            program_id=created_radio_program.id,
+            new_program=RadioProgramUpdateInSchema(),
+            program_file=self.new_upload_file.file,
+        )
+
+        # Then
+        self.radio_programs.deletion_queue.flush()
+        assert updated_program.title == created_radio_program.title
+        assert created_radio_program.title in updated_program.radio_program.file_name
+        assert self.radio_program_files_repository.get_object(
+            updated_program.radio_program.file_name
+        )
+
     @mock.patch(RADIO_PROGRAMS_REPOSITORY_UPDATE_ITEM_MOCK_PATCH)
     def test_update_radio_program_raises_dynamo_db_client_error(
         self, update_item_mock: mock.patch
@@ -236,6 +663,7 @@ class TestRadioProgramsDomain(unittest.TestCase):
                 program_file=new_file.file,
             )
 
+        self.radio_programs.deletion_queue.flush()
         assert self.radio_program_files_repository.list_objects() == []
 
     def test_delete_radio_program(self):
@@ -251,8 +679,117 @@ class TestRadioProgramsDomain(unittest.TestCase):
 
         # When
         self.radio_programs.delete(program_id=db_radio_program.id)
+        pending_deletions = self.radio_programs.get_pending_file_deletions()
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        assert pending_deletions == RELEASED_OBJECTS
+        with pytest.raises(DynamoDbItemNotFoundError):
+            self.radio_programs.get(program_id=db_radio_program.id)
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.get_object(
+                object_key=db_radio_program.radio_program.file_name
+            )
+
+    def test_update_radio_program_with_stale_version_deletes_file(self):
+        """Should raise DynamoDbVersionConflictError and remove the uploaded file."""
+        # Given
+        created_radio_program = self.radio_programs_repository.put_item(
+            self.create_program_model
+        )
+        update_program = RadioProgramUpdateInSchema(title="Updated title")
+        self.radio_programs.update(
+            program_id=created_radio_program.id, new_program=update_program
+        )
+
+        # Then
+        with pytest.raises(DynamoDbVersionConflictError):
+            self.radio_programs.update(
+                program_id=created_radio_program.id,
+                new_program=update_program,
+                program_file=self.new_upload_file.file,
+                expected_version=created_radio_program.version,
+            )
+
+        self.radio_programs.deletion_queue.flush()
+        assert self.radio_program_files_repository.list_objects() == []
+
+    def test_create_and_update_many_radio_programs(self):
+        """Should store and update several radio programs referencing S3 files."""
+        # Given
+        db_radio_program = self.radio_programs.create(
+            radio_program=RadioProgramCreateInSchema(
+                **self.create_program_model.dict()
+            ),
+            program_file=self.upload_file.file,
+        )
+        radio_program_in = RadioProgramBatchCreateInSchema(
+            **self.create_program_model.dict(exclude={"radio_program"}),
+            radio_program=db_radio_program.radio_program,
+        )
+
+        # When
+        created = self.radio_programs.create_many(radio_programs=[radio_program_in])
+        updated = self.radio_programs.update_many(
+            new_programs={
+                created[0].item.id: RadioProgramUpdateInSchema(
+                    description="batch description"
+                )
+            }
+        )
 
         # Then
+        assert updated[0].status == DynamoDbBatchItemStatus.succeeded
+        db_created_program = self.radio_programs.get(program_id=created[0].item.id)
+        assert db_created_program.title == self.create_program_model.title
+        assert db_created_program.description == "batch description"
+        assert db_created_program.radio_program == db_radio_program.radio_program
+
+    def test_many_radio_programs_with_presigned_urls(self):
+        """Should return presigned file URLs in the results of batch writes."""
+        # Given
+        from audio_api.aws.s3.repositories.base_repository import settings
+
+        db_radio_program = self.radio_programs_repository.put_item(
+            self.create_program_model
+        )
+        radio_program_in = RadioProgramBatchCreateInSchema(
+            **self.create_program_model.dict(exclude={"radio_program"}),
+            radio_program=db_radio_program.radio_program,
+        )
+
+        # When
+        with mock.patch.object(settings, "S3_PRESIGNED_URLS", True):
+            created = self.radio_programs.create_many(radio_programs=[radio_program_in])
+            updated = self.radio_programs.update_many(
+                new_programs={
+                    created[0].item.id: RadioProgramUpdateInSchema(
+                        description="batch description"
+                    )
+                }
+            )
+            deleted = self.radio_programs.delete_many(program_ids=[db_radio_program.id])
+
+        # Then
+        for results in (created, updated, deleted):
+            assert "Signature=" in results[0].item.radio_program.file_url
+
+    def test_delete_many_radio_programs(self):
+        """Should delete several radio programs and their S3 files."""
+        # Given
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        db_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+
+        # When
+        results = self.radio_programs.delete_many(program_ids=[db_radio_program.id])
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        assert results[0].status == DynamoDbBatchItemStatus.succeeded
         with pytest.raises(DynamoDbItemNotFoundError):
             self.radio_programs.get(program_id=db_radio_program.id)
         with pytest.raises(S3FileNotFoundError):
@@ -260,9 +797,9 @@ class TestRadioProgramsDomain(unittest.TestCase):
                 object_key=db_radio_program.radio_program.file_name
             )
 
-    @mock.patch(RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECT_MOCK_PATCH)
+    @mock.patch(RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECTS_MOCK_PATCH)
     def test_delete_radio_program_with_s3_client_error_removes_from_dynamo(
-        self, delete_s3_object_mock: mock.patch
+        self, delete_s3_objects_mock: mock.patch
     ):
         """Should delete an existing radio program even if fails to delete from S3."""
         # Given
@@ -275,22 +812,25 @@ class TestRadioProgramsDomain(unittest.TestCase):
         )
 
         # When
-        delete_s3_object_mock.side_effect = S3ClientError("Test error")
+        delete_s3_objects_mock.side_effect = S3ClientError("Test error")
         self.radio_programs.delete(program_id=db_radio_program.id)
 
         # Then
+        with pytest.raises(S3ClientError):
+            self.radio_programs.deletion_queue.flush()
         with pytest.raises(DynamoDbItemNotFoundError):
             self.radio_programs.get(program_id=db_radio_program.id)
         uploaded_object = self.radio_program_files_repository.get_object(
             object_key=db_radio_program.radio_program.file_name
         )
         assert uploaded_object.read() == radio_program_file.file_content
+        assert self.radio_programs.get_pending_file_deletions() == RELEASED_OBJECTS
 
-    @mock.patch(RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECT_MOCK_PATCH)
-    def test_delete_radio_program_with_s3_persistence_error_removes_from_dynamo(
-        self, delete_s3_object_mock: mock.patch
+    @mock.patch(RADIO_PROGRAM_FILES_REPOSITORY_DELETE_S3_OBJECTS_MOCK_PATCH)
+    def test_delete_radio_program_with_failed_s3_deletion_removes_from_dynamo(
+        self, delete_s3_objects_mock: mock.patch
     ):
-        """Should delete an existing radio program even if fails to delete from S3."""
+        """Should delete an existing radio program and retry failed S3 deletions."""
         # Given
         radio_program_in = RadioProgramCreateInSchema(
             **self.create_program_model.dict()
@@ -301,13 +841,117 @@ class TestRadioProgramsDomain(unittest.TestCase):
         )
 
         # When
-        delete_s3_object_mock.side_effect = S3PersistenceError("Test error")
+        delete_s3_objects_mock.side_effect = lambda object_keys: object_keys
         self.radio_programs.delete(program_id=db_radio_program.id)
+        deleted = self.radio_programs.deletion_queue.flush()
 
         # Then
+        assert deleted == 0
         with pytest.raises(DynamoDbItemNotFoundError):
             self.radio_programs.get(program_id=db_radio_program.id)
         uploaded_object = self.radio_program_files_repository.get_object(
             object_key=db_radio_program.radio_program.file_name
         )
         assert uploaded_object.read() == radio_program_file.file_content
+        assert self.radio_programs.get_pending_file_deletions() == RELEASED_OBJECTS
+
+    @mock.patch.object(RadioPrograms, "content_addressed_storage", True)
+    def test_create_radio_programs_with_identical_files_stores_file_once(self):
+        """Should store identical files once, skipping the second upload."""
+        # Given
+        self.radio_programs.radio_program_file_references_repository.delete_all()
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+
+        # When
+        with mock.patch.object(
+            self.radio_program_files_repository,
+            "put_object",
+            wraps=self.radio_program_files_repository.put_object,
+        ) as put_object_mock:
+            first_program = self.radio_programs.create(
+                radio_program=radio_program_in, program_file=self.upload_file.file
+            )
+            second_program = self.radio_programs.create(
+                radio_program=radio_program_in, program_file=self.new_upload_file.file
+            )
+        file_name = first_program.radio_program.file_name
+
+        # Then
+        put_object_mock.assert_called_once()
+        assert file_name.startswith("sha256/")
+        assert second_program.radio_program.file_name == file_name
+        assert [
+            file.file_name
+            for file in self.radio_program_files_repository.list_objects()
+        ] == [file_name]
+        assert (
+            self.radio_programs.radio_program_file_references_repository.get_references(
+                file_name
+            )
+            == 2
+        )
+
+    @mock.patch.object(RadioPrograms, "content_addressed_storage", True)
+    def test_flush_keeps_file_referenced_again_after_being_queued(self):
+        """Should not delete a queued file referenced again by another process."""
+        # Given
+        references_repository = (
+            self.radio_programs.radio_program_file_references_repository
+        )
+        references_repository.delete_all()
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        db_radio_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        file_name = db_radio_program.radio_program.file_name
+        self.radio_programs.delete(program_id=db_radio_program.id)
+
+        # When
+        # Another process can not cancel the deletion queued by this one.
+        references_repository.add_references(file_name)
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        assert self.radio_programs.get_pending_file_deletions() == 0
+        assert [
+            file.file_name
+            for file in self.radio_program_files_repository.list_objects()
+        ] == [file_name]
+
+    @mock.patch.object(RadioPrograms, "content_addressed_storage", True)
+    def test_delete_radio_program_keeps_file_referenced_by_another_program(self):
+        """Should only delete a shared file when its last program is deleted."""
+        # Given
+        self.radio_programs.radio_program_file_references_repository.delete_all()
+        radio_program_in = RadioProgramCreateInSchema(
+            **self.create_program_model.dict()
+        )
+        first_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.upload_file.file
+        )
+        second_program = self.radio_programs.create(
+            radio_program=radio_program_in, program_file=self.new_upload_file.file
+        )
+        file_name = first_program.radio_program.file_name
+
+        # When
+        self.radio_programs.delete(program_id=first_program.id)
+        pending_after_first = self.radio_programs.get_pending_file_deletions()
+        self.radio_programs.delete(program_id=second_program.id)
+        pending_after_second = self.radio_programs.get_pending_file_deletions()
+        self.radio_programs.deletion_queue.flush()
+
+        # Then
+        assert (pending_after_first, pending_after_second) == (0, RELEASED_OBJECTS)
+        with pytest.raises(S3FileNotFoundError):
+            self.radio_program_files_repository.get_object(object_key=file_name)
+        assert (
+            self.radio_programs.radio_program_file_references_repository.get_references(
+                file_name
+            )
+            == 0
+        )